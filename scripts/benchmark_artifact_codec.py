@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark artifact encodings: bytes on disk and read time.
+
+Compares the previous format (indent=2 JSON) with compact JSON, gzip and
+zstd for the compressible artifacts (pages.json, azure_di.json) of a
+workspace, or for a synthetic Azure DI payload when no workspace is given.
+
+Usage:
+    python scripts/benchmark_artifact_codec.py [--root WORKSPACE] [--repeat N]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from context_builder.storage import artifact_codec  # noqa: E402
+from context_builder.storage.artifact_codec import (  # noqa: E402
+    compress,
+    dumps,
+    iter_workspace_artifacts,
+    read_json_artifact,
+)
+
+
+def synthetic_azure_di(pages: int = 20, words_per_page: int = 400) -> dict:
+    """Azure DI-shaped payload: page words with polygons, plus content."""
+    rng = random.Random(42)
+    vocab = ["invoice", "total", "amount", "date", "policy", "claim", "vehicle", "repair",
+             "CHF", "garage", "customer", "number", "address", "street", "insurance"]
+    content_parts = []
+    result_pages = []
+    offset = 0
+    for page_number in range(1, pages + 1):
+        words = []
+        for _ in range(words_per_page):
+            text = rng.choice(vocab)
+            x, y = rng.uniform(0, 8), rng.uniform(0, 11)
+            words.append({
+                "content": text,
+                "polygon": [round(v, 4) for v in (x, y, x + 0.5, y, x + 0.5, y + 0.2, x, y + 0.2)],
+                "confidence": round(rng.uniform(0.8, 1.0), 3),
+                "span": {"offset": offset, "length": len(text)},
+            })
+            content_parts.append(text)
+            offset += len(text) + 1
+        result_pages.append({"pageNumber": page_number, "width": 8.5, "height": 11,
+                             "unit": "inch", "words": words})
+    return {"raw_azure_di_output": {"content": " ".join(content_parts), "pages": result_pages}}
+
+
+def encodings(data) -> dict:
+    compact = dumps(data)
+    encoded = {
+        "pretty (indent=2)": json.dumps(data, indent=2, ensure_ascii=False, default=str).encode("utf-8"),
+        "compact": compact,
+        "gzip": compress(compact, "gzip"),
+    }
+    if artifact_codec.zstandard is not None:
+        encoded["zstd"] = compress(compact, "zstd")
+    return encoded
+
+
+def time_reads(path: Path, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        read_json_artifact(path)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--root", type=Path, help="Workspace root (default: synthetic payload)")
+    parser.add_argument("--repeat", type=int, default=20, help="Reads per measurement")
+    args = parser.parse_args()
+
+    if args.root:
+        payloads = [read_json_artifact(p) for p, compressible in iter_workspace_artifacts(args.root)
+                    if compressible]
+        if not payloads:
+            print(f"No pages.json / azure_di.json artifacts under {args.root}")
+            sys.exit(1)
+    else:
+        payloads = [synthetic_azure_di()]
+
+    totals = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, data in enumerate(payloads):
+            for name, raw in encodings(data).items():
+                path = Path(tmp) / f"{i}-{name.split()[0]}.json"
+                path.write_bytes(raw)
+                size, seconds = totals.get(name, (0, 0.0))
+                totals[name] = (size + len(raw), seconds + time_reads(path, args.repeat))
+
+    base_size, base_time = totals["pretty (indent=2)"]
+    json_lib = "orjson" if artifact_codec.orjson is not None else "json (stdlib)"
+    print(f"{len(payloads)} artifact(s), JSON library: {json_lib}\n")
+    print(f"{'encoding':<20}{'bytes':>14}{'saved':>9}{'read ms':>10}{'vs pretty':>11}")
+    for name, (size, seconds) in totals.items():
+        saved = 100.0 * (base_size - size) / base_size
+        delta = 100.0 * (seconds - base_time) / base_time
+        print(f"{name:<20}{size:>14,}{saved:>8.1f}%{seconds * 1000:>10.2f}{delta:>+10.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -50,7 +50,9 @@ from context_builder.startup import (
     get_staging_dir as _startup_get_staging_dir,
     set_workspace_paths,
 )
-from context_builder.storage import FileStorage, StorageFacade
+from context_builder.storage import StorageFacade, clear_shared_storage, get_shared_storage
+from context_builder.storage.path_map import clear_path_map_cache
+from context_builder.storage.run_claims import clear_run_claim_cache
 from context_builder.storage.workspace_paths import reset_workspace_cache
 
 
@@ -153,8 +155,12 @@ def set_data_dir(path: Path) -> None:
 
 
 def get_storage() -> StorageFacade:
-    """Get Storage instance (fresh for each request to see new runs)."""
-    return StorageFacade.from_storage(FileStorage(get_data_dir()))
+    """Get Storage for the active workspace.
+
+    The underlying FileStorage is shared per workspace; its indexes are
+    reloaded when registry files change, so new runs are still visible.
+    """
+    return StorageFacade.from_storage(get_shared_storage(get_data_dir()))
 
 
 # =============================================================================
@@ -217,13 +223,13 @@ def get_assessment_service() -> AssessmentStorageService:
 
 def get_aggregation_service() -> AggregationService:
     """Get AggregationService instance."""
-    storage = FileStorage(get_data_dir())
+    storage = get_shared_storage(get_data_dir())
     return AggregationService(storage)
 
 
 def get_reconciliation_service() -> ReconciliationService:
     """Get ReconciliationService instance."""
-    storage = FileStorage(get_data_dir())
+    storage = get_shared_storage(get_data_dir())
     aggregation = get_aggregation_service()
     return ReconciliationService(storage, aggregation)
 
@@ -346,6 +352,11 @@ def _reset_service_singletons() -> None:
     # Reset workspace path cache to force re-reading registry
     reset_workspace_cache()
 
+    # Drop shared storage (and its loaded indexes) for the old workspace
+    clear_shared_storage()
+    clear_path_map_cache()
+    clear_run_claim_cache()
+
     # Note: _users_service, _auth_service, _audit_service are global and NOT reset
 
 
@@ -139,6 +139,8 @@ def get_claim_coverage_analysis(claim_id: str) -> Optional[Dict[str, Any]]:
 
     Returns the CoverageAnalysisResult with line items, summary, and
     non-covered explanations, or null if no coverage analysis exists.
+    Template explanations are rewritten by the LLM on the first read and
+    persisted, so later reads are served from disk.
     """
     from context_builder.api.services.coverage_analysis import CoverageAnalysisService
     from context_builder.storage.filesystem import FileStorage
@@ -146,12 +148,60 @@ def get_claim_coverage_analysis(claim_id: str) -> Optional[Dict[str, Any]]:
     workspace_root = get_workspace_path()
     storage = FileStorage(workspace_root)
     service = CoverageAnalysisService(storage)
-    result = service.get_coverage_analysis(claim_id)
+    result = service.get_explanations(claim_id)
     if result is None:
         return None
     return result.model_dump(mode="json")
 
 
+@router.get("/api/claims/{claim_id}/coverage-analysis/explanations")
+def get_claim_coverage_explanations(claim_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get non-covered explanations for a claim, rewritten by the LLM on demand.
+
+    The first request rewrites the template explanations stored at analysis
+    time and persists them; later requests are served from disk.
+    Returns null if no coverage analysis exists.
+    """
+    from context_builder.api.services.coverage_analysis import CoverageAnalysisService
+    from context_builder.storage.filesystem import FileStorage
+
+    service = CoverageAnalysisService(FileStorage(get_workspace_path()))
+    result = service.get_explanations(claim_id)
+    if result is None:
+        return None
+    return {
+        "claim_id": claim_id,
+        "non_covered_explanations": [
+            e.model_dump(mode="json") for e in result.non_covered_explanations or []
+        ],
+        "non_covered_summary": result.non_covered_summary,
+    }
+
+
+class ExplanationPrewarmRequest(BaseModel):
+    """Request body for pre-warming non-covered explanations."""
+    claim_ids: Optional[List[str]] = None
+
+
+@router.post("/api/claims/coverage-analysis/explanations/prewarm")
+async def prewarm_coverage_explanations(
+    request: ExplanationPrewarmRequest,
+) -> Dict[str, Any]:
+    """
+    Rewrite non-covered explanations in the background.
+
+    Without claim_ids, pre-warms every claim whose coverage analysis has
+    items needing review.
+    """
+    from context_builder.api.services.coverage_analysis import CoverageAnalysisService
+    from context_builder.storage.filesystem import FileStorage
+
+    service = CoverageAnalysisService(FileStorage(get_workspace_path()))
+    asyncio.create_task(asyncio.to_thread(service.prewarm_explanations, request.claim_ids))
+    return {"status": "scheduled", "claim_ids": request.claim_ids}
+
+
 @router.get("/api/claims/{claim_id}/assessment")
 def get_claim_assessment(claim_id: str) -> Optional[Dict[str, Any]]:
     """
@@ -599,19 +649,18 @@ def list_claim_runs_for_claim(claim_id: str) -> List[Dict[str, Any]]:
     except ValueError:
         raise HTTPException(status_code=404, detail=f"Claim not found: {claim_id}")
 
-    run_ids = claim_run_storage.list_claim_runs()
-    results = []
-    for run_id in run_ids:
-        manifest = claim_run_storage.read_manifest(run_id)
-        if manifest:
-            results.append({
-                "claim_run_id": run_id,
-                "created_at": manifest.created_at.isoformat(),
-                "stages_completed": manifest.stages_completed,
-                "extraction_runs_considered": manifest.extraction_runs_considered,
-                "contextbuilder_version": manifest.contextbuilder_version,
-            })
-    return results
+    # Summaries come from the claim run catalog, without reading manifests
+    return [
+        {
+            "claim_run_id": run["claim_run_id"],
+            "created_at": run["created_at"],
+            "stages_completed": run["stages_completed"],
+            "extraction_runs_considered": run["extraction_runs_considered"],
+            "contextbuilder_version": run["contextbuilder_version"],
+        }
+        for run in claim_run_storage.list_claim_run_summaries()
+        if run.get("has_manifest")
+    ]
 
 
 @router.get("/api/claims/{claim_id}/claim-runs/{claim_run_id}/facts")
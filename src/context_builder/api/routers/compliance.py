@@ -295,6 +295,8 @@ def get_truth_history(
 @router.get("/api/compliance/label-history/{doc_id}")
 def get_label_history(
     doc_id: str,
+    start_version: int = Query(1, ge=1, description="First version to return"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Max versions to return"),
     _user: CurrentUser = Depends(require_compliance_access),
 ):
     """
@@ -302,22 +304,29 @@ def get_label_history(
 
     Requires: admin or auditor role
 
-    Returns all historical versions of labels for audit.
+    Returns historical versions of labels for audit, optionally one page
+    (start_version, limit) at a time.  version_count is the total number
+    of versions.
     """
     storage = get_storage()
 
     # Access underlying FileStorage for history method
     if hasattr(storage, 'label_store') and hasattr(storage.label_store, 'get_label_history'):
-        history = storage.label_store.get_label_history(doc_id)
+        label_store = storage.label_store
     else:
         # Fallback for FileStorage directly
         from context_builder.storage import FileStorage
-        fs = FileStorage(get_data_dir())
-        history = fs.get_label_history(doc_id)
+        label_store = FileStorage(get_data_dir())
+    history = label_store.get_label_history(doc_id, start_version=start_version, limit=limit)
+    if start_version == 1 and limit is None:
+        version_count = len(history)
+    else:
+        version_count = label_store.get_label_version_count(doc_id)
 
     return {
         "doc_id": doc_id,
-        "version_count": len(history),
+        "version_count": version_count,
+        "start_version": start_version,
         "versions": [
             {
                 "version_number": h.get("_version_metadata", {}).get("version_number"),
@@ -1,12 +1,18 @@
-"""System endpoints: health check and version info."""
+"""System endpoints: health check, version info and plugin stats."""
 
 import subprocess
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
-from context_builder.api.dependencies import get_data_dir, get_project_root
+from context_builder.api.dependencies import (
+    CurrentUser,
+    get_data_dir,
+    get_project_root,
+    require_admin,
+)
+from context_builder.pipeline.claim_stages.plugin_registry import get_plugin_registry
 
 
 router = APIRouter(tags=["system"])
@@ -93,3 +99,15 @@ def get_version():
         git_commit=_GIT_COMMIT,
         display=display,
     )
+
+
+@router.get("/api/system/plugins")
+def get_plugin_stats(
+    current_user: CurrentUser = Depends(require_admin),
+) -> List[Dict[str, Any]]:
+    """List workspace plugins loaded in this process.
+
+    Reports the content hash, load time and reload/hit counters for each
+    screener and decision engine module held by the plugin registry.
+    """
+    return get_plugin_registry().stats()
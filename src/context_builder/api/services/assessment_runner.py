@@ -44,8 +44,8 @@ class AssessmentRunnerService:
         """
         from context_builder.pipeline.claim_stages import (
             ClaimContext,
-            ClaimPipelineRunner,
             ClaimStageConfig,
+            ClaimStageGraph,
             ConfidenceStage,
             DecisionStage,
             EnrichmentStage,
@@ -98,7 +98,9 @@ class AssessmentRunnerService:
                 DecisionStage(),
                 ConfidenceStage(),
             ]
-            runner = ClaimPipelineRunner(stages)
+            # Stages declare their ClaimContext inputs/outputs; the graph
+            # runs independent ones concurrently.
+            runner = ClaimStageGraph.from_stages(stages)
             context = runner.run(context)
 
             if context.status == "success" and context.processing_result:
@@ -9,17 +9,27 @@ Pipeline stages (all non-fatal except reconciliation and assessment):
 3. Assessment - LLM-based claim assessment
 4. Decision - decision dossier (denial clause evaluation)
 5. Confidence - Composite Confidence Index (CCI)
+
+The stages run as a dependency graph; independent steps (config and
+override loading) overlap with reconciliation and screening.
 """
 
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Optional
 
 from context_builder import get_version
 from context_builder.api.services.aggregation import AggregationService
 from context_builder.api.services.reconciliation import ReconciliationService
 from context_builder.pipeline.claim_stages.context import ClaimContext
+from context_builder.pipeline.claim_stages.dag import ClaimStageGraph, StageNode
+from context_builder.pipeline.claim_stages.fingerprint import (
+    StageFingerprint,
+    StageReusePlanner,
+    hash_content,
+    hash_prompt,
+)
 from context_builder.pipeline.claim_stages.screening import ScreeningStage
 from context_builder.pipeline.claim_stages.decision import DecisionStage
 from context_builder.confidence.stage import ConfidenceStage
@@ -31,6 +41,7 @@ from context_builder.pipeline.claim_stages.processing import (
 from context_builder.schemas.assessment_response import AssessmentResponse
 from context_builder.schemas.claim_assessment import ClaimAssessmentResult
 from context_builder.storage.claim_run import ClaimRunStorage
+from context_builder.storage.dossier_index import DossierIndex
 from context_builder.storage.filesystem import FileStorage
 
 logger = logging.getLogger(__name__)
@@ -71,16 +82,27 @@ class ClaimAssessmentService:
         on_llm_start: Optional[Callable[[int], None]] = None,
         on_llm_progress: Optional[Callable[[int], None]] = None,
         run_context=None,
+        force_stages: Optional[Iterable[str]] = None,
     ) -> ClaimAssessmentResult:
         """Run full assessment for a claim.
 
-        Steps:
-        1. Run reconciliation (creates claim_run, aggregates facts)
-        2. Load aggregated facts from claim_run
-        3. Load assessment prompt config
-        4. Run assessment processor
-        5. Save assessment to claim_run
-        6. Update manifest with stages_completed
+        Stages run as a dependency graph (see claim_stages.dag), so steps
+        that do not depend on each other overlap:
+
+        1. Reconciliation (creates claim_run, aggregates facts)
+           - in parallel: load assessment prompt config
+        2. Screening
+           - in parallel: load coverage overrides from the previous run
+        3. Assessment processor (writes assessment.json)
+        4. Decision stage
+        5. Confidence stage
+        6. Update manifest with stages_completed, stage timings and
+           input fingerprints
+
+        Screening and assessment fingerprint their inputs (facts, upstream
+        results, config, prompt, plugin source). If an earlier claim run
+        recorded the same fingerprint, its output is copied instead of
+        running the stage again (see claim_stages.fingerprint).
 
         Args:
             claim_id: Claim to assess.
@@ -90,234 +112,318 @@ class ClaimAssessmentService:
             on_llm_start: Callback when LLM batch processing starts (total count).
             on_llm_progress: Callback for LLM progress updates (increment).
             run_context: Optional ClaimRunContext with shared ID and metadata.
+            force_stages: Stages to run even if their inputs are unchanged
+                ("screening", "assessment" or "all").
 
         Returns:
             ClaimAssessmentResult with decision, payout, reconciliation report, etc.
         """
         logger.info(f"Starting assessment for claim {claim_id}")
+        force = set(force_stages or ())
+
+        # Per-call state shared by the stage nodes below. The claim run
+        # storage is derived from run_id, which every reader depends on.
+        callbacks = {
+            "on_token_update": on_token_update,
+            "on_stage_update": on_stage_update,
+            "on_llm_start": on_llm_start,
+            "on_llm_progress": on_llm_progress,
+        }
+        storage_ref: Dict[str, ClaimRunStorage] = {}
+        planner_ref: Dict[str, StageReusePlanner] = {}
+
+        def _notify(stage_name: str, status: str) -> None:
+            if on_stage_update:
+                try:
+                    on_stage_update(stage_name, status)
+                except Exception:
+                    pass
 
-        # Step 1: Run reconciliation
-        if on_stage_update:
-            try:
-                on_stage_update("reconciliation", "running")
-            except Exception:
-                pass
-        reconcile_result = self.reconciliation.reconcile(claim_id, run_context=run_context)
-        if not reconcile_result.success:
-            logger.error(f"Reconciliation failed for {claim_id}: {reconcile_result.error}")
-            return ClaimAssessmentResult(
-                claim_id=claim_id,
-                success=False,
-                error=f"Reconciliation failed: {reconcile_result.error}",
+        def _reconcile(ctx: ClaimContext) -> ClaimContext:
+            _notify("reconciliation", "running")
+            reconcile_result = self.reconciliation.reconcile(
+                claim_id, run_context=run_context
             )
+            if not reconcile_result.success:
+                logger.error(
+                    f"Reconciliation failed for {claim_id}: {reconcile_result.error}"
+                )
+                ctx.status = "error"
+                ctx.error = f"Reconciliation failed: {reconcile_result.error}"
+                return ctx
 
-        claim_run_id = reconcile_result.report.claim_run_id
-        logger.info(f"Reconciliation complete for {claim_id}, claim_run={claim_run_id}")
-
-        # Step 2: Load claim facts from claim_run
-        claim_folder = self.storage._find_claim_folder(claim_id)
-        if not claim_folder:
-            return ClaimAssessmentResult(
-                claim_id=claim_id,
-                claim_run_id=claim_run_id,
-                success=False,
-                error=f"Claim folder not found: {claim_id}",
-                reconciliation=reconcile_result.report,
+            ctx.reconciliation_report = reconcile_result.report
+            ctx.run_id = reconcile_result.report.claim_run_id
+            logger.info(
+                f"Reconciliation complete for {claim_id}, claim_run={ctx.run_id}"
             )
 
-        claim_run_storage = ClaimRunStorage(claim_folder)
-        claim_facts_data = claim_run_storage.read_claim_facts(claim_run_id)
-        if not claim_facts_data:
-            return ClaimAssessmentResult(
-                claim_id=claim_id,
-                claim_run_id=claim_run_id,
-                success=False,
-                error="No claim facts found after reconciliation",
-                reconciliation=reconcile_result.report,
+            claim_folder = self.storage._find_claim_folder(claim_id)
+            if not claim_folder:
+                ctx.status = "error"
+                ctx.error = f"Claim folder not found: {claim_id}"
+                return ctx
+
+            storage_ref["claim_run"] = ClaimRunStorage(claim_folder)
+            planner_ref["reuse"] = StageReusePlanner(
+                storage=storage_ref["claim_run"],
+                claim_run_id=ctx.run_id,
+                workspace_path=self.storage.output_root,
+                force_stages=force,
             )
+            ctx.aggregated_facts = storage_ref["claim_run"].read_claim_facts(ctx.run_id)
+            if not ctx.aggregated_facts:
+                ctx.status = "error"
+                ctx.error = "No claim facts found after reconciliation"
+            return ctx
 
-        # Step 2b: Run screening stage (deterministic checks before LLM)
-        # NOTE: Enrichment stage removed in Phase 6 cleanup.
-        # Shop authorization lookup is now handled by the screening stage.
-        screening_result = None
-        screening_context = ClaimContext(
-            claim_id=claim_id,
-            workspace_path=self.storage.output_root,
-            run_id=claim_run_id,
-            aggregated_facts=claim_facts_data,
-            reconciliation_report=reconcile_result.report,
-            on_stage_update=on_stage_update,
-            on_llm_start=on_llm_start,
-            on_llm_progress=on_llm_progress,
-        )
+        def _load_config(ctx: ClaimContext) -> ClaimContext:
+            try:
+                ctx.processing_config = self._load_assessment_config()
+            except Exception as e:
+                logger.error(f"Failed to load assessment config: {e}")
+                ctx.status = "error"
+                ctx.error = f"Failed to load assessment config: {e}"
+            return ctx
+
+        def _screen(ctx: ClaimContext) -> ClaimContext:
+            planner = planner_ref["reuse"]
+            fingerprint = StageFingerprint("screening", {
+                "facts": hash_content(ctx.aggregated_facts),
+                "reconciliation": hash_content(ctx.reconciliation_report),
+                "config": planner.config_hash,
+                "plugin": planner.plugin_hash("config/screening/screener.py"),
+            })
+            if planner.try_reuse(fingerprint):
+                ctx.screening_result = storage_ref["claim_run"].read_from_claim_run(
+                    ctx.run_id, "screening.json"
+                )
+                return ctx
 
-        try:
-            screening_stage = ScreeningStage()
-            screening_context = screening_stage.run(screening_context)
-            screening_result = screening_context.screening_result
+            # NOTE: Enrichment stage removed in Phase 6 cleanup.
+            # Shop authorization lookup is now handled by the screening stage.
+            screening_context = ClaimContext(
+                claim_id=claim_id,
+                workspace_path=self.storage.output_root,
+                run_id=ctx.run_id,
+                aggregated_facts=ctx.aggregated_facts,
+                reconciliation_report=ctx.reconciliation_report,
+                on_stage_update=on_stage_update,
+                on_llm_start=on_llm_start,
+                on_llm_progress=on_llm_progress,
+            )
+            screening_context = ScreeningStage().run(screening_context)
+            ctx.screening_result = screening_context.screening_result
             logger.info(
                 f"Screening complete for {claim_id}"
-                + (f" (auto_reject={screening_result.get('auto_reject')})"
-                   if screening_result else " (no screener configured)")
+                + (f" (auto_reject={ctx.screening_result.get('auto_reject')})"
+                   if ctx.screening_result else " (no screener configured)")
             )
-        except Exception as e:
-            logger.warning(
-                f"Screening failed for {claim_id}: {e}, continuing without screening"
+            return ctx
+
+        def _load_overrides(ctx: ClaimContext) -> ClaimContext:
+            ctx.coverage_overrides = self._load_previous_overrides(
+                storage_ref["claim_run"], ctx.run_id
             )
-            screening_result = None
+            return ctx
+
+        def _assess(ctx: ClaimContext) -> ClaimContext:
+            planner = planner_ref["reuse"]
+            fingerprint = StageFingerprint("assessment", {
+                "facts": hash_content(ctx.aggregated_facts),
+                "screening": hash_content(ctx.screening_result),
+                "config": planner.config_hash,
+                "prompt": hash_prompt(ctx.processing_config),
+            })
+            if planner.try_reuse(fingerprint):
+                ctx.processing_result = storage_ref["claim_run"].read_from_claim_run(
+                    ctx.run_id, "assessment.json"
+                )
+                _notify("assessment", "complete")
+                return ctx
 
-        # Step 3: Load assessment prompt config
-        try:
-            processor_config = self._load_assessment_config()
-        except Exception as e:
-            logger.error(f"Failed to load assessment config: {e}")
-            return ClaimAssessmentResult(
+            context = ClaimContext(
                 claim_id=claim_id,
-                claim_run_id=claim_run_id,
-                success=False,
-                error=f"Failed to load assessment config: {e}",
-                reconciliation=reconcile_result.report,
+                workspace_path=self.storage.output_root,
+                run_id=ctx.run_id,
+                aggregated_facts=ctx.aggregated_facts,
+                screening_result=ctx.screening_result,
+                **callbacks,
             )
+            try:
+                _notify("assessment", "running")
 
-        # Step 4: Build context and run assessment
-        context = ClaimContext(
-            claim_id=claim_id,
-            workspace_path=self.storage.output_root,
-            run_id=claim_run_id,
-            aggregated_facts=claim_facts_data,
-            screening_result=screening_result,
-            on_token_update=on_token_update,
-            on_stage_update=on_stage_update,
-            on_llm_start=on_llm_start,
-            on_llm_progress=on_llm_progress,
-        )
-
-        try:
-            if on_stage_update:
-                try:
-                    on_stage_update("assessment", "running")
-                except Exception:
-                    pass
-
-            # Get assessment processor
-            processor = get_processor("assessment")
-            if not processor:
-                # Import to trigger auto-registration
-                from context_builder.pipeline.claim_stages import assessment_processor  # noqa: F401
+                # Get assessment processor
                 processor = get_processor("assessment")
+                if not processor:
+                    # Import to trigger auto-registration
+                    from context_builder.pipeline.claim_stages import assessment_processor  # noqa: F401
+                    processor = get_processor("assessment")
+
+                if not processor:
+                    raise ValueError("Assessment processor not found")
+
+                assessment_result = processor.process(
+                    context=context,
+                    config=ctx.processing_config,
+                    on_token_update=on_token_update,
+                )
 
-            if not processor:
-                raise ValueError("Assessment processor not found")
-
-            assessment_result = processor.process(
-                context=context,
-                config=processor_config,
-                on_token_update=on_token_update,
-            )
-
-            # Parse into AssessmentResponse model
-            assessment_response = AssessmentResponse.model_validate(assessment_result)
+                # Parse into AssessmentResponse model
+                assessment_response = AssessmentResponse.model_validate(assessment_result)
+                _notify("assessment", "complete")
 
-            if on_stage_update:
-                try:
-                    on_stage_update("assessment", "complete")
-                except Exception:
-                    pass
-
-        except Exception as e:
-            logger.error(f"Assessment failed for {claim_id}: {e}")
-            return ClaimAssessmentResult(
-                claim_id=claim_id,
-                claim_run_id=claim_run_id,
-                success=False,
-                error=f"Assessment failed: {e}",
-                reconciliation=reconcile_result.report,
-            )
+            except Exception as e:
+                logger.error(f"Assessment failed for {claim_id}: {e}")
+                ctx.status = "error"
+                ctx.error = f"Assessment failed: {e}"
+                return ctx
 
-        # Step 5: Save assessment to claim_run
-        try:
-            claim_run_storage.write_assessment(
-                claim_run_id,
-                assessment_response.model_dump(mode="json"),
-            )
-            logger.info(f"Wrote assessment.json to claim_run {claim_run_id}")
-        except Exception as e:
-            logger.error(f"Failed to write assessment: {e}", exc_info=True)
-            return ClaimAssessmentResult(
-                claim_id=claim_id,
-                claim_run_id=claim_run_id,
-                success=False,
-                error=f"Assessment completed but file write failed: {e}",
-                reconciliation=reconcile_result.report,
-                assessment=assessment_response,
-            )
+            ctx.processing_result = assessment_response.model_dump(mode="json")
 
-        # Step 5a: Load coverage overrides from previous run's dossier
-        coverage_overrides = self._load_previous_overrides(
-            claim_run_storage, claim_run_id
-        )
-
-        # Step 5b: Run DecisionStage (non-fatal)
-        decision_result = None
-        try:
+            # Save assessment to claim_run
+            try:
+                storage_ref["claim_run"].write_assessment(ctx.run_id, ctx.processing_result)
+                logger.info(f"Wrote assessment.json to claim_run {ctx.run_id}")
+            except Exception as e:
+                logger.error(f"Failed to write assessment: {e}", exc_info=True)
+                ctx.status = "error"
+                ctx.error = f"Assessment completed but file write failed: {e}"
+            return ctx
+
+        def _decide(ctx: ClaimContext) -> ClaimContext:
+            planner = planner_ref["reuse"]
+            # Recorded for audit only: the dossier is cheap to rebuild and is
+            # patched in place by the confidence stage, so it always runs.
+            planner.record_ran(StageFingerprint("decision", {
+                "facts": hash_content(ctx.aggregated_facts),
+                "screening": hash_content(ctx.screening_result),
+                "assessment": hash_content(ctx.processing_result),
+                "coverage_overrides": hash_content(ctx.coverage_overrides),
+                "config": planner.config_hash,
+                "plugin": planner.plugin_hash("config/decision/engine.py"),
+            }))
             decision_context = ClaimContext(
                 claim_id=claim_id,
                 workspace_path=self.storage.output_root,
-                run_id=claim_run_id,
-                aggregated_facts=claim_facts_data,
-                screening_result=screening_result,
-                processing_result=assessment_response.model_dump(mode="json"),
-                coverage_overrides=coverage_overrides,
+                run_id=ctx.run_id,
+                aggregated_facts=ctx.aggregated_facts,
+                screening_result=ctx.screening_result,
+                processing_result=ctx.processing_result,
+                coverage_overrides=ctx.coverage_overrides,
                 on_stage_update=on_stage_update,
             )
-            decision_stage = DecisionStage()
-            decision_context = decision_stage.run(decision_context)
-            decision_result = decision_context.decision_result
+            decision_context = DecisionStage().run(decision_context)
+            ctx.decision_result = decision_context.decision_result
             logger.info(
                 f"Decision complete for {claim_id}"
-                + (f" (verdict={decision_result.get('claim_verdict')})"
-                   if decision_result else " (no result)")
-            )
-        except Exception as e:
-            logger.warning(
-                f"Decision stage failed for {claim_id}: {e}, continuing"
+                + (f" (verdict={ctx.decision_result.get('claim_verdict')})"
+                   if ctx.decision_result else " (no result)")
             )
+            return ctx
 
-        # Step 5c: Run ConfidenceStage (non-fatal)
-        confidence_summary_data = None
-        try:
+        def _score_confidence(ctx: ClaimContext) -> ClaimContext:
+            report = ctx.reconciliation_report
             confidence_context = ClaimContext(
                 claim_id=claim_id,
                 workspace_path=self.storage.output_root,
-                run_id=claim_run_id,
-                aggregated_facts=claim_facts_data,
+                run_id=ctx.run_id,
+                aggregated_facts=ctx.aggregated_facts,
                 reconciliation_report=(
-                    reconcile_result.report.model_dump(mode="json")
-                    if reconcile_result.report else None
+                    report.model_dump(mode="json") if report else None
                 ),
-                screening_result=screening_result,
-                processing_result=assessment_response.model_dump(mode="json"),
-                decision_result=decision_result,
+                screening_result=ctx.screening_result,
+                processing_result=ctx.processing_result,
+                decision_result=ctx.decision_result,
                 on_stage_update=on_stage_update,
             )
-            confidence_stage = ConfidenceStage()
-            confidence_context = confidence_stage.run(confidence_context)
+            ConfidenceStage().run(confidence_context)
             # Read back the persisted summary (stage writes it to disk)
-            cs_data = claim_run_storage.read_from_claim_run(
-                claim_run_id, "confidence_summary.json"
+            cs_data = storage_ref["claim_run"].read_from_claim_run(
+                ctx.run_id, "confidence_summary.json"
             )
             if cs_data:
-                confidence_summary_data = cs_data
+                ctx.confidence_summary = cs_data
                 logger.info(
                     f"Confidence complete for {claim_id}: "
                     f"CCI={cs_data.get('composite_score')}"
                 )
-        except Exception as e:
-            logger.warning(
-                f"Confidence stage failed for {claim_id}: {e}, continuing"
+            return ctx
+
+        # Reconciliation and assessment are fatal; the rest only log.
+        graph = ClaimStageGraph(
+            [
+                StageNode(
+                    "reconciliation", _reconcile,
+                    outputs=("run_id", "reconciliation_report", "aggregated_facts"),
+                ),
+                StageNode("assessment_config", _load_config, outputs=("processing_config",)),
+                StageNode(
+                    "screening", _screen,
+                    inputs=("run_id", "aggregated_facts", "reconciliation_report"),
+                    outputs=("screening_result",),
+                    fatal=False,
+                ),
+                StageNode(
+                    "coverage_overrides", _load_overrides,
+                    inputs=("run_id",),
+                    outputs=("coverage_overrides",),
+                    fatal=False,
+                ),
+                StageNode(
+                    "assessment", _assess,
+                    inputs=(
+                        "run_id", "aggregated_facts", "screening_result",
+                        "processing_config",
+                    ),
+                    outputs=("processing_result",),
+                ),
+                StageNode(
+                    "decision", _decide,
+                    inputs=(
+                        "run_id", "aggregated_facts", "screening_result",
+                        "processing_result", "coverage_overrides",
+                    ),
+                    outputs=("decision_result",),
+                    fatal=False,
+                ),
+                StageNode(
+                    "confidence", _score_confidence,
+                    inputs=(
+                        "run_id", "reconciliation_report", "screening_result",
+                        "processing_result", "decision_result",
+                    ),
+                    outputs=("confidence_summary",),
+                    fatal=False,
+                ),
+            ],
+            notify_stages=False,
+        )
+        context = graph.run(
+            ClaimContext(
+                claim_id=claim_id,
+                workspace_path=self.storage.output_root,
+                run_id="",
+            )
+        )
+
+        claim_run_id = context.run_id or None
+        assessment_response = (
+            AssessmentResponse.model_validate(context.processing_result)
+            if context.processing_result else None
+        )
+        if context.status == "error":
+            return ClaimAssessmentResult(
+                claim_id=claim_id,
+                claim_run_id=claim_run_id,
+                success=False,
+                error=context.error,
+                reconciliation=context.reconciliation_report,
+                assessment=assessment_response,
             )
 
-        # Step 6: Update manifest with stages_completed
+        # Update manifest with stages_completed and stage timings
+        claim_run_storage = storage_ref["claim_run"]
         try:
             manifest = claim_run_storage.read_manifest(claim_run_id)
             if manifest:
@@ -327,6 +433,8 @@ class ClaimAssessmentService:
                 ]:
                     if stage_name not in manifest.stages_completed:
                         manifest.stages_completed.append(stage_name)
+                manifest.stage_timings = graph.report.to_dict()
+                manifest.stage_fingerprints = planner_ref["reuse"].to_manifest()
                 claim_run_storage.write_manifest(manifest)
                 logger.info(
                     f"Updated manifest stages_completed: {manifest.stages_completed}"
@@ -338,7 +446,7 @@ class ClaimAssessmentService:
                 claim_run_id=claim_run_id,
                 success=False,
                 error=f"Assessment completed but manifest update failed: {e}",
-                reconciliation=reconcile_result.report,
+                reconciliation=context.reconciliation_report,
                 assessment=assessment_response,
             )
 
@@ -352,11 +460,11 @@ class ClaimAssessmentService:
             claim_id=claim_id,
             claim_run_id=claim_run_id,
             success=True,
-            reconciliation=reconcile_result.report,
+            reconciliation=context.reconciliation_report,
             assessment=assessment_response,
-            decision_dossier=decision_result,
-            confidence_summary=confidence_summary_data,
-            screening_payout=_extract_screening_payout(screening_result),
+            decision_dossier=context.decision_result,
+            confidence_summary=context.confidence_summary,
+            screening_payout=_extract_screening_payout(context.screening_result),
         )
 
     def _load_assessment_config(self) -> ProcessorConfig:
@@ -401,16 +509,16 @@ class ClaimAssessmentService:
         """
         try:
             all_runs = claim_run_storage.list_claim_runs()
+            dossier_index = DossierIndex(claim_run_storage.claim_folder)
             for run_id in all_runs:
                 if run_id == current_run_id:
                     continue
                 # Find latest dossier in this run
-                run_dir = claim_run_storage.get_claim_run_path(run_id)
-                dossier_files = sorted(run_dir.glob("decision_dossier_v*.json"))
-                if not dossier_files:
+                latest = dossier_index.latest(run_id)
+                if not latest:
                     continue
                 data = claim_run_storage.read_from_claim_run(
-                    run_id, dossier_files[-1].name
+                    run_id, latest["filename"]
                 )
                 if data and data.get("coverage_overrides"):
                     overrides = data["coverage_overrides"]
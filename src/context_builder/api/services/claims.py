@@ -17,7 +17,7 @@ from context_builder.api.services.utils import (
     parse_loss_type_from_folder,
 )
 from context_builder.storage import StorageFacade
-from context_builder.storage.index_reader import IndexReader
+from context_builder.storage.index_reader import open_index_reader
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +39,7 @@ class ClaimsService:
         # Fast path: use pre-computed claims index when no specific run_id
         if run_id is None:
             registry_dir = self.data_dir.parent / "registry"
-            reader = IndexReader(registry_dir)
+            reader = open_index_reader(registry_dir)
             cached = reader.get_all_claim_summaries()
             if cached is not None:
                 logger.debug(f"Using claims index fast-path ({len(cached)} claims)")
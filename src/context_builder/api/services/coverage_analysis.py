@@ -8,6 +8,7 @@ relevant policy data, runs coverage analysis, and stores results.
 import json
 import logging
 import re
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -22,6 +23,19 @@ from context_builder.utils.number_parsing import parse_european_number
 
 logger = logging.getLogger(__name__)
 
+# Per-claim locks so a reviewer request and a background pre-warm never
+# rewrite (and pay for) the same explanations twice.
+_explanation_locks: Dict[str, threading.Lock] = {}
+_explanation_locks_guard = threading.Lock()
+
+
+def _get_explanation_lock(key: str) -> threading.Lock:
+    with _explanation_locks_guard:
+        lock = _explanation_locks.get(key)
+        if lock is None:
+            lock = _explanation_locks[key] = threading.Lock()
+        return lock
+
 
 class CoverageAnalysisError(Exception):
     """Raised when coverage analysis fails."""
@@ -75,12 +89,14 @@ class CoverageAnalysisService:
 
         if config_path and config_path.exists():
             logger.info(f"Loading coverage config from {config_path}")
-            self._analyzer = CoverageAnalyzer.from_config_path(
-                config_path, workspace_path=workspace_root
-            )
         else:
             logger.info("No coverage config found in workspace, using default analyzer")
-            self._analyzer = CoverageAnalyzer(workspace_path=workspace_root)
+            config_path = None
+
+        # Shared setup is built once per config hash and reused across claims
+        self._analyzer = CoverageAnalyzer.for_workspace(
+            config_path, workspace_path=workspace_root
+        )
 
         return self._analyzer
 
@@ -527,6 +543,7 @@ class CoverageAnalysisService:
         claim_id: str,
         claim_run_id: Optional[str] = None,
         force: bool = False,
+        incremental: bool = False,
     ) -> CoverageAnalysisResult:
         """Analyze coverage for a claim.
 
@@ -534,6 +551,8 @@ class CoverageAnalysisService:
             claim_id: Claim identifier
             claim_run_id: Optional specific claim run ID (uses latest if not provided)
             force: If True, rerun even if coverage_analysis.json exists
+            incremental: If True, rerun but reuse unchanged line item results
+                from the most recent previous coverage analysis (implies force)
 
         Returns:
             CoverageAnalysisResult
@@ -559,7 +578,7 @@ class CoverageAnalysisService:
 
         # Check for existing coverage analysis
         existing_path = claim_run_path / "coverage_analysis.json"
-        if existing_path.exists() and not force:
+        if existing_path.exists() and not force and not incremental:
             logger.info(f"Loading existing coverage analysis from {existing_path}")
             with open(existing_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -601,7 +620,7 @@ class CoverageAnalysisService:
 
         # Run analysis
         analyzer = self._get_analyzer()
-        result = analyzer.analyze(
+        analysis_kwargs = dict(
             claim_id=claim_id,
             line_items=line_items,
             covered_components=covered_components,
@@ -615,37 +634,65 @@ class CoverageAnalysisService:
             age_threshold_years=age_threshold_years,
             repair_description=repair_description,
         )
+        if incremental:
+            previous = self._load_previous_analysis(claim_id, claim_run_path)
+            result = analyzer.analyze_incremental(previous, **analysis_kwargs)
+        else:
+            result = analyzer.analyze(**analysis_kwargs)
 
-        # Generate non-covered explanations (LLM rewrite when available)
-        generator = self._get_explanation_generator()
-        llm_client = self._create_explanation_llm_client(claim_id)
-        explanations, summary = generator.generate(
+        # Template explanations now; the LLM rewrite runs on demand
+        # (get_explanations) or via prewarm_explanations.
+        self._get_explanation_generator().prepare(
             result,
             covered_components=covered_components,
             excluded_components=excluded_components,
-            llm_client=llm_client,
         )
-        if explanations:
-            result.non_covered_explanations = explanations
-            result.non_covered_summary = summary
 
         # Write results
         self._write_coverage_analysis(claim_run_path, result)
 
         return result
 
-    def get_coverage_analysis(
-        self, claim_id: str, claim_run_id: Optional[str] = None
+    def _load_previous_analysis(
+        self, claim_id: str, claim_run_path: Path
     ) -> Optional[CoverageAnalysisResult]:
-        """Get existing coverage analysis for a claim.
+        """Load the most recent coverage analysis to diff against.
 
-        Args:
-            claim_id: Claim identifier
-            claim_run_id: Optional specific claim run ID
+        Prefers the analysis already stored in *claim_run_path*, then falls
+        back to the newest earlier claim run that has one.
 
         Returns:
-            CoverageAnalysisResult or None if not found
+            CoverageAnalysisResult or None if no previous analysis exists
         """
+        candidates = [claim_run_path]
+        claim_runs_dir = claim_run_path.parent
+        if claim_runs_dir.exists():
+            earlier = [
+                d for d in claim_runs_dir.iterdir()
+                if d.is_dir() and d.name < claim_run_path.name
+            ]
+            earlier.sort(key=lambda p: p.name, reverse=True)
+            candidates.extend(earlier)
+
+        for run_path in candidates:
+            coverage_path = run_path / "coverage_analysis.json"
+            if not coverage_path.exists():
+                continue
+            try:
+                with open(coverage_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                return CoverageAnalysisResult.model_validate(data)
+            except (json.JSONDecodeError, IOError, ValueError) as e:
+                logger.warning(
+                    f"Ignoring unreadable coverage analysis {coverage_path}: {e}"
+                )
+        logger.info(f"No previous coverage analysis for claim {claim_id}")
+        return None
+
+    def _get_coverage_path(
+        self, claim_id: str, claim_run_id: Optional[str] = None
+    ) -> Optional[Path]:
+        """Resolve coverage_analysis.json for a claim run (latest by default)."""
         if claim_run_id:
             claims_dir = self.storage.output_root / "claims"
             claim_run_path = claims_dir / claim_id / "claim_runs" / claim_run_id
@@ -658,6 +705,23 @@ class CoverageAnalysisService:
         coverage_path = claim_run_path / "coverage_analysis.json"
         if not coverage_path.exists():
             return None
+        return coverage_path
+
+    def get_coverage_analysis(
+        self, claim_id: str, claim_run_id: Optional[str] = None
+    ) -> Optional[CoverageAnalysisResult]:
+        """Get existing coverage analysis for a claim.
+
+        Args:
+            claim_id: Claim identifier
+            claim_run_id: Optional specific claim run ID
+
+        Returns:
+            CoverageAnalysisResult or None if not found
+        """
+        coverage_path = self._get_coverage_path(claim_id, claim_run_id)
+        if coverage_path is None:
+            return None
 
         try:
             with open(coverage_path, "r", encoding="utf-8") as f:
@@ -667,6 +731,82 @@ class CoverageAnalysisService:
             logger.warning(f"Failed to load coverage analysis: {e}")
             return None
 
+    def get_explanations(
+        self, claim_id: str, claim_run_id: Optional[str] = None
+    ) -> Optional[CoverageAnalysisResult]:
+        """Get coverage analysis with LLM-rewritten non-covered explanations.
+
+        Template explanations stored at analysis time are rewritten on first
+        access and persisted back to coverage_analysis.json, so later reads
+        are served from disk.  Falls back to the template text if the LLM
+        is unavailable.
+
+        Args:
+            claim_id: Claim identifier
+            claim_run_id: Optional specific claim run ID
+
+        Returns:
+            CoverageAnalysisResult or None if not found
+        """
+        coverage_path = self._get_coverage_path(claim_id, claim_run_id)
+        if coverage_path is None:
+            return None
+
+        generator = self._get_explanation_generator()
+        with _get_explanation_lock(str(coverage_path)):
+            # Load inside the lock: a concurrent caller may have just
+            # persisted the rewritten explanations.
+            result = self.get_coverage_analysis(claim_id, claim_run_id)
+            if result is None or not generator.needs_rewrite(result):
+                return result
+
+            llm_client = self._create_explanation_llm_client(claim_id)
+            if generator.rewrite_pending(result, llm_client):
+                self._write_coverage_analysis(coverage_path.parent, result)
+            return result
+
+    def prewarm_explanations(
+        self, claim_ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """Rewrite explanations ahead of time for claims flagged for review.
+
+        A claim is flagged when its latest coverage analysis has items
+        needing review.  Explicitly listed claims are always pre-warmed.
+
+        Args:
+            claim_ids: Claims to pre-warm (default: all flagged claims)
+
+        Returns:
+            Claim IDs whose explanations were rewritten
+        """
+        explicit = claim_ids is not None
+        if claim_ids is None:
+            claim_ids = self.list_claims_for_analysis()
+
+        generator = self._get_explanation_generator()
+        warmed = []
+        for cid in claim_ids:
+            result = self.get_coverage_analysis(cid)
+            if result is None:
+                continue
+            if not explicit and result.summary.items_review_needed == 0:
+                continue
+            if not generator.needs_rewrite(result):
+                continue
+            try:
+                refreshed = self.get_explanations(cid)
+            except Exception:
+                logger.warning(
+                    f"Failed to pre-warm explanations for claim {cid}",
+                    exc_info=True,
+                )
+                continue
+            if refreshed is not None and not generator.needs_rewrite(refreshed):
+                warmed.append(cid)
+
+        logger.info(f"Pre-warmed explanations for {len(warmed)} claim(s)")
+        return warmed
+
     def list_claims_for_analysis(self) -> List[str]:
         """List all claims that have claim_facts.json available.
 
@@ -6,6 +6,8 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from context_builder.storage.dossier_index import parse_dossier_version
+
 logger = logging.getLogger(__name__)
 
 # Module-level cache for list_claims results (keyed by claims_dir path).
@@ -249,8 +251,12 @@ class DashboardService:
 
     def _find_latest_dossier(self, run_dir: Path) -> Optional[Path]:
         """Find the latest decision_dossier_v*.json in a run directory."""
-        candidates = sorted(run_dir.glob("decision_dossier_v*.json"))
-        return candidates[-1] if candidates else None
+        candidates = [
+            (version, path)
+            for path in run_dir.glob("decision_dossier_v*.json")
+            if (version := parse_dossier_version(path.name)) is not None
+        ]
+        return max(candidates)[1] if candidates else None
 
     def _build_rationale(self, dossier: Dict[str, Any], verdict: Optional[str]) -> Optional[str]:
         """Build a human-readable rationale from dossier data."""
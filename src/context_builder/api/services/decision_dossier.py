@@ -2,21 +2,171 @@
 
 Provides access to decision dossier versions, clause registry,
 and re-evaluation with assumption overrides.
+
+Re-evaluation keeps a ``ReevaluationSession`` per claim run, so repeated
+what-if edits in the UI reuse the already loaded claim facts and upstream
+results instead of re-reading them from disk.
 """
 
+import copy
 import json
 import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from context_builder.pipeline.claim_stages.decision import (
     DefaultDecisionEngine,
+    apply_coverage_overrides,
     load_engine_from_workspace,
 )
-from context_builder.storage.claim_run import ClaimRunStorage
+from context_builder.storage.claim_run import ClaimRunStorage, resolve_claim_folder
+from context_builder.storage.dossier_index import DossierIndex
 
 logger = logging.getLogger(__name__)
 
+# Claim run files a re-evaluation reads
+_SESSION_INPUTS = (
+    "claim_facts.json",
+    "screening.json",
+    "coverage_analysis.json",
+    "assessment.json",
+)
+
+# Warm sessions per claim run, least recently used first
+_SESSIONS: "OrderedDict[Tuple[Path, str], ReevaluationSession]" = OrderedDict()
+_SESSIONS_LOCK = threading.Lock()
+_MAX_SESSIONS = 32
+
+
+def clear_reevaluation_sessions() -> None:
+    """Drop all warm re-evaluation sessions."""
+    with _SESSIONS_LOCK:
+        _SESSIONS.clear()
+
+
+def _input_signature(run_dir: Path) -> Tuple[Optional[int], ...]:
+    signature = []
+    for name in _SESSION_INPUTS:
+        try:
+            signature.append((run_dir / name).stat().st_mtime_ns)
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+@dataclass
+class ReevaluationSession:
+    """Inputs of one claim run, kept in memory for what-if re-evaluation.
+
+    The session stays valid until one of its input files changes.  The
+    coverage overrides carried over from the latest dossier are re-read
+    only when a newer dossier version appears.
+    """
+
+    claim_folder: Path
+    claim_run_id: str
+    facts: Optional[Dict[str, Any]]
+    screening: Optional[Dict[str, Any]]
+    coverage: Optional[Dict[str, Any]]
+    processing: Optional[Dict[str, Any]]
+    input_signature: Tuple[Optional[int], ...]
+    prior_version: int = -1
+    prior_overrides: Dict[str, bool] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def run_dir(self) -> Path:
+        return self.claim_folder / "claim_runs" / self.claim_run_id
+
+    @classmethod
+    def load(cls, claim_folder: Path, claim_run_id: str) -> "ReevaluationSession":
+        """Read a claim run's inputs from disk."""
+        run_dir = claim_folder / "claim_runs" / claim_run_id
+        signature = _input_signature(run_dir)
+        load = DecisionDossierService._load_json
+        return cls(
+            claim_folder=claim_folder,
+            claim_run_id=claim_run_id,
+            facts=load(run_dir / "claim_facts.json"),
+            screening=load(run_dir / "screening.json"),
+            coverage=load(run_dir / "coverage_analysis.json"),
+            processing=load(run_dir / "assessment.json"),
+            input_signature=signature,
+        )
+
+    @classmethod
+    def get(cls, claim_folder: Path, claim_run_id: str) -> "ReevaluationSession":
+        """Return the warm session for a claim run, (re)loading if stale."""
+        key = (claim_folder, claim_run_id)
+        with _SESSIONS_LOCK:
+            session = _SESSIONS.get(key)
+            if session is not None:
+                _SESSIONS.move_to_end(key)
+        if session is not None and session.is_current():
+            return session
+
+        session = cls.load(claim_folder, claim_run_id)
+        with _SESSIONS_LOCK:
+            _SESSIONS[key] = session
+            _SESSIONS.move_to_end(key)
+            while len(_SESSIONS) > _MAX_SESSIONS:
+                _SESSIONS.popitem(last=False)
+        return session
+
+    def is_current(self) -> bool:
+        return _input_signature(self.run_dir) == self.input_signature
+
+    def carried_overrides(self, index: DossierIndex) -> Dict[str, bool]:
+        """Coverage overrides recorded in the latest dossier of the run."""
+        latest = index.latest(self.claim_run_id)
+        version = latest["version"] if latest else 0
+        if version != self.prior_version:
+            prev = (
+                DecisionDossierService._load_json(self.run_dir / latest["filename"])
+                if latest
+                else None
+            )
+            self.prior_overrides = dict((prev or {}).get("coverage_overrides") or {})
+            self.prior_version = version
+        return self.prior_overrides
+
+    def evaluate(
+        self,
+        engine: Any,
+        claim_id: str,
+        assumptions: Dict[str, bool],
+        coverage_overrides: Dict[str, bool],
+    ) -> Dict[str, Any]:
+        """Evaluate the claim with overrides applied to the loaded inputs.
+
+        The engine gets its own copy of the inputs, so a plugin that
+        mutates them cannot affect later evaluations of the session.
+
+        Args:
+            coverage_overrides: Complete overrides (already merged with
+                those carried over from the previous dossier).
+        """
+        facts, screening, coverage, processing = copy.deepcopy(
+            (self.facts, self.screening, self.coverage, self.processing)
+        )
+        dossier = engine.evaluate(
+            claim_id=claim_id,
+            aggregated_facts=facts,
+            screening_result=screening,
+            coverage_analysis=apply_coverage_overrides(coverage, coverage_overrides),
+            processing_result=processing,
+            assumptions=assumptions,
+            coverage_overrides=coverage_overrides,
+        )
+
+        # Convert Pydantic model to dict if needed
+        if hasattr(dossier, "model_dump"):
+            dossier = dossier.model_dump()
+        return dossier
+
 
 class DecisionDossierService:
     """Service for reading, listing, and re-evaluating decision dossiers."""
@@ -27,47 +177,25 @@ class DecisionDossierService:
 
     def _find_claim_folder(self, claim_id: str) -> Optional[Path]:
         """Find the claim folder for a given claim ID."""
-        if (self.claims_dir / claim_id).exists():
-            return self.claims_dir / claim_id
-
-        for folder in self.claims_dir.iterdir():
-            if folder.is_dir() and claim_id in folder.name:
-                return folder
-
-        return None
+        return resolve_claim_folder(self.claims_dir, claim_id)
 
     def _get_latest_claim_run_id(self, claim_folder: Path) -> Optional[str]:
-        """Get the most recent claim run ID."""
-        runs_dir = claim_folder / "claim_runs"
-        if not runs_dir.exists():
-            return None
-
-        run_dirs = sorted(
-            [d for d in runs_dir.iterdir() if d.is_dir()],
-            key=lambda d: d.stat().st_mtime,
-            reverse=True,
-        )
-        return run_dirs[0].name if run_dirs else None
-
-    def _find_dossier_files(
-        self, claim_folder: Path, claim_run_id: Optional[str] = None
-    ) -> List[Path]:
-        """Find all decision_dossier_v*.json files for a claim."""
-        if claim_run_id:
-            run_dir = claim_folder / "claim_runs" / claim_run_id
-            if run_dir.exists():
-                return sorted(run_dir.glob("decision_dossier_v*.json"))
-            return []
-
-        # Search all claim runs
-        all_files = []
-        runs_dir = claim_folder / "claim_runs"
-        if runs_dir.exists():
-            for run_dir in runs_dir.iterdir():
-                if run_dir.is_dir():
-                    all_files.extend(run_dir.glob("decision_dossier_v*.json"))
+        """Get the most recent claim run ID (from the claim run catalog)."""
+        return ClaimRunStorage(claim_folder).get_latest_claim_run_id()
 
-        return sorted(all_files, key=lambda f: f.stat().st_mtime)
+    def _load_latest_dossier(
+        self, claim_folder: Path, claim_run_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Load the highest dossier version of a claim run (via the index)."""
+        path = DossierIndex(claim_folder).latest_path(claim_run_id)
+        if path is None:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to read dossier {path}: {e}")
+            return None
 
     def get_latest_dossier(
         self, claim_id: str, claim_run_id: Optional[str] = None
@@ -90,17 +218,7 @@ class DecisionDossierService:
         if not claim_run_id:
             return None
 
-        files = self._find_dossier_files(claim_folder, claim_run_id)
-        if not files:
-            return None
-
-        # Return the highest version (last in sorted list)
-        try:
-            with open(files[-1], "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to read dossier {files[-1]}: {e}")
-            return None
+        return self._load_latest_dossier(claim_folder, claim_run_id)
 
     def list_versions(
         self, claim_id: str, claim_run_id: Optional[str] = None
@@ -123,27 +241,10 @@ class DecisionDossierService:
         if not claim_run_id:
             return []
 
-        files = self._find_dossier_files(claim_folder, claim_run_id)
-        versions = []
-
-        for f in files:
-            try:
-                with open(f, "r", encoding="utf-8") as fp:
-                    data = json.load(fp)
-                versions.append({
-                    "version": data.get("version", 0),
-                    "claim_verdict": data.get("claim_verdict"),
-                    "evaluation_timestamp": data.get("evaluation_timestamp"),
-                    "engine_id": data.get("engine_id"),
-                    "failed_clauses_count": len(data.get("failed_clauses", [])),
-                    "unresolved_count": len(data.get("unresolved_assumptions", [])),
-                    "claim_run_id": claim_run_id,
-                    "filename": f.name,
-                })
-            except Exception as e:
-                logger.warning(f"Failed to read dossier metadata from {f}: {e}")
-
-        return versions
+        return [
+            {**summary, "claim_run_id": claim_run_id}
+            for summary in DossierIndex(claim_folder).versions(claim_run_id)
+        ]
 
     def get_version(
         self, claim_id: str, version: int, claim_run_id: Optional[str] = None
@@ -209,96 +310,39 @@ class DecisionDossierService:
         if not claim_run_id:
             return None
 
-        # Load engine
+        # Engine instances are cached by the plugin registry (a stat per call)
         engine = load_engine_from_workspace(self.workspace_path)
         if engine is None:
             engine = DefaultDecisionEngine(self.workspace_path)
 
-        # Load aggregated facts
-        run_dir = claim_folder / "claim_runs" / claim_run_id
-        facts = self._load_json(run_dir / "claim_facts.json")
-
-        # Load screening result
-        screening = self._load_json(run_dir / "screening.json")
-
-        # Load coverage analysis
-        coverage = self._load_json(run_dir / "coverage_analysis.json")
-
-        # Load processing result (assessment)
-        processing = self._load_json(run_dir / "assessment.json")
-
-        if not facts:
+        # Facts and upstream results stay loaded between what-if edits
+        session = ReevaluationSession.get(claim_folder, claim_run_id)
+        if not session.facts:
             logger.warning(f"No claim facts found for {claim_id} in run {claim_run_id}")
             return None
 
-        # Merge coverage overrides: previous dossier + new (new wins)
-        merged_overrides: Dict[str, bool] = {}
-        existing_dossier_files = self._find_dossier_files(claim_folder, claim_run_id)
-        if existing_dossier_files:
-            prev = self._load_json(existing_dossier_files[-1])
-            if prev:
-                merged_overrides.update(prev.get("coverage_overrides", {}))
-        merged_overrides.update(coverage_overrides)
-
-        # Apply coverage overrides to coverage data before engine evaluation
-        if merged_overrides and coverage:
-            import copy
-            coverage = copy.deepcopy(coverage)
-            line_items = coverage.get("line_items", [])
-            for key, is_covered in merged_overrides.items():
-                if key.startswith("item_"):
-                    try:
-                        idx = int(key[5:])
-                        if 0 <= idx < len(line_items):
-                            item = line_items[idx]
-                            total_price = float(item.get("total_price", 0) or 0)
-                            if is_covered:
-                                item["coverage_status"] = "covered"
-                                item["covered_amount"] = total_price
-                                item["not_covered_amount"] = 0
-                            else:
-                                item["coverage_status"] = "not_covered"
-                                item["covered_amount"] = 0
-                                item["not_covered_amount"] = total_price
-                    except (ValueError, IndexError):
-                        pass
-
+        index = DossierIndex(claim_folder)
         try:
-            # Run evaluation with assumptions
-            dossier = engine.evaluate(
-                claim_id=claim_id,
-                aggregated_facts=facts,
-                screening_result=screening,
-                coverage_analysis=coverage,
-                processing_result=processing,
-                assumptions=assumptions,
-                coverage_overrides=merged_overrides,
-            )
-
-            # Convert Pydantic model to dict if needed
-            if hasattr(dossier, "model_dump"):
-                dossier = dossier.model_dump()
-
-            # Determine next version
-            existing = self._find_dossier_files(claim_folder, claim_run_id)
-            max_version = 0
-            for f in existing:
-                try:
-                    v = int(f.stem.split("_v")[-1])
-                    max_version = max(max_version, v)
-                except (ValueError, IndexError):
-                    continue
-
-            next_version = max_version + 1
-            dossier["version"] = next_version
-
-            # Write new version
-            storage = ClaimRunStorage(claim_folder)
-            filename = f"decision_dossier_v{next_version}.json"
-            storage.write_to_claim_run(claim_run_id, filename, dossier)
+            # One evaluation at a time per run, so versions do not collide
+            with session.lock:
+                # Merge coverage overrides: previous dossier + new (new wins)
+                merged_overrides = {
+                    **session.carried_overrides(index),
+                    **coverage_overrides,
+                }
+
+                dossier = session.evaluate(
+                    engine, claim_id, assumptions, merged_overrides
+                )
+                dossier["version"] = index.next_version(claim_run_id)
+
+                # Write new version
+                path = ClaimRunStorage(claim_folder).write_dossier(claim_run_id, dossier)
+                session.prior_version = dossier["version"]
+                session.prior_overrides = dict(merged_overrides)
 
             logger.info(
-                f"Wrote {filename} for {claim_id} (assumptions override)"
+                f"Wrote {path.name} for {claim_id} (assumptions override)"
             )
             return dossier
 
@@ -338,9 +382,7 @@ class DecisionDossierService:
             claim_run_id = self._get_latest_claim_run_id(claim_folder)
             if not claim_run_id:
                 continue
-            run_dir = claim_folder / "claim_runs" / claim_run_id
-            dossier_files = list(run_dir.glob("decision_dossier_v*.json"))
-            if dossier_files:
+            if DossierIndex(claim_folder).latest(claim_run_id):
                 result.append(claim_folder.name)
 
         return result
@@ -371,10 +413,7 @@ class DecisionDossierService:
         confidence_summary = self._load_json(run_dir / "confidence_summary.json")
 
         # Get latest dossier
-        dossier_files = self._find_dossier_files(claim_folder, claim_run_id)
-        dossier = None
-        if dossier_files:
-            dossier = self._load_json(dossier_files[-1])
+        dossier = self._load_latest_dossier(claim_folder, claim_run_id)
 
         # List documents
         docs_dir = claim_folder / "docs"
@@ -4,13 +4,18 @@ from __future__ import annotations
 
 import json
 import logging
-from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from context_builder.schemas.decision_record import ScopeSnapshot, VersionBundle
+from context_builder.storage.evolution_log import (
+    MAX_SKIP_RUNS,
+    EvolutionLog,
+    accuracy_counts,
+    apply_event,
+    bundle_event,
+)
 from context_builder.storage.version_bundles import VersionBundleStore
 
 logger = logging.getLogger(__name__)
@@ -88,89 +93,25 @@ class EvolutionService:
     def __init__(self, data_dir: Path):
         self.data_dir = Path(data_dir)
         self.bundle_store = VersionBundleStore(data_dir)
+        self.evolution_log = EvolutionLog(self.bundle_store.storage_dir)
 
     def get_evolution_timeline(self) -> Dict[str, Any]:
         """Get the full evolution timeline with scope and accuracy metrics.
 
+        Reads the incrementally materialized evolution log; the bundles are
+        only scanned when no snapshot exists yet (see rebuild_timeline).
+
         Returns:
             EvolutionSummary as a dict with timeline, scope_growth, accuracy_trend.
         """
-        # Get all bundles
-        all_bundles = self.bundle_store.get_all_bundles()
+        groups = self.evolution_log.load_groups()
+        if groups is None:
+            groups = self.rebuild_timeline()
 
-        if not all_bundles:
+        if not groups:
             return self._empty_summary()
 
-        # Group bundles by extraction_spec_hash
-        spec_groups: Dict[str, List[tuple[str, VersionBundle]]] = defaultdict(list)
-        for run_id, bundle in all_bundles:
-            spec_hash = bundle.extraction_spec_hash or "unknown"
-            spec_groups[spec_hash].append((run_id, bundle))
-
-        # Build timeline data points
-        timeline: List[EvolutionDataPoint] = []
-
-        for spec_hash, bundles in spec_groups.items():
-            # Sort by created_at within group
-            bundles.sort(key=lambda x: x[1].created_at)
-
-            first_bundle = bundles[0][1]
-            last_bundle = bundles[-1][1]
-
-            # Use most recent run as representative
-            representative_run_id = bundles[-1][0]
-
-            # Get scope from snapshot (prefer last bundle's snapshot)
-            scope = last_bundle.scope_snapshot or first_bundle.scope_snapshot
-            if scope:
-                doc_types_list = scope.doc_types
-                doc_types_count = len(scope.doc_types)
-                total_fields = scope.total_fields
-                fields_by_type = scope.fields_by_type
-            else:
-                doc_types_list = []
-                doc_types_count = 0
-                total_fields = 0
-                fields_by_type = {}
-
-            # Get accuracy from eval summary
-            eval_summary = self._get_eval_summary(representative_run_id)
-            accuracy_rate = None
-            correct_count = 0
-            incorrect_count = 0
-            missing_count = 0
-            docs_evaluated = 0
-
-            if eval_summary:
-                correct_count = eval_summary.get("correct", 0)
-                incorrect_count = eval_summary.get("incorrect", 0)
-                missing_count = eval_summary.get("missing", 0)
-                docs_evaluated = eval_summary.get("docs_evaluated", 0)
-
-                total_outcomes = correct_count + incorrect_count + missing_count
-                if total_outcomes > 0:
-                    accuracy_rate = round(100 * correct_count / total_outcomes, 1)
-
-            point = EvolutionDataPoint(
-                spec_hash=spec_hash[:12],  # Short hash for display
-                first_seen=first_bundle.created_at,
-                last_seen=last_bundle.created_at,
-                bundle_count=len(bundles),
-                doc_types_count=doc_types_count,
-                doc_types_list=doc_types_list,
-                total_fields=total_fields,
-                fields_by_type=fields_by_type,
-                representative_run_id=representative_run_id,
-                accuracy_rate=accuracy_rate,
-                correct_count=correct_count,
-                incorrect_count=incorrect_count,
-                missing_count=missing_count,
-                docs_evaluated=docs_evaluated,
-                model_name=last_bundle.model_name,
-                contextbuilder_version=last_bundle.contextbuilder_version,
-                git_commit=last_bundle.git_commit[:8] if last_bundle.git_commit else None,
-            )
-            timeline.append(point)
+        timeline = [self._group_to_datapoint(group) for group in groups.values()]
 
         # Sort timeline by first_seen
         timeline.sort(key=lambda x: x.first_seen)
@@ -193,6 +134,61 @@ class EvolutionService:
             "doc_type_matrix": [self._doc_type_evolution_to_dict(d) for d in doc_type_matrix],
         }
 
+    def rebuild_timeline(self) -> Dict[str, Dict[str, Any]]:
+        """Recompute the evolution snapshot from all bundles and eval summaries.
+
+        This is the slow path (it loads every run's bundle); it runs when
+        the snapshot is missing and can be called to repair it.
+
+        Returns:
+            Spec groups keyed by full extraction spec hash.
+        """
+        log_offset = self.evolution_log.log_size()
+        state: Dict[str, Any] = {}
+
+        # Bundles are sorted by created_at, so the last one folded into a
+        # group is its most recent run (the representative).
+        bundles = self.bundle_store.get_all_bundles()
+        for run_id, bundle in bundles:
+            apply_event(state, bundle_event(run_id, bundle))
+
+        groups: Dict[str, Dict[str, Any]] = state.get("groups", {})
+        for group in groups.values():
+            eval_summary = self._get_eval_summary(group["representative_run_id"])
+            group.update(accuracy_counts(eval_summary))
+
+        # Bundles saved during the scan are also logged after log_offset
+        skip_runs = [run_id for run_id, _ in bundles[-MAX_SKIP_RUNS:]]
+        self.evolution_log.write_snapshot(groups, log_offset, skip_runs)
+        logger.info(f"Rebuilt evolution timeline with {len(groups)} spec versions")
+        return groups
+
+    @staticmethod
+    def _group_to_datapoint(group: Dict[str, Any]) -> EvolutionDataPoint:
+        """Convert a materialized spec group to a timeline data point."""
+        # Prefer the most recent bundle's scope snapshot
+        scope = group.get("last_scope") or group.get("first_scope") or {}
+        git_commit = group.get("git_commit")
+        return EvolutionDataPoint(
+            spec_hash=group["spec_hash"][:12],  # Short hash for display
+            first_seen=group["first_seen"],
+            last_seen=group["last_seen"],
+            bundle_count=group["bundle_count"],
+            doc_types_count=len(scope.get("doc_types", [])),
+            doc_types_list=scope.get("doc_types", []),
+            total_fields=scope.get("total_fields", 0),
+            fields_by_type=scope.get("fields_by_type", {}),
+            representative_run_id=group["representative_run_id"],
+            accuracy_rate=group.get("accuracy_rate"),
+            correct_count=group.get("correct_count", 0),
+            incorrect_count=group.get("incorrect_count", 0),
+            missing_count=group.get("missing_count", 0),
+            docs_evaluated=group.get("docs_evaluated", 0),
+            model_name=group["model_name"],
+            contextbuilder_version=group["contextbuilder_version"],
+            git_commit=git_commit[:8] if git_commit else None,
+        )
+
     def get_doc_type_matrix(self) -> Dict[str, Any]:
         """Get just the doc type evolution matrix.
 
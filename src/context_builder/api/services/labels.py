@@ -15,6 +15,7 @@ from context_builder.api.services.utils import extract_claim_number
 from context_builder.storage import StorageFacade
 from context_builder.storage.truth_store import TruthStore
 from context_builder.storage.index_builder import upsert_label_entry
+from context_builder.storage.label_history import label_index_entry
 from context_builder.storage.workspace_paths import get_workspace_logs_dir
 from context_builder.services.decision_ledger import DecisionLedger
 from context_builder.schemas.decision_record import (
@@ -386,32 +387,7 @@ class LabelsService:
             return
 
         try:
-            # Count field states
-            field_labels = label_data.get("field_labels", [])
-            labeled_count = sum(
-                1 for fl in field_labels if fl.get("state") == "LABELED"
-            )
-            unverifiable_count = sum(
-                1 for fl in field_labels if fl.get("state") == "UNVERIFIABLE"
-            )
-            unlabeled_count = sum(
-                1 for fl in field_labels if fl.get("state") == "UNLABELED"
-            )
-
-            # Get updated_at from review metadata
-            review = label_data.get("review", {})
-            updated_at = review.get("reviewed_at")
-
-            label_entry = {
-                "doc_id": label_data.get("doc_id"),
-                "claim_id": label_data.get("claim_id"),
-                "has_label": True,
-                "labeled_count": labeled_count,
-                "unverifiable_count": unverifiable_count,
-                "unlabeled_count": unlabeled_count,
-                "updated_at": updated_at,
-            }
-
+            label_entry = label_index_entry(label_data)
             upsert_label_entry(self.registry_dir, label_entry)
         except Exception as e:
             logger.warning(f"Failed to update label index: {e}")
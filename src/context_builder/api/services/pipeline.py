@@ -1,7 +1,6 @@
 """Pipeline service for async pipeline execution with real-time progress."""
 
 import asyncio
-import json
 import logging
 import threading
 from dataclasses import dataclass, field
@@ -813,6 +812,7 @@ class PipelineService:
 
         # Use FileStorage API to delete run data and claims
         storage = FileStorage(self.output_dir.parent)
+        run_claims = storage.get_claims_for_run(run_id)
         success, claims_affected, claims_deleted = storage.delete_run(
             run_id, delete_claims=delete_claims
         )
@@ -821,8 +821,8 @@ class PipelineService:
             logger.warning(f"Failed to delete run {run_id} via storage API")
             return False
 
-        # Rebuild all indexes to remove stale entries
-        self._rebuild_all_indexes()
+        # Drop the run and refresh its claims in the indexes
+        self._update_claim_indexes(run_claims, run_id)
 
         logger.info(
             f"Deleted pipeline run: {run_id} "
@@ -834,7 +834,11 @@ class PipelineService:
         """Rebuild the run index after a run is added or deleted."""
         try:
             from context_builder.storage.index_builder import build_run_index
-            from context_builder.storage.index_reader import RUN_INDEX_FILE, write_jsonl
+            from context_builder.storage.index_reader import (
+                RUN_INDEX_FILE,
+                notify_registry_changed,
+                write_jsonl,
+            )
 
             output_dir = self.output_dir.parent  # output/
             registry_dir = output_dir / "registry"
@@ -846,23 +850,24 @@ class PipelineService:
             run_records = build_run_index(output_dir)
             run_index_path = registry_dir / RUN_INDEX_FILE
             write_jsonl(run_index_path, run_records)
+            notify_registry_changed(registry_dir, RUN_INDEX_FILE)
             logger.info(f"Rebuilt run index with {len(run_records)} runs")
         except Exception as e:
             logger.warning(f"Failed to rebuild run index: {e}")
 
-    def _rebuild_all_indexes(self) -> None:
-        """Rebuild all indexes after a deletion (doc, run, label)."""
+    def _update_claim_indexes(self, claim_ids: List[str], run_id: str) -> None:
+        """Re-index the claims and global run touched by a run (doc, run, claims)."""
         try:
-            from context_builder.storage.index_builder import build_all_indexes
+            from context_builder.storage.index_builder import update_claim_indexes
 
             output_dir = self.output_dir.parent  # output/
-            stats = build_all_indexes(output_dir)
+            stats = update_claim_indexes(output_dir, claim_ids, [run_id])
             logger.info(
-                f"Rebuilt all indexes: {stats.get('doc_count', 0)} docs, "
-                f"{stats.get('run_count', 0)} runs, {stats.get('label_count', 0)} labels"
+                f"Updated indexes ({stats['mode']}): {stats['claims_updated']} claims, "
+                f"{stats['runs_updated']} runs"
             )
         except Exception as e:
-            logger.warning(f"Failed to rebuild indexes: {e}")
+            logger.warning(f"Failed to update indexes: {e}")
 
     def _persist_run(self, run: PipelineRun) -> None:
         """Persist run to disk for visibility in other screens.
@@ -1005,21 +1010,14 @@ class PipelineService:
         run_root: Path,
         summary_data: dict,
     ) -> None:
-        """Rebuild all indexes after pipeline completion.
+        """Update indexes for the run's claims after pipeline completion.
 
         This ensures indexes stay in sync with newly processed documents.
-        Matches CLI behavior which auto-builds indexes after pipeline completion.
+        Matches CLI behavior which updates indexes after pipeline completion.
         """
-        try:
-            from context_builder.storage.index_builder import build_all_indexes
-            logger.info("Rebuilding indexes after pipeline completion...")
-            stats = build_all_indexes(self.output_dir.parent)
-            logger.info(
-                f"Indexes rebuilt: {stats.get('doc_count', 0)} docs, "
-                f"{stats.get('run_count', 0)} runs, {stats.get('label_count', 0)} labels"
-            )
-        except Exception as e:
-            logger.warning(f"Index rebuild failed (non-fatal): {e}")
+        logger.info("Updating indexes after pipeline completion...")
+        claim_ids = list(dict.fromkeys(doc.claim_id for doc in run.docs.values()))
+        self._update_claim_indexes(claim_ids or run.claim_ids, run.run_id)
 
     def _append_to_run_index(
         self,
@@ -1031,13 +1029,10 @@ class PipelineService:
 
         This allows the run to be immediately visible without rebuilding the full index.
         """
+        from context_builder.storage.index_builder import append_run_entry
+
         # Registry is at output/registry/ (sibling to output/claims/ and output/runs/)
         registry_dir = self.output_dir.parent / "registry"
-        run_index_path = registry_dir / "run_index.jsonl"
-
-        if not run_index_path.exists():
-            logger.debug("No run index exists, skipping index update")
-            return
 
         try:
             # Build index record matching the format from index_builder.build_run_index()
@@ -1051,11 +1046,8 @@ class PipelineService:
                 "run_root": str(run_root.relative_to(self.output_dir.parent.parent)),
             }
 
-            # Append to JSONL file
-            with open(run_index_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
-
-            logger.info(f"Appended run {run.run_id} to index")
+            if append_run_entry(registry_dir, record):
+                logger.info(f"Appended run {run.run_id} to index")
         except Exception as e:
             logger.warning(f"Failed to append to run index: {e}")
 
@@ -335,6 +335,26 @@ class ReconciliationService:
     # Fact names that should use VIN normalization before comparison.
     _VIN_FACT_NAMES = {"vin", "chassis_number", "fahrgestellnummer", "vehicle_id"}
 
+    @classmethod
+    def _comparison_value(cls, candidate: dict, is_vin_fact: bool) -> Optional[str]:
+        """Return the string a candidate is compared on.
+
+        Uses the normalized value (or the raw value if there is none), with VIN
+        normalization applied for VIN-like facts.
+
+        Returns:
+            The comparison string, or None if the candidate has no value.
+        """
+        val = candidate.get("normalized_value") or candidate.get("value")
+        if val is None:
+            return None
+        # Convert to string for comparison
+        val_str = str(val)
+        # Apply VIN-specific normalization (O→0, I→1, Q→9)
+        if is_vin_fact:
+            val_str = cls._normalize_vin(val_str)
+        return val_str
+
     def detect_conflicts(
         self, candidates: Dict[str, List[dict]]
     ) -> List[FactConflict]:
@@ -343,6 +363,11 @@ class ReconciliationService:
         A conflict exists when the same fact has different normalized values
         from different documents.
 
+        Candidates are indexed in one pass by fact name and comparison value;
+        a fact conflicts when it has more than one value group.  Sources and
+        confidences are only materialized for conflicting facts, which are
+        rare, so agreeing facts cost a single dict insert per candidate.
+
         Args:
             candidates: Dict mapping field names to candidate values
                        (from AggregationService.build_candidates).
@@ -350,7 +375,7 @@ class ReconciliationService:
         Returns:
             List of FactConflict objects.
         """
-        conflicts = []
+        conflicting: Dict[str, Dict[str, List[dict]]] = {}
 
         for fact_name, candidate_list in candidates.items():
             if len(candidate_list) < 2:
@@ -360,61 +385,61 @@ class ReconciliationService:
             is_vin_fact = fact_name.lower() in self._VIN_FACT_NAMES
 
             # Group by normalized value (or raw value if no normalized)
-            values_to_sources: Dict[str, List[ConflictSource]] = defaultdict(list)
-            value_to_confidence: Dict[str, float] = {}
-
+            groups: Dict[str, List[dict]] = {}
             for candidate in candidate_list:
-                val = candidate.get("normalized_value") or candidate.get("value")
-                if val is None:
-                    continue
+                val_str = self._comparison_value(candidate, is_vin_fact)
+                if val_str is not None:
+                    groups.setdefault(val_str, []).append(candidate)
 
-                # Convert to string for comparison
-                val_str = str(val)
+            # If more than one distinct value, it's a conflict
+            if len(groups) > 1:
+                conflicting[fact_name] = groups
 
-                # Apply VIN-specific normalization (O→0, I→1, Q→9)
-                if is_vin_fact:
-                    val_str = self._normalize_vin(val_str)
-                doc_id = candidate.get("doc_id", "unknown")
-                doc_type = candidate.get("doc_type", "unknown")
-                filename = candidate.get("filename", f"{doc_id}.pdf")
-                confidence = candidate.get("confidence", 0.0)
+        return [
+            self._build_conflict(fact_name, groups)
+            for fact_name, groups in conflicting.items()
+        ]
 
+    @staticmethod
+    def _build_conflict(
+        fact_name: str, groups: Dict[str, List[dict]]
+    ) -> FactConflict:
+        """Build a FactConflict from candidates grouped by comparison value."""
+        values_to_sources: Dict[str, List[ConflictSource]] = {}
+        value_to_confidence: Dict[str, float] = {}
+
+        for val_str, group in groups.items():
+            sources = []
+            for candidate in group:
+                doc_id = candidate.get("doc_id", "unknown")
                 # Create ConflictSource with full provenance
-                source = ConflictSource(
-                    doc_id=doc_id,
-                    doc_type=doc_type,
-                    filename=filename,
-                )
-                values_to_sources[val_str].append(source)
-
-                # Track highest confidence per value
-                if val_str not in value_to_confidence:
-                    value_to_confidence[val_str] = confidence
-                else:
-                    value_to_confidence[val_str] = max(
-                        value_to_confidence[val_str], confidence
+                sources.append(
+                    ConflictSource(
+                        doc_id=doc_id,
+                        doc_type=candidate.get("doc_type", "unknown"),
+                        filename=candidate.get("filename", f"{doc_id}.pdf"),
                     )
-
-            # If more than one distinct value, it's a conflict
-            if len(values_to_sources) > 1:
-                # Find selected value (highest confidence)
-                selected_value = max(
-                    value_to_confidence.keys(),
-                    key=lambda v: value_to_confidence[v],
                 )
+            values_to_sources[val_str] = sources
+            # Track highest confidence per value
+            value_to_confidence[val_str] = max(
+                c.get("confidence", 0.0) for c in group
+            )
 
-                conflicts.append(
-                    FactConflict(
-                        fact_name=fact_name,
-                        values=list(values_to_sources.keys()),
-                        sources=list(values_to_sources.values()),
-                        selected_value=selected_value,
-                        selected_confidence=value_to_confidence[selected_value],
-                        selection_reason="highest_confidence",
-                    )
-                )
+        # Find selected value (highest confidence, first seen on ties)
+        selected_value = max(
+            value_to_confidence.keys(),
+            key=lambda v: value_to_confidence[v],
+        )
 
-        return conflicts
+        return FactConflict(
+            fact_name=fact_name,
+            values=list(values_to_sources.keys()),
+            sources=list(values_to_sources.values()),
+            selected_value=selected_value,
+            selected_confidence=value_to_confidence[selected_value],
+            selection_reason="highest_confidence",
+        )
 
     def evaluate_gate(
         self,
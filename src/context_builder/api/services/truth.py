@@ -4,32 +4,48 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, List, Optional
 
 from context_builder.storage import FileStorage
+from context_builder.storage.truth_catalog import (
+    TruthCatalog,
+    TruthCatalogEntry,
+    TruthDocInstance,
+)
 from context_builder.storage.truth_store import TruthStore
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class DocInstance:
-    doc_id: str
-    claim_id: str
-    doc_type: str
-    original_filename: str
+# Document instances come from the doc index (or the truth catalog).
+DocInstance = TruthDocInstance
+
+# Field states that can produce each comparison outcome.
+_OUTCOME_STATES = {
+    "correct": ("LABELED", "CONFIRMED"),
+    "incorrect": ("LABELED", "CONFIRMED"),
+    "missing": ("LABELED", "CONFIRMED"),
+    "unverifiable": ("UNVERIFIABLE",),
+    "unlabeled": ("UNLABELED",),
+}
 
 
 class TruthService:
-    """Service for listing canonical truth entries with run comparisons."""
+    """Service for listing canonical truth entries with run comparisons.
+
+    Filters run against the truth catalog; only the truth files of matching
+    entries are opened to build per-run field rows.  Document instances are
+    resolved per listing from the doc index, so documents ingested after a
+    truth save are included and deleted claims are not.
+    """
 
     def __init__(self, claims_dir: Path):
         self.claims_dir = claims_dir
         self.output_root = claims_dir.parent
         self.truth_root = self.output_root / "registry" / "truth"
+        self.catalog = TruthCatalog(self.output_root / "registry")
         self.storage = FileStorage(self.output_root)
 
     def list_truth_entries(
@@ -53,51 +69,44 @@ class TruthService:
                 return {"runs": [], "entries": []}
 
         runs = self._list_runs(run_id)
-        file_index = self._build_file_md5_index(doc_type, claim_id, filename, search)
+        catalog = self.catalog.entries()
 
         reviewed_after_dt = self._parse_dt(reviewed_after)
         reviewed_before_dt = self._parse_dt(reviewed_before)
 
-        entries: List[Dict[str, Any]] = []
-        for truth_path in self._iter_truth_files():
-            try:
-                with open(truth_path, "r", encoding="utf-8") as f:
-                    truth = json.load(f)
-            except (json.JSONDecodeError, IOError) as exc:
-                logger.warning("Failed to load truth file %s: %s", truth_path, exc)
-                continue
-
-            file_md5_value = (
-                truth.get("input_hashes", {}).get("file_md5")
-                or truth_path.parent.name
-            )
-            if file_md5 and file_md5_value != file_md5:
-                continue
+        if file_md5:
+            candidates = [catalog[file_md5]] if file_md5 in catalog else []
+        else:
+            candidates = list(catalog.values())
 
-            review = truth.get("review", {})
-            reviewer_value = review.get("reviewer", "")
-            if reviewer and reviewer_value != reviewer:
+        entries: List[Dict[str, Any]] = []
+        for item in candidates:
+            if reviewer and item.reviewer != reviewer:
                 continue
 
-            reviewed_at = review.get("reviewed_at")
-            if reviewed_at:
-                reviewed_dt = self._parse_dt(reviewed_at)
+            if item.reviewed_at:
+                reviewed_dt = self._parse_dt(item.reviewed_at)
                 if reviewed_after_dt and reviewed_dt and reviewed_dt < reviewed_after_dt:
                     continue
                 if reviewed_before_dt and reviewed_dt and reviewed_dt > reviewed_before_dt:
                     continue
 
-            doc_instances = file_index.get(file_md5_value, [])
-            if doc_type and not any(d.doc_type == doc_type for d in doc_instances):
+            doc_instances = self._filter_doc_instances(
+                item, self._resolve_doc_instances(item), doc_type, claim_id, filename, search
+            )
+            if (doc_type or claim_id or filename) and not doc_instances:
                 continue
-            if claim_id and not any(d.claim_id == claim_id for d in doc_instances):
+
+            if outcome and not self._may_have_outcome(item, runs, field_name, state, outcome):
                 continue
-            if filename and not any(filename.lower() in d.original_filename.lower() for d in doc_instances):
+
+            truth = self._load_truth(item.file_md5)
+            if truth is None:
                 continue
 
             field_rows = self._build_field_rows(
                 truth=truth,
-                file_md5=file_md5_value,
+                file_md5=item.file_md5,
                 doc_instances=doc_instances,
                 runs=runs,
                 field_name=field_name,
@@ -108,9 +117,9 @@ class TruthService:
                 continue
 
             entry = {
-                "file_md5": file_md5_value,
+                "file_md5": item.file_md5,
                 "content_md5": truth.get("input_hashes", {}).get("content_md5", ""),
-                "review": review,
+                "review": truth.get("review", {}),
                 "doc_labels": truth.get("doc_labels", {}),
                 "source_doc_ref": truth.get("source_doc_ref", {}),
                 "doc_instances": [
@@ -128,13 +137,14 @@ class TruthService:
 
         return {"runs": runs, "entries": entries}
 
-    def _iter_truth_files(self) -> Iterable[Path]:
-        for truth_dir in self.truth_root.iterdir():
-            if not truth_dir.is_dir():
-                continue
-            truth_file = truth_dir / "latest.json"
-            if truth_file.exists():
-                yield truth_file
+    def _load_truth(self, file_md5: str) -> Optional[Dict[str, Any]]:
+        truth_path = self.truth_root / file_md5 / "latest.json"
+        try:
+            with open(truth_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as exc:
+            logger.warning("Failed to load truth file %s: %s", truth_path, exc)
+            return None
 
     def _has_truth_entries(self) -> bool:
         if not self.truth_root.exists():
@@ -151,64 +161,89 @@ class TruthService:
             return [run_id]
         return [r.run_id for r in self.storage.list_runs()]
 
-    def _build_file_md5_index(
-        self,
+    def _resolve_doc_instances(self, item: TruthCatalogEntry) -> List[DocInstance]:
+        """Documents currently ingested from the entry's source file.
+
+        Uses the doc index; the instances recorded in the catalog at save
+        time are only the fallback when there is no index.  Instances whose
+        claim folder no longer exists are dropped either way.
+        """
+        refs = self.storage.get_docs_by_file_md5(item.file_md5)
+        if refs is None:
+            candidates = [(d, d.claim_id) for d in item.doc_instances]
+        else:
+            candidates = [
+                (
+                    DocInstance(
+                        doc_id=ref.doc_id,
+                        claim_id=ref.claim_id,
+                        doc_type=ref.doc_type,
+                        original_filename=ref.filename,
+                    ),
+                    ref.claim_folder,
+                )
+                for ref in refs
+            ]
+
+        instances: List[DocInstance] = []
+        seen = set()
+        for instance, claim_folder in candidates:
+            key = (instance.doc_id, instance.claim_id)
+            if key in seen or not (self.claims_dir / claim_folder).is_dir():
+                continue
+            seen.add(key)
+            instances.append(instance)
+        return instances
+
+    @staticmethod
+    def _filter_doc_instances(
+        item: TruthCatalogEntry,
+        doc_instances: List[DocInstance],
         doc_type: Optional[str],
         claim_id: Optional[str],
         filename: Optional[str],
         search: Optional[str],
-    ) -> Dict[str, List[DocInstance]]:
-        index: Dict[str, List[DocInstance]] = {}
-        for claim_dir in self.claims_dir.iterdir():
-            if not claim_dir.is_dir() or claim_dir.name.startswith("."):
+    ) -> List[DocInstance]:
+        instances: List[DocInstance] = []
+        for doc_instance in doc_instances:
+            if doc_type and doc_instance.doc_type != doc_type:
                 continue
-
-            docs_dir = claim_dir / "docs"
-            if not docs_dir.exists():
+            if claim_id and doc_instance.claim_id != claim_id:
                 continue
-
-            for doc_dir in docs_dir.iterdir():
-                if not doc_dir.is_dir():
-                    continue
-                meta_path = doc_dir / "meta" / "doc.json"
-                if not meta_path.exists():
-                    continue
-                try:
-                    with open(meta_path, "r", encoding="utf-8") as f:
-                        meta = json.load(f)
-                except (json.JSONDecodeError, IOError):
-                    continue
-
-                file_md5 = meta.get("file_md5")
-                if not file_md5:
+            if filename and filename.lower() not in doc_instance.original_filename.lower():
+                continue
+            if search:
+                search_lower = search.lower()
+                if (
+                    search_lower not in doc_instance.original_filename.lower()
+                    and search_lower not in doc_instance.doc_id.lower()
+                    and search_lower not in doc_instance.claim_id.lower()
+                    and search_lower not in item.file_md5.lower()
+                ):
                     continue
+            instances.append(doc_instance)
+        return instances
 
-                doc_instance = DocInstance(
-                    doc_id=meta.get("doc_id", doc_dir.name),
-                    claim_id=meta.get("claim_id", claim_dir.name),
-                    doc_type=meta.get("doc_type", "unknown"),
-                    original_filename=meta.get("original_filename", ""),
-                )
-
-                if doc_type and doc_instance.doc_type != doc_type:
-                    continue
-                if claim_id and doc_instance.claim_id != claim_id:
-                    continue
-                if filename and filename.lower() not in doc_instance.original_filename.lower():
-                    continue
-                if search:
-                    search_lower = search.lower()
-                    if (
-                        search_lower not in doc_instance.original_filename.lower()
-                        and search_lower not in doc_instance.doc_id.lower()
-                        and search_lower not in doc_instance.claim_id.lower()
-                        and search_lower not in file_md5.lower()
-                    ):
-                        continue
-
-                index.setdefault(file_md5, []).append(doc_instance)
-
-        return index
+    @staticmethod
+    def _may_have_outcome(
+        item: TruthCatalogEntry,
+        runs: List[str],
+        field_name: Optional[str],
+        state: Optional[str],
+        outcome: str,
+    ) -> bool:
+        """Cheap pre-check: can any selected field produce ``outcome``?"""
+        if not runs:
+            return False
+        allowed = _OUTCOME_STATES.get(outcome, ())
+        for name, label_state in item.field_states.items():
+            if field_name and name != field_name:
+                continue
+            if state and label_state != state:
+                continue
+            if label_state in allowed:
+                return True
+        return False
 
     def _build_field_rows(
         self,
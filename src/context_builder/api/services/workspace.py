@@ -353,7 +353,10 @@ class WorkspaceService:
         return True
 
     # Directories to clear during reset (DATA directories)
-    DATA_DIRS = ["claims", "runs", "logs", "registry", "version_bundles", ".pending", ".input"]
+    DATA_DIRS = [
+        "claims", "runs", "logs", "registry", "version_bundles", "config_snapshots",
+        ".pending", ".input",
+    ]
 
     def reset_workspace(
         self,
@@ -372,6 +375,7 @@ class WorkspaceService:
         - logs/ - compliance logs (decisions.jsonl, llm_calls.jsonl)
         - registry/ - indexes and labels
         - version_bundles/ - version snapshots
+        - config_snapshots/ - config snapshots referenced by runs
         - .pending/ - pending uploads
         - .input/ - input staging
 
@@ -18,5 +18,6 @@ import context_builder.cli.cmd_coverage  # noqa: F401
 import context_builder.cli.cmd_reconcile  # noqa: F401
 import context_builder.cli.cmd_pipeline  # noqa: F401
 import context_builder.cli.cmd_assess  # noqa: F401
+import context_builder.cli.cmd_confidence  # noqa: F401
 
 __all__ = ["app", "parse_stages"]
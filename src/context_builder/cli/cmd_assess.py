@@ -54,6 +54,13 @@ def assess_cmd(
         help="Process N claims in parallel (1-8, default: 1 = sequential)",
         min=1, max=8,
     ),
+    force_stage: Optional[List[str]] = typer.Option(
+        None, "--force-stage",
+        help=(
+            "Re-run a stage even if its inputs are unchanged since a previous "
+            "claim run (screening, assessment, or all). Repeatable."
+        ),
+    ),
 ):
     """Run the complete claim processing pipeline: reconciliation + assessment."""
     ensure_initialized()
@@ -73,6 +80,14 @@ def assess_cmd(
         print_err("Cannot combine --claim-id, --all, and --input-folder")
         raise SystemExit(1)
 
+    from context_builder.pipeline.claim_stages.fingerprint import parse_force_stages
+
+    try:
+        force_stages = parse_force_stages(force_stage)
+    except ValueError as e:
+        print_err(str(e))
+        raise SystemExit(1)
+
     from context_builder.api.services.claim_assessment import ClaimAssessmentService
     from context_builder.api.services.aggregation import AggregationService
     from context_builder.api.services.reconciliation import ReconciliationService
@@ -209,6 +224,7 @@ def assess_cmd(
                 on_llm_start=on_llm_start,
                 on_llm_progress=on_llm_progress,
                 run_context=run_context,
+                force_stages=force_stages,
             )
 
             if result.success:
@@ -0,0 +1,79 @@
+"""Confidence commands — batch rescoring of the Composite Confidence Index."""
+
+import time
+
+import typer
+
+from context_builder.cli._app import app
+from context_builder.cli._common import (
+    ensure_initialized,
+    resolve_workspace_root,
+    setup_logging,
+)
+from context_builder.cli._console import console, print_ok, print_err, output_result
+
+confidence_app = typer.Typer(
+    no_args_is_help=True,
+    help="Composite Confidence Index tools.",
+)
+app.add_typer(confidence_app, name="confidence")
+
+
+@confidence_app.command("rescore", help="Rescore all claims from persisted signals and re-route them.")
+def rescore_cmd(
+    ctx: typer.Context,
+    green: float = typer.Option(None, "--green", help="Override the GREEN CCI threshold"),
+    yellow: float = typer.Option(None, "--yellow", help="Override the YELLOW CCI threshold"),
+    write: bool = typer.Option(
+        False, "--write", help="Write routing_decision.json and patch dossiers (default: report only)"
+    ),
+):
+    """Rescore every claim's latest run without re-running any pipeline stage."""
+    ensure_initialized()
+    setup_logging(verbose=ctx.obj["verbose"], quiet=ctx.obj["quiet"])
+
+    from context_builder.confidence.batch import BatchConfidenceScorer, SignalTable
+    from context_builder.confidence.routing import load_thresholds
+    from context_builder.confidence.stage import load_custom_weights
+
+    workspace_root = resolve_workspace_root(quiet=ctx.obj["quiet"])
+    claims_dir = workspace_root / "claims"
+    if not claims_dir.exists():
+        print_err(f"No claims directory found at {claims_dir}")
+        raise SystemExit(1)
+
+    thresholds = load_thresholds(workspace_root)
+    if green is not None:
+        thresholds["cci_green_threshold"] = green
+    if yellow is not None:
+        thresholds["cci_yellow_threshold"] = yellow
+
+    start = time.perf_counter()
+    table = SignalTable.load(claims_dir)
+    load_seconds = time.perf_counter() - start
+
+    scorer = BatchConfidenceScorer(
+        weights=load_custom_weights(workspace_root), thresholds=thresholds
+    )
+    result = scorer.rescore(table, write=write)
+    result.load_seconds = load_seconds
+    stats = result.to_dict()
+
+    if ctx.obj["json"]:
+        output_result(stats, ctx=ctx)
+    elif not ctx.obj["quiet"]:
+        print_ok(f"Rescored {stats['claims']} claims")
+        counts = stats["tier_counts"]
+        console.print(
+            f"  Tiers:      GREEN {counts['GREEN']}, YELLOW {counts['YELLOW']}, RED {counts['RED']}"
+        )
+        console.print(f"  Changed:    {stats['tier_changes']}")
+        console.print(
+            f"  Throughput: {stats['claims_per_second']:,.0f} claims/s "
+            f"(load {stats['load_seconds']:.2f}s, score {stats['score_seconds']:.3f}s"
+            + (f", write {stats['write_seconds']:.2f}s)" if write else ")")
+        )
+        if write:
+            console.print(f"  Written:    {stats['written']} claim runs")
+        else:
+            console.print("[dim](report only — use --write to persist routing)[/dim]")
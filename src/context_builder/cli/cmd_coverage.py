@@ -19,6 +19,10 @@ def coverage_cmd(
     claim_id: str = typer.Option(None, "--claim-id", help="Claim ID to analyze"),
     all_claims: bool = typer.Option(False, "--all", help="Analyze all claims in workspace"),
     force: bool = typer.Option(False, "--force", help="Rerun analysis even if results exist"),
+    incremental: bool = typer.Option(
+        False, "--incremental",
+        help="Rerun analysis, reusing results for unchanged line items",
+    ),
     dry_run: bool = typer.Option(False, "--dry-run", help="Print analysis output without writing to file"),
 ):
     """Run coverage analysis for one or all claims."""
@@ -67,7 +71,9 @@ def coverage_cmd(
                 results["success"].append(cid)
                 continue
 
-            result = coverage_service.analyze_claim(claim_id=cid, force=force)
+            result = coverage_service.analyze_claim(
+                claim_id=cid, force=force, incremental=incremental,
+            )
             results["success"].append(cid)
 
             if ctx.obj["json"]:
@@ -79,6 +85,8 @@ def coverage_cmd(
                 console.print(f"  [red]Not Covered:[/red] {summary.items_not_covered} items (CHF {summary.total_not_covered:,.2f})")
                 if summary.items_review_needed > 0:
                     console.print(f"  [yellow]Review Needed:[/yellow] {summary.items_review_needed} items")
+                if result.metadata.items_reused:
+                    console.print(f"  Reused: {result.metadata.items_reused} items")
                 if summary.coverage_percent is not None:
                     console.print(f"  Coverage %: {summary.coverage_percent}%")
                 console.print(f"  Covered (net): CHF {summary.total_covered_before_excess:,.2f}")
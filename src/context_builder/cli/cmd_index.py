@@ -22,12 +22,39 @@ def index_cmd(
         "--root",
         help="Output root directory (default: active workspace)",
     ),
+    backend: str = typer.Option(
+        None,
+        "--backend",
+        help="Registry backend: jsonl or sqlite (default: keep the current one)",
+    ),
+    migrate: bool = typer.Option(
+        False,
+        "--migrate",
+        help="Convert the existing JSONL indexes to SQLite without rescanning",
+    ),
+    reconcile: bool = typer.Option(
+        False,
+        "--reconcile",
+        help="Only update claims index entries for claim folders that changed",
+    ),
+    journal: bool = typer.Option(
+        False,
+        "--journal",
+        help="Only rescan claims and runs recorded in the change journal since the last build",
+    ),
 ):
-    """Build JSONL indexes (doc, label, run, claim) from workspace filesystem."""
+    """Build registry indexes (doc, label, run, claim) from workspace filesystem."""
     ensure_initialized()
     setup_logging(verbose=ctx.obj["verbose"], quiet=ctx.obj["quiet"])
 
-    from context_builder.storage.index_builder import build_all_indexes
+    from context_builder.storage.claim_run import rebuild_claim_run_indexes
+    from context_builder.storage.index_builder import (
+        REGISTRY_BACKENDS,
+        apply_change_journal,
+        build_all_indexes,
+        reconcile_claims_index,
+    )
+    from context_builder.storage.sqlite_registry import SqliteRegistry
 
     if root:
         output_dir = Path(root)
@@ -38,8 +65,64 @@ def index_cmd(
         print_err(f"Output directory not found: {output_dir}")
         raise SystemExit(1)
 
+    if backend is not None and backend not in REGISTRY_BACKENDS:
+        print_err(f"Unknown backend '{backend}' (expected jsonl or sqlite)")
+        raise SystemExit(1)
+
+    if reconcile:
+        try:
+            stats = reconcile_claims_index(output_dir / "claims", output_dir / "registry")
+        except Exception as e:
+            print_err(f"Claims index reconcile failed: {e}")
+            raise SystemExit(1)
+        if ctx.obj["json"]:
+            output_result(stats, ctx=ctx)
+        elif not ctx.obj["quiet"]:
+            print_ok("Claims index reconciled")
+            console.print(f"  Checked: {stats['claims_checked']}")
+            console.print(f"  Updated: {stats['claims_updated']}")
+            console.print(f"  Removed: {stats['claims_removed']}")
+        return
+
+    if journal:
+        try:
+            stats = apply_change_journal(output_dir)
+        except Exception as e:
+            print_err(f"Journal index update failed: {e}")
+            raise SystemExit(1)
+        if ctx.obj["json"]:
+            output_result(stats, ctx=ctx)
+        elif not ctx.obj["quiet"]:
+            if stats["mode"] == "full":
+                print_ok("No journal checkpoint, rebuilt all indexes")
+                console.print(f"  Documents: {stats['doc_count']}")
+                console.print(f"  Runs:      {stats['run_count']}")
+            else:
+                print_ok("Indexes updated from change journal")
+                console.print(f"  Changes: {stats['changes_applied']}")
+                console.print(f"  Claims:  {stats['claims_updated']}")
+                console.print(f"  Runs:    {stats['runs_updated']}")
+        return
+
+    if migrate:
+        try:
+            with SqliteRegistry(output_dir / "registry") as registry:
+                stats = {**registry.import_jsonl(), "backend": "sqlite"}
+        except Exception as e:
+            print_err(f"Registry migration failed: {e}")
+            raise SystemExit(1)
+        if ctx.obj["json"]:
+            output_result(stats, ctx=ctx)
+        elif not ctx.obj["quiet"]:
+            print_ok(f"Migrated registry to {registry.path}")
+            console.print(f"  Documents: {stats['doc_count']}")
+            console.print(f"  Labels:    {stats['label_count']}")
+            console.print(f"  Runs:      {stats['run_count']}")
+        return
+
     try:
-        stats = build_all_indexes(output_dir)
+        stats = build_all_indexes(output_dir, backend=backend)
+        stats["claim_run_index_count"] = rebuild_claim_run_indexes(output_dir / "claims")
     except Exception as e:
         print_err(f"Index build failed: {e}")
         raise SystemExit(1)
@@ -52,4 +135,5 @@ def index_cmd(
         console.print(f"  Labels:    {stats['label_count']}")
         console.print(f"  Runs:      {stats['run_count']}")
         console.print(f"  Claims:    {stats['claim_count']}")
-        console.print(f"  Registry:  {output_dir}/registry/")
+        console.print(f"  Claim run catalogs: {stats['claim_run_index_count']}")
+        console.print(f"  Registry:  {output_dir}/registry/ ({stats['backend']})")
@@ -471,12 +471,16 @@ def pipeline_cmd(
             console.print(f"  [red]Failed claims:[/red] {', '.join(failed_claims)}")
         console.print(f"  Output: {out}")
 
-    # Auto-build indexes
+    # Auto-update indexes for the processed claims
     if success_docs > 0:
-        from context_builder.storage.index_builder import build_all_indexes
+        from context_builder.storage.index_builder import update_claim_indexes
         try:
-            stats = build_all_indexes(out.parent)
+            stats = update_claim_indexes(
+                out.parent, [r.claim_id for r in claim_results], [run_id]
+            )
             if not ctx.obj["quiet"] and not ctx.obj["json"]:
-                console.print(f"  Indexes updated: {stats['doc_count']} docs, {stats['run_count']} runs")
+                console.print(
+                    f"  Indexes updated: {stats['claims_updated']} claims, {stats['runs_updated']} runs"
+                )
         except Exception as e:
             logger.warning(f"Index build failed (non-fatal): {e}")
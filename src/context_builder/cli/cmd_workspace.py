@@ -1,4 +1,6 @@
-"""Workspace commands — list and reset workspaces."""
+"""Workspace commands — list, reset, recompress and watch workspaces."""
+
+from pathlib import Path
 
 import typer
 
@@ -6,13 +8,14 @@ from context_builder.cli._app import app
 from context_builder.cli._common import (
     ensure_initialized,
     get_project_root,
+    resolve_workspace_root,
     setup_logging,
 )
 from context_builder.cli._console import console, print_ok, print_err, print_warn, output_result, output_table
 
 workspace_app = typer.Typer(
     no_args_is_help=True,
-    help="Manage workspaces (reset, list).",
+    help="Manage workspaces (reset, list, recompress, watch).",
 )
 app.add_typer(workspace_app, name="workspace")
 
@@ -146,3 +149,113 @@ def workspace_reset(
         console.print(f"  Files deleted: {stats['files_deleted']}")
         console.print(f"  Dirs deleted:  {stats['dirs_deleted']}")
         console.print(f"  Preserved: {', '.join(stats['preserved_dirs'])}")
+
+@workspace_app.command("recompress", help="Re-encode stored JSON artifacts (compact JSON, optional gzip/zstd).")
+def workspace_recompress(
+    ctx: typer.Context,
+    root: str = typer.Option(
+        None,
+        "--root",
+        help="Workspace root directory (default: active workspace)",
+    ),
+    codec: str = typer.Option(
+        None,
+        "--codec",
+        help="Compression for pages.json and azure_di.json: none, gzip or zstd "
+        "(default: ARTIFACT_COMPRESSION)",
+    ),
+    min_bytes: int = typer.Option(
+        None,
+        "--min-bytes",
+        help="Only compress artifacts at least this large (default: ARTIFACT_COMPRESSION_MIN_BYTES)",
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Report savings without rewriting files"),
+):
+    """Rewrite existing artifacts in the configured encoding and report bytes saved."""
+    ensure_initialized()
+    setup_logging(verbose=ctx.obj["verbose"], quiet=ctx.obj["quiet"])
+
+    from context_builder.storage.artifact_codec import CODECS, recompress_workspace
+
+    if codec is not None and codec not in CODECS:
+        print_err(f"Unknown codec '{codec}' (expected {', '.join(CODECS)})")
+        raise SystemExit(1)
+
+    if root:
+        output_dir = Path(root)
+    else:
+        output_dir = resolve_workspace_root(quiet=ctx.obj["quiet"])
+
+    if not (output_dir / "claims").exists():
+        print_err(f"No claims directory in workspace: {output_dir}")
+        raise SystemExit(1)
+
+    try:
+        stats = recompress_workspace(output_dir, codec=codec, min_bytes=min_bytes, dry_run=dry_run)
+    except Exception as e:
+        print_err(f"Recompression failed: {e}")
+        raise SystemExit(1)
+
+    if ctx.obj["json"]:
+        output_result({**stats, "dry_run": dry_run}, ctx=ctx)
+    elif not ctx.obj["quiet"]:
+        before = stats["bytes_before"]
+        saved_pct = 100.0 * stats["bytes_saved"] / before if before else 0.0
+        if dry_run:
+            console.print(f"\n[bold]DRY RUN[/bold] — codec: {stats['codec']}")
+        else:
+            print_ok(f"Artifacts re-encoded (codec: {stats['codec']})")
+        console.print(f"  Files scanned:   {stats['files_scanned']}")
+        console.print(f"  Files rewritten: {stats['files_rewritten']}")
+        if stats["files_failed"]:
+            print_warn(f"  Unreadable files skipped: {stats['files_failed']}")
+        console.print(f"  Size: {before:,} -> {stats['bytes_after']:,} bytes ({saved_pct:.1f}% saved)")
+
+
+@workspace_app.command("watch", help="Journal changes made to the workspace outside the tool.")
+def workspace_watch(
+    ctx: typer.Context,
+    root: str = typer.Option(
+        None,
+        "--root",
+        help="Workspace root directory (default: active workspace)",
+    ),
+    debounce: float = typer.Option(
+        1.0,
+        "--debounce",
+        help="Seconds to collect events before journaling them",
+    ),
+):
+    """Watch claims/ and runs/ (inotify via watchdog) until interrupted.
+
+    Changes are appended to the change journal, so ``index --journal``
+    picks up files added or removed by hand.
+    """
+    ensure_initialized()
+    setup_logging(verbose=ctx.obj["verbose"], quiet=ctx.obj["quiet"])
+
+    import time
+
+    from context_builder.storage.journal_watcher import JournalWatcher
+
+    if root:
+        output_dir = Path(root)
+    else:
+        output_dir = resolve_workspace_root(quiet=ctx.obj["quiet"])
+
+    watcher = JournalWatcher(output_dir, debounce_seconds=debounce)
+    try:
+        watcher.start()
+    except (ImportError, ValueError) as e:
+        print_err(str(e))
+        raise SystemExit(1)
+
+    if not ctx.obj["quiet"]:
+        print_ok(f"Watching {output_dir} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.stop()
@@ -21,6 +21,7 @@ Primary entry point::
 
 from typing import Any, Dict, List, Optional
 
+from context_builder.confidence.batch import BatchConfidenceScorer, SignalTable
 from context_builder.confidence.collector import ConfidenceCollector
 from context_builder.confidence.routing import ClaimRouter, load_thresholds
 from context_builder.confidence.scorer import ConfidenceScorer
@@ -144,12 +145,14 @@ def _enrich_data_completeness_detail(
 
 
 __all__ = [
+    "BatchConfidenceScorer",
     "ClaimRouter",
     "ConfidenceCollector",
     "ConfidenceScorer",
     "ConfidenceStage",
     "RoutingDecision",
     "RoutingTier",
+    "SignalTable",
     "compute_confidence",
     "load_thresholds",
 ]
@@ -0,0 +1,356 @@
+"""Batch rescoring of the Composite Confidence Index across claims.
+
+The confidence stage scores one claim at a time while the claim pipeline
+runs.  Recalibrating routing thresholds or component weights should not
+mean re-running assessment (and its LLM calls) for the whole portfolio.
+
+``SignalTable`` loads the signal vectors persisted in each claim's latest
+``confidence_summary.json`` into columns (one list per signal name).
+``BatchConfidenceScorer`` then computes composite scores column by column,
+with the same arithmetic as ``ConfidenceScorer.compute``, and assigns
+routing tiers.  With ``write=True``, each claim run's
+``routing_decision.json`` and its latest dossier are updated from the new
+scores.  Confidence summaries themselves are not rewritten.
+
+Usage::
+
+    table = SignalTable.load(workspace / "claims")
+    result = BatchConfidenceScorer(thresholds=load_thresholds(workspace)).rescore(table)
+    print(result.tier_counts(), result.claims_per_second)
+"""
+
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from context_builder.confidence.routing import DEFAULT_THRESHOLDS, ClaimRouter, assign_tier
+from context_builder.confidence.scorer import (
+    COMPONENT_SIGNALS,
+    DEFAULT_WEIGHTS,
+    DENY_POLARITY_FLIPS,
+    DENY_WEIGHTS,
+    REQUIRED_COMPONENTS,
+    score_to_band,
+)
+from context_builder.confidence.stage import patch_dossier_routing
+from context_builder.schemas.routing import RoutingTier
+from context_builder.storage.claim_run import ClaimRunStorage
+from context_builder.storage.dossier_index import DossierIndex
+
+logger = logging.getLogger(__name__)
+
+# Signals that scale coverage_reliability instead of being averaged
+# (applied in this order, as in ConfidenceScorer.compute)
+COVERAGE_MULTIPLIERS = (
+    "coverage.line_item_complexity",
+    "coverage.zero_coverage_penalty",
+    "coverage.payout_materiality",
+)
+
+
+@dataclass
+class SignalTable:
+    """Normalized signal values of many claim runs, stored by column.
+
+    Row ``i`` describes ``claim_ids[i]`` / ``claim_run_ids[i]``; a column
+    holds None for claims where the signal was not collected.
+    """
+
+    claim_ids: List[str] = field(default_factory=list)
+    claim_run_ids: List[str] = field(default_factory=list)
+    verdicts: List[str] = field(default_factory=list)
+    claim_folders: List[Optional[Path]] = field(default_factory=list)
+    previous_routing: List[Optional[Dict[str, Any]]] = field(default_factory=list)
+    columns: Dict[str, List[Optional[float]]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.claim_ids)
+
+    def add(
+        self,
+        claim_id: str,
+        claim_run_id: str,
+        verdict: str,
+        signals: Dict[str, float],
+        claim_folder: Optional[Path] = None,
+        previous_routing: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Append one claim run's signal vector (signal name -> value)."""
+        row = len(self)
+        self.claim_ids.append(claim_id)
+        self.claim_run_ids.append(claim_run_id)
+        self.verdicts.append((verdict or "").upper().strip())
+        self.claim_folders.append(claim_folder)
+        self.previous_routing.append(previous_routing)
+        for name, value in signals.items():
+            column = self.columns.get(name)
+            if column is None:
+                column = self.columns[name] = [None] * row
+            column.append(value)
+        for column in self.columns.values():
+            if len(column) == row:
+                column.append(None)
+
+    @classmethod
+    def load(cls, claims_dir: Path) -> "SignalTable":
+        """Load the latest persisted signals of every claim in ``claims_dir``.
+
+        Claims whose latest run has no ``confidence_summary.json`` are
+        skipped.  The verdict is the one routing started from (the
+        engine's verdict, before any REFER override).
+        """
+        table = cls()
+        if not claims_dir.exists():
+            return table
+
+        for claim_folder in sorted(claims_dir.iterdir()):
+            if not claim_folder.is_dir() or claim_folder.name.startswith("."):
+                continue
+            storage = ClaimRunStorage(claim_folder)
+            claim_run_id = storage.get_latest_claim_run_id()
+            if not claim_run_id:
+                continue
+            try:
+                summary = storage.read_from_claim_run(claim_run_id, "confidence_summary.json")
+                routing = storage.read_from_claim_run(claim_run_id, "routing_decision.json")
+            except (ValueError, OSError) as e:
+                logger.warning(f"Skipping {claim_folder.name}: {e}")
+                continue
+            if not summary:
+                continue
+
+            if routing:
+                verdict = routing.get("original_verdict") or ""
+            else:
+                latest = DossierIndex(claim_folder).latest(claim_run_id)
+                verdict = (latest or {}).get("claim_verdict") or ""
+
+            table.add(
+                claim_id=summary.get("claim_id") or claim_folder.name,
+                claim_run_id=claim_run_id,
+                verdict=verdict,
+                signals={
+                    s["signal_name"]: s["normalized_value"]
+                    for s in summary.get("signals_collected") or []
+                },
+                claim_folder=claim_folder,
+                previous_routing=routing,
+            )
+        return table
+
+
+@dataclass
+class BatchScores:
+    """Composite and component scores for every row of a SignalTable."""
+
+    composite_scores: List[float]
+    component_scores: Dict[str, List[float]]
+
+    def confidence_index(self, row: int) -> Dict[str, Any]:
+        """The ``confidence_index`` dossier field for one row."""
+        composite = self.composite_scores[row]
+        return {
+            "composite_score": composite,
+            "band": score_to_band(composite).value,
+            "components": {
+                name: scores[row] for name, scores in self.component_scores.items()
+            },
+        }
+
+
+@dataclass
+class BatchRescoreResult:
+    """Outcome of rescoring a SignalTable, with timings."""
+
+    claim_ids: List[str]
+    claim_run_ids: List[str]
+    scores: BatchScores
+    tiers: List[RoutingTier]
+    previous_tiers: List[Optional[str]]
+    load_seconds: float = 0.0
+    score_seconds: float = 0.0
+    write_seconds: float = 0.0
+    written: int = 0
+
+    @property
+    def claims_per_second(self) -> float:
+        """Throughput of the scoring pass (excluding I/O)."""
+        if not self.claim_ids:
+            return 0.0
+        return len(self.claim_ids) / max(self.score_seconds, 1e-9)
+
+    @property
+    def changed(self) -> int:
+        """Number of claims whose routing tier changed."""
+        return sum(
+            1 for tier, previous in zip(self.tiers, self.previous_tiers)
+            if previous is not None and tier.value != previous
+        )
+
+    def tier_counts(self) -> Dict[str, int]:
+        counts = Counter(tier.value for tier in self.tiers)
+        return {tier.value: counts.get(tier.value, 0) for tier in RoutingTier}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "claims": len(self.claim_ids),
+            "tier_counts": self.tier_counts(),
+            "tier_changes": self.changed,
+            "written": self.written,
+            "load_seconds": round(self.load_seconds, 4),
+            "score_seconds": round(self.score_seconds, 4),
+            "write_seconds": round(self.write_seconds, 4),
+            "claims_per_second": round(self.claims_per_second, 1),
+        }
+
+
+class BatchConfidenceScorer:
+    """Rescores many claims in one pass over a SignalTable."""
+
+    def __init__(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        thresholds: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.weights = dict(weights or DEFAULT_WEIGHTS)
+        self.router = ClaimRouter(thresholds)
+
+    def score(self, table: SignalTable) -> BatchScores:
+        """Compute composite scores for all rows.
+
+        Matches ``ConfidenceScorer.compute`` (including its rounding) for
+        each row, but works on whole columns instead of per-claim models.
+        """
+        n = len(table)
+        deny = [verdict == "DENY" for verdict in table.verdicts]
+        custom_weights = self.weights != DEFAULT_WEIGHTS
+
+        def column(name: str) -> Optional[List[Optional[float]]]:
+            values = table.columns.get(name)
+            if values is None or name not in DENY_POLARITY_FLIPS:
+                return values
+            return [
+                round(1.0 - v, 4) if v is not None and is_deny else v
+                for v, is_deny in zip(values, deny)
+            ]
+
+        # Per-row values are collected into lists and added with sum(), as
+        # the per-claim scorer does (float sum() is compensated on 3.12+).
+        component_scores: Dict[str, List[float]] = {}
+        active: Dict[str, List[bool]] = {}
+        for component, signal_names in COMPONENT_SIGNALS.items():
+            matched: List[List[float]] = [[] for _ in range(n)]
+            for values in filter(None, map(column, signal_names)):
+                for row_values, v in zip(matched, values):
+                    if v is not None:
+                        row_values.append(v)
+            component_scores[component] = [
+                round(sum(values) / len(values), 4) if values else 0.0
+                for values in matched
+            ]
+            required = component in REQUIRED_COMPONENTS
+            active[component] = [required or bool(values) for values in matched]
+
+        coverage = component_scores["coverage_reliability"]
+        for name in COVERAGE_MULTIPLIERS:
+            multipliers = table.columns.get(name)
+            if multipliers is not None:
+                coverage[:] = [
+                    round(s * m, 4) if m is not None else s
+                    for s, m in zip(coverage, multipliers)
+                ]
+
+        # Per-row weights depend on the verdict unless custom weights are set
+        if custom_weights:
+            row_weights = [self.weights] * n
+        else:
+            row_weights = [DENY_WEIGHTS if d else DEFAULT_WEIGHTS for d in deny]
+        total_weight = [
+            sum(
+                w.get(component, 0.0)
+                for component in COMPONENT_SIGNALS
+                if active[component][row]
+            )
+            for row, w in enumerate(row_weights)
+        ]
+
+        contributions: List[List[float]] = [[] for _ in range(n)]
+        for component, scores in component_scores.items():
+            for row_values, s, w, t, a in zip(
+                contributions, scores, row_weights, total_weight, active[component]
+            ):
+                if a and t > 0:
+                    row_values.append(round(s * (w.get(component, 0.0) / t), 4))
+        composite = [sum(values) for values in contributions]
+        composite = [round(max(0.0, min(1.0, c)), 4) for c in composite]
+
+        return BatchScores(composite_scores=composite, component_scores=component_scores)
+
+    def route(self, table: SignalTable, scores: BatchScores) -> List[RoutingTier]:
+        """Assign routing tiers from the composite scores."""
+        thresholds = self.router.thresholds
+        green = thresholds.get("cci_green_threshold", DEFAULT_THRESHOLDS["cci_green_threshold"])
+        yellow = thresholds.get(
+            "cci_yellow_threshold", DEFAULT_THRESHOLDS["cci_yellow_threshold"]
+        )
+        return [
+            assign_tier(verdict, cci, green, yellow)[0]
+            for verdict, cci in zip(table.verdicts, scores.composite_scores)
+        ]
+
+    def rescore(self, table: SignalTable, write: bool = False) -> BatchRescoreResult:
+        """Score and route every row; optionally persist routing outcomes."""
+        start = time.perf_counter()
+        scores = self.score(table)
+        tiers = self.route(table, scores)
+        result = BatchRescoreResult(
+            claim_ids=list(table.claim_ids),
+            claim_run_ids=list(table.claim_run_ids),
+            scores=scores,
+            tiers=tiers,
+            previous_tiers=[
+                (routing or {}).get("routing_tier") for routing in table.previous_routing
+            ],
+            score_seconds=time.perf_counter() - start,
+        )
+        if write:
+            start = time.perf_counter()
+            result.written = self.write_routing_outcomes(table, scores)
+            result.write_seconds = time.perf_counter() - start
+        return result
+
+    def write_routing_outcomes(self, table: SignalTable, scores: BatchScores) -> int:
+        """Write routing_decision.json and patch the latest dossier per claim run.
+
+        Returns:
+            Number of claim runs updated.
+        """
+        written = 0
+        for row, claim_folder in enumerate(table.claim_folders):
+            if claim_folder is None:
+                continue
+            claim_run_id = table.claim_run_ids[row]
+            previous = table.previous_routing[row] or {
+                "claim_id": table.claim_ids[row],
+                "claim_run_id": claim_run_id,
+                "original_verdict": table.verdicts[row],
+            }
+            decision = self.router.reroute(previous, scores.composite_scores[row])
+            try:
+                storage = ClaimRunStorage(claim_folder)
+                storage.write_to_claim_run(
+                    claim_run_id, "routing_decision.json", decision.model_dump(mode="json")
+                )
+            except OSError:
+                logger.warning(
+                    f"Failed to write routing for {table.claim_ids[row]}", exc_info=True
+                )
+                continue
+            dossier_path = DossierIndex(claim_folder).latest_path(claim_run_id)
+            if dossier_path:
+                patch_dossier_routing(dossier_path, decision, scores.confidence_index(row))
+            written += 1
+        return written
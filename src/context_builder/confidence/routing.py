@@ -27,7 +27,7 @@ Thresholds are constants with optional workspace-level override via
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -90,6 +90,24 @@ def load_thresholds(workspace_path: Optional[Path] = None) -> Dict[str, Any]:
     return thresholds
 
 
+def assign_tier(
+    verdict: str,
+    cci: Optional[float],
+    green_threshold: float,
+    yellow_threshold: float,
+) -> Tuple[RoutingTier, str]:
+    """Return ``(tier, reason)`` for an upper-cased verdict and a CCI."""
+    if verdict == "REFER":
+        return RoutingTier.RED, "Original verdict is REFER"
+    if cci is None:
+        return RoutingTier.RED, "CCI not available (safety fallback)"
+    if cci >= green_threshold:
+        return RoutingTier.GREEN, f"CCI {cci:.3f} >= {green_threshold} (GREEN threshold)"
+    if cci >= yellow_threshold:
+        return RoutingTier.YELLOW, f"CCI {cci:.3f} >= {yellow_threshold} (YELLOW threshold)"
+    return RoutingTier.RED, f"CCI {cci:.3f} < {yellow_threshold} (below YELLOW threshold)"
+
+
 class ClaimRouter:
     """CCI-driven router: assigns tier from CCI score, keeps triggers as annotations."""
 
@@ -128,21 +146,9 @@ class ClaimRouter:
         )
 
         # -- Determine tier from CCI --
-        if verdict_upper == "REFER":
-            tier = RoutingTier.RED
-            tier_reason = "Original verdict is REFER"
-        elif cci is None:
-            tier = RoutingTier.RED
-            tier_reason = "CCI not available (safety fallback)"
-        elif cci >= green_threshold:
-            tier = RoutingTier.GREEN
-            tier_reason = f"CCI {cci:.3f} >= {green_threshold} (GREEN threshold)"
-        elif cci >= yellow_threshold:
-            tier = RoutingTier.YELLOW
-            tier_reason = f"CCI {cci:.3f} >= {yellow_threshold} (YELLOW threshold)"
-        else:
-            tier = RoutingTier.RED
-            tier_reason = f"CCI {cci:.3f} < {yellow_threshold} (below YELLOW threshold)"
+        tier, tier_reason = assign_tier(
+            verdict_upper, cci, green_threshold, yellow_threshold
+        )
 
         # -- Run informational triggers (annotations only) --
         all_triggers: List[RoutingTriggerResult] = []
@@ -180,6 +186,61 @@ class ClaimRouter:
             cci_threshold_yellow=yellow_threshold,
         )
 
+    def reroute(
+        self, previous: Dict[str, Any], cci: Optional[float]
+    ) -> RoutingDecision:
+        """Re-derive a persisted routing decision for a new CCI.
+
+        Used when rescoring claims in bulk: the tier is recomputed with the
+        current thresholds, RT-5 (the only trigger that reads the CCI) is
+        re-evaluated, and the other triggers are kept as persisted since
+        they depend only on upstream stage data.
+
+        Args:
+            previous: A ``routing_decision.json`` payload.
+            cci: The new composite confidence score.
+        """
+        verdict_upper = str(previous.get("original_verdict") or "").upper().strip()
+        green_threshold = self.thresholds.get(
+            "cci_green_threshold", DEFAULT_THRESHOLDS["cci_green_threshold"]
+        )
+        yellow_threshold = self.thresholds.get(
+            "cci_yellow_threshold", DEFAULT_THRESHOLDS["cci_yellow_threshold"]
+        )
+        tier, tier_reason = assign_tier(
+            verdict_upper, cci, green_threshold, yellow_threshold
+        )
+
+        low_cci = self._check_low_structural_cci(
+            {"composite_score": cci}, verdict_upper
+        )
+        all_triggers = [
+            low_cci if t.get("trigger_id") == low_cci.trigger_id
+            else RoutingTriggerResult(**t)
+            for t in previous.get("all_triggers") or []
+        ]
+        if not any(t.trigger_id == low_cci.trigger_id for t in all_triggers):
+            all_triggers.append(low_cci)
+
+        return RoutingDecision(
+            claim_id=previous.get("claim_id", ""),
+            claim_run_id=previous.get("claim_run_id", ""),
+            original_verdict=verdict_upper,
+            routed_verdict=(
+                "REFER"
+                if tier == RoutingTier.RED and verdict_upper == "APPROVE"
+                else None
+            ),
+            routing_tier=tier,
+            triggers_evaluated=len(all_triggers),
+            triggers_fired=[t for t in all_triggers if t.fired],
+            all_triggers=all_triggers,
+            tier_reason=tier_reason,
+            structural_cci=cci,
+            cci_threshold_green=green_threshold,
+            cci_threshold_yellow=yellow_threshold,
+        )
+
     # -- Individual trigger checks (informational) -------------------------
 
     def _check_reconciliation_gate(
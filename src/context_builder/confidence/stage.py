@@ -15,17 +15,102 @@ import logging
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 import yaml
 
 from context_builder.confidence.scorer import ConfidenceScorer
 from context_builder.pipeline.claim_stages.context import ClaimContext
-from context_builder.storage.claim_run import ClaimRunStorage
+from context_builder.storage.claim_run import ClaimRunStorage, resolve_claim_folder
+from context_builder.storage.dossier_index import DossierIndex
 
 logger = logging.getLogger(__name__)
 
 
+def load_custom_weights(workspace_path: Path) -> Optional[Dict[str, float]]:
+    """Load custom CCI weights from ``config/confidence/weights.yaml`` (if exists)."""
+    weights_path = workspace_path / "config" / "confidence" / "weights.yaml"
+    if not weights_path.exists():
+        return None
+
+    try:
+        with open(weights_path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+        if isinstance(data, dict) and "weights" in data:
+            return {str(k): float(v) for k, v in data["weights"].items()}
+    except Exception:
+        logger.warning(f"Could not load custom weights from {weights_path}", exc_info=True)
+
+    return None
+
+
+def patch_dossier_routing(
+    dossier_path: Path,
+    routing_decision: "RoutingDecision",
+    confidence_index: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Patch dossier with routing info and override verdict if RED.
+
+    A verdict overridden by an earlier routing is restored when the new
+    routing no longer overrides it.  ``confidence_index`` (if given)
+    replaces the dossier's confidence index in the same write.
+    """
+    try:
+        with open(dossier_path, "r", encoding="utf-8") as f:
+            dossier = json.load(f)
+        previous_routing = dossier.get("routing") or {}
+
+        routing_data = {
+            "routing_tier": routing_decision.routing_tier.value,
+            "triggers_fired": [
+                {"trigger_id": t.trigger_id, "name": t.name, "explanation": t.explanation}
+                for t in routing_decision.triggers_fired
+            ],
+            "tier_reason": routing_decision.tier_reason,
+            "original_verdict": routing_decision.original_verdict,
+            "structural_cci": routing_decision.structural_cci,
+            "cci_threshold_green": routing_decision.cci_threshold_green,
+            "cci_threshold_yellow": routing_decision.cci_threshold_yellow,
+        }
+        dossier["routing"] = routing_data
+        if confidence_index is not None:
+            dossier["confidence_index"] = confidence_index
+
+        # Override verdict to REFER if RED + originally APPROVE
+        if routing_decision.routed_verdict:
+            # Kept so a later re-routing (e.g. batch rescoring with new
+            # thresholds) can restore the engine's verdict
+            routing_data["original_verdict_reason"] = previous_routing.get(
+                "original_verdict_reason", dossier.get("verdict_reason")
+            )
+            dossier["claim_verdict"] = routing_decision.routed_verdict
+            cci_str = (
+                f"CCI {routing_decision.structural_cci:.3f}"
+                if routing_decision.structural_cci is not None
+                else "CCI not available"
+            )
+            dossier["verdict_reason"] = (
+                f"Routed to REFER: {cci_str}. "
+                f"{routing_decision.tier_reason}. "
+                f"Original verdict: {routing_decision.original_verdict}"
+            )
+            logger.info(
+                f"Verdict overridden to REFER for {routing_decision.claim_id} "
+                f"(was {routing_decision.original_verdict})"
+            )
+        elif "original_verdict_reason" in previous_routing:
+            # An earlier routing overrode the verdict; this one does not
+            dossier["claim_verdict"] = routing_decision.original_verdict
+            dossier["verdict_reason"] = previous_routing["original_verdict_reason"]
+
+        with open(dossier_path, "w", encoding="utf-8") as f:
+            json.dump(dossier, f, indent=2, ensure_ascii=False)
+        # The verdict may have changed: refresh the index summary
+        DossierIndex.record_file(dossier_path, dossier)
+    except Exception:
+        logger.warning(f"Failed to patch dossier routing {dossier_path}", exc_info=True)
+
+
 @dataclass
 class ConfidenceStage:
     """Confidence stage: collects signals and computes Composite Confidence Index.
@@ -35,21 +120,18 @@ class ConfidenceStage:
     """
 
     name: str = "confidence"
+    # ClaimContext fields read/written (see claim_stages.dag)
+    inputs: ClassVar[Tuple[str, ...]] = (
+        "reconciliation_report",
+        "screening_result",
+        "processing_result",
+        "decision_result",
+    )
+    outputs: ClassVar[Tuple[str, ...]] = ()
 
     def _find_claim_folder(self, workspace_path: Path, claim_id: str) -> Optional[Path]:
         """Find the claim folder for a given claim ID."""
-        claims_dir = workspace_path / "claims"
-        if not claims_dir.exists():
-            return None
-
-        if (claims_dir / claim_id).exists():
-            return claims_dir / claim_id
-
-        for folder in claims_dir.iterdir():
-            if folder.is_dir() and claim_id in folder.name:
-                return folder
-
-        return None
+        return resolve_claim_folder(workspace_path / "claims", claim_id)
 
     def _load_extraction_results(
         self, claim_folder: Path
@@ -177,30 +259,13 @@ class ConfidenceStage:
 
     def _load_custom_weights(self, workspace_path: Path) -> Optional[Dict[str, float]]:
         """Load custom CCI weights from workspace config (if exists)."""
-        weights_path = workspace_path / "config" / "confidence" / "weights.yaml"
-        if not weights_path.exists():
-            return None
-
-        try:
-            with open(weights_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-            if isinstance(data, dict) and "weights" in data:
-                return {str(k): float(v) for k, v in data["weights"].items()}
-        except Exception:
-            logger.warning(f"Could not load custom weights from {weights_path}", exc_info=True)
-
-        return None
+        return load_custom_weights(workspace_path)
 
     def _find_latest_dossier(
         self, claim_folder: Path, claim_run_id: str
     ) -> Optional[Path]:
         """Find the latest decision_dossier_v{N}.json in the claim run."""
-        run_dir = claim_folder / "claim_runs" / claim_run_id
-        if not run_dir.exists():
-            return None
-
-        dossiers = sorted(run_dir.glob("decision_dossier_v*.json"))
-        return dossiers[-1] if dossiers else None
+        return DossierIndex(claim_folder).latest_path(claim_run_id)
 
     def _patch_dossier(
         self, dossier_path: Path, confidence_index: Dict[str, Any]
@@ -251,46 +316,7 @@ class ConfidenceStage:
         self, dossier_path: Path, routing_decision: "RoutingDecision"
     ) -> None:
         """Patch dossier with routing info and override verdict if RED."""
-        try:
-            with open(dossier_path, "r", encoding="utf-8") as f:
-                dossier = json.load(f)
-
-            routing_data = {
-                "routing_tier": routing_decision.routing_tier.value,
-                "triggers_fired": [
-                    {"trigger_id": t.trigger_id, "name": t.name, "explanation": t.explanation}
-                    for t in routing_decision.triggers_fired
-                ],
-                "tier_reason": routing_decision.tier_reason,
-                "original_verdict": routing_decision.original_verdict,
-                "structural_cci": routing_decision.structural_cci,
-                "cci_threshold_green": routing_decision.cci_threshold_green,
-                "cci_threshold_yellow": routing_decision.cci_threshold_yellow,
-            }
-            dossier["routing"] = routing_data
-
-            # Override verdict to REFER if RED + originally APPROVE
-            if routing_decision.routed_verdict:
-                dossier["claim_verdict"] = routing_decision.routed_verdict
-                cci_str = (
-                    f"CCI {routing_decision.structural_cci:.3f}"
-                    if routing_decision.structural_cci is not None
-                    else "CCI not available"
-                )
-                dossier["verdict_reason"] = (
-                    f"Routed to REFER: {cci_str}. "
-                    f"{routing_decision.tier_reason}. "
-                    f"Original verdict: {routing_decision.original_verdict}"
-                )
-                logger.info(
-                    f"Verdict overridden to REFER for {routing_decision.claim_id} "
-                    f"(was {routing_decision.original_verdict})"
-                )
-
-            with open(dossier_path, "w", encoding="utf-8") as f:
-                json.dump(dossier, f, indent=2, ensure_ascii=False)
-        except Exception:
-            logger.warning(f"Failed to patch dossier routing {dossier_path}", exc_info=True)
+        patch_dossier_routing(dossier_path, routing_decision)
 
     def run(self, context: ClaimContext) -> ClaimContext:
         """Execute confidence computation and return updated context.
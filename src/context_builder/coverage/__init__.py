@@ -22,7 +22,11 @@ from context_builder.coverage.schemas import (
 )
 from context_builder.coverage.rule_engine import RuleEngine
 from context_builder.coverage.keyword_matcher import KeywordMatcher
-from context_builder.coverage.analyzer import CoverageAnalyzer
+from context_builder.coverage.analyzer import (
+    AnalyzerSetup,
+    CoverageAnalyzer,
+    get_analyzer_setup,
+)
 from context_builder.coverage.explanation_generator import ExplanationGenerator
 
 __all__ = [
@@ -35,6 +39,8 @@ __all__ = [
     "NonCoveredExplanation",
     "RuleEngine",
     "KeywordMatcher",
+    "AnalyzerSetup",
     "CoverageAnalyzer",
+    "get_analyzer_setup",
     "ExplanationGenerator",
 ]
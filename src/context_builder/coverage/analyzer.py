@@ -9,15 +9,26 @@ Pipeline order:
 3. LLM (fallback, confidence=0.60-0.85)
 """
 
+import copy
+import hashlib
 import logging
+import threading
 import time
-from dataclasses import dataclass, replace as _dc_replace
+from dataclasses import asdict, dataclass, field, replace as _dc_replace
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 
+from context_builder.coverage.incremental import (
+    MATCH_METHOD_ORDER,
+    compute_inputs_fingerprint,
+    diff_line_items,
+    has_post_processing_changes,
+    line_item_fingerprint,
+    restore_classified_item,
+)
 from context_builder.coverage.keyword_matcher import KeywordConfig, KeywordMatcher
 from context_builder.coverage.llm_matcher import LLMMatcher, LLMMatcherConfig
 from context_builder.coverage.part_number_lookup import PartLookupResult, PartNumberLookup
@@ -38,10 +49,13 @@ from context_builder.coverage.schemas import (
 from context_builder.coverage.post_processing import (
     LABOR_TYPES,
     apply_labor_linkage,
+    apply_labor_linkage_verdicts,
     build_excluded_parts_index,
+    build_labor_linkage_payloads,
     demote_labor_for_excluded_parts,
     demote_orphan_labor,
     flag_nominal_price_labor,
+    prelink_labor,
     validate_llm_coverage_decision,
 )
 from context_builder.coverage.trace import TraceBuilder
@@ -190,6 +204,12 @@ class AnalyzerConfig:
     # before falling back to the value-based heuristic (Tier 1a-1c).
     use_llm_primary_repair: bool = True
 
+    # Combine primary repair and labor linkage into ONE LLM call, after a
+    # local pre-linker settles obvious labor links (part numbers, adjacent
+    # positions).  Falls back to the separate calls if the combined call
+    # fails.  Only applies when use_llm_primary_repair is enabled.
+    use_combined_post_processing: bool = False
+
     # Nominal-price labor threshold: labor items at or below this price
     # with an item_code are flagged REVIEW_NEEDED (suspected operation
     # codes where the real cost is hours x rate, not yet supported).
@@ -209,6 +229,9 @@ class AnalyzerConfig:
             config_version=config.get("config_version", "1.0"),
             default_coverage_percent=config.get("default_coverage_percent"),
             use_llm_primary_repair=config.get("use_llm_primary_repair", True),
+            use_combined_post_processing=config.get(
+                "use_combined_post_processing", False
+            ),
             nominal_price_threshold=config.get("nominal_price_threshold", 2.0),
         )
         return cls(**kwargs)
@@ -244,6 +267,215 @@ class RepairContext:
             self.all_detected_components = []
 
 
+@dataclass
+class _ClassifiedItems:
+    """Output of the classification stages (rules, keyword bypass, LLM).
+
+    ``items`` are in analysis order (rule, part-number, keyword, LLM);
+    ``source_indices[i]`` is the input position of ``items[i]``.
+    """
+
+    items: List[LineItemCoverage]
+    source_indices: List[int]
+    keyword_hints_generated: int = 0
+    part_number_hints_generated: int = 0
+
+
+def compute_coverage_config_hash(
+    config_path: Optional[Path], workspace_path: Optional[Path] = None
+) -> str:
+    """Compute a short hash over every file that shapes an AnalyzerSetup.
+
+    Covers the main coverage config, its sibling keyword mappings and
+    component config files, and the workspace ``assumptions.json`` used by
+    the part number lookup.  Missing files contribute their name only.
+    """
+    files: List[Path] = []
+    if config_path is not None:
+        files.append(config_path)
+        for pattern in ("*_keyword_mappings.yaml", "*_component_config.yaml"):
+            sibling = _find_sibling(config_path, pattern)
+            if sibling:
+                files.append(sibling)
+    if workspace_path is not None:
+        files.append(workspace_path / "config" / "assumptions.json")
+
+    hasher = hashlib.sha256()
+    for path in files:
+        hasher.update(str(path).encode("utf-8"))
+        if path.is_file():
+            hasher.update(path.read_bytes())
+    return hasher.hexdigest()[:16]
+
+
+@dataclass
+class AnalyzerSetup:
+    """Immutable coverage configuration shared by all claims of a workspace.
+
+    Holds everything that is expensive to build and identical for every
+    claim: parsed YAML configs, the rule engine's compiled patterns, keyword
+    lookup tables and part number mappings.  Treat instances as read-only;
+    per-claim state (LLM call counter, audit context) lives on the
+    ``CoverageAnalyzer`` returned by ``create_analyzer``.
+    """
+
+    config_hash: str
+    config: AnalyzerConfig
+    rule_engine: RuleEngine
+    keyword_matcher: KeywordMatcher
+    llm_config: LLMMatcherConfig
+    component_config: ComponentConfig
+    workspace_path: Optional[Path] = None
+    part_lookup: Optional[PartNumberLookup] = None
+    build_time_ms: float = 0.0
+    _base_client: Any = field(default=None, init=False, repr=False)
+    _client_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    @classmethod
+    def from_config_path(
+        cls, config_path: Optional[Path], workspace_path: Optional[Path] = None
+    ) -> "AnalyzerSetup":
+        """Parse the coverage config and build all shared components.
+
+        Args:
+            config_path: Path to YAML config file (None or missing for defaults)
+            workspace_path: Path to workspace for part number lookup
+
+        Returns:
+            Fully built AnalyzerSetup
+        """
+        start = time.time()
+        config_hash = compute_coverage_config_hash(config_path, workspace_path)
+
+        analyzer_config = AnalyzerConfig()
+        rule_config = RuleConfig.default()
+        keyword_config = KeywordConfig(mappings=[])
+        llm_config = LLMMatcherConfig(
+            max_concurrent=analyzer_config.llm_max_concurrent,
+            classification_batch_size=analyzer_config.llm_classification_batch_size,
+        )
+        comp_config = ComponentConfig.default()
+
+        if config_path is not None and not config_path.exists():
+            logger.warning(f"Config file not found: {config_path}, using defaults")
+        elif config_path is not None:
+            with open(config_path, "r", encoding="utf-8") as f:
+                config_data = yaml.safe_load(f)
+
+            # Parse sub-configs
+            analyzer_config = AnalyzerConfig.from_dict(config_data.get("analyzer", {}))
+            rule_config = RuleConfig.from_dict(config_data.get("rules", {}))
+
+            # Load keyword config: from main YAML, or from sibling keyword mappings file
+            keyword_data = config_data.get("keywords", {})
+            if not keyword_data.get("mappings"):
+                keyword_file = _find_sibling(config_path, "*_keyword_mappings.yaml")
+                if keyword_file:
+                    with open(keyword_file, "r", encoding="utf-8") as f:
+                        keyword_data = yaml.safe_load(f) or {}
+                    logger.info(f"Loaded keyword mappings from {keyword_file.name}")
+            keyword_config = KeywordConfig.from_dict(keyword_data)
+
+            llm_config = LLMMatcherConfig.from_dict(config_data.get("llm", {}))
+            # Forward batch size from analyzer config to LLM config
+            llm_config.classification_batch_size = analyzer_config.llm_classification_batch_size
+
+            # Load component config from sibling *_component_config.yaml
+            comp_file = _find_sibling(config_path, "*_component_config.yaml")
+            if comp_file:
+                with open(comp_file, "r", encoding="utf-8") as f:
+                    comp_data = yaml.safe_load(f) or {}
+                comp_config = ComponentConfig.from_dict(comp_data)
+                logger.info(f"Loaded component config from {comp_file.name}")
+
+        part_lookup = None
+        if workspace_path:
+            part_lookup = PartNumberLookup(workspace_path)
+            part_lookup.preload()
+
+        return cls(
+            config_hash=config_hash,
+            config=analyzer_config,
+            rule_engine=RuleEngine(rule_config),
+            keyword_matcher=KeywordMatcher(keyword_config),
+            llm_config=llm_config,
+            component_config=comp_config,
+            workspace_path=workspace_path,
+            part_lookup=part_lookup,
+            build_time_ms=(time.time() - start) * 1000,
+        )
+
+    def create_llm_client(self) -> Any:
+        """Return a per-claim audited client sharing one underlying SDK client.
+
+        The OpenAI SDK client and audit sink are created once per setup;
+        each caller gets its own audit context so concurrent claims do not
+        overwrite each other's ``set_context`` values.
+        """
+        from context_builder.services.llm_audit import (
+            AuditedOpenAIClient,
+            create_audited_client,
+        )
+
+        with self._client_lock:
+            if self._base_client is None:
+                self._base_client = create_audited_client()
+            base = self._base_client
+        return AuditedOpenAIClient(base.client, base._sink)
+
+    def create_analyzer(self) -> "CoverageAnalyzer":
+        """Create a lightweight per-claim analyzer bound to this setup."""
+        return CoverageAnalyzer.from_setup(self)
+
+
+# Process-wide AnalyzerSetup cache keyed by (config path, workspace path).
+# Each entry is rebuilt when the coverage config hash changes.
+_setup_cache: Dict[Tuple[str, str], AnalyzerSetup] = {}
+_setup_cache_lock = threading.Lock()
+
+
+def get_analyzer_setup(
+    config_path: Optional[Path], workspace_path: Optional[Path] = None
+) -> AnalyzerSetup:
+    """Get the shared AnalyzerSetup for a coverage config, building it if needed.
+
+    The config files are re-hashed on every call (a few small reads), so
+    edits to the YAML or ``assumptions.json`` take effect on the next claim
+    without a process restart.
+
+    Args:
+        config_path: Path to YAML config file (None for defaults)
+        workspace_path: Path to workspace for part number lookup
+
+    Returns:
+        Cached or freshly built AnalyzerSetup
+    """
+    key = (str(config_path or ""), str(workspace_path or ""))
+    config_hash = compute_coverage_config_hash(config_path, workspace_path)
+
+    with _setup_cache_lock:
+        cached = _setup_cache.get(key)
+        if cached is not None and cached.config_hash == config_hash:
+            return cached
+
+        setup = AnalyzerSetup.from_config_path(config_path, workspace_path)
+        _setup_cache[key] = setup
+        logger.info(
+            f"Built coverage analyzer setup {setup.config_hash} "
+            f"in {setup.build_time_ms:.0f}ms"
+            + (" (config changed)" if cached is not None else "")
+        )
+        return setup
+
+
+def clear_analyzer_setup_cache() -> None:
+    """Clear the AnalyzerSetup cache."""
+    with _setup_cache_lock:
+        _setup_cache.clear()
+
+
 class CoverageAnalyzer:
     """Orchestrates the coverage analysis pipeline.
 
@@ -252,8 +484,12 @@ class CoverageAnalyzer:
     2. Keyword matcher: German term to category mapping
     3. LLM matcher: Fallback for ambiguous items
 
+    Analyzers are cheap per-claim objects: the parsed configuration and
+    compiled matchers live in a shared ``AnalyzerSetup``.  Batch callers
+    should use ``for_workspace`` so the setup is built once per config hash.
+
     Usage:
-        analyzer = CoverageAnalyzer.from_config(config_path)
+        analyzer = CoverageAnalyzer.for_workspace(config_path, workspace_path)
         result = analyzer.analyze(
             claim_id="65196",
             line_items=items_from_claim_facts,
@@ -271,6 +507,8 @@ class CoverageAnalyzer:
         llm_matcher: Optional[LLMMatcher] = None,
         workspace_path: Optional[Path] = None,
         component_config: Optional[ComponentConfig] = None,
+        part_lookup: Optional[PartNumberLookup] = None,
+        config_hash: Optional[str] = None,
     ):
         """Initialize the coverage analyzer.
 
@@ -281,6 +519,8 @@ class CoverageAnalyzer:
             llm_matcher: Pre-configured LLM matcher
             workspace_path: Path to workspace for part number lookup
             component_config: Customer-specific component vocabulary
+            part_lookup: Pre-loaded part number lookup (shared across claims)
+            config_hash: Hash of the coverage config this analyzer was built from
         """
         self.config = config or AnalyzerConfig()
         self.component_config = component_config or ComponentConfig.default()
@@ -288,7 +528,10 @@ class CoverageAnalyzer:
         self.keyword_matcher = keyword_matcher or KeywordMatcher()
         self.llm_matcher = llm_matcher
         self.workspace_path = workspace_path
-        self.part_lookup = PartNumberLookup(workspace_path) if workspace_path else None
+        if part_lookup is None and workspace_path:
+            part_lookup = PartNumberLookup(workspace_path)
+        self.part_lookup = part_lookup
+        self.config_hash = config_hash
 
     @classmethod
     def from_config_path(
@@ -296,6 +539,9 @@ class CoverageAnalyzer:
     ) -> "CoverageAnalyzer":
         """Create an analyzer from a YAML configuration file.
 
+        Always parses the configuration from disk.  Use ``for_workspace`` to
+        reuse a cached ``AnalyzerSetup`` across claims.
+
         Args:
             config_path: Path to YAML config file
             workspace_path: Path to workspace for part number lookup
@@ -303,49 +549,55 @@ class CoverageAnalyzer:
         Returns:
             Configured CoverageAnalyzer instance
         """
-        if not config_path.exists():
-            logger.warning(f"Config file not found: {config_path}, using defaults")
-            return cls(workspace_path=workspace_path)
-
-        with open(config_path, "r", encoding="utf-8") as f:
-            config_data = yaml.safe_load(f)
-
-        # Parse sub-configs
-        analyzer_config = AnalyzerConfig.from_dict(config_data.get("analyzer", {}))
-        rule_config = RuleConfig.from_dict(config_data.get("rules", {}))
-
-        # Load keyword config: from main YAML, or from sibling keyword mappings file
-        keyword_data = config_data.get("keywords", {})
-        if not keyword_data.get("mappings"):
-            keyword_file = _find_sibling(config_path, "*_keyword_mappings.yaml")
-            if keyword_file:
-                with open(keyword_file, "r", encoding="utf-8") as f:
-                    keyword_data = yaml.safe_load(f) or {}
-                logger.info(f"Loaded keyword mappings from {keyword_file.name}")
-        keyword_config = KeywordConfig.from_dict(keyword_data)
-
-        llm_config = LLMMatcherConfig.from_dict(config_data.get("llm", {}))
-        # Forward batch size from analyzer config to LLM config
-        llm_config.classification_batch_size = analyzer_config.llm_classification_batch_size
-
-        # Load component config from sibling *_component_config.yaml
-        comp_config = ComponentConfig.default()
-        comp_file = _find_sibling(config_path, "*_component_config.yaml")
-        if comp_file:
-            with open(comp_file, "r", encoding="utf-8") as f:
-                comp_data = yaml.safe_load(f) or {}
-            comp_config = ComponentConfig.from_dict(comp_data)
-            logger.info(f"Loaded component config from {comp_file.name}")
+        return AnalyzerSetup.from_config_path(
+            config_path, workspace_path=workspace_path
+        ).create_analyzer()
 
+    @classmethod
+    def from_setup(cls, setup: "AnalyzerSetup") -> "CoverageAnalyzer":
+        """Create a lightweight per-claim analyzer from a shared setup.
+
+        The rule engine, keyword matcher, component config and part lookup
+        are shared by reference; only the LLM matcher (call counter and
+        audit context) is created fresh.
+
+        Args:
+            setup: Shared immutable analyzer setup
+
+        Returns:
+            CoverageAnalyzer bound to the setup
+        """
         return cls(
-            config=analyzer_config,
-            rule_engine=RuleEngine(rule_config),
-            keyword_matcher=KeywordMatcher(keyword_config),
-            llm_matcher=LLMMatcher(llm_config),
-            workspace_path=workspace_path,
-            component_config=comp_config,
+            config=setup.config,
+            rule_engine=setup.rule_engine,
+            keyword_matcher=setup.keyword_matcher,
+            llm_matcher=LLMMatcher(
+                setup.llm_config, client_factory=setup.create_llm_client
+            ),
+            workspace_path=setup.workspace_path,
+            component_config=setup.component_config,
+            part_lookup=setup.part_lookup,
+            config_hash=setup.config_hash,
         )
 
+    @classmethod
+    def for_workspace(
+        cls, config_path: Optional[Path], workspace_path: Optional[Path] = None
+    ) -> "CoverageAnalyzer":
+        """Create a per-claim analyzer backed by the process-wide setup cache.
+
+        The setup is built once per coverage config hash; subsequent calls
+        with unchanged config files skip YAML parsing and pattern compilation.
+
+        Args:
+            config_path: Path to YAML config file (None for defaults)
+            workspace_path: Path to workspace for part number lookup
+
+        Returns:
+            CoverageAnalyzer bound to the cached setup
+        """
+        return get_analyzer_setup(config_path, workspace_path).create_analyzer()
+
     def _determine_coverage_percent(
         self,
         vehicle_km: Optional[int],
@@ -1293,18 +1545,7 @@ class CoverageAnalyzer:
         Returns:
             PrimaryRepairResult on success, None on failure (triggers fallback).
         """
-        # Format items for the LLM
-        items_for_llm = []
-        for idx, item in enumerate(all_items):
-            items_for_llm.append({
-                "index": idx,
-                "description": item.description,
-                "item_type": item.item_type,
-                "total_price": item.total_price or 0.0,
-                "coverage_status": item.coverage_status.value if item.coverage_status else "UNKNOWN",
-                "coverage_category": item.coverage_category,
-                "matched_component": item.matched_component,
-            })
+        items_for_llm = self._format_items_for_llm(all_items)
 
         try:
             result = self.llm_matcher.determine_primary_repair(
@@ -1324,6 +1565,46 @@ class CoverageAnalyzer:
         if result is None:
             return None
 
+        return self._resolve_llm_primary(
+            all_items, result, covered_components, claim_id,
+            excluded_components=excluded_components,
+        )
+
+    @staticmethod
+    def _format_items_for_llm(
+        all_items: List[LineItemCoverage],
+    ) -> List[Dict[str, Any]]:
+        """Format analyzed line items for primary repair / post-processing prompts."""
+        items_for_llm = []
+        for idx, item in enumerate(all_items):
+            items_for_llm.append({
+                "index": idx,
+                "description": item.description,
+                "item_type": item.item_type,
+                "total_price": item.total_price or 0.0,
+                "coverage_status": item.coverage_status.value if item.coverage_status else "UNKNOWN",
+                "coverage_category": item.coverage_category,
+                "matched_component": item.matched_component,
+            })
+        return items_for_llm
+
+    def _resolve_llm_primary(
+        self,
+        all_items: List[LineItemCoverage],
+        result: Dict[str, Any],
+        covered_components: Dict[str, List[str]],
+        claim_id: str = "",
+        excluded_components: Optional[Dict[str, List[str]]] = None,
+    ) -> Optional[PrimaryRepairResult]:
+        """Turn a parsed LLM primary repair answer into a PrimaryRepairResult.
+
+        Applies the parts-only redirect, the policy-level coverage fallback
+        and the consequential-damage checks.  Shared by the standalone
+        primary repair call and the combined post-processing pass.
+
+        Returns:
+            PrimaryRepairResult, or None if no parts item can anchor the repair.
+        """
         primary_idx = result["primary_item_index"]
         source_item = all_items[primary_idx]
 
@@ -1502,6 +1783,8 @@ class CoverageAnalyzer:
         claim_id: str = "",
         repair_description: Optional[str] = None,
         excluded_components: Optional[Dict[str, List[str]]] = None,
+        llm_result: Optional[Dict[str, Any]] = None,
+        skip_llm: bool = False,
     ) -> PrimaryRepairResult:
         """Determine the primary repair component (LLM-first, 2-tier).
 
@@ -1517,6 +1800,10 @@ class CoverageAnalyzer:
             repair_context: Detected repair context from labor descriptions
             claim_id: Claim identifier for logging
             repair_description: Damage/diagnostic context from claim documents
+            llm_result: Parsed primary repair answer from the combined
+                post-processing pass (used instead of a standalone LLM call)
+            skip_llm: Do not make a standalone LLM call (the combined pass
+                already consulted the LLM, even if it gave no valid answer)
 
         Returns:
             PrimaryRepairResult describing the primary component
@@ -1524,7 +1811,12 @@ class CoverageAnalyzer:
         primary_result: Optional[PrimaryRepairResult] = None
 
         # Tier 1: LLM-based determination
-        if self.config.use_llm_primary_repair and self.llm_matcher:
+        if llm_result is not None:
+            primary_result = self._resolve_llm_primary(
+                all_items, llm_result, covered_components, claim_id,
+                excluded_components=excluded_components,
+            )
+        elif self.config.use_llm_primary_repair and self.llm_matcher and not skip_llm:
             primary_result = self._llm_determine_primary(
                 all_items, covered_components, claim_id,
                 repair_description=repair_description,
@@ -1597,6 +1889,79 @@ class CoverageAnalyzer:
 
         return primary_result
 
+    def _run_combined_post_processing(
+        self,
+        all_items: List[LineItemCoverage],
+        covered_components: Dict[str, List[str]],
+        repair_context: Optional["RepairContext"] = None,
+        claim_id: str = "",
+        repair_description: Optional[str] = None,
+        excluded_components: Optional[Dict[str, List[str]]] = None,
+    ) -> Optional[Tuple[PrimaryRepairResult, List[LineItemCoverage]]]:
+        """Determine primary repair and labor linkage with one LLM call.
+
+        Obvious labor links (part numbers, adjacent positions) are settled
+        locally first so the LLM only sees the ambiguous labor.  That works
+        on copies of the items: when the combined call fails this returns
+        None and the caller runs the separate primary repair and labor
+        linkage calls on the untouched items.
+
+        Returns:
+            Tuple of (primary repair, updated items), or None to fall back.
+        """
+        all_items = prelink_labor([item.model_copy() for item in all_items])
+        has_covered_parts = any(
+            item.coverage_status == CoverageStatus.COVERED
+            and item.item_type in ("parts", "part", "piece")
+            for item in all_items
+        )
+        candidates, labor_payload, _parts_payload = build_labor_linkage_payloads(all_items)
+        if not has_covered_parts:
+            # Labor can only follow covered parts; nothing to link
+            candidates, labor_payload = [], []
+
+        try:
+            result = self.llm_matcher.classify_post_processing(
+                all_items=self._format_items_for_llm(all_items),
+                labor_items=labor_payload,
+                covered_components=covered_components,
+                claim_id=claim_id,
+                repair_description=repair_description,
+                excluded_components=excluded_components,
+            )
+        except Exception as e:
+            logger.warning(
+                "Combined post-processing failed for claim %s: %s -- "
+                "falling back to separate LLM calls",
+                claim_id, e,
+            )
+            return None
+
+        if not isinstance(result, dict):
+            logger.info(
+                "Combined post-processing returned no result for claim %s -- "
+                "falling back to separate LLM calls",
+                claim_id,
+            )
+            return None
+
+        primary_repair = self._determine_primary_repair(
+            all_items, covered_components, repair_context, claim_id,
+            repair_description=repair_description,
+            excluded_components=excluded_components,
+            llm_result=result.get("primary_repair"),
+            skip_llm=True,
+        )
+
+        if candidates:
+            all_items = apply_labor_linkage_verdicts(
+                all_items, candidates, result.get("labor_items") or [],
+                primary_repair=primary_repair,
+                strategy="combined_post_processing",
+            )
+
+        return primary_repair, all_items
+
     def _is_in_excluded_list(
         self,
         item: LineItemCoverage,
@@ -1641,58 +2006,49 @@ class CoverageAnalyzer:
 
         return False
 
-    def analyze(
+    def _merge_component_config(
         self,
-        claim_id: str,
-        line_items: List[Dict[str, Any]],
-        covered_components: Optional[Dict[str, List[str]]] = None,
-        excluded_components: Optional[Dict[str, List[str]]] = None,
-        vehicle_km: Optional[int] = None,
-        coverage_scale: Optional[List[Dict[str, Any]]] = None,
-        excess_percent: Optional[float] = None,
-        excess_minimum: Optional[float] = None,
-        claim_run_id: Optional[str] = None,
-        on_llm_progress: Optional[Callable[[int], None]] = None,
-        on_llm_start: Optional[Callable[[int], None]] = None,
-        vehicle_age_years: Optional[float] = None,
-        age_threshold_years: Optional[int] = None,
-        repair_description: Optional[str] = None,
-    ) -> CoverageAnalysisResult:
-        """Analyze coverage for all line items in a claim.
-
-        Args:
-            claim_id: Claim identifier
-            line_items: List of line item dicts from claim_facts
-            covered_components: Dict of category -> list of covered parts
-            excluded_components: Dict of category -> list of excluded parts
-            vehicle_km: Current vehicle odometer reading
-            coverage_scale: List of {km_threshold, coverage_percent, age_coverage_percent?}
-            excess_percent: Excess percentage from policy
-            excess_minimum: Minimum excess amount
-            claim_run_id: Optional claim run ID for output
-            on_llm_progress: Callback for LLM progress updates (increment)
-            on_llm_start: Callback when LLM matching starts (total count)
-            vehicle_age_years: Vehicle age in years (for age-based coverage reduction)
-            age_threshold_years: Age threshold for reduced coverage (from policy extraction, e.g., 8)
+        covered_components: Dict[str, List[str]],
+        excluded_components: Dict[str, List[str]],
+    ) -> None:
+        """Merge customer component config into the policy lists (in place).
 
-        Returns:
-            CoverageAnalysisResult with all analysis data
+        Adds always-excluded components to *excluded_components* and
+        additional_policy_parts to the matching *covered_components* category.
         """
-        start_time = time.time()
-        covered_components = covered_components or {}
-        excluded_components = excluded_components or {}
+        if not self.component_config:
+            return
 
         # Merge always-excluded components from customer config
-        if self.component_config and self.component_config.always_excluded_components:
-            for cat, parts in self.component_config.always_excluded_components.items():
-                cat_lower = cat.lower()
-                if cat_lower in excluded_components:
-                    existing = set(excluded_components[cat_lower])
-                    existing.update(parts)
-                    excluded_components[cat_lower] = list(existing)
-                else:
-                    excluded_components[cat_lower] = list(parts)
+        for cat, parts in (self.component_config.always_excluded_components or {}).items():
+            cat_lower = cat.lower()
+            if cat_lower in excluded_components:
+                existing = set(excluded_components[cat_lower])
+                existing.update(parts)
+                excluded_components[cat_lower] = list(existing)
+            else:
+                excluded_components[cat_lower] = list(parts)
 
+        # Merge additional_policy_parts into covered_components so the LLM
+        # sees the extended parts list (e.g., "Différentiel" under four_wd).
+        for cat, extra_parts in (self.component_config.additional_policy_parts or {}).items():
+            cat_lower = cat.lower()
+            if cat_lower in covered_components:
+                existing = list(covered_components[cat_lower])
+                for p in extra_parts:
+                    if p not in existing:
+                        existing.append(p)
+                covered_components[cat_lower] = existing
+
+    def _resolve_coverage_percent(
+        self,
+        claim_id: str,
+        vehicle_km: Optional[int],
+        coverage_scale: Optional[List[Dict[str, Any]]],
+        vehicle_age_years: Optional[float],
+        age_threshold_years: Optional[int],
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """Determine (mileage_percent, effective_percent) for a claim."""
         # Determine coverage percentage from scale (with per-tier age adjustment)
         mileage_percent, effective_percent = self._determine_coverage_percent(
             vehicle_km,
@@ -1712,36 +2068,52 @@ class CoverageAnalyzer:
             mileage_percent = self.config.default_coverage_percent
             effective_percent = self.config.default_coverage_percent
 
-        # Merge additional_policy_parts into covered_components so the LLM
-        # sees the extended parts list (e.g., "Différentiel" under four_wd).
-        if self.component_config and self.component_config.additional_policy_parts:
-            for cat, extra_parts in self.component_config.additional_policy_parts.items():
-                cat_lower = cat.lower()
-                if cat_lower in covered_components:
-                    existing = list(covered_components[cat_lower])
-                    for p in extra_parts:
-                        if p not in existing:
-                            existing.append(p)
-                    covered_components[cat_lower] = existing
-
-        # Extract covered categories
-        covered_categories = self._extract_covered_categories(covered_components)
+        return mileage_percent, effective_percent
 
-        # Extract repair context from labor descriptions
-        # This helps avoid false consumable matches (e.g., "Ölkühler" vs "Ölfilter")
-        repair_context = self._extract_repair_context(
-            line_items, covered_components, excluded_components
+    def _compute_inputs_fingerprint(
+        self,
+        covered_components: Dict[str, List[str]],
+        excluded_components: Dict[str, List[str]],
+        repair_context: RepairContext,
+        repair_description: Optional[str],
+    ) -> str:
+        """Fingerprint the claim-level inputs that item classification uses."""
+        return compute_inputs_fingerprint(
+            covered_components,
+            excluded_components,
+            config_hash=self.config_hash,
+            config_version=self.config.config_version,
+            repair_context=asdict(repair_context),
+            repair_description=repair_description,
         )
 
-        # Log with age info if relevant
-        age_info = ""
-        if vehicle_age_years is not None and effective_percent != mileage_percent:
-            age_info = f", age={vehicle_age_years:.1f}y, age-adjusted"
-        logger.info(
-            f"Analyzing {len(line_items)} items for claim {claim_id} "
-            f"(coverage={effective_percent}%, km={vehicle_km}{age_info})"
-        )
+    def _classify_items(
+        self,
+        claim_id: str,
+        line_items: List[Dict[str, Any]],
+        covered_components: Dict[str, List[str]],
+        excluded_components: Dict[str, List[str]],
+        repair_context: RepairContext,
+        on_llm_progress: Optional[Callable[[int], None]] = None,
+        on_llm_start: Optional[Callable[[int], None]] = None,
+        extra_covered_parts: Optional[List[Dict[str, str]]] = None,
+    ) -> _ClassifiedItems:
+        """Run classification stages 1-3 (rules, keyword bypass, LLM).
+
+        Args:
+            claim_id: Claim identifier
+            line_items: Raw line item dicts to classify
+            covered_components: Dict of category -> list of covered parts
+            excluded_components: Dict of category -> list of excluded parts
+            repair_context: Repair context extracted from all labor items
+            on_llm_progress: Callback for LLM progress updates (increment)
+            on_llm_start: Callback when LLM matching starts (total count)
+            extra_covered_parts: Covered parts classified outside this call
+                (incremental mode), added to the LLM claim context
 
+        Returns:
+            _ClassifiedItems in analysis order with their source indices
+        """
         # Stage 1: Rule engine
         # Skip consumable check if repair context indicates a covered component
         skip_consumable = repair_context.is_covered and repair_context.primary_component is not None
@@ -1752,6 +2124,16 @@ class CoverageAnalyzer:
         )
         logger.debug(f"Rules matched: {len(rule_matched)}/{len(line_items)}")
 
+        # batch_match returns the unmatched dicts themselves, so source
+        # indices can be recovered by identity.
+        remaining_ids = {id(item) for item in remaining}
+        rule_indices = [
+            i for i, item in enumerate(line_items) if id(item) not in remaining_ids
+        ]
+        remaining_indices = [
+            i for i, item in enumerate(line_items) if id(item) in remaining_ids
+        ]
+
         # Stage 2: Generate advisory hints (no coverage decisions)
         # Part-number and keyword hints are passed to the LLM as context.
         keyword_hints = self.keyword_matcher.generate_hints(remaining)
@@ -1779,7 +2161,9 @@ class CoverageAnalyzer:
         # hint mapping to a category NOT in the policy are deterministically
         # NOT_COVERED.  No LLM call can change a categorical impossibility.
         keyword_bypassed: List[LineItemCoverage] = []
+        keyword_indices: List[int] = []
         llm_remaining: List[Dict[str, Any]] = []
+        llm_indices: List[int] = []
         llm_keyword_hints: List[Optional[Dict[str, Any]]] = []
         llm_part_number_hints: List[Optional[Dict[str, Any]]] = []
         covered_cats = list(covered_components.keys())
@@ -1832,6 +2216,7 @@ class CoverageAnalyzer:
                     decision_trace=tb.build(),
                 )
                 keyword_bypassed.append(bypassed_item)
+                keyword_indices.append(remaining_indices[i])
                 logger.info(
                     "Keyword bypass: '%s' -> '%s' (conf %.2f) "
                     "not in covered categories %s",
@@ -1840,6 +2225,7 @@ class CoverageAnalyzer:
                 )
             else:
                 llm_remaining.append(item)
+                llm_indices.append(remaining_indices[i])
                 llm_keyword_hints.append(kw_hint)
                 llm_part_number_hints.append(pn_hint)
 
@@ -1868,7 +2254,7 @@ class CoverageAnalyzer:
                 on_llm_start(len(llm_remaining))
 
             # Collect covered parts from rule stage for LLM context
-            covered_parts_in_claim = []
+            covered_parts_in_claim = list(extra_covered_parts or [])
             for item in rule_matched:
                 if (
                     item.coverage_status == CoverageStatus.COVERED
@@ -1969,23 +2355,58 @@ class CoverageAnalyzer:
                     )
                 )
 
-        # Combine all results
-        all_items = rule_matched + part_matched + keyword_matched + llm_matched
+        return _ClassifiedItems(
+            items=rule_matched + part_matched + keyword_matched + llm_matched,
+            source_indices=rule_indices + keyword_indices + llm_indices,
+            keyword_hints_generated=keyword_hints_count,
+            part_number_hints_generated=pn_hints_count,
+        )
+
+    def _post_process(
+        self,
+        all_items: List[LineItemCoverage],
+        covered_components: Dict[str, List[str]],
+        excluded_components: Dict[str, List[str]],
+        repair_context: RepairContext,
+        claim_id: str,
+        repair_description: Optional[str] = None,
+    ) -> Tuple[Optional[PrimaryRepairResult], List[LineItemCoverage]]:
+        """Run the claim-level post-processing pipeline on classified items.
 
+        Returns:
+            Tuple of (primary_repair, items).  Items keep their order.
+        """
         # Post-processing pipeline (LLM-first):
-        # 1. Primary repair determination
-        primary_repair = self._determine_primary_repair(
-            all_items, covered_components, repair_context, claim_id,
-            repair_description=repair_description,
-            excluded_components=excluded_components,
-        )
+        # 1-2. Primary repair determination + labor linkage, either as one
+        #      combined LLM pass or as two separate calls (fallback)
+        combined = None
+        if (
+            self.config.use_combined_post_processing
+            and self.config.use_llm_primary_repair
+            and self.llm_matcher is not None
+        ):
+            combined = self._run_combined_post_processing(
+                all_items, covered_components, repair_context, claim_id,
+                repair_description=repair_description,
+                excluded_components=excluded_components,
+            )
 
-        # 2. LLM labor linkage (part-number matching + LLM for rest)
-        all_items = apply_labor_linkage(
-            all_items, llm_matcher=self.llm_matcher,
-            repair_context=repair_context,
-            primary_repair=primary_repair, claim_id=claim_id,
-        )
+        if combined is not None:
+            primary_repair, all_items = combined
+        else:
+            # 1. Primary repair determination
+            primary_repair = self._determine_primary_repair(
+                all_items, covered_components, repair_context, claim_id,
+                repair_description=repair_description,
+                excluded_components=excluded_components,
+            )
+
+            # 2. LLM labor linkage (part-number matching + LLM for rest)
+            all_items = apply_labor_linkage(
+                all_items, llm_matcher=self.llm_matcher,
+                repair_context=repair_context,
+                primary_repair=primary_repair, claim_id=claim_id,
+            )
 
         # 2b. Demote labor linked to excluded parts
         all_items = demote_labor_for_excluded_parts(
@@ -2004,6 +2425,31 @@ class CoverageAnalyzer:
             all_items, threshold=self.config.nominal_price_threshold,
         )
 
+        return primary_repair, all_items
+
+    def _build_result(
+        self,
+        claim_id: str,
+        claim_run_id: Optional[str],
+        all_items: List[LineItemCoverage],
+        primary_repair: Optional[PrimaryRepairResult],
+        repair_context: RepairContext,
+        covered_categories: List[str],
+        mileage_percent: Optional[float],
+        effective_percent: Optional[float],
+        vehicle_km: Optional[int],
+        vehicle_age_years: Optional[float],
+        age_threshold_years: Optional[int],
+        excess_percent: Optional[float],
+        excess_minimum: Optional[float],
+        start_time: float,
+        keyword_hints_generated: int = 0,
+        part_number_hints_generated: int = 0,
+        inputs_fingerprint: Optional[str] = None,
+        item_fingerprints: Optional[List[str]] = None,
+        items_reused: int = 0,
+    ) -> CoverageAnalysisResult:
+        """Compute the summary and assemble the CoverageAnalysisResult."""
         # Calculate summary using effective (age-adjusted) coverage percent
         summary = self._calculate_summary(
             all_items,
@@ -2017,14 +2463,24 @@ class CoverageAnalyzer:
         llm_calls = self.llm_matcher.get_llm_call_count() if self.llm_matcher else 0
 
         metadata = CoverageMetadata(
-            rules_applied=len(rule_matched),
-            part_numbers_applied=len(part_matched),
-            keywords_applied=len(keyword_matched),
+            rules_applied=sum(
+                1 for i in all_items if i.match_method == MatchMethod.RULE
+            ),
+            part_numbers_applied=sum(
+                1 for i in all_items if i.match_method == MatchMethod.PART_NUMBER
+            ),
+            keywords_applied=sum(
+                1 for i in all_items if i.match_method == MatchMethod.KEYWORD
+            ),
             llm_calls=llm_calls,
-            keyword_hints_generated=keyword_hints_count,
-            part_number_hints_generated=pn_hints_count,
+            keyword_hints_generated=keyword_hints_generated,
+            part_number_hints_generated=part_number_hints_generated,
             processing_time_ms=processing_time_ms,
             config_version=self.config.config_version,
+            config_hash=self.config_hash,
+            inputs_fingerprint=inputs_fingerprint,
+            item_fingerprints=item_fingerprints,
+            items_reused=items_reused,
         )
 
         # Build inputs record
@@ -2069,3 +2525,292 @@ class CoverageAnalyzer:
             repair_context=repair_context_result,
             metadata=metadata,
         )
+
+    def analyze(
+        self,
+        claim_id: str,
+        line_items: List[Dict[str, Any]],
+        covered_components: Optional[Dict[str, List[str]]] = None,
+        excluded_components: Optional[Dict[str, List[str]]] = None,
+        vehicle_km: Optional[int] = None,
+        coverage_scale: Optional[List[Dict[str, Any]]] = None,
+        excess_percent: Optional[float] = None,
+        excess_minimum: Optional[float] = None,
+        claim_run_id: Optional[str] = None,
+        on_llm_progress: Optional[Callable[[int], None]] = None,
+        on_llm_start: Optional[Callable[[int], None]] = None,
+        vehicle_age_years: Optional[float] = None,
+        age_threshold_years: Optional[int] = None,
+        repair_description: Optional[str] = None,
+    ) -> CoverageAnalysisResult:
+        """Analyze coverage for all line items in a claim.
+
+        Args:
+            claim_id: Claim identifier
+            line_items: List of line item dicts from claim_facts
+            covered_components: Dict of category -> list of covered parts
+            excluded_components: Dict of category -> list of excluded parts
+            vehicle_km: Current vehicle odometer reading
+            coverage_scale: List of {km_threshold, coverage_percent, age_coverage_percent?}
+            excess_percent: Excess percentage from policy
+            excess_minimum: Minimum excess amount
+            claim_run_id: Optional claim run ID for output
+            on_llm_progress: Callback for LLM progress updates (increment)
+            on_llm_start: Callback when LLM matching starts (total count)
+            vehicle_age_years: Vehicle age in years (for age-based coverage reduction)
+            age_threshold_years: Age threshold for reduced coverage (from policy extraction, e.g., 8)
+
+        Returns:
+            CoverageAnalysisResult with all analysis data
+        """
+        start_time = time.time()
+        covered_components = covered_components or {}
+        excluded_components = excluded_components or {}
+
+        self._merge_component_config(covered_components, excluded_components)
+
+        mileage_percent, effective_percent = self._resolve_coverage_percent(
+            claim_id, vehicle_km, coverage_scale,
+            vehicle_age_years, age_threshold_years,
+        )
+
+        # Extract covered categories
+        covered_categories = self._extract_covered_categories(covered_components)
+
+        # Extract repair context from labor descriptions
+        # This helps avoid false consumable matches (e.g., "Ölkühler" vs "Ölfilter")
+        repair_context = self._extract_repair_context(
+            line_items, covered_components, excluded_components
+        )
+
+        # Fingerprints let a later analyze_incremental() reuse these results
+        fingerprints = [line_item_fingerprint(item) for item in line_items]
+        inputs_fingerprint = self._compute_inputs_fingerprint(
+            covered_components, excluded_components, repair_context,
+            repair_description,
+        )
+
+        # Log with age info if relevant
+        age_info = ""
+        if vehicle_age_years is not None and effective_percent != mileage_percent:
+            age_info = f", age={vehicle_age_years:.1f}y, age-adjusted"
+        logger.info(
+            f"Analyzing {len(line_items)} items for claim {claim_id} "
+            f"(coverage={effective_percent}%, km={vehicle_km}{age_info})"
+        )
+
+        classified = self._classify_items(
+            claim_id, line_items, covered_components, excluded_components,
+            repair_context,
+            on_llm_progress=on_llm_progress,
+            on_llm_start=on_llm_start,
+        )
+
+        primary_repair, all_items = self._post_process(
+            classified.items, covered_components, excluded_components,
+            repair_context, claim_id,
+            repair_description=repair_description,
+        )
+
+        return self._build_result(
+            claim_id=claim_id,
+            claim_run_id=claim_run_id,
+            all_items=all_items,
+            primary_repair=primary_repair,
+            repair_context=repair_context,
+            covered_categories=covered_categories,
+            mileage_percent=mileage_percent,
+            effective_percent=effective_percent,
+            vehicle_km=vehicle_km,
+            vehicle_age_years=vehicle_age_years,
+            age_threshold_years=age_threshold_years,
+            excess_percent=excess_percent,
+            excess_minimum=excess_minimum,
+            start_time=start_time,
+            keyword_hints_generated=classified.keyword_hints_generated,
+            part_number_hints_generated=classified.part_number_hints_generated,
+            inputs_fingerprint=inputs_fingerprint,
+            item_fingerprints=[fingerprints[i] for i in classified.source_indices],
+        )
+
+    def analyze_incremental(
+        self,
+        previous: Optional[CoverageAnalysisResult],
+        claim_id: str,
+        line_items: List[Dict[str, Any]],
+        covered_components: Optional[Dict[str, List[str]]] = None,
+        excluded_components: Optional[Dict[str, List[str]]] = None,
+        vehicle_km: Optional[int] = None,
+        coverage_scale: Optional[List[Dict[str, Any]]] = None,
+        excess_percent: Optional[float] = None,
+        excess_minimum: Optional[float] = None,
+        claim_run_id: Optional[str] = None,
+        on_llm_progress: Optional[Callable[[int], None]] = None,
+        on_llm_start: Optional[Callable[[int], None]] = None,
+        vehicle_age_years: Optional[float] = None,
+        age_threshold_years: Optional[int] = None,
+        repair_description: Optional[str] = None,
+    ) -> CoverageAnalysisResult:
+        """Re-analyze a claim, reusing unchanged items from a previous result.
+
+        Line items are diffed against *previous* by fingerprint.  Unchanged
+        items keep their classification; only new or edited items go through
+        the rule/keyword/LLM stages.  Post-processing and the summary always
+        run on the merged item set.
+
+        Falls back to a full ``analyze`` when there is no previous result,
+        it predates item fingerprints, or the claim-level inputs (policy
+        lists, config, repair context) changed.
+
+        Args:
+            previous: Previous CoverageAnalysisResult for the same claim
+            (remaining args as for ``analyze``)
+
+        Returns:
+            CoverageAnalysisResult; ``metadata.items_reused`` records how many
+            item classifications were reused.
+        """
+        full_analysis_kwargs = dict(
+            claim_id=claim_id,
+            line_items=line_items,
+            covered_components=covered_components,
+            excluded_components=excluded_components,
+            vehicle_km=vehicle_km,
+            coverage_scale=coverage_scale,
+            excess_percent=excess_percent,
+            excess_minimum=excess_minimum,
+            claim_run_id=claim_run_id,
+            on_llm_progress=on_llm_progress,
+            on_llm_start=on_llm_start,
+            vehicle_age_years=vehicle_age_years,
+            age_threshold_years=age_threshold_years,
+            repair_description=repair_description,
+        )
+        if previous is None:
+            return self.analyze(**full_analysis_kwargs)
+
+        start_time = time.time()
+        covered = copy.deepcopy(covered_components or {})
+        excluded = copy.deepcopy(excluded_components or {})
+        self._merge_component_config(covered, excluded)
+
+        repair_context = self._extract_repair_context(line_items, covered, excluded)
+        inputs_fingerprint = self._compute_inputs_fingerprint(
+            covered, excluded, repair_context, repair_description,
+        )
+        if previous.metadata.inputs_fingerprint != inputs_fingerprint:
+            logger.info(
+                "Coverage inputs changed for claim %s -- running full analysis",
+                claim_id,
+            )
+            return self.analyze(**full_analysis_kwargs)
+
+        fingerprints = [line_item_fingerprint(item) for item in line_items]
+        diff = diff_line_items(previous, fingerprints)
+        if diff is None:
+            logger.info(
+                "Previous coverage analysis for claim %s has no item "
+                "fingerprints -- running full analysis",
+                claim_id,
+            )
+            return self.analyze(**full_analysis_kwargs)
+
+        mileage_percent, effective_percent = self._resolve_coverage_percent(
+            claim_id, vehicle_km, coverage_scale,
+            vehicle_age_years, age_threshold_years,
+        )
+        covered_categories = self._extract_covered_categories(covered)
+
+        keyword_hints_generated = 0
+        part_number_hints_generated = 0
+
+        if diff.is_unchanged:
+            # Same items, same inputs: only the claim-level aggregates
+            # (coverage percent, excess) can differ.
+            all_items = copy.deepcopy(previous.line_items)
+            primary_repair = copy.deepcopy(previous.primary_repair)
+            item_fingerprints = list(previous.metadata.item_fingerprints)
+            items_reused = len(all_items)
+        else:
+            reused: Dict[int, LineItemCoverage] = {}
+            changed = list(diff.changed)
+            for index, prev_index in diff.reused.items():
+                prev_item = previous.line_items[prev_index]
+                if has_post_processing_changes(prev_item):
+                    # Post-processing overwrote the classification verdict;
+                    # classify again so it can be re-derived from scratch.
+                    changed.append(index)
+                else:
+                    reused[index] = restore_classified_item(prev_item)
+            changed.sort()
+            items_reused = len(reused)
+
+            logger.info(
+                f"Incremental coverage analysis for claim {claim_id}: "
+                f"{len(reused)} reused, {len(changed)} to classify, "
+                f"{diff.removed} removed"
+            )
+
+            reused_covered_parts = [
+                {
+                    "item_code": item.item_code or "",
+                    "description": item.description,
+                    "matched_component": item.matched_component or "",
+                }
+                for item in reused.values()
+                if item.match_method == MatchMethod.RULE
+                and item.coverage_status == CoverageStatus.COVERED
+                and item.item_type in ("parts", "part", "piece")
+            ]
+
+            classified = self._classify_items(
+                claim_id, [line_items[i] for i in changed], covered, excluded,
+                repair_context,
+                on_llm_progress=on_llm_progress,
+                on_llm_start=on_llm_start,
+                extra_covered_parts=reused_covered_parts,
+            )
+            keyword_hints_generated = classified.keyword_hints_generated
+            part_number_hints_generated = classified.part_number_hints_generated
+
+            # Merge in the order a full analysis produces: grouped by
+            # classification stage, then by input position.
+            merged = list(reused.items()) + [
+                (changed[src], item)
+                for src, item in zip(classified.source_indices, classified.items)
+            ]
+            merged.sort(
+                key=lambda entry: (
+                    MATCH_METHOD_ORDER.get(entry[1].match_method, len(MATCH_METHOD_ORDER)),
+                    entry[0],
+                )
+            )
+
+            primary_repair, all_items = self._post_process(
+                [item for _, item in merged], covered, excluded,
+                repair_context, claim_id,
+                repair_description=repair_description,
+            )
+            item_fingerprints = [fingerprints[index] for index, _ in merged]
+
+        return self._build_result(
+            claim_id=claim_id,
+            claim_run_id=claim_run_id,
+            all_items=all_items,
+            primary_repair=primary_repair,
+            repair_context=repair_context,
+            covered_categories=covered_categories,
+            mileage_percent=mileage_percent,
+            effective_percent=effective_percent,
+            vehicle_km=vehicle_km,
+            vehicle_age_years=vehicle_age_years,
+            age_threshold_years=age_threshold_years,
+            excess_percent=excess_percent,
+            excess_minimum=excess_minimum,
+            start_time=start_time,
+            keyword_hints_generated=keyword_hints_generated,
+            part_number_hints_generated=part_number_hints_generated,
+            inputs_fingerprint=inputs_fingerprint,
+            item_fingerprints=item_fingerprints,
+            items_reused=items_reused,
+        )
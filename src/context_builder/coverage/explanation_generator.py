@@ -10,6 +10,11 @@ Two modes:
   2. **Template mode** (``llm_client=None``): Deterministic template fill
      from customer YAML config — no network calls.
 
+Analysis uses template mode via ``prepare()``, which also stores the policy
+context needed for a rewrite (``result.explanation_inputs``).  The LLM
+rewrite then runs lazily through ``rewrite_pending()`` when a reviewer opens
+the explanations, so most claims never pay for it.
+
 Customer config provides reason labels, explanation templates, and policy
 references.  Core code provides the grouping algorithm and LLM/template-fill
 framework.
@@ -27,6 +32,7 @@ import yaml
 from context_builder.coverage.schemas import (
     CoverageAnalysisResult,
     CoverageStatus,
+    ExplanationInputs,
     LineItemCoverage,
     NonCoveredExplanation,
 )
@@ -195,6 +201,9 @@ class ExplanationGenerator:
         ``generate()`` and the generator will call the LLM once to rewrite
         all group explanations.  Falls back to template mode on error.
       - **Template mode** (default): deterministic template fill from config.
+
+    For deferred rewriting, call ``prepare()`` during analysis and
+    ``rewrite_pending()`` when the explanations are actually needed.
     """
 
     # Default prompt name (resolved by prompt_loader)
@@ -278,6 +287,7 @@ class ExplanationGenerator:
                     explanation=explanation_text,
                     policy_reference=policy_ref,
                     match_confidence=min_conf,
+                    technical_reasoning=explanation_text,
                 )
             )
 
@@ -312,6 +322,91 @@ class ExplanationGenerator:
 
         return explanations, summary
 
+    def prepare(
+        self,
+        result: CoverageAnalysisResult,
+        currency: str = "CHF",
+        covered_components: Optional[Dict[str, List[str]]] = None,
+        excluded_components: Optional[Dict[str, List[str]]] = None,
+    ) -> CoverageAnalysisResult:
+        """Attach template explanations and the inputs for a later rewrite.
+
+        No LLM call is made.  ``result.explanation_inputs`` is only set when
+        ``covered_components`` is available (the rewrite prompt needs it).
+
+        Returns:
+            The same *result*, updated in place.
+        """
+        explanations, summary = self.generate(result, currency=currency)
+        if explanations:
+            result.non_covered_explanations = explanations
+            result.non_covered_summary = summary
+        if covered_components:
+            result.explanation_inputs = ExplanationInputs(
+                covered_components=covered_components,
+                excluded_components=excluded_components or {},
+                currency=currency,
+            )
+        return result
+
+    @staticmethod
+    def needs_rewrite(result: CoverageAnalysisResult) -> bool:
+        """Return True if *result* has template explanations awaiting a rewrite."""
+        inputs = result.explanation_inputs
+        if inputs is None or not inputs.covered_components:
+            return False
+        return any(
+            exp.explanation_source == "template"
+            for exp in result.non_covered_explanations or []
+        )
+
+    def rewrite_pending(
+        self, result: CoverageAnalysisResult, llm_client: Any
+    ) -> bool:
+        """Rewrite template explanations on *result* in place via one LLM call.
+
+        Groups that were already rewritten are left alone.  On LLM failure
+        the template text is kept, so a later call can retry.
+
+        Returns:
+            True if any explanation was rewritten.
+        """
+        if llm_client is None or not self.needs_rewrite(result):
+            return False
+
+        inputs = result.explanation_inputs
+        explanations = list(result.non_covered_explanations or [])
+        pending_indices = [
+            i for i, exp in enumerate(explanations)
+            if exp.explanation_source == "template"
+        ]
+        pending = [
+            explanations[i].model_copy(update={
+                "explanation": (
+                    explanations[i].technical_reasoning
+                    or explanations[i].explanation
+                ),
+            })
+            for i in pending_indices
+        ]
+
+        rewritten = self._llm_rewrite(
+            pending,
+            currency=inputs.currency,
+            covered_components=inputs.covered_components,
+            excluded_components=inputs.excluded_components,
+            llm_client=llm_client,
+        )
+
+        changed = False
+        for index, exp in zip(pending_indices, rewritten):
+            if exp.explanation_source == "llm":
+                explanations[index] = exp
+                changed = True
+        if changed:
+            result.non_covered_explanations = explanations
+        return changed
+
     # ------------------------------------------------------------------
     # LLM rewrite
     # ------------------------------------------------------------------
@@ -502,6 +597,7 @@ class ExplanationGenerator:
                 updated.append(exp.model_copy(update={
                     "explanation": lookup[idx],
                     "policy_reference": None,
+                    "explanation_source": "llm",
                 }))
             else:
                 updated.append(exp)
@@ -0,0 +1,182 @@
+"""Helpers for incremental coverage re-analysis.
+
+A full ``CoverageAnalyzer.analyze`` run classifies every line item, usually
+with one LLM call per batch.  When only a handful of items change (a single
+document re-extracted, a reviewer correcting one line), the classification
+of the untouched items is still valid as long as the policy inputs are the
+same.  These helpers fingerprint line items and the claim-level inputs so
+the analyzer can reuse previous ``LineItemCoverage`` results and only
+re-classify what actually changed.
+
+Post-processing (primary repair, labor linkage, demotions) depends on the
+whole item set, so it is always re-run.  Reused items therefore have their
+post-processing trace steps stripped before they are merged back in.
+"""
+
+import copy
+import hashlib
+import json
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+from context_builder.coverage.schemas import (
+    CoverageAnalysisResult,
+    LineItemCoverage,
+    MatchMethod,
+    TraceAction,
+)
+
+# Raw line item fields that influence classification.
+_FINGERPRINT_FIELDS = (
+    "item_code",
+    "description",
+    "item_type",
+    "total_price",
+    "repair_description",
+)
+
+# Decision-trace stages written by the post-processing pipeline.  Steps from
+# these stages are stripped from reused items because post-processing runs
+# again on the merged item set.
+POST_PROCESSING_STAGES = frozenset({
+    "labor_follows_parts",
+    "labor_linkage_llm",
+    "excluded_part_labor_demotion",
+    "labor_demotion",
+    "nominal_price_audit",
+})
+
+# Order in which CoverageAnalyzer.analyze concatenates classification stages.
+MATCH_METHOD_ORDER = {
+    MatchMethod.RULE: 0,
+    MatchMethod.PART_NUMBER: 1,
+    MatchMethod.KEYWORD: 2,
+    MatchMethod.LLM: 3,
+    MatchMethod.MANUAL: 4,
+}
+
+
+def _hash_payload(payload: Any) -> str:
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def line_item_fingerprint(item: Dict[str, Any]) -> str:
+    """Compute a stable fingerprint for a raw line item dict.
+
+    Only fields that influence classification are included; values are
+    normalised the same way the rule engine reads them (``None`` -> ``""``,
+    prices rounded to cents).
+    """
+    payload = {}
+    for key in _FINGERPRINT_FIELDS:
+        value = item.get(key)
+        if key == "total_price":
+            value = round(float(value or 0.0), 2)
+        elif isinstance(value, str):
+            value = value.strip()
+        else:
+            value = value or ""
+        payload[key] = value
+    return _hash_payload(payload)
+
+
+def compute_inputs_fingerprint(
+    covered_components: Dict[str, List[str]],
+    excluded_components: Dict[str, List[str]],
+    config_hash: Optional[str],
+    config_version: Optional[str],
+    repair_context: Optional[Dict[str, Any]] = None,
+    repair_description: Optional[str] = None,
+) -> str:
+    """Fingerprint the claim-level inputs that classification depends on.
+
+    If any of these differ from the previous run, item-level results cannot
+    be reused and the analyzer falls back to a full analysis.
+    """
+    payload = {
+        "covered": {k: sorted(v) for k, v in sorted(covered_components.items())},
+        "excluded": {k: sorted(v) for k, v in sorted(excluded_components.items())},
+        "config_hash": config_hash,
+        "config_version": config_version,
+        "repair_context": repair_context or {},
+        "repair_description": (repair_description or "").strip(),
+    }
+    return _hash_payload(payload)
+
+
+def has_post_processing_changes(item: LineItemCoverage) -> bool:
+    """Return True if post-processing changed this item's verdict.
+
+    Such items cannot be restored to their classification-stage state (the
+    original category/component are overwritten), so they are re-classified.
+    Items without a decision trace are treated the same way.
+    """
+    if item.decision_trace is None:
+        return True
+    return any(
+        step.stage in POST_PROCESSING_STAGES and step.action != TraceAction.SKIPPED
+        for step in item.decision_trace
+    )
+
+
+def restore_classified_item(item: LineItemCoverage) -> LineItemCoverage:
+    """Return a copy of *item* with post-processing trace steps removed."""
+    restored = copy.deepcopy(item)
+    if restored.decision_trace is not None:
+        restored.decision_trace = [
+            step for step in restored.decision_trace
+            if step.stage not in POST_PROCESSING_STAGES
+        ]
+    return restored
+
+
+@dataclass
+class LineItemDiff:
+    """Result of diffing new line items against a previous analysis.
+
+    Attributes:
+        reused: Mapping of new input index -> index in previous line_items.
+        changed: Input indices that must be (re-)classified.
+        removed: Number of previous items with no counterpart in the input.
+    """
+
+    reused: Dict[int, int] = field(default_factory=dict)
+    changed: List[int] = field(default_factory=list)
+    removed: int = 0
+
+    @property
+    def is_unchanged(self) -> bool:
+        return not self.changed and self.removed == 0
+
+
+def diff_line_items(
+    previous: CoverageAnalysisResult,
+    fingerprints: List[str],
+) -> Optional[LineItemDiff]:
+    """Match new item fingerprints against a previous analysis.
+
+    Duplicate fingerprints (e.g. the same labor line listed twice) are
+    matched one-to-one in order.
+
+    Returns:
+        LineItemDiff, or None if the previous result carries no usable
+        item fingerprints.
+    """
+    previous_fps = previous.metadata.item_fingerprints if previous.metadata else None
+    if not previous_fps or len(previous_fps) != len(previous.line_items):
+        return None
+
+    available: Dict[str, Deque[int]] = defaultdict(deque)
+    for prev_index, fp in enumerate(previous_fps):
+        available[fp].append(prev_index)
+
+    diff = LineItemDiff()
+    for index, fp in enumerate(fingerprints):
+        if available.get(fp):
+            diff.reused[index] = available[fp].popleft()
+        else:
+            diff.changed.append(index)
+    diff.removed = sum(len(q) for q in available.values())
+    return diff
@@ -55,6 +55,8 @@ class LLMMatcherConfig:
     labor_linkage_prompt_name: str = "labor_linkage"
     # Prompt file for batch coverage classification (without .md)
     batch_classify_prompt_name: str = "coverage_classify_batch"
+    # Prompt file for combined primary repair + labor linkage (without .md)
+    post_processing_prompt_name: str = "coverage_post_processing"
     # Number of items per LLM call in batch classification
     classification_batch_size: int = 15
 
@@ -75,6 +77,7 @@ class LLMMatcherConfig:
             primary_repair_prompt_name=config.get("primary_repair_prompt_name", "primary_repair"),
             labor_linkage_prompt_name=config.get("labor_linkage_prompt_name", "labor_linkage"),
             batch_classify_prompt_name=config.get("batch_classify_prompt_name", "coverage_classify_batch"),
+            post_processing_prompt_name=config.get("post_processing_prompt_name", "coverage_post_processing"),
             classification_batch_size=config.get("classification_batch_size", 15),
         )
 
@@ -104,23 +107,30 @@ class LLMMatcher:
         self,
         config: Optional[LLMMatcherConfig] = None,
         audited_client: Optional[Any] = None,
+        client_factory: Optional[Callable[[], Any]] = None,
     ):
         """Initialize the LLM matcher.
 
         Args:
             config: LLM matcher configuration
             audited_client: Optional pre-configured AuditedOpenAIClient
+            client_factory: Optional callable creating the client lazily
+                (used to share one SDK client across per-claim matchers)
         """
         self.config = config or LLMMatcherConfig()
         self._client = audited_client
+        self._client_factory = client_factory
         self._llm_calls = 0
 
     def _get_client(self) -> Any:
         """Get or create the audited OpenAI client."""
         if self._client is None:
-            from context_builder.services.llm_audit import create_audited_client
+            if self._client_factory is not None:
+                self._client = self._client_factory()
+            else:
+                from context_builder.services.llm_audit import create_audited_client
 
-            self._client = create_audited_client()
+                self._client = create_audited_client()
         return self._client
 
     def _build_prompt_messages(
@@ -1269,36 +1279,7 @@ class LLMMatcher:
                 content = content.split("```")[1].split("```")[0]
 
             data = json.loads(content.strip())
-            llm_results = data.get("labor_items", [])
-
-            by_index = {}
-            for r in llm_results:
-                idx = r.get("index")
-                if idx is not None:
-                    by_index[idx] = r
-
-            results = []
-            for item in labor_items:
-                idx = item["index"]
-                if idx in by_index:
-                    r = by_index[idx]
-                    results.append({
-                        "index": idx,
-                        "is_covered": bool(r.get("is_covered", False)),
-                        "linked_part_index": r.get("linked_part_index"),
-                        "confidence": float(r.get("confidence", 0.5)),
-                        "reasoning": r.get("reasoning", "No reasoning provided"),
-                    })
-                else:
-                    results.append({
-                        "index": idx,
-                        "is_covered": False,
-                        "linked_part_index": None,
-                        "confidence": 0.0,
-                        "reasoning": "Missing from LLM response (conservative default)",
-                    })
-
-            return results
+            return self._labor_linkage_from_data(data, labor_items)
 
         except (json.JSONDecodeError, KeyError, TypeError) as e:
             logger.warning("Failed to parse labor linkage response: %s", e)
@@ -1313,6 +1294,47 @@ class LLMMatcher:
                 for item in labor_items
             ]
 
+    @staticmethod
+    def _labor_linkage_from_data(
+        data: Dict[str, Any],
+        labor_items: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Build per-labor verdicts from a decoded ``labor_items`` payload.
+
+        Labor items missing from the payload get a conservative
+        not-covered verdict.
+        """
+        llm_results = data.get("labor_items", [])
+
+        by_index = {}
+        for r in llm_results:
+            idx = r.get("index")
+            if idx is not None:
+                by_index[idx] = r
+
+        results = []
+        for item in labor_items:
+            idx = item["index"]
+            if idx in by_index:
+                r = by_index[idx]
+                results.append({
+                    "index": idx,
+                    "is_covered": bool(r.get("is_covered", False)),
+                    "linked_part_index": r.get("linked_part_index"),
+                    "confidence": float(r.get("confidence", 0.5)),
+                    "reasoning": r.get("reasoning", "No reasoning provided"),
+                })
+            else:
+                results.append({
+                    "index": idx,
+                    "is_covered": False,
+                    "linked_part_index": None,
+                    "confidence": 0.0,
+                    "reasoning": "Missing from LLM response (conservative default)",
+                })
+
+        return results
+
     # ------------------------------------------------------------------
     # Labor relevance classification (batch LLM call for Mode 2)
     # ------------------------------------------------------------------
@@ -1689,45 +1711,245 @@ class LLMMatcher:
                 content = content.split("```")[1].split("```")[0]
 
             data = json.loads(content.strip())
+            return self._primary_repair_from_data(data, all_items)
 
-            primary_index = data.get("primary_item_index")
-            if primary_index is None:
-                logger.info("LLM primary repair response missing primary_item_index")
-                return None
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.warning("Failed to parse primary repair response: %s", e)
+            return None
+
+    @staticmethod
+    def _primary_repair_from_data(
+        data: Dict[str, Any],
+        all_items: List[Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """Validate a decoded primary repair payload.
+
+        Returns None when ``primary_item_index`` is missing or out of range.
+        """
+        primary_index = data.get("primary_item_index")
+        if primary_index is None:
+            logger.info("LLM primary repair response missing primary_item_index")
+            return None
 
-            primary_index = int(primary_index)
-            if primary_index < 0 or primary_index >= len(all_items):
-                logger.info(
-                    "LLM returned out-of-range primary_item_index=%d (valid: 0-%d)",
-                    primary_index, len(all_items) - 1,
+        primary_index = int(primary_index)
+        if primary_index < 0 or primary_index >= len(all_items):
+            logger.info(
+                "LLM returned out-of-range primary_item_index=%d (valid: 0-%d)",
+                primary_index, len(all_items) - 1,
+            )
+            return None
+
+        # Parse root cause (defaults to primary if not provided)
+        root_cause_idx = data.get("root_cause_item_index")
+        if root_cause_idx is not None:
+            root_cause_idx = int(root_cause_idx)
+            if root_cause_idx < 0 or root_cause_idx >= len(all_items):
+                logger.warning(
+                    "LLM returned out-of-range root_cause_item_index=%d, ignoring",
+                    root_cause_idx,
                 )
-                return None
+                root_cause_idx = None
+
+        return {
+            "primary_item_index": primary_index,
+            "component": data.get("component"),
+            "category": data.get("category"),
+            "confidence": float(data.get("confidence", 0.5)),
+            "reasoning": data.get("reasoning", "No reasoning provided"),
+            "root_cause_item_index": root_cause_idx,
+            "root_cause_component": data.get("root_cause_component"),
+            "root_cause_category": data.get("root_cause_category"),
+            "root_cause_is_excluded": bool(data.get("root_cause_is_excluded", False)),
+        }
+
+    # ------------------------------------------------------------------
+    # Combined post-processing (primary repair + labor linkage in one call)
+    # ------------------------------------------------------------------
+
+    def classify_post_processing(
+        self,
+        all_items: List[Dict[str, Any]],
+        labor_items: List[Dict[str, Any]],
+        covered_components: Dict[str, List[str]],
+        claim_id: Optional[str] = None,
+        repair_description: Optional[str] = None,
+        excluded_components: Optional[Dict[str, List[str]]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Identify the primary repair and link labor to parts in ONE call.
+
+        Replaces the serial ``determine_primary_repair`` +
+        ``classify_labor_linkage`` round-trips with a single structured
+        request over all line items.
+
+        Args:
+            all_items: List of dicts with keys: index, description, item_type,
+                total_price, coverage_status, coverage_category,
+                matched_component
+            labor_items: Labor candidates to link, with keys: index,
+                description, item_code, total_price
+            covered_components: Policy's covered components by category
+            claim_id: Claim ID for audit trail
+            repair_description: Damage/diagnostic context from claim documents
+            excluded_components: Policy's excluded components by category
+
+        Returns:
+            Dict with ``primary_repair`` (same shape as
+            ``determine_primary_repair``, or None if invalid) and
+            ``labor_items`` (same shape as ``classify_labor_linkage``).
+            Returns None on call or parse failure so the caller can fall
+            back to the separate calls.
+        """
+        if not all_items:
+            return None
+
+        messages = self._build_post_processing_prompt(
+            all_items, labor_items, covered_components, repair_description,
+            excluded_components=excluded_components,
+        )
+
+        client = self._get_client()
+        client.set_context(
+            claim_id=claim_id,
+            call_purpose="coverage_post_processing",
+        )
+
+        max_attempts = max(1, self.config.max_retries)
 
-            # Parse root cause (defaults to primary if not provided)
-            root_cause_idx = data.get("root_cause_item_index")
-            if root_cause_idx is not None:
-                root_cause_idx = int(root_cause_idx)
-                if root_cause_idx < 0 or root_cause_idx >= len(all_items):
+        for attempt in range(max_attempts):
+            try:
+                if attempt > 0:
+                    last_call_id = getattr(client, "get_last_call_id", lambda: None)()
+                    if last_call_id and hasattr(client, "mark_retry"):
+                        client.mark_retry(last_call_id)
+
+                response = client.chat_completions_create(
+                    model=self.config.model,
+                    messages=messages,
+                    temperature=self.config.temperature,
+                    max_tokens=1536,
+                    response_format={"type": "json_object"},
+                )
+                self._llm_calls += 1
+
+                content = response.choices[0].message.content
+                return self._parse_post_processing_response(
+                    content, all_items, labor_items,
+                )
+
+            except Exception as e:
+                if attempt < max_attempts - 1:
+                    base_delay = min(
+                        self.config.retry_base_delay * (2 ** attempt),
+                        self.config.retry_max_delay,
+                    )
+                    delay = random.uniform(0, base_delay)
                     logger.warning(
-                        "LLM returned out-of-range root_cause_item_index=%d, ignoring",
-                        root_cause_idx,
+                        "Post-processing LLM call failed (attempt %d/%d): %s. "
+                        "Retrying in %.1fs...",
+                        attempt + 1, max_attempts, e, delay,
+                    )
+                    time.sleep(delay)
+                else:
+                    logger.error(
+                        "Combined post-processing failed after %d attempts: %s",
+                        max_attempts, e,
                     )
-                    root_cause_idx = None
+
+        self._llm_calls += 1
+        return None
+
+    def _build_post_processing_prompt(
+        self,
+        all_items: List[Dict[str, Any]],
+        labor_items: List[Dict[str, Any]],
+        covered_components: Dict[str, List[str]],
+        repair_description: Optional[str] = None,
+        excluded_components: Optional[Dict[str, List[str]]] = None,
+    ) -> List[Dict[str, str]]:
+        """Build prompt messages for the combined post-processing pass."""
+        item_lines = []
+        for item in all_items:
+            category = item.get("coverage_category") or "N/A"
+            status = item.get("coverage_status", "unknown")
+            line = (
+                f"  [{item['index']}] {item['description']} | "
+                f"type={item.get('item_type', 'unknown')} | "
+                f"price={item.get('total_price', 0):.2f} CHF | "
+                f"category={category} | status={status}"
+            )
+            matched = item.get("matched_component")
+            if matched:
+                line += f" | identified_as={matched}"
+            item_lines.append(line)
+        items_text = "\n".join(item_lines)
+
+        labor_lines = []
+        for item in labor_items:
+            code_str = item.get("item_code") or "N/A"
+            labor_lines.append(
+                f"  [{item['index']}] {item['description']} | "
+                f"code={code_str} | price={item.get('total_price', 0):.2f} CHF"
+            )
+        labor_text = "\n".join(labor_lines) if labor_lines else "  (none)"
+
+        comp_lines = []
+        for category, parts in covered_components.items():
+            if parts:
+                parts_list = ", ".join(parts[:15])
+                if len(parts) > 15:
+                    parts_list += f", ... ({len(parts)} total)"
+                comp_lines.append(f"  - {category}: {parts_list}")
+        comp_text = "\n".join(comp_lines) if comp_lines else "  (none)"
+
+        excl_lines = []
+        for category, parts in (excluded_components or {}).items():
+            if parts:
+                excl_lines.append(f"  - {category}: {', '.join(parts)}")
+        excl_text = "\n".join(excl_lines) if excl_lines else "  (none)"
+
+        from context_builder.utils.prompt_loader import load_prompt
+
+        prompt_data = load_prompt(
+            self.config.post_processing_prompt_name,
+            line_items=items_text,
+            labor_text=labor_text,
+            covered_components=comp_text,
+            excluded_components=excl_text,
+            repair_description=repair_description or "",
+        )
+        return prompt_data["messages"]
+
+    def _parse_post_processing_response(
+        self,
+        content: str,
+        all_items: List[Dict[str, Any]],
+        labor_items: List[Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """Parse the combined post-processing response.
+
+        Returns:
+            Dict with ``primary_repair`` and ``labor_items``, or None if the
+            response is not valid JSON with the expected sections.
+        """
+        try:
+            if "```json" in content:
+                content = content.split("```json")[1].split("```")[0]
+            elif "```" in content:
+                content = content.split("```")[1].split("```")[0]
+
+            data = json.loads(content.strip())
+            primary_data = data.get("primary_repair")
+            if not isinstance(primary_data, dict):
+                logger.info("Post-processing response missing primary_repair section")
+                return None
 
             return {
-                "primary_item_index": primary_index,
-                "component": data.get("component"),
-                "category": data.get("category"),
-                "confidence": float(data.get("confidence", 0.5)),
-                "reasoning": data.get("reasoning", "No reasoning provided"),
-                "root_cause_item_index": root_cause_idx,
-                "root_cause_component": data.get("root_cause_component"),
-                "root_cause_category": data.get("root_cause_category"),
-                "root_cause_is_excluded": bool(data.get("root_cause_is_excluded", False)),
+                "primary_repair": self._primary_repair_from_data(primary_data, all_items),
+                "labor_items": self._labor_linkage_from_data(data, labor_items),
             }
 
-        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
-            logger.warning("Failed to parse primary repair response: %s", e)
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError, AttributeError) as e:
+            logger.warning("Failed to parse post-processing response: %s", e)
             return None
 
     def get_llm_call_count(self) -> int:
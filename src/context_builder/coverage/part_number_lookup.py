@@ -250,6 +250,11 @@ class PartNumberLookup:
         # self._providers.append(FordETKProvider(api_key=...))
         # self._providers.append(TecDocProvider(api_key=...))
 
+    def preload(self) -> None:
+        """Eagerly load static mappings so the instance can be shared across threads."""
+        if self._assumptions_provider is not None:
+            self._assumptions_provider._load_mappings()
+
     def add_provider(self, provider: PartLookupProvider) -> None:
         """Add a lookup provider to the chain."""
         self._providers.append(provider)
@@ -51,34 +51,10 @@ def build_excluded_parts_index(
     return {"codes": codes, "components": components}
 
 
-def apply_labor_linkage(
+def _collect_covered_parts(
     items: List[LineItemCoverage],
-    llm_matcher: Any,
-    repair_context: Any = None,
-    primary_repair: Optional[PrimaryRepairResult] = None,
-    claim_id: str = "",
-) -> List[LineItemCoverage]:
-    """Link labor items to covered parts (LLM-first, 2 strategies).
-
-    1. **Part-number matching** (deterministic): If a labor description
-       contains a covered part's item_code, the labor is linked to that
-       part.
-
-    2. **LLM labor linkage**: For all remaining uncovered labor, make ONE
-       batch LLM call that sees ALL parts and ALL labor together and
-       determines which labor is necessary for which covered parts.
-
-    Args:
-        items: List of analyzed line items
-        llm_matcher: LLM matcher instance (or None to skip LLM step)
-        repair_context: Detected repair context from labor descriptions
-        primary_repair: Primary repair result for LLM context
-        claim_id: Claim ID for audit trail
-
-    Returns:
-        Updated list with labor items potentially promoted
-    """
-    # Collect all covered parts
+) -> Tuple[List[LineItemCoverage], Dict[str, LineItemCoverage]]:
+    """Return covered parts and an index of them by cleaned item_code."""
     covered_parts: List[LineItemCoverage] = []
     covered_parts_by_code: Dict[str, LineItemCoverage] = {}
     for item in items:
@@ -91,8 +67,19 @@ def apply_labor_linkage(
                 clean_code = "".join(c for c in item.item_code if c.isalnum()).upper()
                 if len(clean_code) >= 4:
                     covered_parts_by_code[clean_code] = item
+    return covered_parts, covered_parts_by_code
 
-    # Strategy 1: Part-number matching (deterministic)
+
+def _link_labor_by_part_number(
+    items: List[LineItemCoverage],
+    covered_parts_by_code: Dict[str, LineItemCoverage],
+) -> int:
+    """Promote uncovered labor whose description contains a covered part's code.
+
+    Returns:
+        Number of labor items promoted.
+    """
+    promoted = 0
     if covered_parts_by_code:
         for item in items:
             if item.item_type not in LABOR_TYPES:
@@ -126,29 +113,135 @@ def apply_labor_linkage(
                         f"Promoted labor '{item.description}' to COVERED "
                         f"(linked to part number: {part_code})"
                     )
+                    promoted += 1
                     break
 
-    # Strategy 2: LLM labor linkage for remaining uncovered labor
-    if not covered_parts or llm_matcher is None:
-        return items
+    return promoted
+
+
+# Minimum length of a description token to count as shared between a
+# labor line and its neighbouring part line (skips "und", "aus", "R&I").
+_ADJACENT_MIN_TOKEN_LEN = 5
+
+
+def _description_tokens(description: str) -> set:
+    """Split a description into upper-cased alphanumeric tokens."""
+    cleaned = "".join(c if c.isalnum() else " " for c in description.upper())
+    return {t for t in cleaned.split() if len(t) >= _ADJACENT_MIN_TOKEN_LEN}
 
-    # Collect uncovered labor candidates for LLM evaluation
-    candidates = []
+
+def _link_labor_by_adjacency(items: List[LineItemCoverage]) -> int:
+    """Promote labor that directly neighbours a covered part it names.
+
+    Estimates list removal/installation labor next to the part it serves
+    (e.g. "Steuerkette" followed by "Aus-/Einbau Steuerkette").  A labor
+    line is linked only when an adjacent line is a COVERED part and both
+    descriptions share a significant token; everything else is left to
+    the LLM.
+
+    Returns:
+        Number of labor items promoted.
+    """
+    promoted = 0
     for idx, item in enumerate(items):
-        if item.item_type not in LABOR_TYPES:
-            continue
-        if item.coverage_status == CoverageStatus.COVERED:
-            continue
-        if item.match_method != MatchMethod.LLM:
+        if not _is_linkage_candidate(item):
             continue
-        if item.exclusion_reason:
+        labor_tokens = _description_tokens(item.description)
+        if not labor_tokens:
             continue
-        candidates.append((idx, item))
 
-    if not candidates:
-        return items
+        for neighbour_idx in (idx - 1, idx + 1):
+            if not 0 <= neighbour_idx < len(items):
+                continue
+            part = items[neighbour_idx]
+            if (
+                part.coverage_status != CoverageStatus.COVERED
+                or part.item_type not in ("parts", "part", "piece")
+            ):
+                continue
+            shared = labor_tokens & _description_tokens(part.description)
+            if not shared:
+                continue
+
+            item.coverage_status = CoverageStatus.COVERED
+            item.coverage_category = part.coverage_category
+            item.matched_component = part.matched_component
+            item.match_confidence = 0.80
+            item.covered_amount = item.total_price
+            item.not_covered_amount = 0.0
+            item.match_reasoning = (
+                f"Labor for adjacent covered part: {part.description} "
+                f"(shared term: {sorted(shared)[0]})"
+            )
+            adj_tb = TraceBuilder()
+            adj_tb.extend(item.decision_trace)
+            adj_tb.add("labor_follows_parts", TraceAction.PROMOTED,
+                       f"Labor linked to adjacent covered part [{neighbour_idx}]",
+                       verdict=CoverageStatus.COVERED, confidence=0.80,
+                       detail={"strategy": "adjacent_position",
+                               "linked_part_index": neighbour_idx,
+                               "shared_terms": sorted(shared)},
+                       decision_source=DecisionSource.PROMOTION)
+            item.decision_trace = adj_tb.build()
+            logger.debug(
+                f"Promoted labor '{item.description}' to COVERED "
+                f"(adjacent to covered part [{neighbour_idx}])"
+            )
+            promoted += 1
+            break
+    return promoted
+
+
+def prelink_labor(items: List[LineItemCoverage]) -> List[LineItemCoverage]:
+    """Settle obvious labor-to-part links locally, without the LLM.
+
+    Runs the deterministic linkers used ahead of the combined
+    post-processing LLM pass:
+
+    1. Part-number matching: the labor description contains a covered
+       part's item_code.
+    2. Adjacent position: the labor line neighbours a covered part and
+       shares a significant description token with it.
+
+    Args:
+        items: List of analyzed line items
+
+    Returns:
+        The same list, with obvious labor links promoted to COVERED
+    """
+    _covered_parts, covered_parts_by_code = _collect_covered_parts(items)
+    by_code = _link_labor_by_part_number(items, covered_parts_by_code)
+    by_position = _link_labor_by_adjacency(items)
+    if by_code or by_position:
+        logger.info(
+            "Pre-linked %d labor item(s) locally (%d by part number, %d by position)",
+            by_code + by_position, by_code, by_position,
+        )
+    return items
+
+
+def _is_linkage_candidate(item: LineItemCoverage) -> bool:
+    """Whether a labor item is eligible for LLM labor linkage."""
+    return (
+        item.item_type in LABOR_TYPES
+        and item.coverage_status != CoverageStatus.COVERED
+        and item.match_method == MatchMethod.LLM
+        and not item.exclusion_reason
+    )
+
+
+def build_labor_linkage_payloads(
+    items: List[LineItemCoverage],
+) -> Tuple[List[Tuple[int, LineItemCoverage]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Collect labor linkage candidates and the LLM payloads describing them.
+
+    Returns:
+        Tuple of (candidates as (index, item) pairs, labor payload, parts payload).
+    """
+    candidates = [
+        (idx, item) for idx, item in enumerate(items) if _is_linkage_candidate(item)
+    ]
 
-    # Build parts context for LLM
     parts_payload = []
     for idx, item in enumerate(items):
         if item.item_type in ("parts", "part", "piece"):
@@ -171,6 +264,48 @@ def apply_labor_linkage(
         }
         for idx, item in candidates
     ]
+    return candidates, labor_payload, parts_payload
+
+
+def apply_labor_linkage(
+    items: List[LineItemCoverage],
+    llm_matcher: Any,
+    repair_context: Any = None,
+    primary_repair: Optional[PrimaryRepairResult] = None,
+    claim_id: str = "",
+) -> List[LineItemCoverage]:
+    """Link labor items to covered parts (LLM-first, 2 strategies).
+
+    1. **Part-number matching** (deterministic): If a labor description
+       contains a covered part's item_code, the labor is linked to that
+       part.
+
+    2. **LLM labor linkage**: For all remaining uncovered labor, make ONE
+       batch LLM call that sees ALL parts and ALL labor together and
+       determines which labor is necessary for which covered parts.
+
+    Args:
+        items: List of analyzed line items
+        llm_matcher: LLM matcher instance (or None to skip LLM step)
+        repair_context: Detected repair context from labor descriptions
+        primary_repair: Primary repair result for LLM context
+        claim_id: Claim ID for audit trail
+
+    Returns:
+        Updated list with labor items potentially promoted
+    """
+    covered_parts, covered_parts_by_code = _collect_covered_parts(items)
+
+    # Strategy 1: Part-number matching (deterministic)
+    _link_labor_by_part_number(items, covered_parts_by_code)
+
+    # Strategy 2: LLM labor linkage for remaining uncovered labor
+    if not covered_parts or llm_matcher is None:
+        return items
+
+    candidates, labor_payload, parts_payload = build_labor_linkage_payloads(items)
+    if not candidates:
+        return items
 
     # Build primary repair context for LLM
     primary_ctx = None
@@ -206,6 +341,33 @@ def apply_labor_linkage(
             item.decision_trace = fail_tb.build()
         return items
 
+    return apply_labor_linkage_verdicts(
+        items, candidates, verdicts, primary_repair=primary_repair,
+    )
+
+
+def apply_labor_linkage_verdicts(
+    items: List[LineItemCoverage],
+    candidates: List[Tuple[int, LineItemCoverage]],
+    verdicts: List[Dict[str, Any]],
+    primary_repair: Optional[PrimaryRepairResult] = None,
+    strategy: str = "llm_labor_linkage",
+) -> List[LineItemCoverage]:
+    """Apply LLM labor linkage verdicts to the candidate labor items.
+
+    Labor is only promoted when its linked part is itself COVERED.
+
+    Args:
+        items: List of analyzed line items
+        candidates: (index, item) pairs that were sent to the LLM
+        verdicts: Per-labor verdict dicts (index, is_covered, linked_part_index,
+            confidence, reasoning)
+        primary_repair: Primary repair used when no part index is linked
+        strategy: Strategy name recorded in the decision trace
+
+    Returns:
+        Updated list with labor items potentially promoted
+    """
     # Apply verdicts
     verdict_by_idx = {v["index"]: v for v in verdicts}
 
@@ -234,7 +396,7 @@ def apply_labor_linkage(
                     "labor_linkage_llm", TraceAction.SKIPPED,
                     reasoning,
                     detail={
-                        "strategy": "llm_labor_linkage",
+                        "strategy": strategy,
                         "linked_part_index": linked_part_idx,
                         "linked_part_status": linked_part.coverage_status.value,
                         "llm_confidence": verdict.get("confidence", 0),
@@ -271,7 +433,7 @@ def apply_labor_linkage(
                 f"LLM labor linkage: necessary for covered parts",
                 verdict=CoverageStatus.COVERED,
                 detail={
-                    "strategy": "llm_labor_linkage",
+                    "strategy": strategy,
                     "linked_part_index": linked_part_idx,
                     "llm_confidence": verdict.get("confidence", 0),
                     "llm_reasoning": verdict.get("reasoning", ""),
@@ -294,7 +456,7 @@ def apply_labor_linkage(
                 "labor_linkage_llm", TraceAction.SKIPPED,
                 f"LLM labor linkage: not necessary: {reasoning}",
                 detail={
-                    "strategy": "llm_labor_linkage",
+                    "strategy": strategy,
                     "llm_confidence": (
                         verdict.get("confidence", 0) if verdict else 0
                     ),
@@ -10,12 +10,17 @@ Rules are applied in order:
 4. Zero-price items -> COVERED
 5. Non-covered labor patterns (labor only) -> NOT_COVERED
 6. Generic/empty descriptions -> NOT_COVERED
+
+Each pattern list is compiled into a single combined alternation
+(``_PatternSet``), and exact-match rules (fee item types, literal generic
+descriptions) use set lookups.  ``batch_match`` evaluates every rule column
+once over all items before resolving outcomes in the priority order above.
 """
 
 import logging
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from context_builder.coverage.schemas import (
     CoverageStatus,
@@ -28,6 +33,102 @@ from context_builder.coverage.trace import TraceBuilder
 
 logger = logging.getLogger(__name__)
 
+# Constructs that change meaning (or fail) once a pattern is embedded in a
+# larger alternation: numbered/named backreferences, conditionals and global
+# inline flags.
+_UNCOMBINABLE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
+
+# Patterns per sub-alternation used to locate the winning pattern.
+_CHUNK_SIZE = 32
+
+
+def _alternation(patterns: List["re.Pattern[str]"]) -> "re.Pattern[str]":
+    return re.compile(
+        "|".join(f"(?:{p.pattern})" for p in patterns), re.IGNORECASE
+    )
+
+
+class _PatternSet:
+    """Ordered regex patterns evaluated as one combined alternation.
+
+    ``first_match`` returns the index of the first pattern in config order
+    that matches, exactly as looping over the patterns would.  Most
+    descriptions match nothing, so a single scan with the combined
+    alternation rejects them; on a hit, chunked sub-alternations narrow
+    down the first matching pattern before individual patterns are tried.
+
+    The alternation is non-capturing: with named groups per pattern, CPython's
+    regex engine saves every group mark at each branch, which made large
+    rule sets slower than the plain loop.
+    """
+
+    def __init__(self, patterns: List["re.Pattern[str]"], combine: bool = True):
+        self.patterns = patterns
+        self._combined: Optional["re.Pattern[str]"] = None
+        self._chunks: List[Tuple[int, "re.Pattern[str]"]] = []
+        if combine and patterns and not any(
+            _UNCOMBINABLE.search(p.pattern) for p in patterns
+        ):
+            try:
+                self._combined = _alternation(patterns)
+                if len(patterns) > _CHUNK_SIZE:
+                    self._chunks = [
+                        (start, _alternation(patterns[start:start + _CHUNK_SIZE]))
+                        for start in range(0, len(patterns), _CHUNK_SIZE)
+                    ]
+            except re.error:
+                logger.debug("Pattern set not combinable, evaluating individually")
+                self._combined = None
+                self._chunks = []
+
+    def first_match(self, text: str) -> Optional[int]:
+        """Return the index of the first matching pattern, or None."""
+        if self._combined is None:
+            for i, pattern in enumerate(self.patterns):
+                if pattern.search(text):
+                    return i
+            return None
+
+        if self._combined.search(text) is None:
+            return None
+        for start, chunk in self._chunks or [(0, self._combined)]:
+            if self._chunks and chunk.search(text) is None:
+                continue
+            for i in range(start, min(start + _CHUNK_SIZE, len(self.patterns))):
+                if self.patterns[i].search(text):
+                    return i
+        return None
+
+    def any_match(self, text: str) -> bool:
+        """Return True if any pattern matches *text*."""
+        if self._combined is not None:
+            return self._combined.search(text) is not None
+        return any(pattern.search(text) for pattern in self.patterns)
+
+
+class _ExactPatternSet:
+    """Anchored (full-string, case-insensitive) patterns.
+
+    Plain literals are answered with a set lookup; only real regexes go
+    through the combined ``^(...)$`` pattern.
+    """
+
+    def __init__(self, patterns: List[str], split_literals: bool = True):
+        literals = [p for p in patterns if split_literals and re.escape(p) == p]
+        regexes = [p for p in patterns if p not in literals]
+        self._literals: FrozenSet[str] = frozenset(p.lower() for p in literals)
+        self._regex: Optional["re.Pattern[str]"] = None
+        if regexes:
+            self._regex = re.compile(f"^({'|'.join(regexes)})$", re.IGNORECASE)
+
+    def __bool__(self) -> bool:
+        return bool(self._literals) or self._regex is not None
+
+    def match(self, text: str) -> bool:
+        if text.lower() in self._literals:
+            return True
+        return self._regex is not None and self._regex.match(text) is not None
+
 
 @dataclass
 class RuleConfig:
@@ -85,13 +186,17 @@ class RuleEngine:
     of items that need keyword or LLM analysis.
     """
 
-    def __init__(self, config: Optional[RuleConfig] = None):
+    def __init__(self, config: Optional[RuleConfig] = None, columnar: bool = True):
         """Initialize the rule engine.
 
         Args:
             config: Rule configuration. Uses defaults if not provided.
+            columnar: If True, combine each pattern list into one alternation
+                and evaluate batch_match column by column.  False keeps the
+                per-pattern, per-item evaluation (same outcomes).
         """
         self.config = config or RuleConfig.default()
+        self.columnar = columnar
 
         # Pre-compile regex patterns for performance
         self._exclusion_patterns = [
@@ -107,14 +212,21 @@ class RuleEngine:
             re.compile(p, re.IGNORECASE) for p in self.config.component_override_patterns
         ]
 
-        # Build combined generic description pattern (anchored ^...$)
-        if self.config.generic_description_patterns:
-            joined = "|".join(self.config.generic_description_patterns)
-            self._generic_description_pattern = re.compile(
-                f"^({joined})$", re.IGNORECASE
-            )
-        else:
-            self._generic_description_pattern = None
+        # Combined pattern sets (one scan per description per rule)
+        self._exclusion_set = _PatternSet(self._exclusion_patterns, combine=columnar)
+        self._consumable_set = _PatternSet(self._consumable_patterns, combine=columnar)
+        self._non_covered_labor_set = _PatternSet(
+            self._non_covered_labor_patterns, combine=columnar
+        )
+        self._component_override_set = _PatternSet(
+            self._component_override_patterns, combine=columnar
+        )
+
+        # Exact-match rules: hash lookups
+        self._fee_item_types = frozenset(t.lower() for t in self.config.fee_item_types)
+        self._generic_description_set = _ExactPatternSet(
+            self.config.generic_description_patterns, split_literals=columnar
+        )
 
     def match(
         self,
@@ -139,10 +251,40 @@ class RuleEngine:
         Returns:
             LineItemCoverage if matched by a rule, None otherwise
         """
+        return self._apply_rules(
+            description,
+            item_type,
+            item_code,
+            total_price,
+            skip_consumable_check=skip_consumable_check,
+            repair_context_component=repair_context_component,
+        )
+
+    def _apply_rules(
+        self,
+        description: str,
+        item_type: str,
+        item_code: Optional[str],
+        total_price: float,
+        skip_consumable_check: bool = False,
+        repair_context_component: Optional[str] = None,
+        hits: Optional[Dict[str, Any]] = None,
+    ) -> Optional[LineItemCoverage]:
+        """Resolve rule outcomes for one item in priority order.
+
+        Args:
+            hits: Precomputed rule columns from ``_evaluate_columns``.  Any
+                column that is missing is evaluated on demand.
+
+        Returns:
+            LineItemCoverage if matched by a rule, None otherwise
+        """
+        hits = hits or {}
+        item_type_lower = item_type.lower()
         tb = TraceBuilder()
 
         # Rule 1: Fee items are never covered
-        if item_type.lower() in [t.lower() for t in self.config.fee_item_types]:
+        if item_type_lower in self._fee_item_types:
             tb.add("rule_engine", TraceAction.EXCLUDED,
                    f"Fee items ({item_type}) are not covered by policy",
                    verdict=CoverageStatus.NOT_COVERED, confidence=1.0,
@@ -159,67 +301,76 @@ class RuleEngine:
             )
 
         # Rule 2: Check exclusion patterns
-        for pattern in self._exclusion_patterns:
-            if pattern.search(description):
+        exclusion_hit = (
+            hits["exclusion"] if "exclusion" in hits
+            else self._exclusion_set.first_match(description)
+        )
+        if exclusion_hit is not None:
+            pattern = self._exclusion_patterns[exclusion_hit]
+            tb.add("rule_engine", TraceAction.EXCLUDED,
+                   f"Item matches exclusion pattern: {pattern.pattern}",
+                   verdict=CoverageStatus.NOT_COVERED, confidence=1.0,
+                   detail={"rule": "exclusion_pattern", "pattern": pattern.pattern},
+                   decision_source=DecisionSource.RULE)
+            return self._create_not_covered(
+                description=description,
+                item_type=item_type,
+                item_code=item_code,
+                total_price=total_price,
+                reasoning=f"Item matches exclusion pattern: {pattern.pattern}",
+                exclusion_reason="exclusion_pattern",
+                trace=tb.build(),
+            )
+
+        # Rule 3: Check consumable patterns (parts only)
+        # Skip if repair context indicates a covered component
+        if item_type_lower == "parts":
+            consumable_hit = (
+                hits["consumable"] if "consumable" in hits
+                else self._consumable_set.first_match(description)
+            )
+        else:
+            consumable_hit = None
+
+        if consumable_hit is not None and not skip_consumable_check:
+            pattern = self._consumable_patterns[consumable_hit]
+            # Check if description also indicates a component (not consumable)
+            is_component = (
+                hits["component_override"] if "component_override" in hits
+                else self._component_override_set.any_match(description)
+            )
+            if is_component:
+                # Don't exclude, let it fall through
+                logger.info(
+                    f"Consumable pattern matched but component override "
+                    f"detected for '{description}' - skipping exclusion"
+                )
+            else:
                 tb.add("rule_engine", TraceAction.EXCLUDED,
-                       f"Item matches exclusion pattern: {pattern.pattern}",
+                       f"Consumable item not covered: {pattern.pattern}",
                        verdict=CoverageStatus.NOT_COVERED, confidence=1.0,
-                       detail={"rule": "exclusion_pattern", "pattern": pattern.pattern},
+                       detail={"rule": "consumable", "pattern": pattern.pattern},
                        decision_source=DecisionSource.RULE)
                 return self._create_not_covered(
                     description=description,
                     item_type=item_type,
                     item_code=item_code,
                     total_price=total_price,
-                    reasoning=f"Item matches exclusion pattern: {pattern.pattern}",
-                    exclusion_reason="exclusion_pattern",
+                    reasoning=f"Consumable item not covered: {pattern.pattern}",
+                    exclusion_reason="consumable",
                     trace=tb.build(),
                 )
-
-        # Rule 3: Check consumable patterns (parts only)
-        # Skip if repair context indicates a covered component
-        if item_type.lower() == "parts" and not skip_consumable_check:
-            for pattern in self._consumable_patterns:
-                if pattern.search(description):
-                    # Check if description also indicates a component (not consumable)
-                    is_component = any(
-                        cp.search(description)
-                        for cp in self._component_override_patterns
-                    )
-                    if is_component:
-                        logger.info(
-                            f"Consumable pattern matched but component override "
-                            f"detected for '{description}' - skipping exclusion"
-                        )
-                        break  # Don't exclude, let it fall through
-                    tb.add("rule_engine", TraceAction.EXCLUDED,
-                           f"Consumable item not covered: {pattern.pattern}",
-                           verdict=CoverageStatus.NOT_COVERED, confidence=1.0,
-                           detail={"rule": "consumable", "pattern": pattern.pattern},
-                           decision_source=DecisionSource.RULE)
-                    return self._create_not_covered(
-                        description=description,
-                        item_type=item_type,
-                        item_code=item_code,
-                        total_price=total_price,
-                        reasoning=f"Consumable item not covered: {pattern.pattern}",
-                        exclusion_reason="consumable",
-                        trace=tb.build(),
-                    )
-        elif item_type.lower() == "parts" and skip_consumable_check:
+        elif consumable_hit is not None:
             # Log that we skipped consumable check due to repair context
-            for pattern in self._consumable_patterns:
-                if pattern.search(description):
-                    tb.add("rule_engine", TraceAction.SKIPPED,
-                           f"Consumable check skipped - repair context: {repair_context_component}",
-                           detail={"rule": "consumable_override_by_repair_context",
-                                   "repair_component": repair_context_component},
-                           decision_source=DecisionSource.RULE)
-                    logger.info(
-                        f"Skipped consumable exclusion for '{description}' - "
-                        f"repair context indicates '{repair_context_component}' (covered)"
-                    )
-                    break
+            tb.add("rule_engine", TraceAction.SKIPPED,
+                   f"Consumable check skipped - repair context: {repair_context_component}",
+                   detail={"rule": "consumable_override_by_repair_context",
+                           "repair_component": repair_context_component},
+                   decision_source=DecisionSource.RULE)
+            logger.info(
+                f"Skipped consumable exclusion for '{description}' - "
+                f"repair context indicates '{repair_context_component}' (covered)"
+            )
 
         # Rule 4: Zero-price items (labor) - likely complimentary, skip coverage
         if total_price == 0.0:
@@ -245,27 +396,34 @@ class RuleEngine:
             )
 
         # Rule 5: Non-covered labor patterns (labor only)
-        if item_type.lower() == "labor":
-            for pattern in self._non_covered_labor_patterns:
-                if pattern.search(description):
-                    tb.add("rule_engine", TraceAction.EXCLUDED,
-                           f"Labor matches non-covered pattern: {pattern.pattern}",
-                           verdict=CoverageStatus.NOT_COVERED, confidence=1.0,
-                           detail={"rule": "non_covered_labor", "pattern": pattern.pattern},
-                           decision_source=DecisionSource.RULE)
-                    return self._create_not_covered(
-                        description=description,
-                        item_type=item_type,
-                        item_code=item_code,
-                        total_price=total_price,
-                        reasoning=f"Labor matches non-covered pattern: {pattern.pattern}",
-                        exclusion_reason="non_covered_labor",
-                        trace=tb.build(),
-                    )
+        if item_type_lower == "labor":
+            labor_hit = (
+                hits["non_covered_labor"] if "non_covered_labor" in hits
+                else self._non_covered_labor_set.first_match(description)
+            )
+            if labor_hit is not None:
+                pattern = self._non_covered_labor_patterns[labor_hit]
+                tb.add("rule_engine", TraceAction.EXCLUDED,
+                       f"Labor matches non-covered pattern: {pattern.pattern}",
+                       verdict=CoverageStatus.NOT_COVERED, confidence=1.0,
+                       detail={"rule": "non_covered_labor", "pattern": pattern.pattern},
+                       decision_source=DecisionSource.RULE)
+                return self._create_not_covered(
+                    description=description,
+                    item_type=item_type,
+                    item_code=item_code,
+                    total_price=total_price,
+                    reasoning=f"Labor matches non-covered pattern: {pattern.pattern}",
+                    exclusion_reason="non_covered_labor",
+                    trace=tb.build(),
+                )
 
         # Rule 6: Generic/empty descriptions with no semantic content
-        stripped = description.strip()
-        if self._generic_description_pattern and self._generic_description_pattern.match(stripped):
+        is_generic = (
+            hits["generic"] if "generic" in hits
+            else self._generic_description_set.match(description.strip())
+        )
+        if is_generic:
             tb.add("rule_engine", TraceAction.EXCLUDED,
                    "Generic description - insufficient detail for coverage determination",
                    verdict=CoverageStatus.NOT_COVERED, confidence=1.0,
@@ -325,17 +483,18 @@ class RuleEngine:
         Returns:
             LineItemCoverage (NOT_COVERED) if pattern matches, None otherwise
         """
-        for pattern in self._non_covered_labor_patterns:
-            if pattern.search(description):
-                return self._create_not_covered(
-                    description=description,
-                    item_type="labor",
-                    item_code=None,
-                    total_price=0.0,
-                    reasoning=f"Labor matches non-covered pattern: {pattern.pattern}",
-                    exclusion_reason="non_covered_labor",
-                )
-        return None
+        hit = self._non_covered_labor_set.first_match(description)
+        if hit is None:
+            return None
+        pattern = self._non_covered_labor_patterns[hit]
+        return self._create_not_covered(
+            description=description,
+            item_type="labor",
+            item_code=None,
+            total_price=0.0,
+            reasoning=f"Labor matches non-covered pattern: {pattern.pattern}",
+            exclusion_reason="non_covered_labor",
+        )
 
     def matches_exclusion_pattern(self, text: str) -> Optional[str]:
         """Check if text matches any exclusion pattern.
@@ -344,10 +503,55 @@ class RuleEngine:
         """
         if not text:
             return None
-        for pattern in self._exclusion_patterns:
-            if pattern.search(text):
-                return pattern.pattern
-        return None
+        hit = self._exclusion_set.first_match(text)
+        return self._exclusion_patterns[hit].pattern if hit is not None else None
+
+    def _evaluate_columns(
+        self,
+        descriptions: List[str],
+        item_types: List[str],
+        skip_consumable_check: bool,
+    ) -> List[Dict[str, Any]]:
+        """Evaluate every rule column once over all items.
+
+        Columns are only computed for rows the rule can apply to (e.g. the
+        consumable column for parts that were not already excluded).
+
+        Returns:
+            One ``hits`` dict per item for ``_apply_rules``.
+        """
+        hits: List[Dict[str, Any]] = [{} for _ in descriptions]
+        active = [
+            i for i, t in enumerate(item_types) if t not in self._fee_item_types
+        ]
+
+        for i in active:
+            hits[i]["exclusion"] = self._exclusion_set.first_match(descriptions[i])
+        active = [i for i in active if hits[i]["exclusion"] is None]
+
+        for i in active:
+            if item_types[i] == "parts":
+                hit = self._consumable_set.first_match(descriptions[i])
+                hits[i]["consumable"] = hit
+                if hit is not None and not skip_consumable_check:
+                    hits[i]["component_override"] = (
+                        self._component_override_set.any_match(descriptions[i])
+                    )
+            elif item_types[i] == "labor":
+                hits[i]["non_covered_labor"] = (
+                    self._non_covered_labor_set.first_match(descriptions[i])
+                )
+
+        if self._generic_description_set:
+            for i in active:
+                hits[i]["generic"] = self._generic_description_set.match(
+                    descriptions[i].strip()
+                )
+        else:
+            for i in active:
+                hits[i]["generic"] = False
+
+        return hits
 
     def batch_match(
         self,
@@ -369,14 +573,28 @@ class RuleEngine:
         matched = []
         unmatched = []
 
-        for item in items:
-            result = self.match(
-                description=item.get("description") or "",
-                item_type=item.get("item_type") or "",
-                item_code=item.get("item_code"),
-                total_price=item.get("total_price") or 0.0,
+        descriptions = [item.get("description") or "" for item in items]
+        item_types = [item.get("item_type") or "" for item in items]
+        if self.columnar:
+            columns = self._evaluate_columns(
+                descriptions,
+                [t.lower() for t in item_types],
+                skip_consumable_check,
+            )
+        else:
+            columns = [None] * len(items)
+
+        for item, description, item_type, hits in zip(
+            items, descriptions, item_types, columns
+        ):
+            result = self._apply_rules(
+                description,
+                item_type,
+                item.get("item_code"),
+                item.get("total_price") or 0.0,
                 skip_consumable_check=skip_consumable_check,
                 repair_context_component=repair_context_component,
+                hits=hits,
             )
             if result:
                 matched.append(result)
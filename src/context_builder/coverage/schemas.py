@@ -217,6 +217,20 @@ class CoverageMetadata(BaseModel):
     config_version: Optional[str] = Field(
         None, description="Version of coverage config used"
     )
+    config_hash: Optional[str] = Field(
+        None, description="Hash of the coverage config files used"
+    )
+    inputs_fingerprint: Optional[str] = Field(
+        None,
+        description="Fingerprint of the claim-level inputs used for classification",
+    )
+    item_fingerprints: Optional[List[str]] = Field(
+        None,
+        description="Per-item input fingerprints, aligned with line_items",
+    )
+    items_reused: int = Field(
+        0, description="Count of item classifications reused by incremental analysis"
+    )
 
 
 class PrimaryRepairResult(BaseModel):
@@ -288,6 +302,24 @@ class NonCoveredExplanation(BaseModel):
     match_confidence: float = Field(
         1.0, ge=0.0, le=1.0, description="Minimum confidence in this group"
     )
+    explanation_source: Literal["template", "llm"] = Field(
+        "template", description="Whether the text is template-filled or LLM-rewritten"
+    )
+    technical_reasoning: Optional[str] = Field(
+        None, description="Template/technical text the LLM rewrite starts from"
+    )
+
+
+class ExplanationInputs(BaseModel):
+    """Policy context needed to rewrite explanations on demand."""
+
+    covered_components: Dict[str, List[str]] = Field(
+        default_factory=dict, description="Covered components by category"
+    )
+    excluded_components: Dict[str, List[str]] = Field(
+        default_factory=dict, description="Excluded components by category"
+    )
+    currency: str = Field("CHF", description="Currency code for amounts")
 
 
 class CoverageAnalysisResult(BaseModel):
@@ -337,6 +369,10 @@ class CoverageAnalysisResult(BaseModel):
     non_covered_summary: Optional[str] = Field(
         None, description="Summary string of non-covered items"
     )
+    explanation_inputs: Optional[ExplanationInputs] = Field(
+        None,
+        description="Inputs for on-demand LLM rewrite of non-covered explanations",
+    )
 
     # Processing metadata
     metadata: CoverageMetadata = Field(
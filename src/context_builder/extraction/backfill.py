@@ -14,6 +14,7 @@ from typing import Any, Dict, Optional
 from context_builder.schemas.extraction_result import ExtractionResult, PageContent
 from context_builder.extraction.evidence_resolver import resolve_evidence_offsets
 from context_builder.extraction.validators import validate_extraction
+from context_builder.storage.artifact_codec import read_json_artifact
 
 logger = logging.getLogger(__name__)
 
@@ -30,9 +31,8 @@ def _load_azure_di(doc_dir: Path) -> Optional[Dict[str, Any]]:
     azure_di_path = doc_dir / "text" / "raw" / "azure_di.json"
     if azure_di_path.exists():
         try:
-            with open(azure_di_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            return read_json_artifact(azure_di_path)
+        except (ValueError, IOError) as e:
             logger.debug(f"Failed to load Azure DI: {e}")
     return None
 
@@ -63,17 +63,15 @@ def backfill_extraction(
 
     # Load pages if not embedded or empty
     if not result.pages:
-        with open(pages_path, "r", encoding="utf-8") as f:
-            pages_data = json.load(f)
+        pages_data = read_json_artifact(pages_path)
         result.pages = [PageContent.model_validate(p) for p in pages_data]
 
     # Load Azure DI for table-aware matching
     azure_di = None
     if azure_di_path and azure_di_path.exists():
         try:
-            with open(azure_di_path, "r", encoding="utf-8") as f:
-                azure_di = json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            azure_di = read_json_artifact(azure_di_path)
+        except (ValueError, IOError) as e:
             logger.debug(f"Failed to load Azure DI from {azure_di_path}: {e}")
 
     # Count before
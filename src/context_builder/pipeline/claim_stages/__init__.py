@@ -49,6 +49,16 @@ from context_builder.pipeline.claim_stages.decision import (
     DefaultDecisionEngine,
     load_engine_from_workspace,
 )
+from context_builder.pipeline.claim_stages.dag import (
+    ClaimStageGraph,
+    StageGraphReport,
+    StageNode,
+)
+from context_builder.pipeline.claim_stages.plugin_registry import (
+    PluginRegistry,
+    get_plugin_registry,
+    clear_plugin_registry,
+)
 # NOTE: ConfidenceStage lives in context_builder.confidence.stage which itself
 # imports from this package's .context module.  Importing it eagerly here would
 # create a circular import chain:
@@ -157,6 +167,9 @@ __all__ = [
     # Protocol and runner
     "ClaimStage",
     "ClaimPipelineRunner",
+    "ClaimStageGraph",
+    "StageNode",
+    "StageGraphReport",
     # Callback types
     "ClaimPhaseCallback",
     "ClaimPhaseEndCallback",
@@ -184,6 +197,10 @@ __all__ = [
     "DecisionEngine",
     "DefaultDecisionEngine",
     "load_engine_from_workspace",
+    # Workspace plugin cache
+    "PluginRegistry",
+    "get_plugin_registry",
+    "clear_plugin_registry",
 ]
 
 
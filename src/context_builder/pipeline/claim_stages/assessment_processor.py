@@ -8,13 +8,18 @@ decision engine (see decision.py).
 All LLM calls are logged via the compliance audit service.
 """
 
+import copy
 import json
 import logging
 import os
+import threading
 import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
 
 from context_builder.services.openai_client import get_openai_client
 
@@ -35,6 +40,80 @@ from context_builder.schemas.assessment_response import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class CompiledResponseSchema:
+    """Strict-mode response_format and validator for one response model.
+
+    Instances are shared across threads; treat ``response_format`` as
+    read-only.
+    """
+
+    model: Type[BaseModel]
+    prompt_version: Optional[str]
+    response_format: Dict[str, Any]
+
+    def validate_json(self, content: str) -> BaseModel:
+        """Validate raw JSON text with the model's compiled validator.
+
+        Parses and validates in one pass (no intermediate dict).
+
+        Raises:
+            pydantic.ValidationError: If the content is not valid JSON or
+                does not match the model.
+        """
+        return self.model.model_validate_json(content)
+
+    def validate_python(self, data: Dict[str, Any]) -> BaseModel:
+        """Validate an already-parsed (e.g. normalized) response dict."""
+        return self.model.model_validate(data)
+
+
+# Compiled schemas keyed by (model class, prompt version).  Building the
+# strict schema deep-copies and walks the whole Pydantic schema, so it is
+# done once per key and shared by all threads.
+_SCHEMA_CACHE: Dict[Tuple[Type[BaseModel], Optional[str]], CompiledResponseSchema] = {}
+_SCHEMA_CACHE_LOCK = threading.Lock()
+
+
+def clear_response_schema_cache() -> None:
+    """Clear the compiled response schema cache (used by tests)."""
+    with _SCHEMA_CACHE_LOCK:
+        _SCHEMA_CACHE.clear()
+
+
+def validate_strict_schema(schema: Any, path: str = "$") -> None:
+    """Check that a JSON schema satisfies OpenAI strict-mode constraints.
+
+    Raises:
+        ValueError: On the first violation, naming the offending path.
+    """
+    if isinstance(schema, list):
+        for i, item in enumerate(schema):
+            validate_strict_schema(item, f"{path}[{i}]")
+        return
+    if not isinstance(schema, dict):
+        return
+
+    for key in ("$ref", "$defs", "allOf", "default"):
+        if key in schema:
+            raise ValueError(f"Strict schema has '{key}' at {path}")
+
+    if schema.get("type") == "object":
+        if schema.get("additionalProperties") is not False:
+            raise ValueError(f"Strict schema object at {path} allows additional properties")
+        properties = schema.get("properties", {})
+        if set(schema.get("required", [])) != set(properties):
+            raise ValueError(f"Strict schema object at {path} has optional properties")
+        for name, prop in properties.items():
+            validate_strict_schema(prop, f"{path}.{name}")
+
+    if "items" in schema:
+        validate_strict_schema(schema["items"], f"{path}[]")
+    for key in ("anyOf", "oneOf"):
+        if key in schema:
+            validate_strict_schema(schema[key], f"{path}.{key}")
+
+
 class AssessmentProcessor:
     """Processor that evaluates claims and produces assessment decisions.
 
@@ -49,6 +128,9 @@ class AssessmentProcessor:
         # OpenAI client will be created lazily
         self._client = None
         self._audited_client: Optional[AuditedOpenAIClient] = None
+        # Compile and validate the strict schema up front so a schema that
+        # strict mode would reject fails at import, not mid-batch.
+        self._compile_response_schema()
 
     def _ensure_client(self) -> None:
         """Ensure OpenAI client is initialized (uses Azure OpenAI if configured)."""
@@ -332,6 +414,7 @@ class AssessmentProcessor:
             max_tokens=config.max_tokens,
             on_token_update=on_token_update,
             on_retry=_on_retry,
+            prompt_version=config.prompt_version,
         )
 
         # Signal LLM call complete for progress reporting
@@ -504,31 +587,88 @@ Provide your assessment as JSON matching the response schema."""
 
         return system_prompt, user_prompt
 
-    def _build_response_format(self) -> Dict[str, Any]:
+    def _compile_response_schema(
+        self,
+        prompt_version: Optional[str] = None,
+        model: Type[BaseModel] = AssessmentResponse,
+    ) -> CompiledResponseSchema:
+        """Return the cached strict schema for a response model.
+
+        The schema is built and validated once per (model, prompt_version)
+        and then shared across threads and processor instances.
+        """
+        key = (model, prompt_version)
+        compiled = _SCHEMA_CACHE.get(key)
+        if compiled is not None:
+            return compiled
+
+        with _SCHEMA_CACHE_LOCK:
+            compiled = _SCHEMA_CACHE.get(key)
+            if compiled is not None:
+                return compiled
+
+            # OpenAI strict mode requires additionalProperties: false on all
+            # objects and all properties must be required
+            schema = self._prepare_schema_for_strict_mode(model.model_json_schema())
+            validate_strict_schema(schema)
+
+            compiled = CompiledResponseSchema(
+                model=model,
+                prompt_version=prompt_version,
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": "assessment_response",
+                        "strict": True,
+                        "schema": schema,
+                    },
+                },
+            )
+            _SCHEMA_CACHE[key] = compiled
+            logger.debug(
+                f"Compiled strict response schema for {model.__name__} "
+                f"(prompt_version={prompt_version})"
+            )
+            return compiled
+
+    def _build_response_format(self, prompt_version: Optional[str] = None) -> Dict[str, Any]:
         """Build the response_format parameter for structured JSON output.
 
         Attempts to use json_schema mode for strict enforcement.
         Falls back to json_object if schema mode is not supported.
 
+        Args:
+            prompt_version: Prompt version the schema is cached under.
+
         Returns:
-            Response format dict for OpenAI API.
+            Response format dict for OpenAI API (shared, do not mutate).
         """
-        # Get JSON schema from Pydantic model
-        schema = AssessmentResponse.model_json_schema()
+        return self._compile_response_schema(prompt_version).response_format
 
-        # OpenAI strict mode requires additionalProperties: false on all objects
-        # and all properties must be required
-        schema = self._prepare_schema_for_strict_mode(schema)
+    def _parse_response(
+        self, content: str, prompt_version: Optional[str] = None
+    ) -> AssessmentResponse:
+        """Parse and validate raw LLM output.
 
-        # Use json_schema mode for strict enforcement
-        return {
-            "type": "json_schema",
-            "json_schema": {
-                "name": "assessment_response",
-                "strict": True,
-                "schema": schema,
-            },
-        }
+        Well-formed responses are validated straight from the JSON text.
+        Only if that fails is the JSON loaded, normalized and re-validated,
+        so LLM quirks fixed by _normalize_response are still accepted.
+
+        Raises:
+            json.JSONDecodeError: If the content is not valid JSON.
+            pydantic.ValidationError: If the normalized response is invalid.
+        """
+        compiled = self._compile_response_schema(prompt_version)
+        try:
+            return compiled.validate_json(content)
+        except ValidationError:
+            pass
+
+        result = json.loads(content)
+
+        # Normalize LLM output before validation
+        result = self._normalize_response(result)
+        return compiled.validate_python(result)
 
     def _prepare_schema_for_strict_mode(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare a JSON schema for OpenAI strict mode.
@@ -539,7 +679,6 @@ Provide your assessment as JSON matching the response schema."""
         - No sibling keywords alongside $ref
         - $ref references must be resolved
         """
-        import copy
         schema = copy.deepcopy(schema)
         defs = schema.get("$defs", {})
 
@@ -552,8 +691,6 @@ Provide your assessment as JSON matching the response schema."""
 
     def _resolve_and_fix(self, schema: Dict[str, Any], defs: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively resolve $ref references and fix for strict mode."""
-        import copy
-
         if not isinstance(schema, dict):
             return schema
 
@@ -630,6 +767,7 @@ Provide your assessment as JSON matching the response schema."""
         on_token_update: Optional[Callable[[int, int], None]] = None,
         retries: int = 3,
         on_retry: Optional[Callable[[int, int], None]] = None,
+        prompt_version: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Call OpenAI API with retry logic and structured output validation.
 
@@ -641,6 +779,7 @@ Provide your assessment as JSON matching the response schema."""
             on_token_update: Optional callback for token updates.
             retries: Number of retry attempts.
             on_retry: Optional callback when retrying (attempt, total_retries).
+            prompt_version: Prompt version used to look up the cached schema.
 
         Returns:
             Validated JSON response as dict.
@@ -664,7 +803,7 @@ Provide your assessment as JSON matching the response schema."""
 
                 # Build response format (try strict schema first, fall back to json_object)
                 if use_strict_schema:
-                    response_format = self._build_response_format()
+                    response_format = self._build_response_format(prompt_version)
                 else:
                     response_format = {"type": "json_object"}
 
@@ -695,13 +834,8 @@ Provide your assessment as JSON matching the response schema."""
                 if not content:
                     raise ValueError("Empty response from API")
 
-                result = json.loads(content)
-
-                # Normalize LLM output before validation
-                result = self._normalize_response(result)
-
-                # Validate with Pydantic
-                validated = AssessmentResponse.model_validate(result)
+                # Validate with Pydantic (normalizes LLM quirks if needed)
+                validated = self._parse_response(content, prompt_version)
 
                 # Check completeness
                 warnings = validate_assessment_completeness(validated)
@@ -78,6 +78,7 @@ class ClaimContext:
 
     # Set by processing stage
     processing_type: str = "assessment"
+    processing_config: Optional[Any] = None  # ProcessorConfig used for processing
     processing_result: Optional[Dict[str, Any]] = None
 
     # Coverage overrides from adjuster (carried forward across runs)
@@ -86,6 +87,9 @@ class ClaimContext:
     # Set by decision stage
     decision_result: Optional[Dict[str, Any]] = None
 
+    # Set by confidence stage (persisted confidence_summary.json)
+    confidence_summary: Optional[Dict[str, Any]] = None
+
     # Streaming callbacks for live progress
     on_token_update: Optional[Callable[[int, int], None]] = None  # (input_tokens, output_tokens)
     on_stage_update: Optional[Callable[[str, str], None]] = None  # (stage_name, status)
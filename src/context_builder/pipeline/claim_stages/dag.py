@@ -0,0 +1,376 @@
+"""Dependency-declared runner for claim-level stages.
+
+``ClaimPipelineRunner`` runs stages strictly one after another.  Several
+claim-level steps, however, only depend on the reconciled facts and not on
+each other.  ``ClaimStageGraph`` derives a DAG from the ``inputs`` and
+``outputs`` each stage declares (field names on ``ClaimContext``) and runs
+every stage as soon as the stages it depends on have finished, so
+independent stages execute concurrently.
+
+Dependencies follow the declaration order, which keeps the results
+identical to a sequential run:
+
+- a stage depends on the most recent earlier stage writing one of its inputs;
+- a stage writing a field waits for earlier stages reading or writing it.
+
+Each stage runs on a shallow copy of the context, and only its declared
+outputs (plus an error status) are merged back.  Concurrent stages
+therefore cannot clobber each other's bookkeeping fields such as
+``current_stage``.
+
+After a run, ``ClaimStageGraph.report`` holds per-stage timings and the
+critical path (the chain of dependent stages that bounded wall time).
+"""
+
+import copy
+import dataclasses
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from context_builder.pipeline.claim_stages.context import ClaimContext
+
+logger = logging.getLogger(__name__)
+
+_CONTEXT_FIELDS = frozenset(f.name for f in dataclasses.fields(ClaimContext))
+
+
+@dataclass
+class StageNode:
+    """A claim stage with its declared data dependencies.
+
+    Attributes:
+        name: Unique stage name.
+        run: Callable taking and returning a ClaimContext.
+        inputs: ClaimContext fields the stage reads.
+        outputs: ClaimContext fields the stage writes.
+        fatal: If True, an exception stops the graph with status "error".
+            Otherwise the exception is logged and dependents still run.
+    """
+
+    name: str
+    run: Callable[[ClaimContext], ClaimContext]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    fatal: bool = True
+
+    @classmethod
+    def from_stage(cls, stage: Any, fatal: bool = True) -> "StageNode":
+        """Build a node from a stage object with ``inputs``/``outputs`` attributes."""
+        return cls(
+            name=stage.name,
+            run=stage.run,
+            inputs=tuple(getattr(stage, "inputs", ())),
+            outputs=tuple(getattr(stage, "outputs", ())),
+            fatal=fatal,
+        )
+
+
+@dataclass
+class StageRecord:
+    """Timing and outcome of one stage in a graph run."""
+
+    name: str
+    depends_on: List[str] = field(default_factory=list)
+    status: str = "pending"  # pending, success, error, failed, skipped
+    started_ms: int = 0  # Offset from graph start
+    duration_ms: int = 0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "depends_on": self.depends_on,
+            "status": self.status,
+            "started_ms": self.started_ms,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+        }
+
+
+@dataclass
+class StageGraphReport:
+    """Per-stage timings and critical path of a graph run."""
+
+    stages: Dict[str, StageRecord] = field(default_factory=dict)
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_ms: int = 0
+    total_ms: int = 0
+
+    @property
+    def sum_stage_ms(self) -> int:
+        """Sum of all stage durations (the sequential-run equivalent)."""
+        return sum(r.duration_ms for r in self.stages.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stages": {name: r.to_dict() for name, r in self.stages.items()},
+            "critical_path": self.critical_path,
+            "critical_path_ms": self.critical_path_ms,
+            "sum_stage_ms": self.sum_stage_ms,
+            "total_ms": self.total_ms,
+        }
+
+
+def build_dependencies(nodes: Sequence[StageNode]) -> Dict[str, List[str]]:
+    """Derive stage dependencies from declared inputs/outputs.
+
+    Raises:
+        ValueError: On duplicate stage names or unknown context fields.
+    """
+    last_writer: Dict[str, str] = {}
+    readers: Dict[str, List[str]] = {}
+    deps: Dict[str, List[str]] = {}
+
+    for node in nodes:
+        if node.name in deps:
+            raise ValueError(f"Duplicate claim stage name: {node.name}")
+        unknown = (set(node.inputs) | set(node.outputs)) - _CONTEXT_FIELDS
+        if unknown:
+            raise ValueError(
+                f"Stage '{node.name}' declares unknown ClaimContext fields: "
+                f"{sorted(unknown)}"
+            )
+
+        node_deps: List[str] = []
+
+        def _add(dep: str) -> None:
+            if dep != node.name and dep not in node_deps:
+                node_deps.append(dep)
+
+        for name in node.inputs:
+            if name in last_writer:
+                _add(last_writer[name])
+        for name in node.outputs:
+            if name in last_writer:
+                _add(last_writer[name])
+            for reader in readers.get(name, []):
+                _add(reader)
+
+        for name in node.inputs:
+            readers.setdefault(name, []).append(node.name)
+        for name in node.outputs:
+            last_writer[name] = node.name
+            readers[name] = []
+
+        deps[node.name] = node_deps
+
+    return deps
+
+
+def compute_critical_path(
+    records: Dict[str, StageRecord],
+) -> Tuple[List[str], int]:
+    """Return the longest chain of dependent stages by duration.
+
+    Stages are expected in a topological order (declaration order).
+    """
+    finish: Dict[str, int] = {}
+    via: Dict[str, Optional[str]] = {}
+    for name, record in records.items():
+        best_dep: Optional[str] = None
+        best = 0
+        for dep in record.depends_on:
+            if dep in finish and finish[dep] > best:
+                best, best_dep = finish[dep], dep
+        finish[name] = best + record.duration_ms
+        via[name] = best_dep
+
+    if not finish:
+        return [], 0
+
+    end = max(finish, key=lambda n: finish[n])
+    path: List[str] = []
+    current: Optional[str] = end
+    while current is not None:
+        path.append(current)
+        current = via[current]
+    path.reverse()
+    return path, finish[end]
+
+
+class ClaimStageGraph:
+    """Runs claim stages as a dependency DAG, concurrently where possible.
+
+    Drop-in alternative to ClaimPipelineRunner: the same callbacks are
+    invoked and a stage that sets ``context.status = "error"`` stops any
+    stage that has not started yet.
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[StageNode],
+        max_workers: int = 4,
+        on_phase_start: Optional[Callable[[str, ClaimContext], None]] = None,
+        on_phase_end: Optional[Callable[[str, ClaimContext, str], None]] = None,
+        notify_stages: bool = True,
+    ) -> None:
+        """Initialize the graph.
+
+        Args:
+            nodes: Stages in sequential (topological) order.
+            max_workers: Maximum number of stages running at once.
+            on_phase_start: Optional callback called when each stage starts.
+            on_phase_end: Optional callback called when each stage ends.
+            notify_stages: Send running/finished updates through
+                ``context.on_stage_update`` (disable when nodes report
+                their own progress).
+        """
+        self.nodes = list(nodes)
+        self.dependencies = build_dependencies(self.nodes)
+        self.max_workers = max(1, max_workers)
+        self.on_phase_start = on_phase_start
+        self.on_phase_end = on_phase_end
+        self.notify_stages = notify_stages
+        self.report = StageGraphReport()
+
+    @classmethod
+    def from_stages(cls, stages: Sequence[Any], **kwargs: Any) -> "ClaimStageGraph":
+        """Build a graph from stage objects declaring ``inputs``/``outputs``."""
+        return cls([StageNode.from_stage(s) for s in stages], **kwargs)
+
+    def run(self, context: ClaimContext) -> ClaimContext:
+        """Run all stages, merging their outputs into ``context``.
+
+        Returns:
+            The same context object, updated with every stage's outputs.
+        """
+        context.status = "running"
+        self.report = StageGraphReport(
+            stages={
+                node.name: StageRecord(
+                    name=node.name, depends_on=list(self.dependencies[node.name])
+                )
+                for node in self.nodes
+            }
+        )
+        graph_start = time.perf_counter()
+
+        pending = list(self.nodes)
+        done: Set[str] = set()
+        running: Dict[Future, StageNode] = {}
+        stopped = False
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="claim-stage"
+        ) as executor:
+            while pending or running:
+                if not stopped:
+                    for node in [
+                        n for n in pending
+                        if all(d in done for d in self.dependencies[n.name])
+                    ]:
+                        if len(running) >= self.max_workers:
+                            break
+                        pending.remove(node)
+                        # Snapshot: all dependencies have been merged already.
+                        stage_context = copy.copy(context)
+                        future = executor.submit(
+                            self._run_node, node, stage_context, graph_start
+                        )
+                        running[future] = node
+
+                if not running:
+                    break
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    node = running.pop(future)
+                    result = future.result()
+                    if self._merge(node, context, result):
+                        stopped = True
+                    done.add(node.name)
+
+        for node in pending:
+            self.report.stages[node.name].status = "skipped"
+
+        self.report.total_ms = int((time.perf_counter() - graph_start) * 1000)
+        self.report.critical_path, self.report.critical_path_ms = (
+            compute_critical_path(self.report.stages)
+        )
+        logger.info(
+            f"Claim stages for {context.claim_id} finished in "
+            f"{self.report.total_ms}ms (critical path "
+            f"{' -> '.join(self.report.critical_path)}: "
+            f"{self.report.critical_path_ms}ms, sequential sum "
+            f"{self.report.sum_stage_ms}ms)"
+        )
+
+        if context.status != "error":
+            context.status = "success"
+        return context
+
+    def _run_node(
+        self, node: StageNode, context: ClaimContext, graph_start: float
+    ) -> Tuple[Optional[ClaimContext], Optional[BaseException]]:
+        record = self.report.stages[node.name]
+        start = time.perf_counter()
+        record.started_ms = int((start - graph_start) * 1000)
+
+        if self.notify_stages:
+            context.notify_stage_update(node.name, "running")
+        if self.on_phase_start:
+            try:
+                self.on_phase_start(node.name, context)
+            except Exception:
+                pass  # Don't let callback errors break the pipeline
+
+        try:
+            result = node.run(context)
+            error = None
+        except Exception as e:
+            result, error = None, e
+        record.duration_ms = int((time.perf_counter() - start) * 1000)
+        return result, error
+
+    def _merge(
+        self,
+        node: StageNode,
+        context: ClaimContext,
+        outcome: Tuple[Optional[ClaimContext], Optional[BaseException]],
+    ) -> bool:
+        """Merge a finished stage into ``context``; return True to stop."""
+        result, error = outcome
+        record = self.report.stages[node.name]
+
+        if error is not None:
+            record.error = str(error)
+            if node.fatal:
+                logger.error(f"Claim stage {node.name} failed: {error}")
+                record.status = "error"
+                self._set_error(context, f"{node.name} failed: {error}")
+            else:
+                logger.warning(
+                    f"Claim stage {node.name} failed for {context.claim_id}: "
+                    f"{error}, continuing"
+                )
+                record.status = "failed"
+            status = record.status
+        else:
+            for name in node.outputs:
+                setattr(context, name, getattr(result, name))
+            if result.status == "error":
+                self._set_error(context, result.error)
+                record.status = "error"
+                record.error = result.error
+            else:
+                record.status = "success"
+            status = record.status
+
+        if self.on_phase_end:
+            try:
+                self.on_phase_end(node.name, context, status)
+            except Exception:
+                pass  # Don't let callback errors break the pipeline
+        if self.notify_stages:
+            context.notify_stage_update(node.name, status)
+
+        return status == "error"
+
+    @staticmethod
+    def _set_error(context: ClaimContext, error: Optional[str]) -> None:
+        # First error wins, as in a sequential run that stops at it.
+        if context.status != "error":
+            context.status = "error"
+            context.error = error
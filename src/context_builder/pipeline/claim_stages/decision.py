@@ -14,17 +14,18 @@ Pipeline flow:
     Reconciliation -> Enrichment -> Screening -> Processing -> Decision
 """
 
-import importlib.util
 import json
 import logging
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
+from typing import Any, ClassVar, Dict, List, Optional, Protocol, Tuple, runtime_checkable
 
 from context_builder.pipeline.claim_stages.context import ClaimContext
-from context_builder.storage.claim_run import ClaimRunStorage
+from context_builder.pipeline.claim_stages.plugin_registry import get_plugin_registry
+from context_builder.storage.claim_run import ClaimRunStorage, resolve_claim_folder
+from context_builder.storage.dossier_index import DossierIndex
 
 logger = logging.getLogger(__name__)
 
@@ -284,44 +285,57 @@ def load_engine_from_workspace(workspace_path: Path) -> Optional[DecisionEngine]
         workspace_path: Path to the workspace root.
 
     Returns:
-        Instantiated engine or None if not found.
+        Instantiated engine or None if not found. The instance is shared
+        by all callers until the engine file changes.
     """
     engine_path = workspace_path / "config" / "decision" / "engine.py"
 
-    if not engine_path.exists():
-        logger.debug(f"No decision engine found at {engine_path}")
-        return None
-
-    try:
-        spec = importlib.util.spec_from_file_location(
-            "workspace_decision_engine", engine_path
-        )
-        if spec is None or spec.loader is None:
-            logger.warning(f"Could not load spec for {engine_path}")
-            return None
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-
-        # Find the engine class (first class with an 'evaluate' method)
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
-            if (
-                isinstance(attr, type)
-                and attr_name != "DecisionEngine"
-                and hasattr(attr, "evaluate")
-                and hasattr(attr, "engine_id")
-            ):
-                engine = attr(workspace_path)
-                logger.info(f"Loaded decision engine: {attr_name} from {engine_path}")
-                return engine
+    # Module execution is cached process-wide; repeat calls only stat the file.
+    return get_plugin_registry().get(
+        kind="decision_engine",
+        plugin_path=engine_path,
+        module_name="workspace_decision_engine",
+        select=lambda name, cls: (
+            name != "DecisionEngine"
+            and hasattr(cls, "evaluate")
+            and hasattr(cls, "engine_id")
+        ),
+        workspace_path=workspace_path,
+    )
+
+
+def apply_coverage_overrides(
+    coverage_analysis: Optional[Dict[str, Any]], overrides: Dict[str, bool]
+) -> Optional[Dict[str, Any]]:
+    """Return coverage analysis with ``item_{N}`` overrides applied.
+
+    The input is not modified; a copy is returned when any override applies.
+    """
+    if not overrides or not coverage_analysis:
+        return coverage_analysis
 
-        logger.warning(f"No DecisionEngine implementation found in {engine_path}")
-        return None
+    import copy
 
-    except Exception as e:
-        logger.error(f"Failed to load decision engine from {engine_path}: {e}")
-        return None
+    coverage_analysis = copy.deepcopy(coverage_analysis)
+    line_items = coverage_analysis.get("line_items", [])
+    for key, is_covered in overrides.items():
+        if key.startswith("item_"):
+            try:
+                idx = int(key[5:])
+                if 0 <= idx < len(line_items):
+                    item = line_items[idx]
+                    total_price = float(item.get("total_price", 0) or 0)
+                    if is_covered:
+                        item["coverage_status"] = "covered"
+                        item["covered_amount"] = total_price
+                        item["not_covered_amount"] = 0
+                    else:
+                        item["coverage_status"] = "not_covered"
+                        item["covered_amount"] = 0
+                        item["not_covered_amount"] = total_price
+            except (ValueError, IndexError):
+                pass
+    return coverage_analysis
 
 
 # ── Decision Stage ──────────────────────────────────────────────────
@@ -344,6 +358,14 @@ class DecisionStage:
     """
 
     name: str = "decision"
+    # ClaimContext fields read/written (see claim_stages.dag)
+    inputs: ClassVar[Tuple[str, ...]] = (
+        "aggregated_facts",
+        "screening_result",
+        "processing_result",
+        "coverage_overrides",
+    )
+    outputs: ClassVar[Tuple[str, ...]] = ("decision_result",)
     _engine: Optional[DecisionEngine] = field(default=None, repr=False)
     _workspace_path: Optional[Path] = field(default=None, repr=False)
 
@@ -363,42 +385,15 @@ class DecisionStage:
 
     def _find_claim_folder(self, workspace_path: Path, claim_id: str) -> Optional[Path]:
         """Find the claim folder for a given claim ID."""
-        claims_dir = workspace_path / "claims"
-
-        if (claims_dir / claim_id).exists():
-            return claims_dir / claim_id
-
-        for folder in claims_dir.iterdir():
-            if folder.is_dir() and claim_id in folder.name:
-                return folder
-
-        return None
+        return resolve_claim_folder(workspace_path / "claims", claim_id)
 
     def _get_next_version(self, claim_folder: Path, claim_run_id: str) -> int:
         """Determine the next dossier version number.
 
-        Scans for existing decision_dossier_v*.json files in the claim run
-        directory and returns the next version number.
+        Uses the claim's dossier index, which re-scans the claim run
+        directory only if it changed since it was last indexed.
         """
-        run_dir = claim_folder / "claim_runs" / claim_run_id
-        if not run_dir.exists():
-            return 1
-
-        existing = list(run_dir.glob("decision_dossier_v*.json"))
-        if not existing:
-            return 1
-
-        max_version = 0
-        for f in existing:
-            try:
-                # Extract version number from filename: decision_dossier_v3.json -> 3
-                version_str = f.stem.split("_v")[-1]
-                version = int(version_str)
-                max_version = max(max_version, version)
-            except (ValueError, IndexError):
-                continue
-
-        return max_version + 1
+        return DossierIndex(claim_folder).next_version(claim_run_id)
 
     def _load_coverage_analysis(
         self, claim_folder: Path, claim_run_id: str
@@ -478,31 +473,12 @@ class DecisionStage:
                     claim_folder, context.run_id
                 )
 
-            # Apply coverage overrides to coverage data (mirrors
-            # DecisionDossierService.evaluate_with_assumptions logic)
+            # Apply coverage overrides to coverage data (shared with
+            # DecisionDossierService.evaluate_with_assumptions)
             coverage_overrides = getattr(context, "coverage_overrides", None) or {}
-            if coverage_overrides and coverage_analysis:
-                import copy
-
-                coverage_analysis = copy.deepcopy(coverage_analysis)
-                line_items = coverage_analysis.get("line_items", [])
-                for key, is_covered in coverage_overrides.items():
-                    if key.startswith("item_"):
-                        try:
-                            idx = int(key[5:])
-                            if 0 <= idx < len(line_items):
-                                item = line_items[idx]
-                                total_price = float(item.get("total_price", 0) or 0)
-                                if is_covered:
-                                    item["coverage_status"] = "covered"
-                                    item["covered_amount"] = total_price
-                                    item["not_covered_amount"] = 0
-                                else:
-                                    item["coverage_status"] = "not_covered"
-                                    item["covered_amount"] = 0
-                                    item["not_covered_amount"] = total_price
-                        except (ValueError, IndexError):
-                            pass
+            coverage_analysis = apply_coverage_overrides(
+                coverage_analysis, coverage_overrides
+            )
 
             # Determine next version
             next_version = 1
@@ -531,12 +507,9 @@ class DecisionStage:
             if claim_folder:
                 try:
                     storage = ClaimRunStorage(claim_folder)
-                    filename = f"decision_dossier_v{next_version}.json"
-                    storage.write_to_claim_run(
-                        context.run_id, filename, dossier
-                    )
+                    dossier_path = storage.write_dossier(context.run_id, dossier)
                     logger.info(
-                        f"Wrote {filename} for claim {context.claim_id}"
+                        f"Wrote {dossier_path.name} for claim {context.claim_id}"
                     )
                 except Exception as e:
                     logger.error(f"Failed to write decision dossier: {e}")
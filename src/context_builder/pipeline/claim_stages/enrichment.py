@@ -31,10 +31,11 @@ import time
 import warnings
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Protocol, runtime_checkable
+from typing import Any, ClassVar, Dict, Optional, Protocol, Tuple, runtime_checkable
 
 from context_builder.pipeline.claim_stages.context import ClaimContext
 from context_builder.schemas.reconciliation import ReconciliationReport
+from context_builder.storage.claim_run import resolve_claim_folder
 
 logger = logging.getLogger(__name__)
 
@@ -177,6 +178,9 @@ class EnrichmentStage:
     """
 
     name: str = "enrichment"
+    # ClaimContext fields read/written (see claim_stages.dag)
+    inputs: ClassVar[Tuple[str, ...]] = ("aggregated_facts", "reconciliation_report")
+    outputs: ClassVar[Tuple[str, ...]] = ("aggregated_facts",)
     _enricher: Optional[Enricher] = None
     _workspace_path: Optional[Path] = None
 
@@ -199,20 +203,7 @@ class EnrichmentStage:
         self, workspace_path: Path, claim_id: str
     ) -> Optional[ReconciliationReport]:
         """Load reconciliation report from claim context directory."""
-        # Find claim folder
-        claims_dir = workspace_path / "claims"
-        claim_folder = None
-
-        # Try exact match first
-        if (claims_dir / claim_id).exists():
-            claim_folder = claims_dir / claim_id
-        else:
-            # Try pattern match (e.g., "65258" matches "claim_65258")
-            for folder in claims_dir.iterdir():
-                if folder.is_dir() and claim_id in folder.name:
-                    claim_folder = folder
-                    break
-
+        claim_folder = self._find_claim_folder(workspace_path, claim_id)
         if not claim_folder:
             logger.warning(f"Claim folder not found for {claim_id}")
             return None
@@ -232,18 +223,7 @@ class EnrichmentStage:
 
     def _find_claim_folder(self, workspace_path: Path, claim_id: str) -> Optional[Path]:
         """Find the claim folder for a given claim ID."""
-        claims_dir = workspace_path / "claims"
-
-        # Try exact match first
-        if (claims_dir / claim_id).exists():
-            return claims_dir / claim_id
-
-        # Try pattern match
-        for folder in claims_dir.iterdir():
-            if folder.is_dir() and claim_id in folder.name:
-                return folder
-
-        return None
+        return resolve_claim_folder(workspace_path / "claims", claim_id)
 
     def _write_enriched_facts(
         self, workspace_path: Path, claim_id: str, enriched_facts: Dict[str, Any]
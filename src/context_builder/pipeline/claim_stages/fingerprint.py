@@ -0,0 +1,295 @@
+"""Input fingerprints for incremental claim reassessment.
+
+Each reusable claim stage fingerprints the inputs it depends on -- facts,
+upstream results, workspace config, prompt, plugin source and the code
+version -- and the fingerprints are persisted in the claim run manifest.
+When a previous claim run recorded the same fingerprint for a stage, its
+output files are copied into the new run instead of running the stage
+again, with the run identity fields (claim run ID, timestamps) rewritten
+for the new run.
+
+Only stages whose outputs are a pure function of their inputs and that are
+expensive to recompute are reusable.  The decision stage is cheap and its
+dossier is later patched by the confidence stage.  The confidence stage
+also reads extraction results from disk.  Both always run.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from context_builder.storage.claim_run import ClaimRunStorage
+from context_builder.storage.config_snapshots import ConfigSnapshotStore
+
+logger = logging.getLogger(__name__)
+
+# Stages whose outputs can be reused, and the claim run files they produce.
+# The first file is required for reuse; the rest are copied if present.
+STAGE_ARTIFACTS: Dict[str, Tuple[str, ...]] = {
+    "screening": ("screening.json", "coverage_analysis.json"),
+    "assessment": ("assessment.json",),
+}
+
+REUSABLE_STAGES = tuple(STAGE_ARTIFACTS)
+
+# Keys that change on every run without changing the content.
+_RUN_ID_KEYS = frozenset({"claim_run_id", "run_id"})
+_TIMESTAMP_KEYS = frozenset({
+    "generated_at",
+    "screening_timestamp",
+    "assessment_timestamp",
+})
+_VOLATILE_KEYS = _RUN_ID_KEYS | _TIMESTAMP_KEYS
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """Package version plus git commit, so a code upgrade invalidates reuse."""
+    from context_builder import get_version
+    from context_builder.pipeline.helpers.metadata import get_git_info
+
+    commit_sha = get_git_info().get("commit_sha")
+    return f"{get_version()}+{commit_sha}" if commit_sha else get_version()
+
+
+def _strip_volatile(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            k: _strip_volatile(v) for k, v in value.items() if k not in _VOLATILE_KEYS
+        }
+    if isinstance(value, list):
+        return [_strip_volatile(v) for v in value]
+    return value
+
+
+def hash_content(value: Any) -> Optional[str]:
+    """Hash a JSON-like value, ignoring per-run keys (ids, timestamps).
+
+    Pydantic models are dumped in JSON mode first.  Returns None for None.
+    """
+    if value is None:
+        return None
+    if hasattr(value, "model_dump"):
+        value = value.model_dump(mode="json")
+    encoded = json.dumps(
+        _strip_volatile(value), sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def restamp(value: Any, source_run_id: str, claim_run_id: str, timestamp: str) -> Any:
+    """Copy of a reused output with the run identity of the new claim run.
+
+    IDs equal to the source claim run are replaced (other run IDs, e.g. of
+    extraction runs, are kept) and timestamps are set to ``timestamp``.
+    """
+    if isinstance(value, dict):
+        restamped = {}
+        for k, v in value.items():
+            if k in _RUN_ID_KEYS and v == source_run_id:
+                restamped[k] = claim_run_id
+            elif k in _TIMESTAMP_KEYS and isinstance(v, str):
+                restamped[k] = timestamp
+            else:
+                restamped[k] = restamp(v, source_run_id, claim_run_id, timestamp)
+        return restamped
+    if isinstance(value, list):
+        return [restamp(v, source_run_id, claim_run_id, timestamp) for v in value]
+    return value
+
+
+def hash_file(path: Path) -> Optional[str]:
+    """SHA-256 of a file's bytes, or None if it does not exist."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def hash_prompt(config: Any) -> Optional[str]:
+    """Hash the prompt and sampling settings of a ProcessorConfig."""
+    if config is None:
+        return None
+    return hash_content({
+        "prompt_content": getattr(config, "prompt_content", None),
+        "prompt_version": getattr(config, "prompt_version", None),
+        "model": getattr(config, "model", None),
+        "temperature": getattr(config, "temperature", None),
+        "max_tokens": getattr(config, "max_tokens", None),
+    })
+
+
+@dataclass
+class StageFingerprint:
+    """Hashes of everything a stage's output depends on.
+
+    The code version is added to the components automatically.
+    """
+
+    stage: str
+    components: Dict[str, Optional[str]]
+
+    def __post_init__(self) -> None:
+        self.components.setdefault("code_version", code_version())
+
+    @property
+    def value(self) -> str:
+        return hash_content({"stage": self.stage, **self.components}) or ""
+
+
+@dataclass
+class ReuseDecision:
+    """Audit record of whether a stage ran or reused a previous output."""
+
+    stage: str
+    fingerprint: str
+    components: Dict[str, Optional[str]]
+    action: str  # "reused" or "ran"
+    reason: str  # "fingerprint_match", "forced", "no_match", "not_reusable"
+    source_claim_run_id: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "components": self.components,
+            "action": self.action,
+            "reason": self.reason,
+            "source_claim_run_id": self.source_claim_run_id,
+        }
+
+
+@dataclass
+class StageReusePlanner:
+    """Decides, per claim run, which stages can reuse a previous output.
+
+    Attributes:
+        storage: Claim run storage of the claim being assessed.
+        claim_run_id: The claim run being produced.
+        workspace_path: Workspace root (for config and plugin hashes).
+        force_stages: Stages to run regardless of fingerprints ("all" for every stage).
+    """
+
+    storage: ClaimRunStorage
+    claim_run_id: str
+    workspace_path: Path
+    force_stages: Set[str] = field(default_factory=set)
+    decisions: Dict[str, ReuseDecision] = field(default_factory=dict)
+    _config_hash: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def config_hash(self) -> Optional[str]:
+        """Snapshot ID of the workspace config (same as the run metadata hash)."""
+        if self._config_hash is None:
+            self._config_hash = ConfigSnapshotStore(self.workspace_path / "config").compute_id()
+        return self._config_hash
+
+    def plugin_hash(self, relative_path: str) -> Optional[str]:
+        return hash_file(self.workspace_path / relative_path)
+
+    def is_forced(self, stage: str) -> bool:
+        return "all" in self.force_stages or stage in self.force_stages
+
+    def try_reuse(self, fingerprint: StageFingerprint) -> Optional[str]:
+        """Copy a previous run's output for this stage if the fingerprint matches.
+
+        Returns:
+            The source claim run ID if the output was reused, else None.
+            The decision is recorded either way.
+        """
+        stage = fingerprint.stage
+        value = fingerprint.value
+
+        if self.is_forced(stage):
+            self._record(fingerprint, "ran", "forced")
+            return None
+
+        source = self._find_matching_run(stage, value)
+        if source is None:
+            self._record(fingerprint, "ran", "no_match")
+            return None
+
+        timestamp = datetime.now(timezone.utc).isoformat()
+        try:
+            for filename in STAGE_ARTIFACTS[stage]:
+                data = self.storage.read_from_claim_run(source, filename)
+                if data is not None:
+                    self.storage.write_to_claim_run(
+                        self.claim_run_id,
+                        filename,
+                        restamp(data, source, self.claim_run_id, timestamp),
+                    )
+        except Exception as e:
+            logger.warning(f"Could not reuse {stage} output from {source}: {e}")
+            self._record(fingerprint, "ran", "no_match")
+            return None
+
+        logger.info(f"Reusing {stage} output from claim run {source} (inputs unchanged)")
+        self._record(fingerprint, "reused", "fingerprint_match", source)
+        return source
+
+    def record_ran(self, fingerprint: StageFingerprint) -> None:
+        """Record a stage that ran without a reuse check."""
+        self._record(fingerprint, "ran", "not_reusable")
+
+    def to_manifest(self) -> Dict[str, Any]:
+        return {stage: d.to_dict() for stage, d in self.decisions.items()}
+
+    def _record(
+        self,
+        fingerprint: StageFingerprint,
+        action: str,
+        reason: str,
+        source: Optional[str] = None,
+    ) -> None:
+        self.decisions[fingerprint.stage] = ReuseDecision(
+            stage=fingerprint.stage,
+            fingerprint=fingerprint.value,
+            components=dict(fingerprint.components),
+            action=action,
+            reason=reason,
+            source_claim_run_id=source,
+        )
+
+    def _find_matching_run(self, stage: str, value: str) -> Optional[str]:
+        """Return the newest other claim run that recorded ``value`` for ``stage``."""
+        required = STAGE_ARTIFACTS[stage][0]
+        try:
+            for run_id in self.storage.list_claim_runs():
+                if run_id == self.claim_run_id:
+                    continue
+                manifest = self.storage.read_manifest(run_id)
+                recorded = (manifest.stage_fingerprints or {}) if manifest else {}
+                entry = recorded.get(stage)
+                if not isinstance(entry, dict) or entry.get("fingerprint") != value:
+                    continue
+                if (self.storage.get_claim_run_path(run_id) / required).exists():
+                    return run_id
+        except Exception as e:
+            logger.debug(f"Could not scan previous claim runs for {stage}: {e}")
+        return None
+
+
+def parse_force_stages(values: Optional[Iterable[str]]) -> Set[str]:
+    """Normalize --force-stage values (repeatable and/or comma-separated).
+
+    Raises:
+        ValueError: On an unknown stage name.
+    """
+    stages: Set[str] = set()
+    for raw in values or []:
+        for name in raw.split(","):
+            name = name.strip().lower()
+            if not name:
+                continue
+            if name != "all" and name not in STAGE_ARTIFACTS:
+                raise ValueError(
+                    f"Unknown stage '{name}' (expected one of: "
+                    f"{', '.join(REUSABLE_STAGES)}, all)"
+                )
+            stages.add(name)
+    return stages
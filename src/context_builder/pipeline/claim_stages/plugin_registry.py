@@ -0,0 +1,275 @@
+"""Process-wide registry for workspace plugin modules.
+
+Workspaces customise the claim pipeline by dropping Python modules into
+their config folder (``config/screening/screener.py``,
+``config/decision/engine.py``, ...).  Executing such a module is not free:
+the NSA screener and decision engine import large rule tables and build
+lookup structures at import time.
+
+The registry loads each plugin module once per process and hands out the
+same ready instance until the file or the workspace config changes.
+Entries are keyed by the resolved file path and validated against the
+file's mtime/size, with a content hash as the tie-breaker, so touching a
+file without editing it does not trigger a reload.  Plugin constructors
+read rule tables and YAML from the workspace config, so entries are also
+validated against the config's snapshot ID (see ``ConfigSnapshotStore``,
+which only stats unchanged files).  When either changes, the new module
+is executed and the entry is swapped atomically; callers holding the old
+instance keep using it undisturbed.
+
+Load failures are cached against the content hash as well, so a broken
+plugin is not re-executed for every claim — it is retried as soon as the
+file is edited.
+"""
+
+import hashlib
+import importlib.util
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from context_builder.storage.config_snapshots import ConfigSnapshotStore
+
+logger = logging.getLogger(__name__)
+
+# Predicate deciding whether a module attribute is the plugin class.
+ClassSelector = Callable[[str, type], bool]
+
+
+@dataclass
+class PluginEntry:
+    """A loaded plugin module and the instance built from it.
+
+    Attributes:
+        kind: Plugin kind label (e.g. "screener", "decision_engine").
+        path: Resolved path of the plugin module.
+        mtime_ns: File modification time at load time.
+        size: File size at load time.
+        content_hash: SHA-256 of the module source.
+        config_hash: Snapshot ID of the workspace config at load time.
+        class_name: Name of the selected plugin class (None on failure).
+        instance: Ready plugin instance (None on failure).
+        error: Error message if loading failed.
+        load_ms: Wall time spent executing the module and instantiating.
+        loaded_at: ISO timestamp of the load.
+        reloads: Number of times this path was reloaded after a change.
+        hits: Number of times the cached instance was handed out.
+    """
+
+    kind: str
+    path: Path
+    mtime_ns: int
+    size: int
+    content_hash: str
+    config_hash: Optional[str] = None
+    class_name: Optional[str] = None
+    instance: Any = None
+    error: Optional[str] = None
+    load_ms: float = 0.0
+    loaded_at: str = ""
+    reloads: int = 0
+    hits: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize entry metadata (without the instance)."""
+        return {
+            "kind": self.kind,
+            "path": str(self.path),
+            "content_hash": self.content_hash,
+            "config_hash": self.config_hash,
+            "class_name": self.class_name,
+            "error": self.error,
+            "load_ms": round(self.load_ms, 2),
+            "loaded_at": self.loaded_at,
+            "reloads": self.reloads,
+            "hits": self.hits,
+        }
+
+
+class PluginRegistry:
+    """Thread-safe cache of workspace plugin instances.
+
+    Lookups that find an unchanged file and config only cost ``stat`` calls.  Loads
+    are serialised under a lock so concurrent claims never execute the same
+    module twice.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[str, Path], PluginEntry] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        kind: str,
+        plugin_path: Path,
+        module_name: str,
+        select: ClassSelector,
+        workspace_path: Path,
+    ) -> Optional[Any]:
+        """Return the plugin instance for ``plugin_path``, loading if needed.
+
+        Args:
+            kind: Plugin kind label, used in logs and stats.
+            plugin_path: Path to the plugin module.
+            module_name: Module name to execute the file under.
+            select: Predicate picking the plugin class from module attributes.
+            workspace_path: Passed to the plugin class constructor.
+
+        Returns:
+            Plugin instance, or None if the file is missing, has no matching
+            class, or failed to load.
+        """
+        try:
+            stat = plugin_path.stat()
+        except OSError:
+            logger.debug(f"No {kind} found at {plugin_path}")
+            return None
+
+        key = (kind, plugin_path.resolve())
+        config_hash = self._config_hash(workspace_path)
+        entry = self._entries.get(key)
+        if entry is not None and self._is_current(entry, stat, config_hash):
+            entry.hits += 1
+            return entry.instance
+
+        with self._lock:
+            # Another thread may have loaded it while we waited.
+            entry = self._entries.get(key)
+            if entry is not None and self._is_current(entry, stat, config_hash):
+                entry.hits += 1
+                return entry.instance
+
+            try:
+                source = plugin_path.read_bytes()
+            except OSError as e:
+                logger.error(f"Failed to read {kind} from {plugin_path}: {e}")
+                return None
+            content_hash = hashlib.sha256(source).hexdigest()
+
+            if (
+                entry is not None
+                and entry.content_hash == content_hash
+                and entry.config_hash == config_hash
+            ):
+                # Touched but not edited: keep the instance, refresh the stat.
+                entry.mtime_ns = stat.st_mtime_ns
+                entry.size = stat.st_size
+                entry.hits += 1
+                return entry.instance
+
+            new_entry = self._load(
+                kind, key[1], module_name, select, workspace_path,
+                source, content_hash, stat,
+            )
+            new_entry.config_hash = config_hash
+            if entry is not None:
+                new_entry.reloads = entry.reloads + 1
+                reason = (
+                    "content changed" if entry.content_hash != content_hash
+                    else "workspace config changed"
+                )
+                logger.info(
+                    f"Reloaded {kind} from {plugin_path} in {new_entry.load_ms:.1f}ms "
+                    f"({reason})"
+                )
+            self._entries[key] = new_entry
+            return new_entry.instance
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Return load/reload metadata for all registered plugins."""
+        return [entry.to_dict() for entry in list(self._entries.values())]
+
+    def clear(self) -> None:
+        """Drop all cached plugins (used by tests)."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _is_current(entry: PluginEntry, stat: Any, config_hash: Optional[str]) -> bool:
+        return (
+            entry.mtime_ns == stat.st_mtime_ns
+            and entry.size == stat.st_size
+            and entry.config_hash == config_hash
+        )
+
+    @staticmethod
+    def _config_hash(workspace_path: Path) -> Optional[str]:
+        """Snapshot ID of the workspace config the plugin constructor reads."""
+        try:
+            return ConfigSnapshotStore(Path(workspace_path) / "config").compute_id()
+        except Exception as e:
+            logger.debug(f"Failed to hash workspace config of {workspace_path}: {e}")
+            return None
+
+    @staticmethod
+    def _load(
+        kind: str,
+        plugin_path: Path,
+        module_name: str,
+        select: ClassSelector,
+        workspace_path: Path,
+        source: bytes,
+        content_hash: str,
+        stat: Any,
+    ) -> PluginEntry:
+        entry = PluginEntry(
+            kind=kind,
+            path=plugin_path,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            content_hash=content_hash,
+            loaded_at=datetime.utcnow().isoformat(),
+        )
+        start = time.perf_counter()
+        try:
+            spec = importlib.util.spec_from_file_location(module_name, plugin_path)
+            if spec is None or spec.loader is None:
+                logger.warning(f"Could not load spec for {plugin_path}")
+                entry.error = "could not load module spec"
+                return entry
+
+            # Execute the exact bytes that were hashed, so the cached entry
+            # can never describe a different version of the file.
+            module = importlib.util.module_from_spec(spec)
+            code = compile(source, str(plugin_path), "exec")
+            exec(code, module.__dict__)
+
+            for attr_name in dir(module):
+                attr = getattr(module, attr_name)
+                if isinstance(attr, type) and select(attr_name, attr):
+                    entry.instance = attr(workspace_path)
+                    entry.class_name = attr_name
+                    break
+            else:
+                logger.warning(f"No {kind} implementation found in {plugin_path}")
+                entry.error = "no matching class"
+        except Exception as e:
+            logger.error(f"Failed to load {kind} from {plugin_path}: {e}")
+            entry.error = str(e)
+            entry.instance = None
+        finally:
+            entry.load_ms = (time.perf_counter() - start) * 1000
+
+        if entry.instance is not None:
+            logger.info(
+                f"Loaded {kind}: {entry.class_name} from {plugin_path} "
+                f"in {entry.load_ms:.1f}ms"
+            )
+        return entry
+
+
+_registry = PluginRegistry()
+
+
+def get_plugin_registry() -> PluginRegistry:
+    """Return the process-wide plugin registry."""
+    return _registry
+
+
+def clear_plugin_registry() -> None:
+    """Clear the process-wide plugin registry."""
+    _registry.clear()
@@ -19,7 +19,7 @@ import logging
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Protocol
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Protocol, Tuple
 
 import yaml
 
@@ -106,6 +106,15 @@ class ProcessingStage:
     """
 
     name: str = "processing"
+    # ClaimContext fields read/written (see claim_stages.dag)
+    inputs: ClassVar[Tuple[str, ...]] = ("aggregated_facts", "screening_result")
+    outputs: ClassVar[Tuple[str, ...]] = (
+        "processing_result",
+        "prompt_version",
+        "processing_type",
+        "input_tokens",
+        "output_tokens",
+    )
     _discovered_configs: Dict[str, ProcessorConfig] = field(default_factory=dict)
 
     def run(self, context: ClaimContext) -> ClaimContext:
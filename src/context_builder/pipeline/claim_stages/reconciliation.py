@@ -16,7 +16,7 @@ The stage uses ReconciliationService which:
 import logging
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional, Tuple
 
 from context_builder.api.services.aggregation import AggregationService
 from context_builder.api.services.reconciliation import ReconciliationService
@@ -38,6 +38,13 @@ class ReconciliationStage:
     """
 
     name: str = "reconciliation"
+    # ClaimContext fields read/written (see claim_stages.dag)
+    inputs: ClassVar[Tuple[str, ...]] = ()
+    outputs: ClassVar[Tuple[str, ...]] = (
+        "aggregated_facts",
+        "facts_run_id",
+        "reconciliation_report",
+    )
 
     def run(self, context: ClaimContext) -> ClaimContext:
         """Execute reconciliation and return updated context.
@@ -15,7 +15,6 @@ Pipeline flow:
     ReconciliationStage -> EnrichmentStage -> ScreeningStage -> ProcessingStage
 """
 
-import importlib.util
 import json
 import logging
 import re
@@ -23,7 +22,7 @@ import time
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple, runtime_checkable
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Protocol, Tuple, runtime_checkable
 
 from context_builder.coverage.explanation_generator import (
     ExplanationConfig,
@@ -31,9 +30,10 @@ from context_builder.coverage.explanation_generator import (
 )
 from context_builder.coverage.schemas import CoverageAnalysisResult
 from context_builder.pipeline.claim_stages.context import ClaimContext
+from context_builder.pipeline.claim_stages.plugin_registry import get_plugin_registry
 from context_builder.schemas.reconciliation import ReconciliationReport
 from context_builder.schemas.screening import ScreeningResult
-from context_builder.storage.claim_run import ClaimRunStorage
+from context_builder.storage.claim_run import ClaimRunStorage, resolve_claim_folder
 
 logger = logging.getLogger(__name__)
 
@@ -262,45 +262,19 @@ def load_screener_from_workspace(workspace_path: Path) -> Optional[Screener]:
         workspace_path: Path to the workspace root.
 
     Returns:
-        Instantiated screener or None if not found.
+        Instantiated screener or None if not found. The instance is shared
+        by all callers until the screener file changes.
     """
     screener_path = workspace_path / "config" / "screening" / "screener.py"
 
-    if not screener_path.exists():
-        logger.debug(f"No screener found at {screener_path}")
-        return None
-
-    try:
-        # Dynamic import of workspace screener module
-        spec = importlib.util.spec_from_file_location(
-            "workspace_screener", screener_path
-        )
-        if spec is None or spec.loader is None:
-            logger.warning(f"Could not load spec for {screener_path}")
-            return None
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-
-        # Find the screener class (first class with a 'screen' method)
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
-            if (
-                isinstance(attr, type)
-                and attr_name != "Screener"
-                and hasattr(attr, "screen")
-            ):
-                # Instantiate with workspace_path
-                screener = attr(workspace_path)
-                logger.info(f"Loaded screener: {attr_name} from {screener_path}")
-                return screener
-
-        logger.warning(f"No Screener implementation found in {screener_path}")
-        return None
-
-    except Exception as e:
-        logger.error(f"Failed to load screener from {screener_path}: {e}")
-        return None
+    # Module execution is cached process-wide; repeat calls only stat the file.
+    return get_plugin_registry().get(
+        kind="screener",
+        plugin_path=screener_path,
+        module_name="workspace_screener",
+        select=lambda name, cls: name != "Screener" and hasattr(cls, "screen"),
+        workspace_path=workspace_path,
+    )
 
 
 # ── Screening Stage ──────────────────────────────────────────────────
@@ -321,6 +295,9 @@ class ScreeningStage:
     """
 
     name: str = "screening"
+    # ClaimContext fields read/written (see claim_stages.dag)
+    inputs: ClassVar[Tuple[str, ...]] = ("aggregated_facts", "reconciliation_report")
+    outputs: ClassVar[Tuple[str, ...]] = ("screening_result",)
     _screener: Optional[Screener] = field(default=None, repr=False)
     _workspace_path: Optional[Path] = field(default=None, repr=False)
 
@@ -342,19 +319,7 @@ class ScreeningStage:
         self, workspace_path: Path, claim_id: str
     ) -> Optional[ReconciliationReport]:
         """Load reconciliation report from claim context directory."""
-        claims_dir = workspace_path / "claims"
-        claim_folder = None
-
-        # Try exact match first
-        if (claims_dir / claim_id).exists():
-            claim_folder = claims_dir / claim_id
-        else:
-            # Try pattern match (e.g., "65258" matches "claim_65258")
-            for folder in claims_dir.iterdir():
-                if folder.is_dir() and claim_id in folder.name:
-                    claim_folder = folder
-                    break
-
+        claim_folder = self._find_claim_folder(workspace_path, claim_id)
         if not claim_folder:
             logger.warning(f"Claim folder not found for {claim_id}")
             return None
@@ -374,16 +339,7 @@ class ScreeningStage:
 
     def _find_claim_folder(self, workspace_path: Path, claim_id: str) -> Optional[Path]:
         """Find the claim folder for a given claim ID."""
-        claims_dir = workspace_path / "claims"
-
-        if (claims_dir / claim_id).exists():
-            return claims_dir / claim_id
-
-        for folder in claims_dir.iterdir():
-            if folder.is_dir() and claim_id in folder.name:
-                return folder
-
-        return None
+        return resolve_claim_folder(workspace_path / "claims", claim_id)
 
     def _write_screening_result(
         self,
@@ -426,37 +382,17 @@ class ScreeningStage:
                     return {k: v for k, v in val.items() if v}
         return {}
 
-    @staticmethod
-    def _create_explanation_llm_client(claim_id: str) -> Any:
-        """Create an audited LLM client for non-covered explanations.
-
-        Returns None if unavailable (falls back to template mode).
-        """
-        try:
-            from context_builder.services.llm_audit import create_audited_client
-
-            client = create_audited_client()
-            client.set_context(
-                claim_id=claim_id,
-                call_purpose="non_covered_explanation",
-            )
-            return client
-        except Exception:
-            logger.warning(
-                "Could not create LLM client for non-covered explanations; "
-                "falling back to template mode",
-                exc_info=True,
-            )
-            return None
-
     def _enrich_with_explanations(
         self,
         coverage_result: CoverageAnalysisResult,
         workspace_path: Path,
         aggregated_facts: Optional[Dict[str, Any]] = None,
-        claim_id: Optional[str] = None,
     ) -> CoverageAnalysisResult:
-        """Add non-covered explanations to coverage result."""
+        """Add template non-covered explanations to coverage result.
+
+        The LLM rewrite is deferred until the explanations are requested
+        (see CoverageAnalysisService.get_explanations).
+        """
         try:
             coverage_dir = workspace_path / "config" / "coverage"
             config: Optional[ExplanationConfig] = None
@@ -468,28 +404,19 @@ class ScreeningStage:
 
             generator = ExplanationGenerator(config or ExplanationConfig.default())
 
-            # Extract policy context for LLM mode
+            # Policy context is stored for the on-demand LLM rewrite
             covered = self._extract_components_from_facts(
                 aggregated_facts, "covered_components"
             )
             excluded = self._extract_components_from_facts(
                 aggregated_facts, "excluded_components"
             )
-            llm_client = (
-                self._create_explanation_llm_client(claim_id)
-                if claim_id
-                else None
-            )
 
-            explanations, summary = generator.generate(
+            generator.prepare(
                 coverage_result,
                 covered_components=covered or None,
                 excluded_components=excluded or None,
-                llm_client=llm_client,
             )
-            if explanations:
-                coverage_result.non_covered_explanations = explanations
-                coverage_result.non_covered_summary = summary
         except Exception as e:
             logger.warning(f"Failed to generate non-covered explanations: {e}")
 
@@ -594,7 +521,6 @@ class ScreeningStage:
                     coverage_result,
                     context.workspace_path,
                     aggregated_facts=context.aggregated_facts,
-                    claim_id=context.claim_id,
                 )
                 self._write_coverage_analysis(
                     context.workspace_path,
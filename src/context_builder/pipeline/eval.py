@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, Optional, Tuple
 
 from context_builder.storage import FileStorage
+from context_builder.storage.evolution_log import EvolutionLog
 from context_builder.storage.truth_store import TruthStore
 
 logger = logging.getLogger(__name__)
@@ -186,4 +187,13 @@ def evaluate_run(output_root: Path, run_id: str) -> Dict[str, Any]:
         summary["unverifiable"] += counts["unverifiable"]
 
     _atomic_write_json(eval_dir / "summary.json", summary)
+
+    # Feed the incrementally materialized evolution timeline (a workspace
+    # without bundles has no timeline; its first rebuild reads this summary)
+    bundles_dir = base_root / "version_bundles"
+    if bundles_dir.is_dir():
+        try:
+            EvolutionLog(bundles_dir).record_eval(run_id, summary)
+        except Exception as exc:
+            logger.warning("Failed to record eval in evolution log: %s", exc)
     return summary
@@ -3,7 +3,6 @@
 import hashlib
 import logging
 import os
-import shutil
 import subprocess
 import sys
 from collections import Counter
@@ -14,6 +13,7 @@ from typing import Any, Dict, List, Optional
 from context_builder.pipeline.helpers.io import write_json_atomic
 from context_builder.pipeline.paths import RunPaths
 from context_builder.pipeline.writer import ResultWriter
+from context_builder.storage.config_snapshots import ConfigSnapshotStore
 from context_builder.storage.workspace_paths import get_workspace_config_dir
 
 logger = logging.getLogger(__name__)
@@ -66,6 +66,10 @@ def compute_templates_hash() -> str:
 def compute_workspace_config_hash() -> Optional[str]:
     """Compute SHA-256 hash of workspace config directory.
 
+    The hash is the config's snapshot ID (see ConfigSnapshotStore); file
+    digests are cached by (path, size, mtime), so unchanged files are only
+    stat'ed.
+
     Returns:
         Hex-encoded hash of all config files, or None if config dir doesn't exist.
     """
@@ -73,33 +77,26 @@ def compute_workspace_config_hash() -> Optional[str]:
         config_dir = get_workspace_config_dir()
         if not config_dir.exists():
             return None
-
-        hasher = hashlib.sha256()
-        files_found = False
-
-        # Hash all files in config directory recursively
-        for file_path in sorted(config_dir.rglob("*")):
-            if file_path.is_file():
-                files_found = True
-                # Include relative path in hash for structure awareness
-                rel_path = file_path.relative_to(config_dir)
-                hasher.update(str(rel_path).encode("utf-8"))
-                hasher.update(file_path.read_bytes())
-
-        return hasher.hexdigest() if files_found else None
+        return ConfigSnapshotStore(config_dir).compute_id()
     except Exception as e:
         logger.warning(f"Failed to compute workspace config hash: {e}")
         return None
 
 
 def snapshot_workspace_config(run_paths: RunPaths) -> Optional[Path]:
-    """Snapshot workspace config directory to run's config_snapshot folder.
+    """Snapshot workspace config and reference it from the run.
+
+    File contents go to the workspace's content-addressed snapshot store
+    (written once per unique file); the run gets a config_snapshot.json
+    holding only the snapshot ID.  Readers resolve it against the store of
+    the workspace the run lives in (``ConfigSnapshotStore(config_dir)``),
+    so a moved or copied workspace keeps working.
 
     Args:
         run_paths: Run-scoped output paths
 
     Returns:
-        Path to the snapshot directory, or None if no config to snapshot.
+        Path to the run's config_snapshot.json, or None if no config to snapshot.
     """
     try:
         config_dir = get_workspace_config_dir()
@@ -107,26 +104,16 @@ def snapshot_workspace_config(run_paths: RunPaths) -> Optional[Path]:
             logger.debug("No workspace config directory to snapshot")
             return None
 
-        # Check if there are any files to snapshot
-        files = list(config_dir.rglob("*"))
-        if not any(f.is_file() for f in files):
+        store = ConfigSnapshotStore(config_dir)
+        snapshot_id = store.snapshot()
+        if snapshot_id is None:
             logger.debug("Workspace config directory is empty, skipping snapshot")
             return None
 
-        # Create snapshot directory under the run
-        snapshot_dir = run_paths.run_root / "config_snapshot"
-        snapshot_dir.mkdir(parents=True, exist_ok=True)
-
-        # Copy entire config directory structure
-        for file_path in files:
-            if file_path.is_file():
-                rel_path = file_path.relative_to(config_dir)
-                dest_path = snapshot_dir / rel_path
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(file_path, dest_path)
-
-        logger.debug(f"Snapshotted workspace config to {snapshot_dir}")
-        return snapshot_dir
+        ref_path = run_paths.run_root / "config_snapshot.json"
+        write_json_atomic(ref_path, {"snapshot_id": snapshot_id})
+        logger.debug(f"Recorded workspace config snapshot {snapshot_id} in {ref_path}")
+        return ref_path
     except Exception as e:
         logger.warning(f"Failed to snapshot workspace config: {e}")
         return None
@@ -47,7 +47,7 @@ from context_builder.pipeline.helpers.metadata import (
 )
 from context_builder.pipeline.event_collector import EventCollector
 from context_builder.pipeline.events import EventType, PipelineEvent
-from context_builder.pipeline.state import is_claim_processed
+from context_builder.pipeline.state import is_claim_processed, record_claim_run
 from context_builder.pipeline.writer import ResultWriter
 from context_builder.schemas.run_errors import DocStatus, PipelineStage, RunErrorCode, TextSource
 from context_builder.storage.version_bundles import VersionBundleStore, get_version_bundle_store
@@ -307,6 +307,7 @@ def process_claim(
     # Create logs directory and set up file logging
     run_paths.logs_dir.mkdir(parents=True, exist_ok=True)
     log_handler = _setup_run_logging(run_paths, run_id)
+    final_status = "failed"
 
     try:
         logger.info(f"Starting run {run_id} for claim {claim.claim_id}")
@@ -555,7 +556,8 @@ def process_claim(
             "processing_time_seconds": round(elapsed, 2),
             "completed_at": datetime.utcnow().isoformat() + "Z",
         }
-        write_json_atomic(run_paths.summary_json, summary, writer=writer)
+        writer.write_artifact(run_paths.summary_json, summary)
+        final_status = status
 
         # Compute and write metrics
         if compute_metrics:
@@ -603,6 +605,8 @@ def process_claim(
         )
 
     finally:
+        # Record the claim's run for skip checks and run deletion
+        record_claim_run(output_base, claim.claim_id, run_id, final_status)
         # Always clean up log handler
         logging.getLogger().removeHandler(log_handler)
         log_handler.close()
@@ -6,15 +6,30 @@ import logging
 import time
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
 from context_builder.pipeline.paths import DocPaths
 from context_builder.pipeline.stages.context import DocumentContext
 from context_builder.pipeline.writer import ResultWriter
+from context_builder.storage.path_map import PathMap
 
 logger = logging.getLogger(__name__)
 
 
+def _record_doc_path(context: DocumentContext) -> None:
+    """Add a newly classified document to the workspace path map."""
+    claim_folder = Path(context.doc_paths.doc_root).parent.parent
+    if not claim_folder.is_dir():
+        return
+    try:
+        PathMap.for_claims_dir(claim_folder.parent).record_doc(
+            claim_folder.name, context.doc.doc_id, context.claim_id
+        )
+    except OSError as e:
+        logger.warning(f"Failed to record {context.doc.doc_id} in path map: {e}")
+
+
 def _build_combined_text(
     azure_text: str,
     vision_data: Optional[Dict[str, Any]],
@@ -147,6 +162,7 @@ class ClassificationStage:
                 "created_at": datetime.utcnow().isoformat() + "Z",
             }
             self.writer.write_json(context.doc_paths.doc_json, doc_meta)
+            _record_doc_path(context)
         else:
             try:
                 context.doc_type, context.language, context.confidence = load_existing_classification(
@@ -110,7 +110,7 @@ def run_extraction(
 
     # Write extraction result (with tokens if PII vault enabled)
     output_path = run_paths.extraction_dir / f"{doc_id}.json"
-    writer.write_json(output_path, result_data)
+    writer.write_artifact(output_path, result_data)
 
     # Get quality gate status
     quality_gate_status = result.quality_gate.status if result.quality_gate else None
@@ -11,6 +11,7 @@ from context_builder.pipeline.paths import DocPaths
 from context_builder.pipeline.stages.context import DocumentContext, IngestionResult
 from context_builder.pipeline.text import build_pages_json, build_pages_json_from_azure_di
 from context_builder.pipeline.writer import ResultWriter
+from context_builder.storage.artifact_codec import read_json_artifact
 
 logger = logging.getLogger(__name__)
 
@@ -132,7 +133,7 @@ def _ingest_with_provider(
 
         # Save raw Azure DI output for debugging
         raw_path = doc_paths.text_raw_dir / "azure_di.json"
-        writer.write_json(raw_path, data)
+        writer.write_artifact(raw_path, data)
 
         # Return with Azure DI data for proper page splitting
         return IngestionResult(
@@ -259,8 +260,7 @@ def load_existing_ingestion(
     if not doc_paths.pages_json.exists():
         raise FileNotFoundError(f"pages.json not found: {doc_paths.pages_json}")
 
-    with open(doc_paths.pages_json, "r", encoding="utf-8") as f:
-        pages_data = json.load(f)
+    pages_data = read_json_artifact(doc_paths.pages_json)
 
     # Reconstruct text content from pages
     pages = pages_data.get("pages", [])
@@ -323,7 +323,7 @@ class IngestionStage:
                         context.doc.doc_id,
                         source_type="azure_di" if context.doc.source_type in ("pdf", "image") else "preextracted_txt",
                     )
-                self.writer.write_json(context.doc_paths.pages_json, context.pages_data)
+                self.writer.write_artifact(context.doc_paths.pages_json, context.pages_data)
         else:
             try:
                 context.text_content, context.pages_data = load_existing_ingestion(context.doc_paths)
@@ -1,11 +1,16 @@
 """State module: check processing state for idempotency."""
 
-import json
 import logging
 from pathlib import Path
 from typing import Optional
 
 from context_builder.pipeline.paths import get_claim_paths
+from context_builder.storage.run_claims import (
+    PROCESSED_STATUSES,
+    RunClaimIndex,
+    get_claim_run_statuses,
+    record_claim_run_status,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +19,9 @@ def is_claim_processed(output_base: Path, claim_id: str) -> bool:
     """
     Check if a claim has been successfully processed.
 
-    Looks for runs/<run_id>/logs/summary.json with status success or partial.
+    Reads the claim's run status marker, which is written at claim
+    finalization and rebuilt from runs/<run_id>/logs/summary.json when
+    the claim's runs change outside the pipeline.
 
     Args:
         output_base: Base output directory
@@ -24,33 +31,36 @@ def is_claim_processed(output_base: Path, claim_id: str) -> bool:
         True if claim has been processed (success or partial)
     """
     claim_paths = get_claim_paths(output_base, claim_id)
-    runs_dir = claim_paths.runs_dir
 
-    if not runs_dir.exists():
-        return False
-
-    for run_dir in runs_dir.iterdir():
-        if not run_dir.is_dir():
-            continue
-
-        summary_file = run_dir / "logs" / "summary.json"
-        if not summary_file.exists():
-            continue
-
-        try:
-            with open(summary_file, encoding="utf-8") as f:
-                summary = json.load(f)
-                status = summary.get("status")
-                if status in ("success", "partial"):
-                    logger.debug(f"Claim {claim_id} already processed (run: {run_dir.name})")
-                    return True
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Failed to read summary {summary_file}: {e}")
-            continue
+    for run_id, status in sorted(get_claim_run_statuses(claim_paths.claim_root).items()):
+        if status in PROCESSED_STATUSES:
+            logger.debug(f"Claim {claim_id} already processed (run: {run_id})")
+            return True
 
     return False
 
 
+def record_claim_run(output_base: Path, claim_id: str, run_id: str, status: str) -> None:
+    """
+    Record a finalized claim run in the run/claim index and status marker.
+
+    Args:
+        output_base: Base output directory
+        claim_id: Claim identifier
+        run_id: Run identifier
+        status: Final claim status (success, partial, failed)
+    """
+    claim_paths = get_claim_paths(output_base, claim_id)
+    try:
+        record_claim_run_status(claim_paths.claim_root, run_id, status)
+        RunClaimIndex.for_claims_dir(output_base).record(
+            run_id, claim_paths.claim_root.name, status
+        )
+    except Exception as e:
+        # Derived data: never fail the run over it
+        logger.warning(f"Failed to record run {run_id} for claim {claim_id}: {e}")
+
+
 def get_latest_run(output_base: Path, claim_id: str) -> Optional[str]:
     """
     Get the most recent run ID for a claim.
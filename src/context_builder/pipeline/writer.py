@@ -8,6 +8,9 @@ import shutil
 from pathlib import Path
 from typing import Any
 
+from context_builder.storage.artifact_codec import write_json_artifact
+from context_builder.storage.change_journal import record_change
+
 
 class ResultWriter:
     """Centralized filesystem writes for pipeline outputs.
@@ -17,12 +20,16 @@ class ResultWriter:
     ``ResultWriter`` calls from different document threads never
     contend on the same file.  No additional locking is required
     when using ``ThreadPoolExecutor`` for parallel document processing.
+
+    Every write is recorded in the workspace change journal (see
+    ``context_builder.storage.change_journal``).
     """
 
     def write_json(self, path: Path, data: Any) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         with open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        record_change(path)
 
     def write_json_atomic(self, path: Path, data: Any) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -30,17 +37,31 @@ class ResultWriter:
         with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False, default=str)
         tmp_path.replace(path)
+        record_change(path)
+
+    def write_artifact(self, path: Path, data: Any) -> None:
+        """Atomically write a machine-read JSON artifact.
+
+        Written as compact JSON; ``pages.json`` and ``azure_di.json`` are
+        compressed when ``ARTIFACT_COMPRESSION`` is set (see
+        ``context_builder.storage.artifact_codec``).
+        """
+        write_json_artifact(path, data)
+        record_change(path)
 
     def write_text(self, path: Path, text: str) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(text, encoding="utf-8")
+        record_change(path)
 
     def copy_file(self, src: Path, dest: Path) -> None:
         dest.parent.mkdir(parents=True, exist_ok=True)
         if os.path.exists(src) and os.path.exists(dest) and os.path.samefile(src, dest):
             return  # Source and destination are the same file (e.g. --from-workspace)
         shutil.copy2(src, dest)
+        record_change(dest)
 
     def touch(self, path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         path.touch()
+        record_change(path)
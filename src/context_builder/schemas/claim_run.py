@@ -52,3 +52,17 @@ class ClaimRunManifest(BaseModel):
         None, description="SHA-256 of workspace config"
     )
     command: Optional[str] = Field(None, description="CLI command string")
+    stage_timings: Optional[Dict[str, Any]] = Field(
+        None,
+        description=(
+            "Claim stage graph timings: per-stage start/duration/status, "
+            "critical path and total wall time"
+        ),
+    )
+    stage_fingerprints: Optional[Dict[str, Any]] = Field(
+        None,
+        description=(
+            "Per-stage input fingerprints and reuse decisions "
+            "(ran/reused, reason, source claim run)"
+        ),
+    )
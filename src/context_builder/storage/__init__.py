@@ -32,7 +32,7 @@ Usage:
 """
 
 from .protocol import Storage, DocStore, RunStore, LabelStore, PendingStore
-from .filesystem import FileStorage
+from .filesystem import FileStorage, clear_shared_storage, get_shared_storage
 from .facade import StorageFacade
 from .models import (
     ClaimRef,
@@ -46,8 +46,12 @@ from .models import (
     SourceFileRef,
     ExtractionRef,
 )
-from .index_reader import IndexReader
-from .index_builder import build_all_indexes
+from .index_reader import IndexReader, open_index_reader
+from .sqlite_registry import SqliteIndexReader
+from .index_builder import apply_change_journal, build_all_indexes, update_claim_indexes
+from .change_journal import ChangeJournal
+from .path_map import PathMap
+from .run_claims import RunClaimIndex
 from .truth_store import GroundTruthStore, TruthStore
 from .claim_run import ClaimRunStorage
 from .workspace_paths import (
@@ -68,6 +72,8 @@ __all__ = [
     # Implementation
     "FileStorage",
     "StorageFacade",
+    "get_shared_storage",
+    "clear_shared_storage",
     # Models
     "ClaimRef",
     "DocRef",
@@ -81,7 +87,14 @@ __all__ = [
     "ExtractionRef",
     # Index utilities
     "IndexReader",
+    "SqliteIndexReader",
+    "open_index_reader",
     "build_all_indexes",
+    "apply_change_journal",
+    "update_claim_indexes",
+    "ChangeJournal",
+    "PathMap",
+    "RunClaimIndex",
     "GroundTruthStore",
     "TruthStore",  # Deprecated alias
     # Claim runs
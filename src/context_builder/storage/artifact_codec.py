@@ -0,0 +1,289 @@
+"""Encoding of JSON artifacts: compact JSON, optionally compressed.
+
+Machine-read artifacts (extraction results, run summaries, ``pages.json``
+and raw provider output) are written as compact JSON.  Large payloads
+(``pages.json`` and ``azure_di.json``, see ``COMPRESSIBLE_ARTIFACTS``) can
+also be compressed with gzip or zstd.  File names do not change: readers
+detect the encoding from the leading magic bytes, so plain, compact and
+compressed artifacts are all read the same way (``read_json_artifact``).
+
+Compression is selected per process with environment variables:
+
+- ``ARTIFACT_COMPRESSION``: ``none`` (default), ``gzip`` or ``zstd``
+- ``ARTIFACT_COMPRESSION_MIN_BYTES``: only compress payloads at least
+  this large (default 256 KiB)
+
+``orjson`` is used for JSON when installed and ``zstandard`` for zstd;
+without them the stdlib ``json`` module is used and zstd falls back to
+gzip.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+CODECS = ("none", "gzip", "zstd")
+COMPRESSION_ENV = "ARTIFACT_COMPRESSION"
+MIN_BYTES_ENV = "ARTIFACT_COMPRESSION_MIN_BYTES"
+DEFAULT_MIN_BYTES = 256 * 1024
+
+# Artifacts whose readers all go through read_json_artifact
+COMPRESSIBLE_ARTIFACTS = frozenset({"pages.json", "azure_di.json"})
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def get_compression() -> Tuple[str, int]:
+    """Configured (codec, min_bytes) for compressible artifacts."""
+    codec = os.getenv(COMPRESSION_ENV, "none").strip().lower() or "none"
+    if codec not in CODECS:
+        logger.warning(f"Unknown {COMPRESSION_ENV}={codec!r}, writing uncompressed artifacts")
+        codec = "none"
+    try:
+        min_bytes = int(os.getenv(MIN_BYTES_ENV, DEFAULT_MIN_BYTES))
+    except ValueError:
+        min_bytes = DEFAULT_MIN_BYTES
+    return codec, min_bytes
+
+
+# -----------------------------------------------------------------------------
+# Serialization
+# -----------------------------------------------------------------------------
+
+
+def dumps(data: Any, indent: Optional[int] = None) -> bytes:
+    """Serialize to UTF-8 JSON, compact unless ``indent`` is given."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent is not None:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=str, option=option)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles them
+    separators = None if indent is not None else (",", ":")
+    return json.dumps(
+        data, indent=indent, separators=separators, ensure_ascii=False, default=str
+    ).encode("utf-8")
+
+
+def detect_codec(raw: bytes) -> str:
+    """Codec of an encoded artifact, from its magic bytes."""
+    if raw.startswith(GZIP_MAGIC):
+        return "gzip"
+    if raw.startswith(ZSTD_MAGIC):
+        return "zstd"
+    return "none"
+
+
+def compress(payload: bytes, codec: str) -> bytes:
+    """Compress a serialized payload (``none`` returns it unchanged)."""
+    if codec == "zstd" and zstandard is None:
+        logger.debug("zstandard is not installed, using gzip")
+        codec = "gzip"
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(payload)
+    if codec == "gzip":
+        # mtime=0 keeps the output deterministic for identical payloads
+        return gzip.compress(payload, compresslevel=6, mtime=0)
+    return payload
+
+
+def decompress(raw: bytes) -> bytes:
+    """Decode an artifact's bytes to its JSON payload."""
+    codec = detect_codec(raw)
+    if codec == "gzip":
+        return gzip.decompress(raw)
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("Artifact is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+    return raw
+
+
+def loads(raw: bytes) -> Any:
+    """Parse an artifact's bytes, whatever its encoding.
+
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON.
+    """
+    payload = decompress(raw)
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass  # Re-parse for the stdlib error type and message
+    return json.loads(payload.decode("utf-8-sig"))
+
+
+def encode_artifact(
+    data: Any, compressible: bool = False, codec: Optional[str] = None
+) -> bytes:
+    """Encode an artifact as compact JSON, compressed if configured.
+
+    Args:
+        data: JSON-serializable data.
+        compressible: Whether the artifact may be compressed.
+        codec: Compression codec; defaults to ``ARTIFACT_COMPRESSION``.
+            Payloads smaller than ``ARTIFACT_COMPRESSION_MIN_BYTES`` stay
+            uncompressed.
+    """
+    payload = dumps(data)
+    if not compressible:
+        return payload
+    default_codec, min_bytes = get_compression()
+    codec = codec or default_codec
+    if codec == "none" or len(payload) < min_bytes:
+        return payload
+    return compress(payload, codec)
+
+
+# -----------------------------------------------------------------------------
+# Files
+# -----------------------------------------------------------------------------
+
+
+def read_json_artifact(path: Path) -> Any:
+    """Read a JSON artifact, detecting compression.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If the payload is not valid JSON.
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def write_json_artifact(path: Path, data: Any, compressible: Optional[bool] = None) -> int:
+    """Atomically write a JSON artifact.
+
+    Args:
+        path: Destination path.
+        data: JSON-serializable data.
+        compressible: Whether the artifact may be compressed; defaults to
+            whether its file name is in ``COMPRESSIBLE_ARTIFACTS``.
+
+    Returns:
+        Number of bytes written.
+    """
+    if compressible is None:
+        compressible = Path(path).name in COMPRESSIBLE_ARTIFACTS
+    encoded = encode_artifact(data, compressible=compressible)
+    _write_bytes_atomic(Path(path), encoded)
+    return len(encoded)
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    tmp_path.replace(path)
+
+
+# -----------------------------------------------------------------------------
+# Workspace migration
+# -----------------------------------------------------------------------------
+
+
+def iter_workspace_artifacts(output_dir: Path) -> Iterator[Tuple[Path, bool]]:
+    """Yield (path, compressible) for the machine-read JSON artifacts of a workspace.
+
+    Covers ``docs/*/text/pages.json``, ``docs/*/text/raw/azure_di.json``,
+    and each claim run's ``extraction/*.json`` and ``logs/summary.json``.
+    """
+    claims_dir = Path(output_dir) / "claims"
+    if not claims_dir.is_dir():
+        return
+    for claim_folder in sorted(claims_dir.iterdir()):
+        if not claim_folder.is_dir() or claim_folder.name.startswith("."):
+            continue
+        for path in sorted(claim_folder.glob("docs/*/text/pages.json")):
+            yield path, True
+        for path in sorted(claim_folder.glob("docs/*/text/raw/azure_di.json")):
+            yield path, True
+        for path in sorted(claim_folder.glob("runs/*/extraction/*.json")):
+            yield path, False
+        for path in sorted(claim_folder.glob("runs/*/logs/summary.json")):
+            yield path, False
+
+
+def recompress_workspace(
+    output_dir: Path,
+    codec: Optional[str] = None,
+    min_bytes: Optional[int] = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Re-encode a workspace's existing artifacts.
+
+    Every artifact is rewritten as compact JSON; compressible ones at least
+    ``min_bytes`` large are compressed with ``codec`` (``none`` decompresses
+    them).  Files already in the target encoding are left untouched.
+
+    Args:
+        output_dir: Workspace root (containing ``claims/``).
+        codec: Target codec; defaults to ``ARTIFACT_COMPRESSION``.
+        min_bytes: Compression threshold; defaults to
+            ``ARTIFACT_COMPRESSION_MIN_BYTES``.
+        dry_run: Compute the savings without writing.
+
+    Returns:
+        Dictionary with files_scanned, files_rewritten, files_failed,
+        bytes_before, bytes_after and bytes_saved.
+    """
+    default_codec, default_min_bytes = get_compression()
+    codec = codec or default_codec
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec: {codec} (expected one of {', '.join(CODECS)})")
+    min_bytes = default_min_bytes if min_bytes is None else min_bytes
+
+    stats = {
+        "codec": codec,
+        "files_scanned": 0,
+        "files_rewritten": 0,
+        "files_failed": 0,
+        "bytes_before": 0,
+        "bytes_after": 0,
+    }
+    for path, compressible in iter_workspace_artifacts(output_dir):
+        stats["files_scanned"] += 1
+        try:
+            raw = path.read_bytes()
+            payload = dumps(loads(raw))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable artifact {path}: {e}")
+            stats["files_failed"] += 1
+            continue
+
+        encoded = payload
+        if compressible and codec != "none" and len(payload) >= min_bytes:
+            encoded = compress(payload, codec)
+        stats["bytes_before"] += len(raw)
+        stats["bytes_after"] += len(encoded)
+        if encoded == raw:
+            continue
+        stats["files_rewritten"] += 1
+        if not dry_run:
+            _write_bytes_atomic(path, encoded)
+
+    stats["bytes_saved"] = stats["bytes_before"] - stats["bytes_after"]
+    return stats
@@ -0,0 +1,305 @@
+"""Workspace change journal: an append-only record of artifact writes and deletes.
+
+The storage layer (``ResultWriter`` and the ``FileStorage`` save/delete
+methods) appends one line per change to ``registry/changes.jsonl``, so index
+builds and other derived views can update only what changed::
+
+    {"ts": ..., "kind": "write" | "delete", "path": "claims/<claim>/docs/<doc>/...",
+     "claim_id": ..., "doc_id": ..., "run_id": ...}
+
+``path`` is relative to the workspace root and ``claim_id`` is the claim
+folder name.  Changes are only journaled for workspaces that have a
+``registry/`` directory; until the first index build there is nothing to
+keep up to date.
+
+Consumers keep a checkpoint (byte offset) per consumer name in
+``registry/journal_checkpoints/<name>.json`` and read only the tail
+after it.  The journal's first line carries a random ``journal_id``, so a
+deleted or replaced journal invalidates every checkpoint and consumers
+fall back to a full scan.  Replaying a change twice must be harmless.
+
+A full index build rescans everything, so it rotates the journal (see
+``ChangeJournal.rotate``): the journal would otherwise grow with every
+write for the life of the workspace.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILE = "changes.jsonl"
+JOURNAL_SCHEMA = "change_journal_v1"
+CHECKPOINTS_DIR = "journal_checkpoints"
+CHANGE_KINDS = ("write", "delete")
+
+_APPEND_LOCK = threading.Lock()
+
+
+def workspace_root_for(path: Path) -> Optional[Path]:
+    """Workspace root of an artifact path, if the workspace has a registry.
+
+    The root is the parent of the innermost ``claims`` directory in the
+    path, or else of the innermost ``runs`` directory (global runs).
+    """
+    parts = Path(path).parts
+    for anchor in ("claims", "runs"):
+        if anchor in parts[:-1]:
+            index = len(parts) - 2 - parts[-2::-1].index(anchor)
+            root = Path(*parts[:index]) if index else Path(".")
+            return root if (root / "registry").is_dir() else None
+    return None
+
+
+def describe_path(rel_path: str) -> Dict[str, Optional[str]]:
+    """claim_id, doc_id and run_id encoded in a workspace-relative path."""
+    parts = rel_path.split("/")
+    ids: Dict[str, Optional[str]] = {"claim_id": None, "doc_id": None, "run_id": None}
+    if parts[0] == "claims" and len(parts) > 1:
+        ids["claim_id"] = parts[1]
+        if len(parts) > 3 and parts[2] == "docs":
+            ids["doc_id"] = parts[3]
+        elif len(parts) > 3 and parts[2] == "runs":
+            ids["run_id"] = parts[3]
+    elif parts[0] == "runs" and len(parts) > 1:
+        ids["run_id"] = parts[1]
+    return ids
+
+
+def record_change(
+    path: Path,
+    kind: str = "write",
+    claim_id: Optional[str] = None,
+    doc_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    root: Optional[Path] = None,
+) -> bool:
+    """Journal a write or delete of a workspace artifact.
+
+    IDs not given are derived from the path.  ``root`` is the workspace
+    root; by default it is found from the path (see ``workspace_root_for``).
+    Never raises: the journal is an optimization and a failed append only
+    costs a full rescan.
+
+    Returns:
+        True if the change was journaled.
+    """
+    try:
+        path = Path(path)
+        if root is None:
+            root = workspace_root_for(path)
+        elif not (Path(root) / "registry").is_dir():
+            root = None
+        if root is None:
+            return False
+        root = Path(root)
+        rel_path = path.relative_to(root).as_posix()
+        ids = describe_path(rel_path)
+        entry = {
+            "ts": datetime.utcnow().isoformat() + "Z",
+            "kind": kind,
+            "path": rel_path,
+            "claim_id": claim_id or ids["claim_id"],
+            "doc_id": doc_id or ids["doc_id"],
+            "run_id": run_id or ids["run_id"],
+        }
+        ChangeJournal(root / "registry").append([entry])
+        return True
+    except Exception as e:
+        logger.debug(f"Failed to journal {kind} of {path}: {e}")
+        return False
+
+
+def _new_header() -> bytes:
+    header = {"schema_version": JOURNAL_SCHEMA, "journal_id": uuid.uuid4().hex}
+    return (json.dumps(header) + "\n").encode("utf-8")
+
+
+class ChangeJournal:
+    """Append-only change journal of one workspace registry."""
+
+    def __init__(self, registry_dir: Path):
+        self.registry_dir = Path(registry_dir)
+        self.path = self.registry_dir / JOURNAL_FILE
+        self.checkpoints_dir = self.registry_dir / CHECKPOINTS_DIR
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+
+    def ensure(self) -> int:
+        """Create the journal if needed and return its current end offset."""
+        if not self.path.exists():
+            self.registry_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                pass  # Created concurrently
+            else:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_new_header())
+        return self.end_offset()
+
+    def rotate(self, keep_from: int) -> int:
+        """Start a new journal (new journal_id), keeping entries after ``keep_from``.
+
+        Every consumer checkpoint becomes invalid.  Used by full index
+        builds, which cover everything journaled before ``keep_from``.
+        An entry another process appends while the file is swapped can be
+        lost; the next full build picks up its change.
+
+        Returns:
+            Offset of the first kept entry in the new journal.
+        """
+        self.registry_dir.mkdir(parents=True, exist_ok=True)
+        header = _new_header()
+        tmp_path = self.path.with_name(
+            f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with _APPEND_LOCK:
+            try:
+                old = open(self.path, "rb")
+            except FileNotFoundError:
+                old = None
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(header)
+                    if old is not None:
+                        old.seek(keep_from)
+                        f.write(old.read())
+                tmp_path.replace(self.path)
+                # Appended to the old file by other processes during the copy
+                late = old.read() if old is not None else b""
+                if late:
+                    with open(self.path, "ab") as f:
+                        f.write(late)
+            finally:
+                if old is not None:
+                    old.close()
+        logger.debug(f"Rotated change journal {self.path}")
+        return len(header)
+
+    def append(self, entries: List[dict]) -> None:
+        """Append change entries."""
+        if not entries:
+            return
+        if not self.path.exists():
+            self.ensure()
+        data = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries)
+        with _APPEND_LOCK:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(data)
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def journal_id(self) -> Optional[str]:
+        """ID of the current journal file (None if there is none)."""
+        try:
+            with open(self.path, "rb") as f:
+                first_line = f.readline()
+            stat = self.path.stat()
+        except OSError:
+            return None
+        try:
+            header = json.loads(first_line)
+            if header.get("schema_version") == JOURNAL_SCHEMA:
+                return header["journal_id"]
+        except (json.JSONDecodeError, KeyError, AttributeError):
+            pass
+        return f"ino:{stat.st_dev}:{stat.st_ino}"
+
+    def end_offset(self) -> int:
+        """Offset just past the last complete line."""
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            return 0
+        if size == 0:
+            return 0
+        with open(self.path, "rb") as f:
+            f.seek(max(size - 1, 0))
+            if f.read(1) == b"\n":
+                return size
+            f.seek(0)
+            data = f.read(size)
+        return data.rfind(b"\n") + 1
+
+    def read_since(self, offset: int) -> Tuple[List[dict], int]:
+        """Entries after ``offset`` and the offset after the last one read.
+
+        Only complete lines are returned; a partially written entry is
+        picked up by the next read.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except OSError:
+            return [], offset
+        end = data.rfind(b"\n") + 1
+        entries = []
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Invalid change journal entry in {self.path}: {e}")
+                continue
+            if "kind" in entry:
+                entries.append(entry)
+        return entries, offset + end
+
+    # -------------------------------------------------------------------------
+    # Consumer checkpoints
+    # -------------------------------------------------------------------------
+
+    def get_checkpoint(self, consumer: str) -> Optional[int]:
+        """Offset a consumer has processed up to, or None if it must rescan."""
+        try:
+            with open(self.checkpoints_dir / f"{consumer}.json", "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if checkpoint.get("journal_id") != self.journal_id():
+            return None
+        offset = checkpoint.get("offset")
+        if not isinstance(offset, int) or offset > self.end_offset():
+            return None
+        return offset
+
+    def set_checkpoint(self, consumer: str, offset: int) -> None:
+        """Record that a consumer has processed the journal up to ``offset``."""
+        journal_id = self.journal_id()
+        if journal_id is None:
+            return
+        self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
+        checkpoint_path = self.checkpoints_dir / f"{consumer}.json"
+        tmp_path = checkpoint_path.with_name(
+            f"{checkpoint_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"journal_id": journal_id, "offset": offset}, f)
+        tmp_path.replace(checkpoint_path)
+
+    def changes_since_checkpoint(self, consumer: str) -> Optional[Tuple[List[dict], int]]:
+        """Entries a consumer has not processed yet, and the offset to commit.
+
+        Returns:
+            (entries, end_offset), or None if the consumer has no valid
+            checkpoint and must rescan.
+        """
+        offset = self.get_checkpoint(consumer)
+        if offset is None:
+            return None
+        return self.read_since(offset)
@@ -3,15 +3,44 @@
 import hashlib
 import json
 import logging
+import os
+import re
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from context_builder.schemas.claim_run import ClaimRunManifest
+from context_builder.storage.dossier_index import DossierIndex, dossier_filename
+from context_builder.storage.index_reader import open_index_reader
+from context_builder.storage.path_map import PathMap
 
 logger = logging.getLogger(__name__)
 
+# Catalog of the runs in a claim_runs/ directory (see ClaimRunStorage).
+CLAIM_RUN_INDEX_FILE = "index.json"
+CLAIM_RUN_INDEX_SCHEMA = "claim_run_index_v1"
+
+_RUN_ID_TIMESTAMP = re.compile(r"(\d{8})_(\d{6})")
+
+# Parsed catalogs per claim_runs/ dir, valid while the directory's mtime
+# (which changes when runs are added/removed or index.json is replaced)
+# is unchanged: path -> (dir mtime_ns, index data, cached at ns)
+_INDEX_CACHE: Dict[Path, Tuple[int, Dict[str, Any], int]] = {}
+_INDEX_LOCK = threading.RLock()
+
+# A directory modified this recently may change again within the same
+# mtime tick, so its cached catalog is re-checked against the directory.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def clear_claim_run_index_cache() -> None:
+    """Drop all cached claim run catalogs."""
+    with _INDEX_LOCK:
+        _INDEX_CACHE.clear()
+
 
 @dataclass
 class ClaimRunContext:
@@ -48,7 +77,14 @@ class ClaimRunStorage:
     """Storage operations for claim runs.
 
     Handles creating, reading, and listing claim runs.
-    Uses "always latest" strategy - no current pointer.
+
+    ``claim_runs/index.json`` catalogs the runs newest first, with a
+    ``latest`` pointer and a summary of each manifest.  It is rewritten
+    atomically by ``write_manifest`` (and so by ``create_claim_run``).
+    Runs are ordered by manifest ``created_at``, not by directory mtime,
+    so copies and restores keep their order.  Run directories added or
+    removed behind the catalog's back are reconciled on the next read;
+    ``rebuild_index`` recreates it from the manifests.
     """
 
     def __init__(self, claim_folder: Path):
@@ -142,6 +178,7 @@ class ClaimRunStorage:
             json.dump(manifest.model_dump(mode="json"), f, indent=2, default=str)
         tmp_path.replace(manifest_path)
 
+        self._update_index(self._summarize(manifest.claim_run_id, manifest))
         return manifest_path
 
     def read_manifest(self, claim_run_id: str) -> Optional[ClaimRunManifest]:
@@ -167,20 +204,15 @@ class ClaimRunStorage:
         Returns:
             List of claim run IDs.
         """
-        if not self.claim_runs_dir.exists():
-            return []
+        return [r["claim_run_id"] for r in self._load_index()["runs"]]
 
-        runs = []
-        for run_dir in self.claim_runs_dir.iterdir():
-            if run_dir.is_dir():
-                runs.append(run_dir.name)
+    def list_claim_run_summaries(self) -> List[Dict[str, Any]]:
+        """List catalog summaries of all claim runs, newest first.
 
-        # Sort by directory modification time, newest first
-        runs.sort(
-            key=lambda name: (self.claim_runs_dir / name).stat().st_mtime,
-            reverse=True,
-        )
-        return runs
+        Each summary holds claim_run_id, created_at, stages_completed,
+        extraction_runs_considered, contextbuilder_version and has_manifest.
+        """
+        return [dict(r) for r in self._load_index()["runs"]]
 
     def get_latest_claim_run_id(self) -> Optional[str]:
         """Get the latest claim run ID.
@@ -188,8 +220,165 @@ class ClaimRunStorage:
         Returns:
             Latest claim run ID or None if no runs exist.
         """
-        runs = self.list_claim_runs()
-        return runs[0] if runs else None
+        return self._load_index()["latest"]
+
+    def rebuild_index(self) -> Dict[str, Any]:
+        """Recreate claim_runs/index.json from the run manifests.
+
+        Returns:
+            The rebuilt index.
+        """
+        with _INDEX_LOCK:
+            runs = [self._summarize(run_id) for run_id in self._scan_run_dirs()]
+            return self._write_index(runs)
+
+    # =========================================================================
+    # RUN CATALOG
+    # =========================================================================
+
+    @property
+    def index_path(self) -> Path:
+        return self.claim_runs_dir / CLAIM_RUN_INDEX_FILE
+
+    def _dir_mtime_ns(self) -> Optional[int]:
+        try:
+            return self.claim_runs_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _scan_run_dirs(self) -> List[str]:
+        if not self.claim_runs_dir.exists():
+            return []
+        with os.scandir(self.claim_runs_dir) as entries:
+            return [e.name for e in entries if e.is_dir()]
+
+    def _summarize(
+        self, claim_run_id: str, manifest: Optional[ClaimRunManifest] = None
+    ) -> Dict[str, Any]:
+        """Build the catalog entry for a run."""
+        if manifest is None:
+            try:
+                manifest = self.read_manifest(claim_run_id)
+            except Exception as e:
+                logger.warning(f"Unreadable manifest for claim run {claim_run_id}: {e}")
+                manifest = None
+
+        if manifest is not None:
+            return {
+                "claim_run_id": claim_run_id,
+                "created_at": manifest.created_at.isoformat(),
+                "stages_completed": list(manifest.stages_completed),
+                "extraction_runs_considered": list(manifest.extraction_runs_considered),
+                "contextbuilder_version": manifest.contextbuilder_version,
+                "has_manifest": True,
+            }
+
+        # No manifest: use the timestamp embedded in the ID
+        # (clm_YYYYMMDD_HHMMSS_xxx), else the directory's mtime when first seen.
+        match = _RUN_ID_TIMESTAMP.search(claim_run_id)
+        created_at = None
+        if match:
+            try:
+                created_at = datetime.strptime(
+                    "".join(match.groups()), "%Y%m%d%H%M%S"
+                ).isoformat()
+            except ValueError:
+                created_at = None
+        if created_at is None:
+            try:
+                mtime = (self.claim_runs_dir / claim_run_id).stat().st_mtime
+                created_at = datetime.utcfromtimestamp(mtime).isoformat()
+            except OSError:
+                created_at = ""
+        return {
+            "claim_run_id": claim_run_id,
+            "created_at": created_at,
+            "stages_completed": [],
+            "extraction_runs_considered": [],
+            "contextbuilder_version": None,
+            "has_manifest": False,
+        }
+
+    def _write_index(self, runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Sort runs newest first and atomically replace index.json.
+
+        Caller holds _INDEX_LOCK.
+        """
+        runs = sorted(
+            runs, key=lambda r: (r["created_at"] or "", r["claim_run_id"]), reverse=True
+        )
+        index = {
+            "schema_version": CLAIM_RUN_INDEX_SCHEMA,
+            "latest": runs[0]["claim_run_id"] if runs else None,
+            "runs": runs,
+        }
+        if not self.claim_runs_dir.exists():
+            return index
+
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2, ensure_ascii=False, default=str)
+        tmp_path.replace(self.index_path)
+
+        mtime_ns = self._dir_mtime_ns()
+        if mtime_ns is not None:
+            _INDEX_CACHE[self.claim_runs_dir] = (mtime_ns, index, time.time_ns())
+        return index
+
+    def _update_index(self, summary: Dict[str, Any]) -> None:
+        """Insert or replace one run's entry in the catalog."""
+        try:
+            with _INDEX_LOCK:
+                runs = [
+                    r for r in self._load_index()["runs"]
+                    if r["claim_run_id"] != summary["claim_run_id"]
+                ]
+                runs.append(summary)
+                self._write_index(runs)
+        except Exception as e:
+            # The catalog is derived data: the next read reconciles it.
+            logger.warning(f"Failed to update claim run index in {self.claim_runs_dir}: {e}")
+
+    def _load_index(self) -> Dict[str, Any]:
+        """Return the catalog, reconciling it with the run directories if stale."""
+        empty = {"schema_version": CLAIM_RUN_INDEX_SCHEMA, "latest": None, "runs": []}
+        mtime_ns = self._dir_mtime_ns()
+        if mtime_ns is None:
+            return empty
+
+        with _INDEX_LOCK:
+            cached = _INDEX_CACHE.get(self.claim_runs_dir)
+            if (
+                cached
+                and cached[0] == mtime_ns
+                and cached[2] - mtime_ns > _RACY_WINDOW_NS
+            ):
+                return cached[1]
+
+            index = None
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+                if index.get("schema_version") != CLAIM_RUN_INDEX_SCHEMA:
+                    index = None
+            except FileNotFoundError:
+                pass
+            except (json.JSONDecodeError, OSError, AttributeError) as e:
+                logger.warning(f"Invalid claim run index {self.index_path}: {e}")
+                index = None
+
+            run_dirs = set(self._scan_run_dirs())
+            if index is None:
+                return self.rebuild_index()
+
+            known = {r["claim_run_id"]: r for r in index.get("runs", [])}
+            if set(known) != run_dirs:
+                runs = [r for run_id, r in known.items() if run_id in run_dirs]
+                runs.extend(self._summarize(run_id) for run_id in run_dirs - set(known))
+                return self._write_index(runs)
+
+            _INDEX_CACHE[self.claim_runs_dir] = (mtime_ns, index, time.time_ns())
+            return index
 
     def get_claim_run_path(self, claim_run_id: str) -> Path:
         """Get path to a claim run directory.
@@ -300,3 +489,65 @@ class ClaimRunStorage:
             Path to written file.
         """
         return self.write_to_claim_run(claim_run_id, "assessment.json", assessment)
+
+    def write_dossier(self, claim_run_id: str, dossier: dict) -> Path:
+        """Write decision_dossier_v{N}.json and record it in the dossier index.
+
+        Args:
+            claim_run_id: Claim run ID.
+            dossier: Dossier data; its ``version`` field determines N.
+
+        Returns:
+            Path to written file.
+        """
+        index = DossierIndex(self.claim_folder)
+        index.versions(claim_run_id)  # Bring the run's entry up to date first
+        file_path = self.write_to_claim_run(
+            claim_run_id, dossier_filename(dossier["version"]), dossier
+        )
+        try:
+            index.record(claim_run_id, dossier, file_path.name)
+        except OSError as e:
+            logger.warning(f"Failed to update dossier index for {self.claim_folder}: {e}")
+        return file_path
+
+
+def resolve_claim_folder(claims_dir: Path, claim_id: str) -> Optional[Path]:
+    """Find the folder of a claim under ``claims_dir``.
+
+    Tries the folder named after the claim, then the registry's claim
+    index, then the path map, which also matches folder names containing
+    the claim ID without scanning the directory.
+    """
+    direct_path = claims_dir / claim_id
+    if direct_path.is_dir():
+        return direct_path
+
+    reader = open_index_reader(claims_dir.parent / "registry")
+    if reader.is_available:
+        folder_name = reader.get_claim_folder(claim_id)
+        if folder_name and (claims_dir / folder_name).is_dir():
+            return claims_dir / folder_name
+
+    if not claims_dir.is_dir():
+        return None
+    return PathMap.for_claims_dir(claims_dir).claim_folder(claim_id, partial=True)
+
+
+def rebuild_claim_run_indexes(claims_dir: Path) -> int:
+    """Rebuild claim_runs/index.json for every claim under ``claims_dir``.
+
+    Returns:
+        Number of claims whose catalog was rebuilt.
+    """
+    rebuilt = 0
+    if not claims_dir.exists():
+        return rebuilt
+    for claim_folder in sorted(claims_dir.iterdir()):
+        if not claim_folder.is_dir() or claim_folder.name.startswith("."):
+            continue
+        storage = ClaimRunStorage(claim_folder)
+        if storage.claim_runs_dir.is_dir():
+            storage.rebuild_index()
+            rebuilt += 1
+    return rebuilt
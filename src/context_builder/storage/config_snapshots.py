@@ -0,0 +1,237 @@
+"""Content-addressed snapshots of the workspace config directory.
+
+A run records the ID of the snapshot it used instead of a copy of the
+``config/`` tree.  The store keeps, under ``{workspace}/config_snapshots/``:
+
+- ``objects/<aa>/<sha256>``: one blob per unique file content
+- ``trees/<snapshot_id>.json``: relative path -> blob digest for one snapshot
+
+The snapshot ID is a SHA-256 over the sorted (path, digest) pairs, so an
+unchanged config maps to the same ID (and adds nothing to disk).  File
+digests are cached by (path, size, mtime) in ``digests.json``, so hashing an
+unchanged config only stats its files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOTS_DIR = "config_snapshots"
+DIGEST_CACHE_FILE = "digests.json"
+TREE_SCHEMA = "config_snapshot_v1"
+
+# Files modified this recently are not cached: a same-size rewrite within
+# the filesystem's mtime granularity would otherwise go unnoticed.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# config dir -> {rel_path: (size, mtime_ns, digest)}
+_DIGESTS: Dict[Path, Dict[str, Tuple[int, int, str]]] = {}
+_DIGESTS_LOCK = threading.Lock()
+
+
+def clear_config_digest_cache() -> None:
+    """Drop in-process file digest caches."""
+    with _DIGESTS_LOCK:
+        _DIGESTS.clear()
+
+
+def _hash_file(file_path: Path) -> str:
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    tmp_path.replace(path)
+
+
+def tree_id(files: Dict[str, str]) -> Optional[str]:
+    """Snapshot ID for a mapping of relative path -> file digest."""
+    if not files:
+        return None
+    hasher = hashlib.sha256()
+    for rel_path in sorted(files):
+        hasher.update(f"{rel_path}\0{files[rel_path]}\n".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class ConfigSnapshotStore:
+    """Content-addressed store for snapshots of one workspace config dir."""
+
+    def __init__(self, config_dir: Path, store_dir: Optional[Path] = None):
+        """Initialize the store.
+
+        Args:
+            config_dir: Workspace config directory to snapshot.
+            store_dir: Snapshot store location; defaults to
+                ``config_snapshots/`` next to ``config_dir``.
+        """
+        self.config_dir = Path(config_dir)
+        self.store_dir = Path(store_dir or self.config_dir.parent / SNAPSHOTS_DIR)
+        self.objects_dir = self.store_dir / "objects"
+        self.trees_dir = self.store_dir / "trees"
+
+    # -------------------------------------------------------------------------
+    # Hashing
+    # -------------------------------------------------------------------------
+
+    def list_files(self) -> List[Path]:
+        """Config files to snapshot, sorted."""
+        if not self.config_dir.exists():
+            return []
+        return sorted(p for p in self.config_dir.rglob("*") if p.is_file())
+
+    def file_digests(self) -> Dict[str, str]:
+        """Digest of each config file, keyed by POSIX relative path.
+
+        Files whose size and mtime match the cache are not re-read.
+        """
+        key = self.config_dir.resolve() if self.config_dir.exists() else self.config_dir
+        with _DIGESTS_LOCK:
+            cache = _DIGESTS.get(key)
+            if cache is None:
+                cache = _DIGESTS[key] = self._load_digest_cache()
+
+            now_ns = time.time_ns()
+            digests: Dict[str, str] = {}
+            fresh: Dict[str, Tuple[int, int, str]] = {}
+            changed = False
+            for file_path in self.list_files():
+                rel_path = file_path.relative_to(self.config_dir).as_posix()
+                stat = file_path.stat()
+                cached = cache.get(rel_path)
+                if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                    digest = cached[2]
+                else:
+                    digest = _hash_file(file_path)
+                    changed = True
+                digests[rel_path] = digest
+                if now_ns - stat.st_mtime_ns > _RACY_WINDOW_NS:
+                    fresh[rel_path] = (stat.st_size, stat.st_mtime_ns, digest)
+
+            if changed or fresh.keys() != cache.keys():
+                _DIGESTS[key] = fresh
+                self._save_digest_cache(fresh)
+            return digests
+
+    def compute_id(self) -> Optional[str]:
+        """Snapshot ID of the current config, or None if it has no files."""
+        return tree_id(self.file_digests())
+
+    def _load_digest_cache(self) -> Dict[str, Tuple[int, int, str]]:
+        cache_path = self.store_dir / DIGEST_CACHE_FILE
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable config digest cache {cache_path}: {e}")
+            return {}
+        if data.get("config_dir") != str(self.config_dir):
+            return {}
+        return {k: tuple(v) for k, v in data.get("files", {}).items()}
+
+    def _save_digest_cache(self, cache: Dict[str, Tuple[int, int, str]]) -> None:
+        data = {"config_dir": str(self.config_dir), "files": cache}
+        try:
+            _write_atomic(
+                self.store_dir / DIGEST_CACHE_FILE,
+                json.dumps(data, indent=2, sort_keys=True).encode("utf-8"),
+            )
+        except OSError as e:
+            logger.debug(f"Failed to save config digest cache: {e}")
+
+    # -------------------------------------------------------------------------
+    # Snapshots
+    # -------------------------------------------------------------------------
+
+    def snapshot(self) -> Optional[str]:
+        """Store the current config and return its snapshot ID.
+
+        Only blobs and trees not already in the store are written.
+
+        Returns:
+            Snapshot ID, or None if the config dir has no files.
+        """
+        files = self.file_digests()
+        snapshot_id = tree_id(files)
+        if snapshot_id is None:
+            return None
+
+        tree_path = self.trees_dir / f"{snapshot_id}.json"
+        if tree_path.exists():
+            return snapshot_id
+
+        for rel_path, digest in files.items():
+            blob_path = self._blob_path(digest)
+            if blob_path.exists():
+                continue
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = blob_path.with_name(
+                f"{blob_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            shutil.copyfile(self.config_dir / rel_path, tmp_path)
+            if _hash_file(tmp_path) != digest:
+                # Changed since it was hashed; the next snapshot picks it up
+                tmp_path.unlink()
+                raise OSError(f"Config file changed while snapshotting: {rel_path}")
+            tmp_path.replace(blob_path)
+
+        tree = {"schema_version": TREE_SCHEMA, "snapshot_id": snapshot_id, "files": files}
+        _write_atomic(tree_path, json.dumps(tree, indent=2, sort_keys=True).encode("utf-8"))
+        logger.debug(f"Stored config snapshot {snapshot_id} ({len(files)} files)")
+        return snapshot_id
+
+    def get_tree(self, snapshot_id: str) -> Optional[Dict[str, str]]:
+        """Relative path -> blob digest for a stored snapshot."""
+        tree_path = self.trees_dir / f"{snapshot_id}.json"
+        try:
+            with open(tree_path, "r", encoding="utf-8") as f:
+                return json.load(f)["files"]
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError, KeyError) as e:
+            logger.warning(f"Failed to read config snapshot {snapshot_id}: {e}")
+            return None
+
+    def read_file(self, snapshot_id: str, rel_path: str) -> Optional[bytes]:
+        """Content of one file in a stored snapshot."""
+        tree = self.get_tree(snapshot_id)
+        if tree is None or rel_path not in tree:
+            return None
+        return self._blob_path(tree[rel_path]).read_bytes()
+
+    def restore(self, snapshot_id: str, dest_dir: Path) -> bool:
+        """Materialize a stored snapshot as a directory tree.
+
+        Returns:
+            False if the snapshot is unknown.
+        """
+        tree = self.get_tree(snapshot_id)
+        if tree is None:
+            return False
+        for rel_path, digest in tree.items():
+            dest_path = Path(dest_dir) / rel_path
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self._blob_path(digest), dest_path)
+        return True
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
@@ -0,0 +1,217 @@
+"""Per-claim index of decision dossier versions.
+
+Dossiers are written as ``claim_runs/<run>/decision_dossier_v{N}.json``.
+The index keeps a summary of each version, grouped by run, in
+``<claim>/dossier_index.json``:
+
+- version and filename
+- claim verdict, evaluation timestamp and engine ID
+- failed clause and unresolved assumption counts
+
+Dossier writers (``ClaimRunStorage.write_dossier`` and in-place patches)
+update the index.  Each run's entry also stores the run directory's mtime
+when it was last indexed.  If the directory changed since, for example
+because a dossier was written by older code, that run is re-scanned once
+and the index is updated.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DOSSIER_INDEX_FILE = "dossier_index.json"
+DOSSIER_INDEX_SCHEMA = "dossier_index_v1"
+
+_DOSSIER_FILE = re.compile(r"^decision_dossier_v(\d+)\.json$")
+
+# Parsed indexes per file: path -> ((mtime_ns, size), data)
+_INDEX_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_INDEX_LOCK = threading.RLock()
+
+
+def clear_dossier_index_cache() -> None:
+    """Drop all parsed dossier indexes."""
+    with _INDEX_LOCK:
+        _INDEX_CACHE.clear()
+
+
+def dossier_filename(version: int) -> str:
+    return f"decision_dossier_v{version}.json"
+
+
+def parse_dossier_version(filename: str) -> Optional[int]:
+    """Return N for ``decision_dossier_v{N}.json``, else None."""
+    match = _DOSSIER_FILE.match(filename)
+    return int(match.group(1)) if match else None
+
+
+def dossier_summary(dossier: Dict[str, Any], filename: str) -> Dict[str, Any]:
+    """Summarize a dossier for the index (the fields version listings show)."""
+    version = dossier.get("version")
+    if version is None:
+        version = parse_dossier_version(filename) or 0
+    return {
+        "version": version,
+        "filename": filename,
+        "claim_verdict": dossier.get("claim_verdict"),
+        "evaluation_timestamp": dossier.get("evaluation_timestamp"),
+        "engine_id": dossier.get("engine_id"),
+        "failed_clauses_count": len(dossier.get("failed_clauses") or []),
+        "unresolved_count": len(dossier.get("unresolved_assumptions") or []),
+    }
+
+
+def _signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class DossierIndex:
+    """Dossier version summaries for one claim folder."""
+
+    def __init__(self, claim_folder: Path):
+        self.claim_folder = Path(claim_folder)
+        self.claim_runs_dir = self.claim_folder / "claim_runs"
+        self.path = self.claim_folder / DOSSIER_INDEX_FILE
+
+    def versions(self, claim_run_id: str) -> List[Dict[str, Any]]:
+        """Return version summaries for a claim run, in version order."""
+        run_dir = self.claim_runs_dir / claim_run_id
+        with _INDEX_LOCK:
+            mtime_ns = _mtime_ns(run_dir)
+            if mtime_ns is None:
+                return []
+            entry = self._load()["runs"].get(claim_run_id)
+            if entry is None or entry.get("dir_mtime_ns") != mtime_ns:
+                entry = self._rescan(claim_run_id, mtime_ns)
+            return list(entry["versions"])
+
+    def latest(self, claim_run_id: str) -> Optional[Dict[str, Any]]:
+        """Return the summary of the highest dossier version, if any."""
+        versions = self.versions(claim_run_id)
+        return versions[-1] if versions else None
+
+    def latest_path(self, claim_run_id: str) -> Optional[Path]:
+        latest = self.latest(claim_run_id)
+        if latest is None:
+            return None
+        return self.claim_runs_dir / claim_run_id / latest["filename"]
+
+    def next_version(self, claim_run_id: str) -> int:
+        latest = self.latest(claim_run_id)
+        return latest["version"] + 1 if latest else 1
+
+    def record(
+        self, claim_run_id: str, dossier: Dict[str, Any], filename: str
+    ) -> Dict[str, Any]:
+        """Record a dossier that was just written (or patched) in a run.
+
+        The run's entry is assumed to be current apart from this file, so
+        callers bring it in sync (``versions``) before writing.
+        """
+        summary = dossier_summary(dossier, filename)
+        with _INDEX_LOCK:
+            data = self._load()
+            entry = data["runs"].get(claim_run_id) or {"versions": []}
+            versions = [v for v in entry["versions"] if v["filename"] != filename]
+            versions.append(summary)
+            versions.sort(key=lambda v: v["version"])
+            runs = dict(data["runs"])
+            runs[claim_run_id] = {
+                "dir_mtime_ns": _mtime_ns(self.claim_runs_dir / claim_run_id),
+                "versions": versions,
+            }
+            self._write(runs)
+        return summary
+
+    @classmethod
+    def record_file(cls, dossier_path: Path, dossier: Dict[str, Any]) -> Dict[str, Any]:
+        """Record a dossier given its path (``<claim>/claim_runs/<run>/<file>``)."""
+        run_dir = dossier_path.parent
+        return cls(run_dir.parent.parent).record(run_dir.name, dossier, dossier_path.name)
+
+    def rebuild(self) -> Dict[str, Any]:
+        """Re-scan every claim run and replace the index."""
+        runs: Dict[str, Any] = {}
+        if self.claim_runs_dir.is_dir():
+            for run_dir in sorted(self.claim_runs_dir.iterdir()):
+                if run_dir.is_dir():
+                    runs[run_dir.name] = self._scan_run(run_dir)
+        with _INDEX_LOCK:
+            return self._write(runs)
+
+    def _scan_run(self, run_dir: Path) -> Dict[str, Any]:
+        mtime_ns = _mtime_ns(run_dir)
+        versions = []
+        for path in run_dir.glob("decision_dossier_v*.json"):
+            if parse_dossier_version(path.name) is None:
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    dossier = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Failed to read dossier metadata from {path}: {e}")
+                continue
+            versions.append(dossier_summary(dossier, path.name))
+        versions.sort(key=lambda v: v["version"])
+        return {"dir_mtime_ns": mtime_ns, "versions": versions}
+
+    def _rescan(self, claim_run_id: str, mtime_ns: int) -> Dict[str, Any]:
+        """Re-index one run whose directory changed (caller holds the lock)."""
+        entry = self._scan_run(self.claim_runs_dir / claim_run_id)
+        entry["dir_mtime_ns"] = mtime_ns
+        runs = dict(self._load()["runs"])
+        runs[claim_run_id] = entry
+        try:
+            self._write(runs)
+        except OSError as e:
+            logger.warning(f"Failed to update dossier index {self.path}: {e}")
+        return entry
+
+    def _load(self) -> Dict[str, Any]:
+        """Return the parsed index (cached until the file changes)."""
+        signature = _signature(self.path)
+        cached = _INDEX_CACHE.get(self.path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        data: Dict[str, Any] = {"runs": {}}
+        if signature is not None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    loaded = json.load(f)
+                if loaded.get("schema_version") == DOSSIER_INDEX_SCHEMA:
+                    data = loaded
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Invalid dossier index {self.path}: {e}")
+            _INDEX_CACHE[self.path] = (signature, data)
+        return data
+
+    def _write(self, runs: Dict[str, Any]) -> Dict[str, Any]:
+        """Atomically replace the index file (caller holds the lock)."""
+        data = {"schema_version": DOSSIER_INDEX_SCHEMA, "runs": runs}
+        self.claim_folder.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        tmp_path.replace(self.path)
+        _INDEX_CACHE[self.path] = (_signature(self.path), data)
+        return data
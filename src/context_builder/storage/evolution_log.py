@@ -0,0 +1,260 @@
+"""Incrementally materialized pipeline evolution timeline.
+
+The evolution dashboard groups version bundles by extraction spec hash and
+shows scope and accuracy per group.  Computing that from scratch loads
+every run's bundle and an eval summary per group, so it grows with the
+number of runs.
+
+Instead, each saved version bundle and each eval summary appends one
+compact event to ``version_bundles/evolution_log.jsonl``, carrying
+precomputed scope and accuracy figures.  Readers fold the events into
+per-spec groups and keep the result in ``evolution_timeline.json``,
+together with the log offset it covers.  A read therefore only parses the
+snapshot (one entry per spec version) plus the events appended since.
+
+Appends are single lines, so concurrent writers (parallel pipeline runs)
+do not need to coordinate.  When the snapshot is missing, it is rebuilt
+from the bundles themselves (see ``EvolutionService.rebuild_timeline``).
+Bundles saved while a rebuild scans may be both scanned and logged after
+the rebuild's offset; the snapshot lists the scanned runs in
+``skip_runs`` and their bundle events are skipped on replay.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from context_builder.schemas.decision_record import VersionBundle
+
+logger = logging.getLogger(__name__)
+
+EVOLUTION_LOG_FILE = "evolution_log.jsonl"
+EVOLUTION_SNAPSHOT_FILE = "evolution_timeline.json"
+EVOLUTION_SNAPSHOT_SCHEMA = "evolution_timeline_v1"
+
+# Evals whose run is not (yet) a group's representative are kept in case
+# the run's bundle arrives later; older ones are dropped beyond this many.
+_MAX_PENDING_EVALS = 200
+# Most recent runs folded in by a rebuild whose bundle events may still be
+# in the log tail it did not cover.
+MAX_SKIP_RUNS = 200
+
+
+def accuracy_counts(eval_summary: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Extract accuracy figures from an eval summary (or empty ones)."""
+    summary = eval_summary or {}
+    correct = summary.get("correct", 0)
+    incorrect = summary.get("incorrect", 0)
+    missing = summary.get("missing", 0)
+    total_outcomes = correct + incorrect + missing
+    return {
+        "accuracy_rate": (
+            round(100 * correct / total_outcomes, 1) if total_outcomes > 0 else None
+        ),
+        "correct_count": correct,
+        "incorrect_count": incorrect,
+        "missing_count": missing,
+        "docs_evaluated": summary.get("docs_evaluated", 0),
+    }
+
+
+def bundle_event(run_id: str, bundle: VersionBundle) -> Dict[str, Any]:
+    """Build the log event for a saved version bundle."""
+    scope = bundle.scope_snapshot
+    return {
+        "type": "bundle",
+        "run_id": run_id,
+        "spec_hash": bundle.extraction_spec_hash or "unknown",
+        "created_at": bundle.created_at,
+        "scope": scope.model_dump() if scope else None,
+        "model_name": bundle.model_name,
+        "contextbuilder_version": bundle.contextbuilder_version,
+        "git_commit": bundle.git_commit,
+    }
+
+
+def eval_event(run_id: str, eval_summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the log event for a run's eval summary."""
+    return {"type": "eval", "run_id": run_id, **accuracy_counts(eval_summary)}
+
+
+def new_group(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Start a spec group from its first bundle event."""
+    return {
+        "spec_hash": event["spec_hash"],
+        "first_seen": event["created_at"],
+        "last_seen": event["created_at"],
+        "bundle_count": 1,
+        "first_scope": event["scope"],
+        "last_scope": event["scope"],
+        "representative_run_id": event["run_id"],
+        "model_name": event["model_name"],
+        "contextbuilder_version": event["contextbuilder_version"],
+        "git_commit": event["git_commit"],
+        **accuracy_counts(None),
+    }
+
+
+def apply_event(state: Dict[str, Any], event: Dict[str, Any]) -> None:
+    """Fold one log event into the snapshot state (in place)."""
+    groups: Dict[str, Dict[str, Any]] = state.setdefault("groups", {})
+    pending: Dict[str, Dict[str, Any]] = state.setdefault("pending_evals", {})
+
+    if event.get("type") == "bundle":
+        skip_runs = state.get("skip_runs")
+        if skip_runs and event["run_id"] in skip_runs:
+            # Already folded in by the rebuild that wrote the snapshot
+            skip_runs.remove(event["run_id"])
+            return
+        group = groups.get(event["spec_hash"])
+        if group is None:
+            group = groups[event["spec_hash"]] = new_group(event)
+        else:
+            group["bundle_count"] += 1
+            if event["created_at"] < group["first_seen"]:
+                group["first_seen"] = event["created_at"]
+                group["first_scope"] = event["scope"]
+            if event["created_at"] < group["last_seen"]:
+                return
+            # Most recent bundle of the group becomes its representative
+            group.update(
+                last_seen=event["created_at"],
+                last_scope=event["scope"],
+                representative_run_id=event["run_id"],
+                model_name=event["model_name"],
+                contextbuilder_version=event["contextbuilder_version"],
+                git_commit=event["git_commit"],
+                **accuracy_counts(None),
+            )
+        counts = pending.pop(event["run_id"], None)
+        if counts:
+            group.update(counts)
+
+    elif event.get("type") == "eval":
+        counts = {k: v for k, v in event.items() if k not in ("type", "run_id")}
+        for group in groups.values():
+            if group["representative_run_id"] == event["run_id"]:
+                group.update(counts)
+                return
+        pending.pop(event["run_id"], None)
+        pending[event["run_id"]] = counts
+        while len(pending) > _MAX_PENDING_EVALS:
+            pending.pop(next(iter(pending)))
+
+
+class EvolutionLog:
+    """Append-only evolution events plus a folded snapshot.
+
+    Attributes:
+        storage_dir: The ``version_bundles`` directory.
+    """
+
+    def __init__(self, storage_dir: Path):
+        self.storage_dir = Path(storage_dir)
+        self.log_path = self.storage_dir / EVOLUTION_LOG_FILE
+        self.snapshot_path = self.storage_dir / EVOLUTION_SNAPSHOT_FILE
+
+    def record_bundle(self, run_id: str, bundle: VersionBundle) -> None:
+        self.append(bundle_event(run_id, bundle))
+
+    def record_eval(self, run_id: str, eval_summary: Dict[str, Any]) -> None:
+        self.append(eval_event(run_id, eval_summary))
+
+    def append(self, event: Dict[str, Any]) -> None:
+        """Append one event (a single line, safe across processes)."""
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(event, ensure_ascii=False, default=str) + "\n"
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    def log_size(self) -> int:
+        try:
+            return self.log_path.stat().st_size
+        except OSError:
+            return 0
+
+    def load_groups(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Return spec groups keyed by full spec hash.
+
+        Folds events appended since the snapshot and persists the result.
+
+        Returns:
+            The groups, or None if there is no snapshot yet (rebuild needed).
+        """
+        state = self._read_snapshot()
+        if state is None:
+            return None
+
+        offset = state.get("log_offset", 0)
+        size = self.log_size()
+        if size < offset:
+            logger.warning("Evolution log shrank below snapshot offset; rebuild needed")
+            return None
+        if size > offset:
+            with open(self.log_path, "rb") as f:
+                f.seek(offset)
+                tail = f.read(size - offset)
+            # Only fold complete lines; a partial line is picked up next time.
+            complete = tail[: tail.rfind(b"\n") + 1]
+            for raw in complete.splitlines():
+                if not raw.strip():
+                    continue
+                try:
+                    apply_event(state, json.loads(raw))
+                except (json.JSONDecodeError, KeyError, TypeError) as e:
+                    logger.warning(f"Skipping invalid evolution event: {e}")
+            if complete:
+                state["log_offset"] = offset + len(complete)
+                self._write_snapshot(state)
+
+        return state["groups"]
+
+    def write_snapshot(
+        self,
+        groups: Dict[str, Dict[str, Any]],
+        log_offset: int,
+        skip_runs: Optional[List[str]] = None,
+    ) -> None:
+        """Replace the snapshot (used by rebuilds).
+
+        Args:
+            groups: Spec groups folded from the bundles.
+            log_offset: Log size before the bundles were scanned.
+            skip_runs: Scanned runs whose bundle events may follow
+                ``log_offset`` and must not be folded in again.
+        """
+        self._write_snapshot({
+            "groups": groups,
+            "pending_evals": {},
+            "skip_runs": list(skip_runs or []),
+            "log_offset": log_offset,
+        })
+
+    def _read_snapshot(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Invalid evolution snapshot {self.snapshot_path}: {e}")
+            return None
+        if state.get("schema_version") != EVOLUTION_SNAPSHOT_SCHEMA:
+            return None
+        state.setdefault("groups", {})
+        state.setdefault("pending_evals", {})
+        return state
+
+    def _write_snapshot(self, state: Dict[str, Any]) -> None:
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        state = {**state, "schema_version": EVOLUTION_SNAPSHOT_SCHEMA}
+        tmp_path = self.snapshot_path.with_name(
+            f"{self.snapshot_path.name}.{os.getpid()}.tmp"
+        )
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, default=str)
+        tmp_path.replace(self.snapshot_path)
@@ -11,10 +11,13 @@ import json
 import logging
 import os
 import shutil
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+from .artifact_codec import encode_artifact, read_json_artifact
+from .change_journal import record_change
 from .models import (
     ClaimRef,
     DocRef,
@@ -26,8 +29,13 @@ from .models import (
     SourceFileRef,
     ExtractionRef,
 )
-from .index_reader import IndexReader
+from .index_builder import update_claim_summary
+from .label_history import LabelHistory
+from .path_map import PathMap
+from .run_claims import RunClaimIndex, forget_claim_run_status
+from .index_reader import IndexReader, open_index_reader
 from .claim_run import ClaimRunStorage
+from .sqlite_registry import REGISTRY_DB_FILE, SqliteIndexReader
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +43,33 @@ logger = logging.getLogger(__name__)
 # This prevents duplicate warnings when multiple FileStorage instances are created
 _warned_registry_paths: set[str] = set()
 
+# Process-wide FileStorage per output root (see get_shared_storage)
+_SHARED_STORAGE: dict[Path, "FileStorage"] = {}
+_SHARED_STORAGE_LOCK = threading.Lock()
+
+
+def get_shared_storage(output_root: Path) -> "FileStorage":
+    """Return the process-wide FileStorage for an output root.
+
+    Its index reader keeps parsed indexes across requests and reloads an
+    index only after that file is written (by this process or another).
+    """
+    key = Path(output_root)
+    storage = _SHARED_STORAGE.get(key)
+    if storage is None:
+        with _SHARED_STORAGE_LOCK:
+            storage = _SHARED_STORAGE.get(key)
+            if storage is None:
+                storage = FileStorage(key)
+                _SHARED_STORAGE[key] = storage
+    return storage
+
+
+def clear_shared_storage() -> None:
+    """Drop all shared FileStorage instances (e.g. after a workspace switch)."""
+    with _SHARED_STORAGE_LOCK:
+        _SHARED_STORAGE.clear()
+
 
 class FileStorage:
     """Filesystem-based storage implementation with index support.
@@ -68,7 +103,16 @@ class FileStorage:
             self.runs_dir = self.output_root.parent / "runs"
             self.registry_dir = self.output_root.parent / "registry"
 
-        self._index_reader = IndexReader(self.registry_dir)
+        self._workspace_root = self.registry_dir.parent
+        self._reader = open_index_reader(self.registry_dir)
+
+    @property
+    def _index_reader(self) -> IndexReader:
+        """Index reader for the registry's current backend."""
+        use_sqlite = (self.registry_dir / REGISTRY_DB_FILE).exists()
+        if use_sqlite != isinstance(self._reader, SqliteIndexReader):
+            self._reader = open_index_reader(self.registry_dir)
+        return self._reader
 
     def _warn_no_index(self, operation: str) -> None:
         """Log warning about missing indexes (once per registry path per session)."""
@@ -298,9 +342,8 @@ class FileStorage:
             return None
 
         try:
-            with open(pages_json, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError):
+            data = read_json_artifact(pages_json)
+        except (ValueError, IOError):
             return None
 
         return DocText(
@@ -337,6 +380,17 @@ class FileStorage:
 
         return None
 
+    def get_docs_by_file_md5(self, file_md5: str) -> Optional[List[DocRef]]:
+        """Documents ingested from the file with this MD5.
+
+        Returns:
+            Matching documents from the doc index, or None if there is no
+            index (scanning every doc.json per lookup is left to callers).
+        """
+        if not self._index_reader.is_available:
+            return None
+        return self._index_reader.get_docs_by_file_md5(file_md5)
+
     def find_doc_claim(self, doc_id: str) -> Optional[str]:
         """Find which claim contains a document."""
         if self._index_reader.is_available:
@@ -468,9 +522,8 @@ class FileStorage:
             return None
 
         try:
-            with open(azure_di_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            return read_json_artifact(azure_di_path)
+        except (ValueError, IOError):
             return None
 
     # -------------------------------------------------------------------------
@@ -677,6 +730,7 @@ class FileStorage:
             if tmp_path.exists():
                 tmp_path.unlink()
             raise IOError(f"Failed to save manifest: {e}")
+        record_change(manifest_path, root=self._workspace_root)
 
     def save_run_summary(self, run_id: str, summary: dict, claim_id: Optional[str] = None) -> None:
         """Save run summary (atomic write).
@@ -706,13 +760,14 @@ class FileStorage:
         tmp_path = summary_path.with_suffix(".json.tmp")
 
         try:
-            with open(tmp_path, "w", encoding="utf-8") as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False, default=str)
+            with open(tmp_path, "wb") as f:
+                f.write(encode_artifact(summary))
             tmp_path.replace(summary_path)
         except IOError as e:
             if tmp_path.exists():
                 tmp_path.unlink()
             raise IOError(f"Failed to save summary: {e}")
+        record_change(summary_path, root=self._workspace_root)
 
     def save_extraction(self, run_id: str, doc_id: str, claim_id: str, data: dict) -> None:
         """Save extraction result for a document (atomic write).
@@ -737,13 +792,14 @@ class FileStorage:
         tmp_path = extraction_path.with_suffix(".json.tmp")
 
         try:
-            with open(tmp_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            with open(tmp_path, "wb") as f:
+                f.write(encode_artifact(data))
             tmp_path.replace(extraction_path)
         except IOError as e:
             if tmp_path.exists():
                 tmp_path.unlink()
             raise IOError(f"Failed to save extraction: {e}")
+        record_change(extraction_path, doc_id=doc_id, root=self._workspace_root)
 
     def mark_run_complete(self, run_id: str) -> None:
         """Mark a run as complete (create .complete marker).
@@ -762,6 +818,7 @@ class FileStorage:
             complete_marker.touch()
         except IOError as e:
             raise IOError(f"Failed to mark run complete: {e}")
+        record_change(complete_marker, root=self._workspace_root)
 
     def list_runs_for_doc(self, doc_id: str, claim_id: str) -> List[str]:
         """List all run IDs that have extraction for a document.
@@ -838,71 +895,70 @@ class FileStorage:
         labels_dir = self.registry_dir / "labels"
         labels_dir.mkdir(parents=True, exist_ok=True)
 
-        # Add version metadata
-        version_ts = datetime.utcnow().isoformat() + "Z"
-        versioned_data = {
-            **label_data,
-            "_version_metadata": {
-                "saved_at": version_ts,
-                "version_number": self._get_next_label_version(doc_id),
-            },
-        }
-
+        history = LabelHistory(labels_dir, doc_id)
         label_path = self._get_label_path(doc_id)
         tmp_path = label_path.with_suffix(".json.tmp")
 
-        try:
-            with open(tmp_path, "w", encoding="utf-8") as f:
-                json.dump(versioned_data, f, indent=2, ensure_ascii=False, default=str)
-            tmp_path.replace(label_path)
+        with history.lock:
+            # Version number from the history header (no history scan)
+            header = history.header()
+            version_ts = datetime.utcnow().isoformat() + "Z"
+            versioned_data = {
+                **label_data,
+                "_version_metadata": {
+                    "saved_at": version_ts,
+                    "version_number": header["latest_version"] + 1,
+                },
+            }
+
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(versioned_data, f, indent=2, ensure_ascii=False, default=str)
+                tmp_path.replace(label_path)
+            except IOError as e:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+                raise IOError(f"Failed to save label: {e}")
 
             # Append to history for compliance (append-only)
-            self._append_label_history(doc_id, versioned_data)
-        except IOError as e:
-            if tmp_path.exists():
-                tmp_path.unlink()
-            raise IOError(f"Failed to save label: {e}")
+            try:
+                history.append(versioned_data, header)
+            except IOError as e:
+                logger.warning(f"Failed to append label history: {e}")
+        record_change(
+            label_path,
+            claim_id=doc_folder.parent.parent.name,
+            doc_id=doc_id,
+            root=self._workspace_root,
+        )
 
-    def _get_next_label_version(self, doc_id: str) -> int:
-        """Get the next version number for a label."""
-        history_path = self._get_label_history_path(doc_id)
-        if not history_path.exists():
-            return 1
-        try:
-            with open(history_path, "r", encoding="utf-8") as f:
-                return sum(1 for _ in f) + 1
-        except IOError:
-            return 1
-
-    def _append_label_history(self, doc_id: str, label_data: dict) -> None:
-        """Append label version to history (append-only for compliance)."""
-        history_path = self._get_label_history_path(doc_id)
-        try:
-            with open(history_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(label_data, ensure_ascii=False, default=str) + "\n")
-        except IOError as e:
-            logger.warning(f"Failed to append label history: {e}")
+    def get_label_history(
+        self, doc_id: str, start_version: int = 1, limit: Optional[int] = None
+    ) -> List[dict]:
+        """Get historical versions of labels for a document from global registry.
 
-    def get_label_history(self, doc_id: str) -> List[dict]:
-        """Get all historical versions of labels for a document from global registry.
+        Args:
+            doc_id: Document ID.
+            start_version: First version to return (1-based).
+            limit: Maximum number of versions to return (all if None).
 
         Returns list from oldest to newest.
         """
-        history_path = self._get_label_history_path(doc_id)
-        if not history_path.exists():
+        if not self._get_label_history_path(doc_id).exists():
             return []
-
-        history = []
         try:
-            with open(history_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        history.append(json.loads(line))
-        except (json.JSONDecodeError, IOError) as e:
+            return LabelHistory(self.registry_dir / "labels", doc_id).read_versions(
+                start_version, limit
+            )
+        except IOError as e:
             logger.warning(f"Failed to load label history for {doc_id}: {e}")
+            return []
 
-        return history
+    def get_label_version_count(self, doc_id: str) -> int:
+        """Number of saved label versions for a document (from the history header)."""
+        if not self._get_label_history_path(doc_id).exists():
+            return 0
+        return LabelHistory(self.registry_dir / "labels", doc_id).latest_version()
 
     def get_label_summary(self, doc_id: str) -> Optional[LabelSummary]:
         """Get label summary for a document (from index if available)."""
@@ -1003,36 +1059,8 @@ class FileStorage:
                 if folder_path.exists():
                     return folder_path
 
-        # Direct match by folder name
-        direct_path = self.claims_dir / claim_id
-        if direct_path.exists():
-            return direct_path
-
-        # Scan for matching claim_id in doc.json files
-        for folder in self.claims_dir.iterdir():
-            if not folder.is_dir():
-                continue
-
-            docs_dir = folder / "docs"
-            if not docs_dir.exists():
-                continue
-
-            for doc_folder in docs_dir.iterdir():
-                if not doc_folder.is_dir():
-                    continue
-
-                doc_json = doc_folder / "meta" / "doc.json"
-                if doc_json.exists():
-                    try:
-                        with open(doc_json, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                            if data.get("claim_id") == claim_id:
-                                return folder
-                    except (json.JSONDecodeError, IOError):
-                        pass
-                break  # Only check first doc in each claim
-
-        return None
+        # Folder name or claim_id recorded in the path map
+        return PathMap.for_claims_dir(self.claims_dir).claim_folder(claim_id)
 
     def _find_doc_folder(self, doc_id: str) -> Optional[Path]:
         """Find document folder by doc_id."""
@@ -1045,19 +1073,9 @@ class FileStorage:
                 if doc_path.exists():
                     return doc_path
 
-        # Fallback: scan all claims
         if not self.claims_dir.exists():
             return None
-
-        for claim_folder in self.claims_dir.iterdir():
-            if not claim_folder.is_dir():
-                continue
-
-            doc_folder = claim_folder / "docs" / doc_id
-            if doc_folder.exists():
-                return doc_folder
-
-        return None
+        return PathMap.for_claims_dir(self.claims_dir).doc_folder(doc_id)
 
     # -------------------------------------------------------------------------
     # Delete Operations
@@ -1083,15 +1101,27 @@ class FileStorage:
         try:
             shutil.rmtree(claim_folder)
             logger.info(f"Deleted claim folder: {claim_folder}")
-            return True
         except Exception as e:
             logger.error(f"Failed to delete claim folder {claim_folder}: {e}")
             return False
+        record_change(claim_folder, kind="delete", root=self._workspace_root)
+
+        PathMap.for_claims_dir(self.claims_dir).forget_claim(claim_folder.name)
+        RunClaimIndex.for_claims_dir(self.claims_dir).forget_claim(claim_folder.name)
+        try:
+            update_claim_summary(claim_folder, self.registry_dir)
+        except Exception as e:
+            logger.warning(f"Failed to remove {claim_folder.name} from claims index: {e}")
+        return True
 
     def get_claims_for_run(self, run_id: str) -> List[str]:
         """Get the list of claim IDs that were processed in a run.
 
-        Reads from the run manifest to determine which claims belong to a batch.
+        Uses the run/claim index written at claim finalization.  Claims in
+        the run manifest that the index lacks are added if they have a
+        folder for the run (not finalized yet, e.g. a killed run); claims
+        the run skipped have none.  Runs that finished before the index
+        existed are read from the manifest alone.
 
         Args:
             run_id: The run ID to look up
@@ -1099,7 +1129,8 @@ class FileStorage:
         Returns:
             List of claim IDs (folder names) associated with this run
         """
-        claim_ids = []
+        indexed = RunClaimIndex.for_claims_dir(self.claims_dir).claims_for_run(run_id)
+        claim_ids = list(indexed or [])
 
         # Read from global run manifest
         global_run_dir = self.runs_dir / run_id
@@ -1111,7 +1142,9 @@ class FileStorage:
                     manifest = json.load(f)
                     for claim in manifest.get("claims", []):
                         claim_id = claim.get("claim_id")
-                        if claim_id:
+                        if not claim_id or claim_id in claim_ids:
+                            continue
+                        if indexed is None or (self.claims_dir / claim_id / "runs" / run_id).is_dir():
                             claim_ids.append(claim_id)
             except (json.JSONDecodeError, IOError) as e:
                 logger.warning(f"Failed to read manifest for {run_id}: {e}")
@@ -1128,6 +1161,10 @@ class FileStorage:
         - Per-claim run directories (output/claims/{claim_id}/runs/{run_id}/)
         - Optionally: claim folders themselves (but NOT labels)
 
+        Only the claims in the run (see get_claims_for_run) are touched,
+        except that the run folders of an unfinished run (no .complete
+        marker) are looked for in every claim.
+
         Args:
             run_id: The run ID to delete
             delete_claims: If True, also delete claim folders created by this run.
@@ -1141,9 +1178,15 @@ class FileStorage:
         claims_deleted = 0
 
         # Get claims associated with this run BEFORE deleting manifest
-        claims_to_delete = []
-        if delete_claims:
-            claims_to_delete = self.get_claims_for_run(run_id)
+        run_claims = self.get_claims_for_run(run_id)
+        claims_to_delete = run_claims if delete_claims else []
+        if not (self.runs_dir / run_id / ".complete").exists() and self.claims_dir.is_dir():
+            # Killed or in-flight: unfinished claims are in neither the
+            # index nor a manifest
+            run_claims = run_claims + [
+                f.name for f in sorted(self.claims_dir.iterdir())
+                if f.name not in run_claims and (f / "runs" / run_id).is_dir()
+            ]
 
         # Delete global run directory
         global_run_dir = self.runs_dir / run_id
@@ -1155,20 +1198,24 @@ class FileStorage:
             except Exception as e:
                 logger.error(f"Failed to delete global run directory {global_run_dir}: {e}")
                 return (False, 0, 0)
+            record_change(global_run_dir, kind="delete", root=self._workspace_root)
 
         # Delete per-claim run directories
-        if self.claims_dir.exists():
-            for claim_folder in self.claims_dir.iterdir():
-                if not claim_folder.is_dir():
+        for claim_id in run_claims:
+            claim_folder = self._find_claim_folder(claim_id)
+            if not claim_folder:
+                continue
+            claim_run_dir = claim_folder / "runs" / run_id
+            if claim_run_dir.exists():
+                try:
+                    shutil.rmtree(claim_run_dir)
+                    claims_affected += 1
+                    logger.debug(f"Deleted claim run directory: {claim_run_dir}")
+                except Exception as e:
+                    logger.warning(f"Failed to delete claim run dir {claim_run_dir}: {e}")
                     continue
-                claim_run_dir = claim_folder / "runs" / run_id
-                if claim_run_dir.exists():
-                    try:
-                        shutil.rmtree(claim_run_dir)
-                        claims_affected += 1
-                        logger.debug(f"Deleted claim run directory: {claim_run_dir}")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete claim run dir {claim_run_dir}: {e}")
+                record_change(claim_run_dir, kind="delete", root=self._workspace_root)
+                forget_claim_run_status(claim_folder, run_id)
 
         if claims_affected > 0:
             logger.info(f"Deleted {claims_affected} per-claim run directories for {run_id}")
@@ -1191,6 +1238,8 @@ class FileStorage:
             except Exception as e:
                 logger.warning(f"Failed to delete version bundle {version_bundles_dir}: {e}")
 
+        RunClaimIndex.for_claims_dir(self.claims_dir).forget_run(run_id)
+
         # Invalidate indexes so they reload on next access
         self.invalidate_indexes()
 
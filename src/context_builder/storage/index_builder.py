@@ -2,14 +2,24 @@
 
 Scans output folders and builds indexes for fast lookups.
 Supports both full rebuilds and incremental updates.
+
+When the registry uses the SQLite backend (``registry.db`` exists),
+incremental updates go to the database and the JSONL files are refreshed
+by the next full build.
+
+``apply_change_journal`` updates the indexes from the workspace change
+journal, rescanning only the claims and runs written since the last build.
 """
 
+import hashlib
 import json
 import logging
+import os
 import re
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from .index_reader import (
     DOC_INDEX_FILE,
@@ -17,12 +27,40 @@ from .index_reader import (
     RUN_INDEX_FILE,
     CLAIMS_INDEX_FILE,
     REGISTRY_META_FILE,
+    notify_registry_changed,
     write_jsonl,
     read_jsonl,
 )
+from .change_journal import ChangeJournal
+from .path_map import PathMap
+from .run_claims import RunClaimIndex
+from .sqlite_registry import SqliteIndexReader, SqliteRegistry, remove_registry_db
 
 logger = logging.getLogger(__name__)
 
+REGISTRY_BACKENDS = ("jsonl", "sqlite")
+
+# Signature of each claim folder when its claims index record was built
+CLAIMS_INDEX_STATE_FILE = "claims_index_state.json"
+CLAIMS_INDEX_STATE_SCHEMA = "claims_index_state_v1"
+
+# Serializes read-splice-write updates of the claims index
+_CLAIMS_INDEX_LOCK = threading.RLock()
+
+# Change journal consumer name of the index builder
+INDEX_JOURNAL_CONSUMER = "index_builder"
+
+
+def _sqlite_registry(registry_dir: Path) -> Optional[SqliteRegistry]:
+    """Return the SQLite registry if this registry uses that backend."""
+    registry = SqliteRegistry(registry_dir)
+    return registry if registry.exists else None
+
+
+def get_registry_backend(registry_dir: Path) -> str:
+    """Return the backend the registry directory currently uses."""
+    return "sqlite" if _sqlite_registry(registry_dir) else "jsonl"
+
 
 # -----------------------------------------------------------------------------
 # Incremental Index Update Functions
@@ -39,6 +77,13 @@ def append_doc_entry(registry_dir: Path, doc_entry: dict) -> bool:
     Returns:
         True if entry was appended successfully.
     """
+    registry = _sqlite_registry(registry_dir)
+    if registry is not None:
+        with registry:
+            registry.upsert_docs([doc_entry])
+        notify_registry_changed(registry_dir, DOC_INDEX_FILE)
+        return True
+
     doc_index_path = registry_dir / DOC_INDEX_FILE
     if not doc_index_path.exists():
         logger.debug("Doc index does not exist, skipping append")
@@ -48,6 +93,7 @@ def append_doc_entry(registry_dir: Path, doc_entry: dict) -> bool:
         with open(doc_index_path, "a", encoding="utf-8") as f:
             f.write(json.dumps(doc_entry, ensure_ascii=False, default=str) + "\n")
         logger.debug(f"Appended doc {doc_entry.get('doc_id')} to index")
+        notify_registry_changed(registry_dir, DOC_INDEX_FILE)
         return True
     except IOError as e:
         logger.warning(f"Failed to append to doc index: {e}")
@@ -64,6 +110,13 @@ def append_run_entry(registry_dir: Path, run_entry: dict) -> bool:
     Returns:
         True if entry was appended successfully.
     """
+    registry = _sqlite_registry(registry_dir)
+    if registry is not None:
+        with registry:
+            registry.upsert_runs([run_entry])
+        notify_registry_changed(registry_dir, RUN_INDEX_FILE)
+        return True
+
     run_index_path = registry_dir / RUN_INDEX_FILE
     if not run_index_path.exists():
         logger.debug("Run index does not exist, skipping append")
@@ -73,6 +126,7 @@ def append_run_entry(registry_dir: Path, run_entry: dict) -> bool:
         with open(run_index_path, "a", encoding="utf-8") as f:
             f.write(json.dumps(run_entry, ensure_ascii=False, default=str) + "\n")
         logger.debug(f"Appended run {run_entry.get('run_id')} to index")
+        notify_registry_changed(registry_dir, RUN_INDEX_FILE)
         return True
     except IOError as e:
         logger.warning(f"Failed to append to run index: {e}")
@@ -82,7 +136,8 @@ def append_run_entry(registry_dir: Path, run_entry: dict) -> bool:
 def upsert_label_entry(registry_dir: Path, label_entry: dict) -> bool:
     """Update or insert a label entry in the label index.
 
-    If doc_id exists, updates the entry. Otherwise appends.
+    The JSONL index is appended to rather than rewritten: readers keep the
+    last entry per doc_id, and full index builds write it compactly.
 
     Args:
         registry_dir: Path to registry directory.
@@ -91,39 +146,21 @@ def upsert_label_entry(registry_dir: Path, label_entry: dict) -> bool:
     Returns:
         True if entry was upserted successfully.
     """
-    label_index_path = registry_dir / LABEL_INDEX_FILE
-    if not label_index_path.exists():
-        # Create new file with single entry
-        try:
-            registry_dir.mkdir(parents=True, exist_ok=True)
-            with open(label_index_path, "w", encoding="utf-8") as f:
-                f.write(json.dumps(label_entry, ensure_ascii=False, default=str) + "\n")
-            logger.debug(f"Created label index with doc {label_entry.get('doc_id')}")
-            return True
-        except IOError as e:
-            logger.warning(f"Failed to create label index: {e}")
-            return False
+    registry = _sqlite_registry(registry_dir)
+    if registry is not None:
+        with registry:
+            registry.upsert_labels([label_entry])
+        logger.debug(f"Upserted label for doc {label_entry.get('doc_id')}")
+        notify_registry_changed(registry_dir, LABEL_INDEX_FILE)
+        return True
 
+    label_index_path = registry_dir / LABEL_INDEX_FILE
     try:
-        doc_id = label_entry.get("doc_id")
-        updated = False
-        new_records = []
-
-        # Read existing entries and update if found
-        for record in read_jsonl(label_index_path):
-            if record.get("doc_id") == doc_id:
-                new_records.append(label_entry)
-                updated = True
-            else:
-                new_records.append(record)
-
-        # If not found, append
-        if not updated:
-            new_records.append(label_entry)
-
-        # Write back
-        write_jsonl(label_index_path, new_records)
-        logger.debug(f"Upserted label for doc {doc_id}")
+        registry_dir.mkdir(parents=True, exist_ok=True)
+        with open(label_index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(label_entry, ensure_ascii=False, default=str) + "\n")
+        logger.debug(f"Upserted label for doc {label_entry.get('doc_id')}")
+        notify_registry_changed(registry_dir, LABEL_INDEX_FILE)
         return True
     except IOError as e:
         logger.warning(f"Failed to upsert label index: {e}")
@@ -144,10 +181,25 @@ def update_registry_meta(registry_dir: Path) -> bool:
     label_index_path = registry_dir / LABEL_INDEX_FILE
     run_index_path = registry_dir / RUN_INDEX_FILE
 
+    registry = _sqlite_registry(registry_dir)
+    if registry is not None:
+        with registry:
+            meta = {"built_at": datetime.now().isoformat() + "Z", **registry.counts()}
+            registry.write_meta(meta)
+        try:
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f, indent=2, ensure_ascii=False)
+        except IOError as e:
+            logger.warning(f"Failed to update registry meta: {e}")
+            return False
+        notify_registry_changed(registry_dir, REGISTRY_META_FILE)
+        return True
+
     try:
         # Count entries in each index
         doc_count = sum(1 for _ in read_jsonl(doc_index_path))
-        label_count = sum(1 for _ in read_jsonl(label_index_path))
+        # The label index may hold superseded entries for a doc_id
+        label_count = len({r.get("doc_id") for r in read_jsonl(label_index_path)})
         run_count = sum(1 for _ in read_jsonl(run_index_path))
 
         # Count unique claims from doc index
@@ -168,6 +220,7 @@ def update_registry_meta(registry_dir: Path) -> bool:
             json.dump(meta, f, indent=2, ensure_ascii=False)
 
         logger.debug(f"Updated registry meta: {doc_count} docs, {run_count} runs")
+        notify_registry_changed(registry_dir, REGISTRY_META_FILE)
         return True
     except IOError as e:
         logger.warning(f"Failed to update registry meta: {e}")
@@ -199,60 +252,69 @@ def build_doc_index(claims_dir: Path) -> list[dict]:
             continue
         if claim_folder.name.startswith("."):
             continue
+        records.extend(_doc_records_for_claim(claims_dir, claim_folder))
 
-        docs_dir = claim_folder / "docs"
-        if not docs_dir.exists():
-            continue
+    logger.info(f"Built doc index with {len(records)} documents")
+    return records
 
-        for doc_folder in sorted(docs_dir.iterdir()):
-            if not doc_folder.is_dir():
-                continue
 
-            doc_json_path = doc_folder / "meta" / "doc.json"
-            if not doc_json_path.exists():
-                logger.debug(f"No doc.json found in {doc_folder}")
-                continue
+def _doc_records_for_claim(claims_dir: Path, claim_folder: Path) -> list[dict]:
+    """Build the doc index records of one claim folder."""
+    records = []
 
-            try:
-                with open(doc_json_path, "r", encoding="utf-8") as f:
-                    doc_meta = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to read {doc_json_path}: {e}")
-                continue
+    docs_dir = claim_folder / "docs"
+    if not docs_dir.exists():
+        return records
 
-            # Extract claim_id from doc.json if present, else use folder name
-            claim_id = doc_meta.get("claim_id") or claim_folder.name
+    for doc_folder in sorted(docs_dir.iterdir()):
+        if not doc_folder.is_dir():
+            continue
 
-            # Check artifact availability
-            source_dir = doc_folder / "source"
-            has_pdf = any(source_dir.glob("*.pdf")) if source_dir.exists() else False
-            has_images = (
-                any(source_dir.glob("*.png"))
-                or any(source_dir.glob("*.jpg"))
-                or any(source_dir.glob("*.jpeg"))
-            ) if source_dir.exists() else False
+        doc_json_path = doc_folder / "meta" / "doc.json"
+        if not doc_json_path.exists():
+            logger.debug(f"No doc.json found in {doc_folder}")
+            continue
 
-            pages_json = doc_folder / "text" / "pages.json"
-            has_text = pages_json.exists()
+        try:
+            with open(doc_json_path, "r", encoding="utf-8") as f:
+                doc_meta = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to read {doc_json_path}: {e}")
+            continue
 
-            record = {
-                "doc_id": doc_meta.get("doc_id", doc_folder.name),
-                "claim_id": claim_id,
-                "claim_folder": claim_folder.name,
-                "doc_type": doc_meta.get("doc_type", "unknown"),
-                "filename": doc_meta.get("original_filename", ""),
-                "source_type": doc_meta.get("source_type", "unknown"),
-                "language": doc_meta.get("language", "unknown"),
-                "page_count": doc_meta.get("page_count", 1),
-                "has_pdf": has_pdf,
-                "has_text": has_text,
-                "has_images": has_images,
-                "doc_root": str(doc_folder.relative_to(claims_dir.parent)),
-                "created_at": doc_meta.get("created_at"),
-            }
-            records.append(record)
+        # Extract claim_id from doc.json if present, else use folder name
+        claim_id = doc_meta.get("claim_id") or claim_folder.name
+
+        # Check artifact availability
+        source_dir = doc_folder / "source"
+        has_pdf = any(source_dir.glob("*.pdf")) if source_dir.exists() else False
+        has_images = (
+            any(source_dir.glob("*.png"))
+            or any(source_dir.glob("*.jpg"))
+            or any(source_dir.glob("*.jpeg"))
+        ) if source_dir.exists() else False
+
+        pages_json = doc_folder / "text" / "pages.json"
+        has_text = pages_json.exists()
+
+        record = {
+            "doc_id": doc_meta.get("doc_id", doc_folder.name),
+            "claim_id": claim_id,
+            "claim_folder": claim_folder.name,
+            "doc_type": doc_meta.get("doc_type", "unknown"),
+            "filename": doc_meta.get("original_filename", ""),
+            "source_type": doc_meta.get("source_type", "unknown"),
+            "language": doc_meta.get("language", "unknown"),
+            "page_count": doc_meta.get("page_count", 1),
+            "has_pdf": has_pdf,
+            "has_text": has_text,
+            "has_images": has_images,
+            "doc_root": str(doc_folder.relative_to(claims_dir.parent)),
+            "created_at": doc_meta.get("created_at"),
+            "file_md5": doc_meta.get("file_md5"),
+        }
+        records.append(record)
 
-    logger.info(f"Built doc index with {len(records)} documents")
     return records
 
 
@@ -346,53 +408,59 @@ def build_run_index(output_dir: Path) -> list[dict]:
         return records
 
     for run_folder in sorted(runs_dir.iterdir()):
-        if not run_folder.is_dir():
-            continue
-        # Support both legacy run_* and new BATCH-* formats
-        if not (run_folder.name.startswith("run_") or run_folder.name.startswith("BATCH-")):
-            continue
+        record = _run_record(output_dir, run_folder)
+        if record is not None:
+            records.append(record)
 
-        # Only index complete runs
-        complete_marker = run_folder / ".complete"
-        if not complete_marker.exists():
-            logger.debug(f"Skipping incomplete run: {run_folder.name}")
-            continue
+    logger.info(f"Built run index with {len(records)} runs")
+    return records
 
-        # Read manifest for metadata
-        manifest_path = run_folder / "manifest.json"
-        summary_path = run_folder / "summary.json"
 
-        manifest = {}
-        summary = {}
+def _run_record(output_dir: Path, run_folder: Path) -> Optional[dict]:
+    """Build the run index record of a global run folder (None if not indexed)."""
+    if not run_folder.is_dir():
+        return None
+    # Support both legacy run_* and new BATCH-* formats
+    if not (run_folder.name.startswith("run_") or run_folder.name.startswith("BATCH-")):
+        return None
 
-        if manifest_path.exists():
-            try:
-                with open(manifest_path, "r", encoding="utf-8") as f:
-                    manifest = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to read {manifest_path}: {e}")
+    # Only index complete runs
+    complete_marker = run_folder / ".complete"
+    if not complete_marker.exists():
+        logger.debug(f"Skipping incomplete run: {run_folder.name}")
+        return None
 
-        if summary_path.exists():
-            try:
-                with open(summary_path, "r", encoding="utf-8") as f:
-                    summary = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to read {summary_path}: {e}")
+    # Read manifest for metadata
+    manifest_path = run_folder / "manifest.json"
+    summary_path = run_folder / "summary.json"
 
-        # Build record from available data
-        record = {
-            "run_id": run_folder.name,
-            "status": summary.get("status", "complete"),
-            "started_at": manifest.get("started_at"),
-            "ended_at": manifest.get("ended_at") or summary.get("completed_at"),
-            "claims_count": manifest.get("claims_count", summary.get("claims_processed", 0)),
-            "docs_count": summary.get("docs_total", summary.get("docs_success", 0)),
-            "run_root": str(run_folder.relative_to(output_dir.parent)),
-        }
-        records.append(record)
+    manifest = {}
+    summary = {}
 
-    logger.info(f"Built run index with {len(records)} runs")
-    return records
+    if manifest_path.exists():
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to read {manifest_path}: {e}")
+
+    if summary_path.exists():
+        try:
+            with open(summary_path, "r", encoding="utf-8") as f:
+                summary = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to read {summary_path}: {e}")
+
+    # Build record from available data
+    return {
+        "run_id": run_folder.name,
+        "status": summary.get("status", "complete"),
+        "started_at": manifest.get("started_at"),
+        "ended_at": manifest.get("ended_at") or summary.get("completed_at"),
+        "claims_count": manifest.get("claims_count", summary.get("claims_processed", 0)),
+        "docs_count": summary.get("docs_total", summary.get("docs_success", 0)),
+        "run_root": str(run_folder.relative_to(output_dir.parent)),
+    }
 
 
 def _is_run_dir(name: str) -> bool:
@@ -484,6 +552,149 @@ def _format_completed_date(timestamp: str) -> dict:
         return {"closed_date": None, "last_processed": None}
 
 
+def build_claim_summary(claim_folder: Path) -> Optional[dict]:
+    """Compute the claims index record for one claim folder.
+
+    Args:
+        claim_folder: Path to the claim folder (output/claims/<folder>/).
+
+    Returns:
+        Claim summary dict matching ClaimSummary schema, or None if the
+        folder has no documents.
+    """
+    docs_dir = claim_folder / "docs"
+    if not docs_dir.exists():
+        return None
+
+    # Collect doc info
+    doc_types = set()
+    doc_count = 0
+    for doc_dir in docs_dir.iterdir():
+        if not doc_dir.is_dir():
+            continue
+        doc_json = doc_dir / "meta" / "doc.json"
+        if not doc_json.exists():
+            continue
+        doc_count += 1
+        try:
+            with open(doc_json, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            doc_types.add(meta.get("doc_type", "unknown"))
+        except (json.JSONDecodeError, IOError):
+            doc_types.add("unknown")
+
+    if doc_count == 0:
+        return None
+
+    folder_name = claim_folder.name
+    claim_number = _extract_claim_number(folder_name)
+
+    # Find latest run
+    run_id = _get_latest_run_id(claim_folder)
+
+    extracted_count = 0
+    total_risk_score = 0
+    total_amount = 0.0
+    flags_count = 0
+    closed_date = None
+    last_processed = None
+    gate_pass_count = 0
+    gate_warn_count = 0
+    gate_fail_count = 0
+
+    if run_id:
+        run_dir = claim_folder / "runs" / run_id
+
+        # Read run summary for dates (check logs/summary.json first, then manifest.json)
+        completed_at = ""
+        summary_path = run_dir / "logs" / "summary.json"
+        if summary_path.exists():
+            try:
+                with open(summary_path, "r", encoding="utf-8") as f:
+                    summary = json.load(f)
+                completed_at = summary.get("completed_at", "")
+            except (json.JSONDecodeError, IOError):
+                pass
+        if not completed_at:
+            manifest_path = run_dir / "manifest.json"
+            if manifest_path.exists():
+                try:
+                    with open(manifest_path, "r", encoding="utf-8") as f:
+                        manifest = json.load(f)
+                    completed_at = manifest.get("ended_at", "")
+                except (json.JSONDecodeError, IOError):
+                    pass
+        if completed_at:
+            dates = _format_completed_date(completed_at)
+            closed_date = dates["closed_date"]
+            last_processed = dates["last_processed"]
+
+        # Read extractions
+        extractions_dir = run_dir / "extraction"
+        if extractions_dir.exists():
+            for ext_file in extractions_dir.iterdir():
+                if not ext_file.name.endswith(".json"):
+                    continue
+                try:
+                    with open(ext_file, "r", encoding="utf-8") as f:
+                        ext_data = json.load(f)
+                except (json.JSONDecodeError, IOError):
+                    continue
+
+                extracted_count += 1
+                total_risk_score += _calculate_risk_score(ext_data)
+
+                quality = ext_data.get("quality_gate", {})
+                status = quality.get("status", "unknown")
+                if status == "pass":
+                    gate_pass_count += 1
+                elif status == "warn":
+                    gate_warn_count += 1
+                    flags_count += 1
+                elif status == "fail":
+                    gate_fail_count += 1
+                    flags_count += 2
+                flags_count += len(quality.get("missing_required_fields", []))
+
+                amount = _extract_amount(ext_data)
+                if amount:
+                    total_amount = max(total_amount, amount)
+
+    # Count labels
+    labeled_count = 0
+    for doc_dir in docs_dir.iterdir():
+        if not doc_dir.is_dir():
+            continue
+        if (doc_dir / "labels" / "latest.json").exists():
+            labeled_count += 1
+
+    avg_risk = total_risk_score // max(extracted_count, 1)
+    status = "Reviewed" if labeled_count > 0 else "Not Reviewed"
+    in_run = run_id is not None and extracted_count > 0
+
+    return {
+        "claim_id": claim_number,
+        "folder_name": folder_name,
+        "doc_count": doc_count,
+        "doc_types": sorted(doc_types),
+        "extracted_count": extracted_count,
+        "labeled_count": labeled_count,
+        "lob": "MOTOR",
+        "risk_score": avg_risk,
+        "loss_type": _parse_loss_type(folder_name),
+        "amount": total_amount if total_amount > 0 else None,
+        "currency": "USD",
+        "flags_count": flags_count,
+        "status": status,
+        "closed_date": closed_date,
+        "gate_pass_count": gate_pass_count,
+        "gate_warn_count": gate_warn_count,
+        "gate_fail_count": gate_fail_count,
+        "last_processed": last_processed,
+        "in_run": in_run,
+    }
+
+
 def build_claims_index(claims_dir: Path, output_dir: Path) -> list[dict]:
     """Build claims index with fully-computed ClaimSummary records.
 
@@ -506,153 +717,271 @@ def build_claims_index(claims_dir: Path, output_dir: Path) -> list[dict]:
     for claim_folder in sorted(claims_dir.iterdir()):
         if not claim_folder.is_dir() or claim_folder.name.startswith("."):
             continue
+        record = build_claim_summary(claim_folder)
+        if record is not None:
+            records.append(record)
 
-        docs_dir = claim_folder / "docs"
-        if not docs_dir.exists():
-            continue
+    logger.info(f"Built claims index with {len(records)} claims")
+    return records
 
-        # Collect doc info
-        doc_types = set()
-        doc_count = 0
-        for doc_dir in docs_dir.iterdir():
-            if not doc_dir.is_dir():
-                continue
-            doc_json = doc_dir / "meta" / "doc.json"
-            if not doc_json.exists():
-                continue
-            doc_count += 1
-            try:
-                with open(doc_json, "r", encoding="utf-8") as f:
-                    meta = json.load(f)
-                doc_types.add(meta.get("doc_type", "unknown"))
-            except (json.JSONDecodeError, IOError):
-                doc_types.add("unknown")
 
-        if doc_count == 0:
-            continue
+# -----------------------------------------------------------------------------
+# Incremental Claims Index Maintenance
+# -----------------------------------------------------------------------------
 
-        folder_name = claim_folder.name
-        claim_number = _extract_claim_number(folder_name)
-
-        # Find latest run
-        run_id = _get_latest_run_id(claim_folder)
-
-        extracted_count = 0
-        total_risk_score = 0
-        total_amount = 0.0
-        flags_count = 0
-        closed_date = None
-        last_processed = None
-        gate_pass_count = 0
-        gate_warn_count = 0
-        gate_fail_count = 0
-
-        if run_id:
-            run_dir = claim_folder / "runs" / run_id
-
-            # Read run summary for dates (check logs/summary.json first, then manifest.json)
-            completed_at = ""
-            summary_path = run_dir / "logs" / "summary.json"
-            if summary_path.exists():
-                try:
-                    with open(summary_path, "r", encoding="utf-8") as f:
-                        summary = json.load(f)
-                    completed_at = summary.get("completed_at", "")
-                except (json.JSONDecodeError, IOError):
-                    pass
-            if not completed_at:
-                manifest_path = run_dir / "manifest.json"
-                if manifest_path.exists():
-                    try:
-                        with open(manifest_path, "r", encoding="utf-8") as f:
-                            manifest = json.load(f)
-                        completed_at = manifest.get("ended_at", "")
-                    except (json.JSONDecodeError, IOError):
-                        pass
-            if completed_at:
-                dates = _format_completed_date(completed_at)
-                closed_date = dates["closed_date"]
-                last_processed = dates["last_processed"]
-
-            # Read extractions
-            extractions_dir = run_dir / "extraction"
-            if extractions_dir.exists():
-                for ext_file in extractions_dir.iterdir():
-                    if not ext_file.name.endswith(".json"):
-                        continue
-                    try:
-                        with open(ext_file, "r", encoding="utf-8") as f:
-                            ext_data = json.load(f)
-                    except (json.JSONDecodeError, IOError):
-                        continue
-
-                    extracted_count += 1
-                    total_risk_score += _calculate_risk_score(ext_data)
-
-                    quality = ext_data.get("quality_gate", {})
-                    status = quality.get("status", "unknown")
-                    if status == "pass":
-                        gate_pass_count += 1
-                    elif status == "warn":
-                        gate_warn_count += 1
-                        flags_count += 1
-                    elif status == "fail":
-                        gate_fail_count += 1
-                        flags_count += 2
-                    flags_count += len(quality.get("missing_required_fields", []))
-
-                    amount = _extract_amount(ext_data)
-                    if amount:
-                        total_amount = max(total_amount, amount)
-
-        # Count labels
-        labeled_count = 0
-        for doc_dir in docs_dir.iterdir():
-            if not doc_dir.is_dir():
-                continue
-            if (doc_dir / "labels" / "latest.json").exists():
-                labeled_count += 1
 
-        avg_risk = total_risk_score // max(extracted_count, 1)
-        status = "Reviewed" if labeled_count > 0 else "Not Reviewed"
-        in_run = run_id is not None and extracted_count > 0
+def claim_folder_signature(claim_folder: Path) -> str:
+    """Fingerprint the files a claim summary is computed from.
 
-        records.append({
-            "claim_id": claim_number,
-            "folder_name": folder_name,
-            "doc_count": doc_count,
-            "doc_types": sorted(doc_types),
-            "extracted_count": extracted_count,
-            "labeled_count": labeled_count,
-            "lob": "MOTOR",
-            "risk_score": avg_risk,
-            "loss_type": _parse_loss_type(folder_name),
-            "amount": total_amount if total_amount > 0 else None,
-            "currency": "USD",
-            "flags_count": flags_count,
-            "status": status,
-            "closed_date": closed_date,
-            "gate_pass_count": gate_pass_count,
-            "gate_warn_count": gate_warn_count,
-            "gate_fail_count": gate_fail_count,
-            "last_processed": last_processed,
-            "in_run": in_run,
-        })
+    Stats (without reading) doc metadata, label files, the run list and
+    the latest run's summary and extractions. Any write that can change
+    the claim's summary changes the signature.
+    """
+    parts = []
 
-    logger.info(f"Built claims index with {len(records)} claims")
-    return records
+    def add(path: Path) -> None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return
+        parts.append(f"{path.relative_to(claim_folder)}:{stat.st_mtime_ns}:{stat.st_size}")
+
+    docs_dir = claim_folder / "docs"
+    add(docs_dir)
+    if docs_dir.is_dir():
+        for doc_dir in sorted(docs_dir.iterdir()):
+            add(doc_dir / "meta" / "doc.json")
+            add(doc_dir / "labels" / "latest.json")
+
+    add(claim_folder / "runs")
+    run_id = _get_latest_run_id(claim_folder)
+    if run_id:
+        run_dir = claim_folder / "runs" / run_id
+        add(run_dir / "logs" / "summary.json")
+        add(run_dir / "manifest.json")
+        extractions_dir = run_dir / "extraction"
+        add(extractions_dir)
+        if extractions_dir.is_dir():
+            for ext_file in sorted(extractions_dir.iterdir()):
+                add(ext_file)
+
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _claim_folders(claims_dir: Path) -> list[Path]:
+    if not claims_dir.exists():
+        return []
+    return [
+        f for f in sorted(claims_dir.iterdir())
+        if f.is_dir() and not f.name.startswith(".")
+    ]
+
+
+def _load_claims_state(registry_dir: Path) -> dict[str, str]:
+    """Return folder name -> signature recorded when each summary was built."""
+    state_path = registry_dir / CLAIMS_INDEX_STATE_FILE
+    if not state_path.exists():
+        return {}
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning(f"Invalid claims index state {state_path}: {e}")
+        return {}
+    if data.get("schema_version") != CLAIMS_INDEX_STATE_SCHEMA:
+        return {}
+    return data.get("claims", {})
+
+
+def _save_claims_state(registry_dir: Path, claims: dict[str, str]) -> None:
+    _write_atomic(
+        registry_dir / CLAIMS_INDEX_STATE_FILE,
+        json.dumps(
+            {"schema_version": CLAIMS_INDEX_STATE_SCHEMA, "claims": claims},
+            indent=2, ensure_ascii=False,
+        ),
+    )
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    tmp_path.replace(path)
+
+
+def _splice_claim_records(
+    records: list[dict], updates: dict[str, Optional[dict]]
+) -> list[dict]:
+    """Replace, insert or drop (None) records by folder name, keeping folder order."""
+    by_folder = {r.get("folder_name"): r for r in records}
+    for folder_name, record in updates.items():
+        if record is None:
+            by_folder.pop(folder_name, None)
+        else:
+            by_folder[folder_name] = record
+    return [by_folder[name] for name in sorted(by_folder, key=lambda n: n or "")]
+
+
+def _apply_claim_updates(registry_dir: Path, updates: dict[str, Optional[dict]]) -> bool:
+    """Splice updated claim records into the current claims index.
+
+    Returns False if there is no claims index to update (it is created by
+    the next full build).
+    """
+    registry = _sqlite_registry(registry_dir)
+    if registry is not None:
+        with registry:
+            return registry.splice_claim_summaries(updates)
+
+    records = _current_claim_records(registry_dir)
+    if records is None:
+        return False
+    _write_claim_records(registry_dir, _splice_claim_records(records, updates))
+    return True
+
+
+def _current_claim_records(registry_dir: Path) -> Optional[list[dict]]:
+    """Read the claims index from the active backend (None if not built)."""
+    if _sqlite_registry(registry_dir) is not None:
+        reader = SqliteIndexReader(registry_dir)
+        try:
+            return reader.get_all_claim_summaries()
+        finally:
+            reader.close()
+    claims_path = registry_dir / CLAIMS_INDEX_FILE
+    return list(read_jsonl(claims_path)) if claims_path.exists() else None
+
+
+def _write_claim_records(registry_dir: Path, records: list[dict]) -> None:
+    """Replace the whole claims index in the active backend."""
+    registry = _sqlite_registry(registry_dir)
+    if registry is not None:
+        with registry:
+            registry.replace_claim_summaries(records)
+    else:
+        _write_atomic(
+            registry_dir / CLAIMS_INDEX_FILE,
+            "".join(json.dumps(r, ensure_ascii=False, default=str) + "\n" for r in records),
+        )
+    notify_registry_changed(registry_dir, CLAIMS_INDEX_FILE)
+
+
+def update_claim_summary(claim_folder: Path, registry_dir: Path) -> Optional[dict]:
+    """Recompute one claim's summary and splice it into the claims index.
+
+    A claim folder that no longer exists (or has no documents) is removed
+    from the index.
+
+    Args:
+        claim_folder: Path to the claim folder (output/claims/<folder>/).
+        registry_dir: Path to registry directory.
+
+    Returns:
+        The new claim summary, or None if the claim was removed or there
+        is no claims index yet.
+    """
+    claim_folder = Path(claim_folder)
+    with _CLAIMS_INDEX_LOCK:
+        signature = None
+        record = None
+        if claim_folder.is_dir():
+            signature = claim_folder_signature(claim_folder)
+            record = build_claim_summary(claim_folder)
+
+        if not _apply_claim_updates(registry_dir, {claim_folder.name: record}):
+            return None
+
+        state = _load_claims_state(registry_dir)
+        if signature is None:
+            state.pop(claim_folder.name, None)
+        else:
+            state[claim_folder.name] = signature
+        _save_claims_state(registry_dir, state)
+
+    logger.debug(f"Updated claims index entry for {claim_folder.name}")
+    return record
+
+
+def reconcile_claims_index(claims_dir: Path, registry_dir: Path) -> dict:
+    """Bring the claims index up to date, revisiting only changed claims.
+
+    Claims whose folder signature matches the one recorded at their last
+    build are skipped. New and changed claims are recomputed and deleted
+    ones are dropped. Without recorded signatures (or a claims index), all
+    claims are rebuilt.
+
+    Returns:
+        Dictionary with claims_checked, claims_updated and claims_removed.
+    """
+    with _CLAIMS_INDEX_LOCK:
+        previous = _load_claims_state(registry_dir)
+        updates, state = _changed_claim_records(claims_dir, previous)
+        if not previous or not _apply_claim_updates(registry_dir, updates):
+            _write_claim_records(
+                registry_dir, [r for r in updates.values() if r is not None]
+            )
+        _save_claims_state(registry_dir, state)
+
+    removed = sum(1 for r in updates.values() if r is None)
+    stats = {
+        "claims_checked": len(state),
+        "claims_updated": len(updates) - removed,
+        "claims_removed": removed,
+    }
+    logger.info(
+        f"Reconciled claims index: {stats['claims_updated']} updated, "
+        f"{stats['claims_removed']} removed of {stats['claims_checked']}"
+    )
+    return stats
+
+
+def _changed_claim_records(
+    claims_dir: Path, previous: dict[str, str]
+) -> tuple[dict[str, Optional[dict]], dict[str, str]]:
+    """Recompute summaries for claim folders whose signature changed.
+
+    Args:
+        claims_dir: Path to claims directory.
+        previous: Signatures recorded at the last build (empty: rebuild all).
+
+    Returns:
+        (updates, state): folder name -> new record (None to remove), and
+        the signatures to record for every current folder.
+    """
+    state: dict[str, str] = {}
+    updates: dict[str, Optional[dict]] = {}
+    for claim_folder in _claim_folders(claims_dir):
+        # Signature first, so a write during the rebuild is seen next time
+        signature = claim_folder_signature(claim_folder)
+        state[claim_folder.name] = signature
+        if previous.get(claim_folder.name) != signature:
+            updates[claim_folder.name] = build_claim_summary(claim_folder)
+    for folder_name in previous.keys() - state.keys():
+        updates[folder_name] = None
+    return updates, state
 
 
 def build_all_indexes(
     output_dir: Path,
     registry_dir: Optional[Path] = None,
+    backend: Optional[str] = None,
+    incremental_claims: bool = False,
 ) -> dict:
     """Build all indexes and write to registry directory.
 
+    The JSONL files are always written.  With the SQLite backend the same
+    records also replace the contents of ``registry.db``; selecting the
+    JSONL backend removes the database.
+
     Args:
         output_dir: Path to output directory (output/).
         registry_dir: Optional custom registry directory.
             Default: output/registry/
+        backend: "jsonl" or "sqlite". Default: keep the current backend.
+        incremental_claims: Only recompute claims index records for claim
+            folders that changed since the last build.
 
     Returns:
         Dictionary with build statistics.
@@ -660,6 +989,10 @@ def build_all_indexes(
     claims_dir = output_dir / "claims"
     if registry_dir is None:
         registry_dir = output_dir / "registry"
+    if backend is None:
+        backend = get_registry_backend(registry_dir)
+    if backend not in REGISTRY_BACKENDS:
+        raise ValueError(f"Unknown registry backend: {backend}")
 
     logger.info(f"Building indexes from {output_dir}")
     logger.info(f"Registry directory: {registry_dir}")
@@ -667,11 +1000,37 @@ def build_all_indexes(
     # Create registry directory
     registry_dir.mkdir(parents=True, exist_ok=True)
 
+    with _CLAIMS_INDEX_LOCK:
+        return _build_all_indexes(
+            output_dir, claims_dir, registry_dir, backend, incremental_claims
+        )
+
+
+def _build_all_indexes(
+    output_dir: Path,
+    claims_dir: Path,
+    registry_dir: Path,
+    backend: str,
+    incremental_claims: bool,
+) -> dict:
+    # Changes journaled while the build scans are replayed by the next update
+    journal = ChangeJournal(registry_dir)
+    journal_offset = journal.ensure()
+
     # Build each index
     doc_records = build_doc_index(claims_dir)
     label_records = build_label_index(claims_dir)
     run_records = build_run_index(output_dir)
-    claims_records = build_claims_index(claims_dir, output_dir)
+
+    previous = _load_claims_state(registry_dir) if incremental_claims else {}
+    existing = _current_claim_records(registry_dir) if previous else None
+    if existing is None:
+        previous = {}
+    claims_updates, claims_state = _changed_claim_records(claims_dir, previous)
+    claims_records = _splice_claim_records(existing or [], claims_updates)
+    logger.info(
+        f"Claims index: {len(claims_updates)} of {len(claims_state)} claim folders recomputed"
+    )
 
     # Count unique claims
     claim_ids = set()
@@ -702,10 +1061,199 @@ def build_all_indexes(
     with open(meta_path, "w", encoding="utf-8") as f:
         json.dump(meta, f, indent=2, ensure_ascii=False)
 
-    logger.info(f"Index build complete:")
+    if backend == "sqlite":
+        with SqliteRegistry(registry_dir) as registry:
+            registry.replace_all(
+                doc_records, label_records, run_records, claims_records, meta
+            )
+    elif remove_registry_db(registry_dir):
+        logger.info("Removed SQLite registry (switched to JSONL backend)")
+
+    _save_claims_state(registry_dir, claims_state)
+    notify_registry_changed(registry_dir)
+    PathMap.for_claims_dir(claims_dir).rebuild(doc_records)
+    RunClaimIndex.for_claims_dir(claims_dir).rebuild()
+    # The build supersedes the journal; keep only the changes made during it
+    journal.set_checkpoint(INDEX_JOURNAL_CONSUMER, journal.rotate(journal_offset))
+
+    logger.info(f"Index build complete ({backend} backend):")
     logger.info(f"  Documents: {len(doc_records)}")
     logger.info(f"  Labels: {len(label_records)}")
     logger.info(f"  Runs: {len(run_records)}")
     logger.info(f"  Claims: {len(claim_ids)}")
 
-    return meta
+    return {**meta, "backend": backend}
+
+
+def update_claim_indexes(
+    output_dir: Path,
+    claim_folders: Iterable[str],
+    run_ids: Iterable[str] = (),
+    registry_dir: Optional[Path] = None,
+) -> dict:
+    """Re-index the given claim folders and global runs only.
+
+    Their doc and run index records are replaced and their claims index
+    summaries recomputed; the rest of the registry is left alone.  Used
+    after a pipeline run or a run deletion, which know what they touched.
+    With the SQLite backend or indexes missing, this falls back to
+    ``build_all_indexes``.
+
+    Args:
+        output_dir: Path to output directory (output/).
+        claim_folders: Claim folder names (deleted folders are removed).
+        run_ids: Global run IDs (deleted runs are removed).
+        registry_dir: Optional custom registry directory.
+            Default: output/registry/
+
+    Returns:
+        Dictionary with mode ("claims" or "full"), claims_updated and
+        runs_updated, plus the build statistics of a full build.
+    """
+    if registry_dir is None:
+        registry_dir = output_dir / "registry"
+    claim_folders = set(claim_folders)
+    run_ids = set(run_ids)
+
+    with _CLAIMS_INDEX_LOCK:
+        if not _can_splice_indexes(registry_dir):
+            logger.info("Indexes cannot be updated in place, rebuilding all indexes")
+            stats = build_all_indexes(output_dir, registry_dir, incremental_claims=True)
+            return {
+                **stats,
+                "mode": "full",
+                "claims_updated": len(claim_folders),
+                "runs_updated": len(run_ids),
+            }
+        _splice_indexes(output_dir, registry_dir, claim_folders, run_ids)
+
+    logger.info(f"Updated indexes for {len(claim_folders)} claims, {len(run_ids)} runs")
+    return {
+        "mode": "claims",
+        "claims_updated": len(claim_folders),
+        "runs_updated": len(run_ids),
+    }
+
+
+def _can_splice_indexes(registry_dir: Path) -> bool:
+    """Whether doc, run and claims index records can be replaced in place."""
+    return _sqlite_registry(registry_dir) is None and all(
+        (registry_dir / name).exists()
+        for name in (DOC_INDEX_FILE, RUN_INDEX_FILE, CLAIMS_INDEX_FILE)
+    )
+
+
+def _splice_indexes(
+    output_dir: Path,
+    registry_dir: Path,
+    claim_folders: set[str],
+    run_ids: set[str],
+) -> None:
+    """Replace the index records of some claim folders and global runs."""
+    claims_dir = output_dir / "claims"
+    doc_path = registry_dir / DOC_INDEX_FILE
+    run_path = registry_dir / RUN_INDEX_FILE
+
+    if claim_folders:
+        existing = [c for c in (claims_dir / n for n in claim_folders) if c.is_dir()]
+        claim_docs = {c.name: _doc_records_for_claim(claims_dir, c) for c in existing}
+        doc_records = [
+            r for r in read_jsonl(doc_path) if r.get("claim_folder") not in claim_folders
+        ]
+        for records in claim_docs.values():
+            doc_records.extend(records)
+        doc_records.sort(key=lambda r: r.get("doc_root") or "")
+        _write_records_atomic(doc_path, doc_records)
+
+        path_map = PathMap.for_claims_dir(claims_dir)
+        for name in sorted(claim_folders - claim_docs.keys()):
+            path_map.forget_claim(name)
+        for name, records in claim_docs.items():
+            path_map.replace_claim(name, records)
+
+        updates: dict[str, Optional[dict]] = dict.fromkeys(claim_folders)
+        state = _load_claims_state(registry_dir)
+        for name in claim_folders:
+            state.pop(name, None)
+        for claim_folder in existing:
+            state[claim_folder.name] = claim_folder_signature(claim_folder)
+            updates[claim_folder.name] = build_claim_summary(claim_folder)
+        _apply_claim_updates(registry_dir, updates)
+        _save_claims_state(registry_dir, state)
+
+    if run_ids:
+        run_records = [r for r in read_jsonl(run_path) if r.get("run_id") not in run_ids]
+        for run_id in run_ids:
+            record = _run_record(output_dir, output_dir / "runs" / run_id)
+            if record is not None:
+                run_records.append(record)
+        run_records.sort(key=lambda r: r.get("run_id") or "")
+        _write_records_atomic(run_path, run_records)
+
+    if claim_folders or run_ids:
+        update_registry_meta(registry_dir)
+        notify_registry_changed(registry_dir)
+
+
+def apply_change_journal(output_dir: Path, registry_dir: Optional[Path] = None) -> dict:
+    """Bring the indexes up to date from the change journal.
+
+    Only the claim folders and global runs named in journal entries since
+    the index builder's checkpoint are rescanned: their doc and run index
+    records are replaced and their claims index summaries recomputed.
+    The label index is left alone (label saves already upsert it).
+
+    Without a valid checkpoint (no build since the journal was created, or
+    the journal was deleted), with the SQLite backend, or with indexes
+    missing, this falls back to ``build_all_indexes``.
+
+    Args:
+        output_dir: Path to output directory (output/).
+        registry_dir: Optional custom registry directory.
+            Default: output/registry/
+
+    Returns:
+        Dictionary with mode ("journal" or "full") and changes_applied,
+        plus the build statistics of a full build or claims_updated and
+        runs_updated.
+    """
+    if registry_dir is None:
+        registry_dir = output_dir / "registry"
+    journal = ChangeJournal(registry_dir)
+
+    with _CLAIMS_INDEX_LOCK:
+        pending = journal.changes_since_checkpoint(INDEX_JOURNAL_CONSUMER)
+        if pending is None or not _can_splice_indexes(registry_dir):
+            logger.info("No usable change journal checkpoint, rebuilding all indexes")
+            stats = build_all_indexes(output_dir, registry_dir, incremental_claims=True)
+            return {**stats, "mode": "full", "changes_applied": 0}
+
+        entries, end_offset = pending
+        claim_folders = {
+            e["claim_id"] for e in entries
+            if e.get("claim_id") and not e["claim_id"].startswith(".")
+        }
+        run_ids = {
+            e["run_id"] for e in entries
+            if e.get("run_id") and str(e.get("path", "")).startswith("runs/")
+        }
+        _splice_indexes(output_dir, registry_dir, claim_folders, run_ids)
+        journal.set_checkpoint(INDEX_JOURNAL_CONSUMER, end_offset)
+
+    logger.info(
+        f"Applied {len(entries)} journaled changes: "
+        f"{len(claim_folders)} claims, {len(run_ids)} runs updated"
+    )
+    return {
+        "mode": "journal",
+        "changes_applied": len(entries),
+        "claims_updated": len(claim_folders),
+        "runs_updated": len(run_ids),
+    }
+
+
+def _write_records_atomic(path: Path, records: list[dict]) -> None:
+    _write_atomic(
+        path,
+        "".join(json.dumps(r, ensure_ascii=False, default=str) + "\n" for r in records),
+    )
@@ -6,6 +6,8 @@ lookup dictionaries for O(1) access by ID.
 
 import json
 import logging
+import os
+import threading
 from pathlib import Path
 from typing import Optional, Iterator
 
@@ -20,6 +22,38 @@ LABEL_INDEX_FILE = "label_index.jsonl"
 RUN_INDEX_FILE = "run_index.jsonl"
 CLAIMS_INDEX_FILE = "claims_index.jsonl"
 REGISTRY_META_FILE = "registry_meta.json"
+REGISTRY_FILES = (
+    DOC_INDEX_FILE,
+    LABEL_INDEX_FILE,
+    RUN_INDEX_FILE,
+    CLAIMS_INDEX_FILE,
+    REGISTRY_META_FILE,
+)
+
+# In-process registry write counters: (registry dir, file name) -> generation.
+# Writers bump them so cached readers reload even when a rewrite keeps the
+# file's mtime and size (coarse timestamps).
+_GENERATIONS: dict[tuple[str, str], int] = {}
+_GENERATIONS_LOCK = threading.Lock()
+
+
+def notify_registry_changed(registry_dir: Path, *file_names: str) -> None:
+    """Record a write to registry index files so readers reload them.
+
+    Args:
+        registry_dir: Path to registry directory.
+        file_names: Index files that changed (default: all of them).
+    """
+    key_dir = os.path.abspath(registry_dir)
+    with _GENERATIONS_LOCK:
+        for file_name in file_names or REGISTRY_FILES:
+            key = (key_dir, file_name)
+            _GENERATIONS[key] = _GENERATIONS.get(key, 0) + 1
+
+
+def registry_generation(registry_dir: Path, file_name: str) -> int:
+    """Return the in-process write generation of a registry index file."""
+    return _GENERATIONS.get((os.path.abspath(registry_dir), file_name), 0)
 
 
 def read_jsonl(file_path: Path) -> Iterator[dict]:
@@ -46,6 +80,61 @@ def read_jsonl(file_path: Path) -> Iterator[dict]:
                 continue
 
 
+def doc_ref_from_record(record: dict) -> DocRef:
+    """Build a DocRef from a doc index record."""
+    return DocRef(
+        doc_id=record.get("doc_id", ""),
+        claim_id=record.get("claim_id", ""),
+        claim_folder=record.get("claim_folder", ""),
+        doc_type=record.get("doc_type", "unknown"),
+        filename=record.get("filename", ""),
+        source_type=record.get("source_type", "text"),
+        language=record.get("language", "unknown"),
+        page_count=record.get("page_count", 1),
+        has_pdf=record.get("has_pdf", False),
+        has_text=record.get("has_text", False),
+        has_images=record.get("has_images", False),
+        doc_root=record.get("doc_root", ""),
+    )
+
+
+def label_summary_from_record(record: dict) -> LabelSummary:
+    """Build a LabelSummary from a label index record."""
+    return LabelSummary(
+        doc_id=record.get("doc_id", ""),
+        claim_id=record.get("claim_id", ""),
+        has_label=record.get("has_label", False),
+        labeled_count=record.get("labeled_count", 0),
+        unverifiable_count=record.get("unverifiable_count", 0),
+        unlabeled_count=record.get("unlabeled_count", 0),
+        updated_at=record.get("updated_at"),
+    )
+
+
+def run_ref_from_record(record: dict) -> RunRef:
+    """Build a RunRef from a run index record."""
+    return RunRef(
+        run_id=record.get("run_id", ""),
+        status=record.get("status", "unknown"),
+        started_at=record.get("started_at"),
+        ended_at=record.get("ended_at"),
+        claims_count=record.get("claims_count", 0),
+        docs_count=record.get("docs_count", 0),
+        run_root=record.get("run_root", ""),
+    )
+
+
+def meta_from_dict(data: dict) -> RegistryMeta:
+    """Build RegistryMeta from registry_meta.json content."""
+    return RegistryMeta(
+        built_at=data.get("built_at", ""),
+        doc_count=data.get("doc_count", 0),
+        label_count=data.get("label_count", 0),
+        run_count=data.get("run_count", 0),
+        claim_count=data.get("claim_count", 0),
+    )
+
+
 def write_jsonl(file_path: Path, records: list[dict]) -> int:
     """Write records to JSONL file.
 
@@ -67,6 +156,9 @@ class IndexReader:
     """Reader for the registry index files.
 
     Loads indexes lazily and builds lookup dictionaries for fast access.
+    Each loaded index remembers the version of its file (in-process write
+    generation, mtime and size) and is reloaded on access once that
+    changes, so one reader can be shared across requests and threads.
     """
 
     def __init__(self, registry_dir: Path):
@@ -79,10 +171,28 @@ class IndexReader:
         self._doc_index: Optional[dict[str, DocRef]] = None
         self._doc_by_claim: Optional[dict[str, list[DocRef]]] = None
         self._label_index: Optional[dict[str, LabelSummary]] = None
+        self._label_tail: Optional[tuple] = None  # (inode, size, last bytes) when loaded
         self._run_index: Optional[dict[str, RunRef]] = None
         self._meta: Optional[RegistryMeta] = None
         self._claim_folders: Optional[dict[str, str]] = None  # claim_id -> claim_folder
+        self._doc_by_md5: Optional[dict[str, list[DocRef]]] = None
         self._claims_index: Optional[list[dict]] = None
+        self._versions: dict[str, tuple] = {}  # file name -> version when loaded
+        self._lock = threading.RLock()
+
+    def _file_version(self, file_name: str) -> tuple:
+        generation = registry_generation(self.registry_dir, file_name)
+        try:
+            stat = (self.registry_dir / file_name).stat()
+        except OSError:
+            return (generation, None, None)
+        return (generation, stat.st_mtime_ns, stat.st_size)
+
+    def _is_current(self, file_name: str, loaded: object) -> bool:
+        """Check that an index was loaded and its file has not changed since."""
+        return loaded is not None and self._versions.get(file_name) == self._file_version(
+            file_name
+        )
 
     @property
     def is_available(self) -> bool:
@@ -93,103 +203,148 @@ class IndexReader:
 
     def get_meta(self) -> Optional[RegistryMeta]:
         """Get registry metadata."""
-        if self._meta is not None:
+        if self._is_current(REGISTRY_META_FILE, self._meta):
             return self._meta
 
-        meta_path = self.registry_dir / REGISTRY_META_FILE
-        if not meta_path.exists():
-            return None
-
-        try:
-            with open(meta_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self._meta = RegistryMeta(
-                    built_at=data.get("built_at", ""),
-                    doc_count=data.get("doc_count", 0),
-                    label_count=data.get("label_count", 0),
-                    run_count=data.get("run_count", 0),
-                    claim_count=data.get("claim_count", 0),
-                )
-                return self._meta
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Failed to read registry meta: {e}")
-            return None
+        with self._lock:
+            version = self._file_version(REGISTRY_META_FILE)
+            if version[1] is None:
+                return None
+            try:
+                with open(self.registry_dir / REGISTRY_META_FILE, "r", encoding="utf-8") as f:
+                    self._meta = meta_from_dict(json.load(f))
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning(f"Failed to read registry meta: {e}")
+                return None
+            self._versions[REGISTRY_META_FILE] = version
+            return self._meta
 
     def _load_doc_index(self) -> None:
-        """Load document index into memory."""
-        if self._doc_index is not None:
+        """Load document index into memory (or reload it if the file changed)."""
+        if self._is_current(DOC_INDEX_FILE, self._doc_index):
             return
 
-        self._doc_index = {}
-        self._doc_by_claim = {}
-        self._claim_folders = {}
-
-        doc_path = self.registry_dir / DOC_INDEX_FILE
-        for record in read_jsonl(doc_path):
-            doc_ref = DocRef(
-                doc_id=record.get("doc_id", ""),
-                claim_id=record.get("claim_id", ""),
-                claim_folder=record.get("claim_folder", ""),
-                doc_type=record.get("doc_type", "unknown"),
-                filename=record.get("filename", ""),
-                source_type=record.get("source_type", "text"),
-                language=record.get("language", "unknown"),
-                page_count=record.get("page_count", 1),
-                has_pdf=record.get("has_pdf", False),
-                has_text=record.get("has_text", False),
-                has_images=record.get("has_images", False),
-                doc_root=record.get("doc_root", ""),
-            )
-            self._doc_index[doc_ref.doc_id] = doc_ref
-
-            # Build claim -> docs mapping
-            claim_key = doc_ref.claim_id or doc_ref.claim_folder
-            if claim_key not in self._doc_by_claim:
-                self._doc_by_claim[claim_key] = []
-            self._doc_by_claim[claim_key].append(doc_ref)
-
-            # Track claim_id -> claim_folder mapping
-            if doc_ref.claim_id and doc_ref.claim_folder:
-                self._claim_folders[doc_ref.claim_id] = doc_ref.claim_folder
-                self._claim_folders[doc_ref.claim_folder] = doc_ref.claim_folder
+        with self._lock:
+            # The version is taken before reading, so a concurrent write
+            # is picked up by the next access
+            version = self._file_version(DOC_INDEX_FILE)
+            if self._doc_index is not None and self._versions.get(DOC_INDEX_FILE) == version:
+                return
+
+            doc_index: dict[str, DocRef] = {}
+            doc_by_claim: dict[str, list[DocRef]] = {}
+            claim_folders: dict[str, str] = {}
+            doc_by_md5: dict[str, list[DocRef]] = {}
+
+            doc_path = self.registry_dir / DOC_INDEX_FILE
+            for record in read_jsonl(doc_path):
+                doc_ref = doc_ref_from_record(record)
+                doc_index[doc_ref.doc_id] = doc_ref
+                if record.get("file_md5"):
+                    doc_by_md5.setdefault(record["file_md5"], []).append(doc_ref)
+
+                # Build claim -> docs mapping
+                claim_key = doc_ref.claim_id or doc_ref.claim_folder
+                if claim_key not in doc_by_claim:
+                    doc_by_claim[claim_key] = []
+                doc_by_claim[claim_key].append(doc_ref)
+
+                # Track claim_id -> claim_folder mapping
+                if doc_ref.claim_id and doc_ref.claim_folder:
+                    claim_folders[doc_ref.claim_id] = doc_ref.claim_folder
+                    claim_folders[doc_ref.claim_folder] = doc_ref.claim_folder
+
+            self._doc_by_claim = doc_by_claim
+            self._claim_folders = claim_folders
+            self._doc_by_md5 = doc_by_md5
+            self._doc_index = doc_index
+            self._versions[DOC_INDEX_FILE] = version
 
     def _load_label_index(self) -> None:
-        """Load label index into memory."""
-        if self._label_index is not None:
+        """Load label index into memory (or reload it if the file changed)."""
+        if self._is_current(LABEL_INDEX_FILE, self._label_index):
             return
 
-        self._label_index = {}
-        label_path = self.registry_dir / LABEL_INDEX_FILE
-        for record in read_jsonl(label_path):
-            summary = LabelSummary(
-                doc_id=record.get("doc_id", ""),
-                claim_id=record.get("claim_id", ""),
-                has_label=record.get("has_label", False),
-                labeled_count=record.get("labeled_count", 0),
-                unverifiable_count=record.get("unverifiable_count", 0),
-                unlabeled_count=record.get("unlabeled_count", 0),
-                updated_at=record.get("updated_at"),
-            )
-            self._label_index[summary.doc_id] = summary
+        with self._lock:
+            version = self._file_version(LABEL_INDEX_FILE)
+            if self._label_index is not None and self._versions.get(LABEL_INDEX_FILE) == version:
+                return
+
+            label_path = self.registry_dir / LABEL_INDEX_FILE
+            # Marked before reading: entries appended meanwhile are replayed
+            # again next time, which is harmless (later lines win)
+            tail = self._tail_marker(label_path)
+            appended = self._read_label_appends(label_path)
+            if appended is not None:
+                # Label saves append entries; later lines win
+                label_index = dict(self._label_index)
+                records = appended
+            else:
+                label_index = {}
+                records = read_jsonl(label_path)
+            for record in records:
+                summary = label_summary_from_record(record)
+                label_index[summary.doc_id] = summary
+            self._label_index = label_index
+            self._label_tail = tail
+            self._versions[LABEL_INDEX_FILE] = version
+
+    @staticmethod
+    def _tail_marker(path: Path) -> Optional[tuple]:
+        """Identify a file's current end: (inode, size, last bytes)."""
+        try:
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                f.seek(max(size - 64, 0))
+                return (os.fstat(f.fileno()).st_ino, size, f.read(size - max(size - 64, 0)))
+        except OSError:
+            return None
+
+    def _read_label_appends(self, label_path: Path) -> Optional[list[dict]]:
+        """Records appended to the label index since it was loaded.
+
+        Returns None when the file was replaced or rewritten (full reload).
+        """
+        if self._label_index is None or self._label_tail is None:
+            return None
+        inode, size, tail = self._label_tail
+        try:
+            with open(label_path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                if stat.st_ino != inode or stat.st_size <= size:
+                    return None
+                f.seek(size - len(tail))
+                if f.read(len(tail)) != tail:
+                    return None
+                data = f.read(stat.st_size - size)
+        except OSError:
+            return None
+        records = []
+        for line in data.splitlines():
+            if line.strip():
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Invalid JSON in {label_path}: {e}")
+        return records
 
     def _load_run_index(self) -> None:
-        """Load run index into memory."""
-        if self._run_index is not None:
+        """Load run index into memory (or reload it if the file changed)."""
+        if self._is_current(RUN_INDEX_FILE, self._run_index):
             return
 
-        self._run_index = {}
-        run_path = self.registry_dir / RUN_INDEX_FILE
-        for record in read_jsonl(run_path):
-            run_ref = RunRef(
-                run_id=record.get("run_id", ""),
-                status=record.get("status", "unknown"),
-                started_at=record.get("started_at"),
-                ended_at=record.get("ended_at"),
-                claims_count=record.get("claims_count", 0),
-                docs_count=record.get("docs_count", 0),
-                run_root=record.get("run_root", ""),
-            )
-            self._run_index[run_ref.run_id] = run_ref
+        with self._lock:
+            version = self._file_version(RUN_INDEX_FILE)
+            if self._run_index is not None and self._versions.get(RUN_INDEX_FILE) == version:
+                return
+
+            run_index: dict[str, RunRef] = {}
+            run_path = self.registry_dir / RUN_INDEX_FILE
+            for record in read_jsonl(run_path):
+                run_ref = run_ref_from_record(record)
+                run_index[run_ref.run_id] = run_ref
+            self._run_index = run_index
+            self._versions[RUN_INDEX_FILE] = version
 
     # -------------------------------------------------------------------------
     # Public Access Methods
@@ -214,6 +369,11 @@ class IndexReader:
                 docs = self._doc_by_claim.get(folder, [])
         return docs
 
+    def get_docs_by_file_md5(self, file_md5: str) -> list[DocRef]:
+        """Get all documents ingested from a file with this MD5."""
+        self._load_doc_index()
+        return list(self._doc_by_md5.get(file_md5, [])) if self._doc_by_md5 else []
+
     def get_all_docs(self) -> list[DocRef]:
         """Get all document references."""
         self._load_doc_index()
@@ -274,15 +434,17 @@ class IndexReader:
         Returns:
             List of claim summary dicts if index exists, None otherwise.
         """
-        if self._claims_index is not None:
+        if self._is_current(CLAIMS_INDEX_FILE, self._claims_index):
             return self._claims_index
 
-        claims_path = self.registry_dir / CLAIMS_INDEX_FILE
-        if not claims_path.exists():
-            return None
-
-        self._claims_index = list(read_jsonl(claims_path))
-        return self._claims_index
+        with self._lock:
+            version = self._file_version(CLAIMS_INDEX_FILE)
+            if version[1] is None:
+                self._claims_index = None
+                return None
+            self._claims_index = list(read_jsonl(self.registry_dir / CLAIMS_INDEX_FILE))
+            self._versions[CLAIMS_INDEX_FILE] = version
+            return self._claims_index
 
     def invalidate(self) -> None:
         """Clear cached indexes (force reload on next access)."""
@@ -292,4 +454,19 @@ class IndexReader:
         self._run_index = None
         self._meta = None
         self._claim_folders = None
+        self._doc_by_md5 = None
         self._claims_index = None
+        self._versions = {}
+
+
+def open_index_reader(registry_dir: Path) -> IndexReader:
+    """Open the registry with whichever backend it was built with.
+
+    Returns a ``SqliteIndexReader`` when ``registry.db`` exists in the
+    registry directory (``index --backend sqlite``), else the JSONL reader.
+    """
+    from .sqlite_registry import REGISTRY_DB_FILE, SqliteIndexReader
+
+    if (registry_dir / REGISTRY_DB_FILE).exists():
+        return SqliteIndexReader(registry_dir)
+    return IndexReader(registry_dir)
@@ -0,0 +1,156 @@
+"""Journal changes made to a workspace outside the tool.
+
+The storage layer journals its own writes (see ``change_journal``).  Files
+copied in, edited or deleted by hand are only seen by a full index build,
+unless ``JournalWatcher`` runs alongside: it watches ``claims/`` and
+``runs/`` with ``watchdog`` (inotify on Linux) and appends the changes to
+the same journal.  Writes made by the tool while the watcher runs are
+journaled twice; consumers replay changes idempotently, so that only
+costs a rescan of the same claim.
+
+``watchdog`` is optional; ``JournalWatcher.start`` raises ImportError
+without it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Dict
+
+from .change_journal import record_change
+
+logger = logging.getLogger(__name__)
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+WATCHED_DIRS = ("claims", "runs")
+# Temporary files of atomic writes; the final rename is journaled instead
+IGNORED_SUFFIXES = (".tmp",)
+
+
+class _JournalEventHandler(FileSystemEventHandler):
+    def __init__(self, watcher: "JournalWatcher"):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_created(self, event) -> None:
+        self.watcher.add(event.src_path, "write")
+
+    def on_modified(self, event) -> None:
+        # Directory mtime updates are implied by the entry events
+        if not event.is_directory:
+            self.watcher.add(event.src_path, "write")
+
+    def on_deleted(self, event) -> None:
+        self.watcher.add(event.src_path, "delete")
+
+    def on_moved(self, event) -> None:
+        self.watcher.add(event.src_path, "delete")
+        self.watcher.add(event.dest_path, "write")
+
+
+class JournalWatcher:
+    """Watch a workspace and journal filesystem changes.
+
+    Events are collected for ``debounce_seconds`` and flushed to the
+    journal once per path, so a burst of writes to one file is a single
+    entry.
+
+    Usage:
+        with JournalWatcher(workspace_root):
+            ...  # changes are journaled until the block exits
+    """
+
+    def __init__(self, output_dir: Path, debounce_seconds: float = 1.0):
+        self.output_dir = Path(output_dir)
+        self.debounce_seconds = debounce_seconds
+        self._pending: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._observer = None
+        self._flusher = None
+
+    def add(self, path: str, kind: str) -> None:
+        """Queue a change for the next flush."""
+        if isinstance(path, bytes):
+            path = path.decode()
+        if path.endswith(IGNORED_SUFFIXES):
+            return
+        with self._lock:
+            self._pending[path] = kind
+
+    def flush(self) -> int:
+        """Journal the queued changes.
+
+        Returns:
+            Number of changes journaled.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return sum(
+            1 for path, kind in pending.items()
+            if record_change(Path(path), kind=kind, root=self.output_dir)
+        )
+
+    def start(self) -> None:
+        """Start watching.
+
+        Raises:
+            ImportError: If watchdog is not installed.
+            ValueError: If the workspace has no registry to journal into.
+        """
+        if Observer is None:
+            raise ImportError(
+                "watchdog package not installed. Please install it with: pip install watchdog"
+            )
+        if not (self.output_dir / "registry").is_dir():
+            raise ValueError(
+                f"No registry in {self.output_dir}; build the indexes first"
+            )
+
+        handler = _JournalEventHandler(self)
+        self._observer = Observer()
+        for name in WATCHED_DIRS:
+            watched_dir = self.output_dir / name
+            watched_dir.mkdir(exist_ok=True)
+            self._observer.schedule(handler, str(watched_dir), recursive=True)
+        self._observer.start()
+
+        self._stop.clear()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="journal-watcher", daemon=True
+        )
+        self._flusher.start()
+        logger.info(f"Watching {self.output_dir} for changes")
+
+    def stop(self) -> None:
+        """Stop watching and journal the remaining changes."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.debounce_seconds):
+            count = self.flush()
+            if count:
+                logger.debug(f"Journaled {count} external changes")
+
+    def __enter__(self) -> "JournalWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
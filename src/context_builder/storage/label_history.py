@@ -0,0 +1,185 @@
+"""Per-document label history with a small header for O(1) versioning.
+
+Each document's label history is an append-only JSONL file
+(``registry/labels/{doc_id}_history.jsonl``, one line per version).  Next
+to it, ``{doc_id}_history.idx.json`` records:
+
+- ``latest_version``: number of the newest version
+- ``latest_summary``: label index entry for the newest version
+- ``offsets``: byte offset of each version's line (version N at index N-1)
+- ``history_size``: size of the history file the header describes
+
+Saving a label reads and rewrites only the header, and history pages are
+read by seeking to their offsets.  A header whose ``history_size`` does
+not match the history file (missing, or written by an older version) is
+rebuilt with one pass over the file.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+HEADER_SCHEMA = "label_history_header_v1"
+
+_DOC_LOCKS: Dict[Path, threading.Lock] = {}
+_DOC_LOCKS_GUARD = threading.Lock()
+
+
+def label_index_entry(label_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Label index entry (label summary) for a saved label."""
+    field_labels = label_data.get("field_labels", [])
+    return {
+        "doc_id": label_data.get("doc_id"),
+        "claim_id": label_data.get("claim_id"),
+        "has_label": True,
+        "labeled_count": sum(1 for fl in field_labels if fl.get("state") == "LABELED"),
+        "unverifiable_count": sum(
+            1 for fl in field_labels if fl.get("state") == "UNVERIFIABLE"
+        ),
+        "unlabeled_count": sum(1 for fl in field_labels if fl.get("state") == "UNLABELED"),
+        "updated_at": label_data.get("review", {}).get("reviewed_at"),
+    }
+
+
+class LabelHistory:
+    """Version history of one document's labels."""
+
+    def __init__(self, labels_dir: Path, doc_id: str):
+        self.labels_dir = Path(labels_dir)
+        self.doc_id = doc_id
+        self.history_path = self.labels_dir / f"{doc_id}_history.jsonl"
+        self.header_path = self.labels_dir / f"{doc_id}_history.idx.json"
+
+    @property
+    def lock(self) -> threading.Lock:
+        """Process-wide lock serializing saves of this document's labels."""
+        with _DOC_LOCKS_GUARD:
+            return _DOC_LOCKS.setdefault(self.history_path, threading.Lock())
+
+    # -------------------------------------------------------------------------
+    # Header
+    # -------------------------------------------------------------------------
+
+    def header(self) -> Dict[str, Any]:
+        """Return the header, rebuilding it if it does not match the history."""
+        try:
+            history_size = self.history_path.stat().st_size
+        except FileNotFoundError:
+            return self._empty_header()
+
+        try:
+            with open(self.header_path, "r", encoding="utf-8") as f:
+                header = json.load(f)
+            if header.get("history_size") == history_size:
+                return header
+        except (OSError, json.JSONDecodeError):
+            pass
+        return self.rebuild_header()
+
+    def rebuild_header(self) -> Dict[str, Any]:
+        """Recompute the header from the history file."""
+        header = self._empty_header()
+        if not self.history_path.exists():
+            return header
+
+        last_line = None
+        offset = 0
+        with open(self.history_path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    header["offsets"].append(offset)
+                    last_line = line
+                offset += len(line)
+        header["history_size"] = offset
+        header["latest_version"] = len(header["offsets"])
+        if last_line is not None:
+            try:
+                header["latest_summary"] = label_index_entry(json.loads(last_line))
+            except json.JSONDecodeError as e:
+                logger.warning(f"Invalid last entry in label history for {self.doc_id}: {e}")
+        self._write_header(header)
+        return header
+
+    def latest_version(self) -> int:
+        return self.header()["latest_version"]
+
+    def _empty_header(self) -> Dict[str, Any]:
+        return {
+            "schema_version": HEADER_SCHEMA,
+            "doc_id": self.doc_id,
+            "latest_version": 0,
+            "latest_summary": None,
+            "offsets": [],
+            "history_size": 0,
+        }
+
+    def _write_header(self, header: Dict[str, Any]) -> None:
+        tmp_path = self.header_path.with_name(f"{self.header_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(header, f, ensure_ascii=False, default=str)
+            tmp_path.replace(self.header_path)
+        except OSError as e:
+            # The header is derived data; the next read rebuilds it
+            logger.warning(f"Failed to write label history header for {self.doc_id}: {e}")
+
+    # -------------------------------------------------------------------------
+    # Append / read
+    # -------------------------------------------------------------------------
+
+    def append(self, versioned_data: Dict[str, Any], header: Dict[str, Any]) -> Dict[str, Any]:
+        """Append a version and update the header (caller holds ``lock``).
+
+        Args:
+            versioned_data: Label data including ``_version_metadata``.
+            header: Current header, as returned by ``header()``.
+
+        Returns:
+            The updated header.
+        """
+        line = (json.dumps(versioned_data, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+        with open(self.history_path, "ab") as f:
+            offset = f.tell()
+            f.write(line)
+        header = {
+            **header,
+            "latest_version": header["latest_version"] + 1,
+            "latest_summary": label_index_entry(versioned_data),
+            "offsets": header["offsets"] + [offset],
+            "history_size": offset + len(line),
+        }
+        self._write_header(header)
+        return header
+
+    def read_versions(self, start_version: int = 1, limit: Optional[int] = None) -> List[dict]:
+        """Read versions ``start_version`` .. ``start_version + limit - 1``.
+
+        Only the requested byte range of the history file is read.
+        """
+        header = self.header()
+        offsets = header["offsets"]
+        first = max(start_version, 1) - 1
+        if first >= len(offsets):
+            return []
+        last = len(offsets) if limit is None else min(first + limit, len(offsets))
+        end = offsets[last] if last < len(offsets) else header["history_size"]
+
+        with open(self.history_path, "rb") as f:
+            f.seek(offsets[first])
+            data = f.read(end - offsets[first])
+
+        versions = []
+        for line in data.splitlines():
+            if line.strip():
+                try:
+                    versions.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Failed to load label history for {self.doc_id}: {e}")
+        return versions
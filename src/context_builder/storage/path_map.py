@@ -0,0 +1,399 @@
+"""Persistent map from claim and document IDs to their folders.
+
+The path map resolves claim IDs that are not folder names, and doc IDs
+without the registry index.  It records, in ``registry/path_map.jsonl``:
+
+- claim keys (folder name, claim ID, other aliases) -> claim folder
+- doc ID -> claim folder (the doc lives in ``<folder>/docs/<doc_id>``)
+
+The file is an append-only log: ingestion appends ``doc`` entries,
+claim deletion appends a ``forget`` entry, and full index builds rewrite
+it compactly.  Each process replays only the bytes appended since its
+last read; a rewrite (new inode, or different bytes before the replayed
+offset) makes it replay the whole file.
+
+Lookups that miss are remembered (negative cache) until the map or the
+claims directory changes.  Directory scans happen only to repair the
+map: when the file is missing, for claim folders created without going
+through the hooks (detected by the claims directory's mtime), and once
+per missed lookup, in case the map lost an entry.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+PATH_MAP_FILE = "path_map.jsonl"
+PATH_MAP_SCHEMA = "path_map_v1"
+# Bytes before the replayed offset compared to detect a rewritten file
+_TAIL_BYTES = 64
+
+_PATH_MAPS: Dict[Path, "PathMap"] = {}
+_PATH_MAPS_LOCK = threading.Lock()
+
+
+def clear_path_map_cache() -> None:
+    """Drop all loaded path maps."""
+    with _PATH_MAPS_LOCK:
+        _PATH_MAPS.clear()
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_claim_id(claim_folder: Path) -> Optional[str]:
+    """Claim ID recorded in the first doc.json of a claim folder."""
+    docs_dir = claim_folder / "docs"
+    if not docs_dir.is_dir():
+        return None
+    for doc_folder in sorted(docs_dir.iterdir()):
+        doc_json = doc_folder / "meta" / "doc.json"
+        if not doc_json.exists():
+            continue
+        try:
+            with open(doc_json, "r", encoding="utf-8") as f:
+                return json.load(f).get("claim_id")
+        except (json.JSONDecodeError, IOError):
+            return None
+    return None
+
+
+def _doc_entries(docs: Iterable[dict]) -> list:
+    """Map entries for doc index records (documents and claim ID aliases)."""
+    entries = []
+    for record in docs:
+        folder_name = record.get("claim_folder")
+        if not folder_name:
+            continue
+        entries.append({"doc": record.get("doc_id"), "folder": folder_name})
+        claim_id = record.get("claim_id")
+        if claim_id and claim_id != folder_name:
+            entries.append({"claim": claim_id, "folder": folder_name})
+    return entries
+
+
+class PathMap:
+    """Claim and document folder lookups for one claims directory."""
+
+    def __init__(self, claims_dir: Path, registry_dir: Optional[Path] = None):
+        self.claims_dir = Path(claims_dir)
+        self.registry_dir = Path(registry_dir or self.claims_dir.parent / "registry")
+        self.path = self.registry_dir / PATH_MAP_FILE
+        self._claims: Dict[str, str] = {}  # claim key -> folder name
+        self._docs: Dict[str, str] = {}  # doc_id -> folder name
+        self._folders: Set[str] = set()
+        self._offset = 0  # Bytes of the log replayed so far
+        self._inode: Optional[int] = None
+        self._tail = b""  # Last bytes replayed
+        self._misses: Set[Tuple[str, str]] = set()
+        self._claims_dir_mtime: Optional[int] = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_claims_dir(cls, claims_dir: Path) -> "PathMap":
+        """Return the process-wide path map for a claims directory."""
+        key = Path(claims_dir)
+        path_map = _PATH_MAPS.get(key)
+        if path_map is None:
+            with _PATH_MAPS_LOCK:
+                path_map = _PATH_MAPS.setdefault(key, cls(key))
+        return path_map
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    def claim_folder(self, claim_id: str, partial: bool = False) -> Optional[Path]:
+        """Resolve a claim ID, folder name or alias to its claim folder.
+
+        Args:
+            claim_id: Claim ID, folder name or alias.
+            partial: Fall back to the first known folder whose name contains
+                the ID (e.g. "65258" -> "claim_65258"), matched in memory.
+        """
+        miss_key = ("partial" if partial else "claim", claim_id)
+        with self._lock:
+            self._refresh()
+            folder = self._lookup_claim(claim_id, partial, miss_key)
+            if folder is None and self._sync_new_folders():
+                folder = self._lookup_claim(claim_id, partial, miss_key)
+            if folder is None and miss_key not in self._misses:
+                folder = self._scan_for_claim(claim_id, partial)
+            if folder is None:
+                self._misses.add(miss_key)
+            return folder
+
+    def doc_folder(self, doc_id: str) -> Optional[Path]:
+        """Resolve a doc ID to its folder (``<claim>/docs/<doc_id>``)."""
+        with self._lock:
+            self._refresh()
+            folder = self._lookup_doc(doc_id)
+            if folder is None and self._sync_new_folders():
+                folder = self._lookup_doc(doc_id)
+            if folder is None and ("doc", doc_id) not in self._misses:
+                folder = self._scan_for_doc(doc_id)
+            if folder is None:
+                self._misses.add(("doc", doc_id))
+            return folder
+
+    def _lookup_claim(
+        self, claim_id: str, partial: bool, miss_key: Tuple[str, str]
+    ) -> Optional[Path]:
+        folder_name = self._claims.get(claim_id)
+        if folder_name is not None and (self.claims_dir / folder_name).is_dir():
+            return self.claims_dir / folder_name
+        if miss_key in self._misses:
+            return None
+        if (self.claims_dir / claim_id).is_dir():
+            self._apply({"claim": claim_id, "folder": claim_id})
+            return self.claims_dir / claim_id
+        if not partial:
+            return None
+        folder_name = next((f for f in sorted(self._folders) if claim_id in f), None)
+        if folder_name is not None and (self.claims_dir / folder_name).is_dir():
+            self._claims[claim_id] = folder_name
+            return self.claims_dir / folder_name
+        return None
+
+    def _lookup_doc(self, doc_id: str) -> Optional[Path]:
+        folder_name = self._docs.get(doc_id)
+        if folder_name is not None:
+            doc_path = self.claims_dir / folder_name / "docs" / doc_id
+            if doc_path.is_dir():
+                return doc_path
+        return None
+
+    def _scan_for_claim(self, claim_id: str, partial: bool) -> Optional[Path]:
+        """Find a claim folder on disk after a map miss, and record it."""
+        folders = self._list_folders()
+        for folder_name in folders:
+            if _read_claim_id(self.claims_dir / folder_name) == claim_id:
+                self.record_claim(folder_name, claim_id)
+                return self.claims_dir / folder_name
+        if partial:
+            folder_name = next((f for f in folders if claim_id in f), None)
+            if folder_name is not None:
+                return self.claims_dir / folder_name
+        return None
+
+    def _scan_for_doc(self, doc_id: str) -> Optional[Path]:
+        """Find a document folder on disk after a map miss, and record it."""
+        for folder_name in self._list_folders():
+            doc_path = self.claims_dir / folder_name / "docs" / doc_id
+            if doc_path.is_dir():
+                self._append([{"doc": doc_id, "folder": folder_name}])
+                return doc_path
+        return None
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def record_claim(self, folder_name: str, *aliases: str) -> None:
+        """Record a claim folder and the IDs it can be looked up by."""
+        entries = [{"claim": key, "folder": folder_name} for key in (folder_name, *aliases) if key]
+        self._append(entries)
+
+    def record_doc(self, folder_name: str, doc_id: str, claim_id: Optional[str] = None) -> None:
+        """Record a document ingested into a claim folder.
+
+        Re-ingesting an already mapped document appends nothing.
+        """
+        with self._lock:
+            self._refresh()
+            entries = []
+            if self._docs.get(doc_id) != folder_name:
+                entries.append({"doc": doc_id, "folder": folder_name})
+            for key in (folder_name, claim_id):
+                if key and self._claims.get(key) != folder_name:
+                    entries.append({"claim": key, "folder": folder_name})
+            self._append(entries)
+
+    def forget_claim(self, folder_name: str) -> None:
+        """Drop a deleted claim folder with its aliases and documents."""
+        self._append([{"forget": folder_name}])
+
+    def replace_claim(self, folder_name: str, docs: Iterable[dict]) -> None:
+        """Replace a claim folder's aliases and documents.
+
+        Args:
+            folder_name: Claim folder name.
+            docs: The folder's doc index records (doc_id, claim_id,
+                claim_folder).
+        """
+        entries = [{"forget": folder_name}, {"claim": folder_name, "folder": folder_name}]
+        entries.extend(_doc_entries(docs))
+        self._append(entries)
+
+    def rebuild(self, docs: Optional[Iterable[dict]] = None) -> Dict[str, int]:
+        """Rewrite the map from the claims directory (repair).
+
+        Args:
+            docs: Doc index records (doc_id, claim_id, claim_folder) when
+                the caller already scanned them; otherwise doc.json files
+                are read.
+
+        Returns:
+            Dictionary with claim_count and doc_count.
+        """
+        with self._lock:
+            claims_dir_mtime = _mtime_ns(self.claims_dir)
+            folders = self._list_folders()
+            entries: list = [{"claim": name, "folder": name} for name in folders]
+            if docs is None:
+                for name in folders:
+                    entries.extend(self._scan_folder(name))
+            else:
+                entries.extend(_doc_entries(docs))
+
+            self.registry_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"schema_version": PATH_MAP_SCHEMA}) + "\n")
+                seen = set()
+                for entry in entries:
+                    line = json.dumps(entry, ensure_ascii=False)
+                    if line not in seen:
+                        seen.add(line)
+                        f.write(line + "\n")
+            tmp_path.replace(self.path)
+
+            self._reset()
+            self._refresh()
+            self._claims_dir_mtime = claims_dir_mtime
+            return {"claim_count": len(self._folders), "doc_count": len(self._docs)}
+
+    def _scan_folder(self, folder_name: str) -> list:
+        entries = []
+        claim_folder = self.claims_dir / folder_name
+        claim_id = _read_claim_id(claim_folder)
+        if claim_id and claim_id != folder_name:
+            entries.append({"claim": claim_id, "folder": folder_name})
+        docs_dir = claim_folder / "docs"
+        if docs_dir.is_dir():
+            for doc_folder in sorted(docs_dir.iterdir()):
+                if doc_folder.is_dir():
+                    entries.append({"doc": doc_folder.name, "folder": folder_name})
+        return entries
+
+    def _list_folders(self) -> list:
+        if not self.claims_dir.is_dir():
+            return []
+        return sorted(
+            f.name for f in self.claims_dir.iterdir()
+            if f.is_dir() and not f.name.startswith(".")
+        )
+
+    def _sync_new_folders(self) -> bool:
+        """Index claim folders created without going through the hooks.
+
+        Only runs when the claims directory changed since the last sync.
+        Returns True if anything was added or removed.
+        """
+        mtime = _mtime_ns(self.claims_dir)
+        if mtime is None or mtime == self._claims_dir_mtime:
+            return False
+        self._claims_dir_mtime = mtime
+        current = set(self._list_folders())
+        entries: list = []
+        for folder_name in sorted(current - self._folders):
+            entries.append({"claim": folder_name, "folder": folder_name})
+            entries.extend(self._scan_folder(folder_name))
+        for folder_name in sorted(self._folders - current):
+            entries.append({"forget": folder_name})
+        if not entries:
+            return False
+        logger.debug(f"Path map: repaired {len(entries)} entries under {self.claims_dir}")
+        self._append(entries)
+        return True
+
+    # -------------------------------------------------------------------------
+    # Log replay
+    # -------------------------------------------------------------------------
+
+    def _reset(self) -> None:
+        self._claims = {}
+        self._docs = {}
+        self._folders = set()
+        self._offset = 0
+        self._inode = None
+        self._tail = b""
+        self._misses = set()
+
+    def _refresh(self) -> None:
+        """Replay log entries appended since the last read (caller holds the lock)."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            if self._offset == 0 and self.claims_dir.is_dir():
+                logger.info(f"Building path map for {self.claims_dir}")
+                self.rebuild()
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            # Replaced by a rebuild in another process
+            self._reset()
+        if stat.st_size == self._offset:
+            return
+
+        with open(self.path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_ino != self._inode:
+                self._reset()
+            elif self._tail:
+                f.seek(self._offset - len(self._tail))
+                if f.read(len(self._tail)) != self._tail:
+                    # Rewritten in place to at least our offset
+                    self._reset()
+            f.seek(self._offset)
+            data = f.read(max(stat.st_size - self._offset, 0))
+        # Only replay complete lines; a partial write is picked up next time
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                self._apply(json.loads(line))
+            except json.JSONDecodeError as e:
+                logger.warning(f"Invalid path map entry in {self.path}: {e}")
+        self._offset += end
+        self._inode = stat.st_ino
+        self._tail = (self._tail + data[:end])[-_TAIL_BYTES:]
+        self._misses = set()
+
+    def _apply(self, entry: dict) -> None:
+        folder_name = entry.get("folder")
+        if "claim" in entry:
+            self._claims[entry["claim"]] = folder_name
+            self._folders.add(folder_name)
+        elif "doc" in entry:
+            self._docs[entry["doc"]] = folder_name
+            self._folders.add(folder_name)
+        elif "forget" in entry:
+            forgotten = entry["forget"]
+            self._folders.discard(forgotten)
+            self._claims = {k: v for k, v in self._claims.items() if v != forgotten}
+            self._docs = {k: v for k, v in self._docs.items() if v != forgotten}
+
+    def _append(self, entries: list) -> None:
+        if not entries:
+            return
+        with self._lock:
+            self._refresh()
+            self.registry_dir.mkdir(parents=True, exist_ok=True)
+            data = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(data)
+            # Replays our entries (and any appended concurrently before them)
+            self._refresh()
@@ -390,17 +390,25 @@ class LabelStore(Protocol):
     def get_label_summary(self, doc_id: str) -> Optional[LabelSummary]:
         ...
 
-    def get_label_history(self, doc_id: str) -> list[dict]:
-        """Get all historical versions of labels for a document.
+    def get_label_history(
+        self, doc_id: str, start_version: int = 1, limit: Optional[int] = None
+    ) -> list[dict]:
+        """Get historical versions of labels for a document.
 
         Args:
             doc_id: Document identifier.
+            start_version: First version to return (1-based).
+            limit: Maximum number of versions to return (all if None).
 
         Returns:
             List of label versions, oldest to newest.
         """
         ...
 
+    def get_label_version_count(self, doc_id: str) -> int:
+        """Number of saved label versions for a document."""
+        ...
+
     def count_labels_for_claim(self, claim_id: str) -> int:
         """Count the number of labeled documents in a claim.
 
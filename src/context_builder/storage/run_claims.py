@@ -0,0 +1,330 @@
+"""Run <-> claim reverse index and per-claim run status markers.
+
+Claim finalization records:
+
+- ``registry/run_claims.jsonl``: append-only log of ``{"run", "claim",
+  "status"}`` entries (claim = claim folder name), plus ``forget_run`` /
+  ``forget_claim`` entries written by deletions.  Full index builds
+  rewrite it from the claim folders; each process replays only the bytes
+  appended since its last read, or the whole file after a rewrite (new
+  inode, or different bytes before the replayed offset).
+- ``<claim>/.run_status.json``: run ID -> status for the claim's runs,
+  with the mtime of its ``runs/`` directory.  A changed mtime means runs
+  were added or removed without going through the hooks, and the marker
+  is rebuilt from the run summaries.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+RUN_CLAIMS_FILE = "run_claims.jsonl"
+RUN_CLAIMS_SCHEMA = "run_claims_v1"
+CLAIM_STATUS_FILE = ".run_status.json"
+CLAIM_STATUS_SCHEMA = "claim_run_status_v1"
+PROCESSED_STATUSES = ("success", "partial")
+# Bytes before the replayed offset compared to detect a rewritten file
+_TAIL_BYTES = 64
+
+_INDEXES: Dict[Path, "RunClaimIndex"] = {}
+_INDEXES_LOCK = threading.Lock()
+_STATUS_LOCK = threading.Lock()
+
+
+def clear_run_claim_cache() -> None:
+    """Drop all loaded run/claim indexes."""
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _list_runs(claim_folder: Path) -> List[Path]:
+    runs_dir = claim_folder / "runs"
+    if not runs_dir.is_dir():
+        return []
+    return sorted(d for d in runs_dir.iterdir() if d.is_dir() and not d.name.startswith("."))
+
+
+def _read_run_status(run_dir: Path) -> Optional[str]:
+    """Status from a claim run's logs/summary.json (None while incomplete)."""
+    summary_file = run_dir / "logs" / "summary.json"
+    if not summary_file.exists():
+        return None
+    try:
+        with open(summary_file, encoding="utf-8") as f:
+            return json.load(f).get("status")
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning(f"Failed to read summary {summary_file}: {e}")
+        return None
+
+
+def _write_atomic(path: Path, data: dict) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    tmp_path.replace(path)
+
+
+# -----------------------------------------------------------------------------
+# Per-claim status markers
+# -----------------------------------------------------------------------------
+
+
+def get_claim_run_statuses(claim_folder: Path) -> Dict[str, Optional[str]]:
+    """Run ID -> status for a claim's runs.
+
+    Served from the claim's status marker; the marker is rebuilt from the
+    run summaries when missing or when the runs directory changed.
+    """
+    claim_folder = Path(claim_folder)
+    runs_mtime = _mtime_ns(claim_folder / "runs")
+    if runs_mtime is None:
+        return {}
+
+    marker_path = claim_folder / CLAIM_STATUS_FILE
+    try:
+        with open(marker_path, "r", encoding="utf-8") as f:
+            marker = json.load(f)
+        if marker.get("runs_mtime_ns") == runs_mtime:
+            return marker["runs"]
+    except FileNotFoundError:
+        pass
+    except (OSError, json.JSONDecodeError, KeyError) as e:
+        logger.debug(f"Rebuilding unreadable run status marker {marker_path}: {e}")
+
+    with _STATUS_LOCK:
+        runs = {run_dir.name: _read_run_status(run_dir) for run_dir in _list_runs(claim_folder)}
+        _save_claim_run_statuses(claim_folder, runs, runs_mtime)
+    return runs
+
+
+def record_claim_run_status(claim_folder: Path, run_id: str, status: Optional[str]) -> None:
+    """Record the final status of a claim run in the claim's marker."""
+    claim_folder = Path(claim_folder)
+    runs = get_claim_run_statuses(claim_folder)
+    with _STATUS_LOCK:
+        runs = {**runs, run_id: status}
+        _save_claim_run_statuses(claim_folder, runs, _mtime_ns(claim_folder / "runs"))
+
+
+def forget_claim_run_status(claim_folder: Path, run_id: str) -> None:
+    """Drop a deleted run from the claim's marker."""
+    claim_folder = Path(claim_folder)
+    marker_path = claim_folder / CLAIM_STATUS_FILE
+    if not marker_path.exists():
+        return
+    with _STATUS_LOCK:
+        try:
+            with open(marker_path, "r", encoding="utf-8") as f:
+                runs = json.load(f).get("runs", {})
+        except (OSError, json.JSONDecodeError):
+            runs = {}
+        runs.pop(run_id, None)
+        _save_claim_run_statuses(claim_folder, runs, _mtime_ns(claim_folder / "runs"))
+
+
+def _save_claim_run_statuses(
+    claim_folder: Path, runs: Dict[str, Optional[str]], runs_mtime: Optional[int]
+) -> None:
+    if not claim_folder.is_dir():
+        return
+    marker = {
+        "schema_version": CLAIM_STATUS_SCHEMA,
+        "runs_mtime_ns": runs_mtime,
+        "runs": runs,
+    }
+    try:
+        _write_atomic(claim_folder / CLAIM_STATUS_FILE, marker)
+    except OSError as e:
+        # The marker is derived data; the next read rebuilds it
+        logger.warning(f"Failed to write run status marker for {claim_folder.name}: {e}")
+
+
+# -----------------------------------------------------------------------------
+# Run <-> claim index
+# -----------------------------------------------------------------------------
+
+
+class RunClaimIndex:
+    """Which claims each run touched, for one claims directory."""
+
+    def __init__(self, claims_dir: Path, registry_dir: Optional[Path] = None):
+        self.claims_dir = Path(claims_dir)
+        self.registry_dir = Path(registry_dir or self.claims_dir.parent / "registry")
+        self.path = self.registry_dir / RUN_CLAIMS_FILE
+        self._runs: Dict[str, Dict[str, Optional[str]]] = {}  # run_id -> {claim: status}
+        self._claims: Dict[str, Set[str]] = {}  # claim -> run_ids
+        self._offset = 0  # Bytes of the log replayed so far
+        self._inode: Optional[int] = None
+        self._tail = b""  # Last bytes replayed
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_claims_dir(cls, claims_dir: Path) -> "RunClaimIndex":
+        """Return the process-wide index for a claims directory."""
+        key = Path(claims_dir)
+        index = _INDEXES.get(key)
+        if index is None:
+            with _INDEXES_LOCK:
+                index = _INDEXES.setdefault(key, cls(key))
+        return index
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    def claims_for_run(self, run_id: str) -> Optional[List[str]]:
+        """Claim folders with a run folder for ``run_id``.
+
+        Returns:
+            Sorted folder names, or None if the run is not in the index.
+        """
+        with self._lock:
+            self._refresh()
+            claims = self._runs.get(run_id)
+            return sorted(claims) if claims is not None else None
+
+    def runs_for_claim(self, claim_folder: str) -> List[str]:
+        """Run IDs recorded for a claim folder, sorted."""
+        with self._lock:
+            self._refresh()
+            return sorted(self._claims.get(claim_folder, ()))
+
+    def claim_status(self, run_id: str, claim_folder: str) -> Optional[str]:
+        """Final status of a claim in a run, if recorded."""
+        with self._lock:
+            self._refresh()
+            return self._runs.get(run_id, {}).get(claim_folder)
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def record(self, run_id: str, claim_folder: str, status: Optional[str]) -> None:
+        """Record that a run finished processing a claim."""
+        self._append([{"run": run_id, "claim": claim_folder, "status": status}])
+
+    def forget_run(self, run_id: str) -> None:
+        """Drop a deleted run."""
+        self._append([{"forget_run": run_id}])
+
+    def forget_claim(self, claim_folder: str) -> None:
+        """Drop a deleted claim folder from every run."""
+        self._append([{"forget_claim": claim_folder}])
+
+    def rebuild(self) -> Dict[str, int]:
+        """Rewrite the index from the claim folders' run directories (repair).
+
+        Returns:
+            Dictionary with run_count and entry_count.
+        """
+        with self._lock:
+            entries = []
+            if self.claims_dir.is_dir():
+                for claim_folder in sorted(self.claims_dir.iterdir()):
+                    if not claim_folder.is_dir() or claim_folder.name.startswith("."):
+                        continue
+                    statuses = get_claim_run_statuses(claim_folder)
+                    for run_id in sorted(statuses):
+                        entries.append(
+                            {"run": run_id, "claim": claim_folder.name, "status": statuses[run_id]}
+                        )
+
+            self.registry_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"schema_version": RUN_CLAIMS_SCHEMA}) + "\n")
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            tmp_path.replace(self.path)
+
+            self._reset()
+            self._refresh()
+            return {"run_count": len(self._runs), "entry_count": len(entries)}
+
+    # -------------------------------------------------------------------------
+    # Log replay
+    # -------------------------------------------------------------------------
+
+    def _reset(self) -> None:
+        self._runs = {}
+        self._claims = {}
+        self._offset = 0
+        self._inode = None
+        self._tail = b""
+
+    def _refresh(self) -> None:
+        """Replay log entries appended since the last read (caller holds the lock)."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            if self._offset == 0 and self.claims_dir.is_dir():
+                logger.info(f"Building run/claim index for {self.claims_dir}")
+                self.rebuild()
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            # Replaced by a rebuild in another process
+            self._reset()
+        if stat.st_size == self._offset:
+            return
+
+        with open(self.path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_ino != self._inode:
+                self._reset()
+            elif self._tail:
+                f.seek(self._offset - len(self._tail))
+                if f.read(len(self._tail)) != self._tail:
+                    # Rewritten in place to at least our offset
+                    self._reset()
+            f.seek(self._offset)
+            data = f.read(max(stat.st_size - self._offset, 0))
+        # Only replay complete lines; a partial write is picked up next time
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                self._apply(json.loads(line))
+            except json.JSONDecodeError as e:
+                logger.warning(f"Invalid run/claim index entry in {self.path}: {e}")
+        self._offset += end
+        self._inode = stat.st_ino
+        self._tail = (self._tail + data[:end])[-_TAIL_BYTES:]
+
+    def _apply(self, entry: dict) -> None:
+        if "run" in entry:
+            run_id, claim = entry["run"], entry.get("claim")
+            self._runs.setdefault(run_id, {})[claim] = entry.get("status")
+            self._claims.setdefault(claim, set()).add(run_id)
+        elif "forget_run" in entry:
+            run_id = entry["forget_run"]
+            for claim in self._runs.pop(run_id, {}):
+                self._claims.get(claim, set()).discard(run_id)
+        elif "forget_claim" in entry:
+            claim = entry["forget_claim"]
+            for run_id in self._claims.pop(claim, set()):
+                self._runs.get(run_id, {}).pop(claim, None)
+
+    def _append(self, entries: list) -> None:
+        with self._lock:
+            self._refresh()
+            self.registry_dir.mkdir(parents=True, exist_ok=True)
+            data = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(data)
+            self._refresh()
@@ -0,0 +1,448 @@
+"""SQLite backend for the registry indexes.
+
+The JSONL registry is loaded into dicts in full by every ``IndexReader``,
+and incremental writers pay for that too: saving a label rewrites the
+whole label index and updating the metadata re-reads every index file.
+
+``registry.db`` holds the same records in an embedded SQLite database
+(stdlib ``sqlite3``, WAL mode) with indexed lookups by doc_id, claim_id,
+claim folder, run_id and file_md5.  Upserts are single transactions and
+readers never load more than a query returns.
+
+The backend is opt-in: ``index --backend sqlite`` (or ``--migrate`` to
+convert the existing JSONL files) creates the database, after which
+``open_index_reader`` returns a ``SqliteIndexReader`` and the incremental
+writers in ``index_builder`` write to the database.  Full builds keep
+writing the JSONL files as well, so ``index --backend jsonl`` switches
+back at any time.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from .index_reader import (
+    CLAIMS_INDEX_FILE,
+    DOC_INDEX_FILE,
+    LABEL_INDEX_FILE,
+    REGISTRY_META_FILE,
+    RUN_INDEX_FILE,
+    IndexReader,
+    doc_ref_from_record,
+    label_summary_from_record,
+    meta_from_dict,
+    read_jsonl,
+    run_ref_from_record,
+)
+from .models import DocRef, LabelSummary, RegistryMeta, RunRef
+
+logger = logging.getLogger(__name__)
+
+
+REGISTRY_DB_FILE = "registry.db"
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    doc_id TEXT PRIMARY KEY,
+    claim_id TEXT NOT NULL,
+    claim_folder TEXT NOT NULL,
+    claim_key TEXT NOT NULL,
+    file_md5 TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_docs_claim_key ON docs(claim_key);
+CREATE INDEX IF NOT EXISTS idx_docs_claim_id ON docs(claim_id);
+CREATE INDEX IF NOT EXISTS idx_docs_claim_folder ON docs(claim_folder);
+CREATE INDEX IF NOT EXISTS idx_docs_file_md5 ON docs(file_md5);
+
+CREATE TABLE IF NOT EXISTS labels (
+    doc_id TEXT PRIMARY KEY,
+    claim_id TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_labels_claim_id ON labels(claim_id);
+
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    record TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS claims (
+    seq INTEGER PRIMARY KEY,
+    claim_id TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_claims_claim_id ON claims(claim_id);
+CREATE INDEX IF NOT EXISTS idx_claims_folder_name
+    ON claims(json_extract(record, '$.folder_name'));
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _dumps(record: dict) -> str:
+    return json.dumps(record, ensure_ascii=False, default=str)
+
+
+def _doc_row(record: dict) -> tuple:
+    claim_id = record.get("claim_id") or ""
+    claim_folder = record.get("claim_folder") or ""
+    return (
+        record.get("doc_id", ""),
+        claim_id,
+        claim_folder,
+        claim_id or claim_folder,
+        record.get("file_md5"),
+        _dumps(record),
+    )
+
+
+def _label_row(record: dict) -> tuple:
+    return (record.get("doc_id", ""), record.get("claim_id") or "", _dumps(record))
+
+
+def _run_row(record: dict) -> tuple:
+    return (record.get("run_id", ""), _dumps(record))
+
+
+class SqliteRegistry:
+    """Connection to ``registry.db`` with the registry read/write operations.
+
+    One connection is shared by all threads using the instance; statements
+    are serialized with a lock.  Reads against a database that does not
+    exist return nothing rather than creating it.
+    """
+
+    def __init__(self, registry_dir: Path):
+        self.registry_dir = Path(registry_dir)
+        self.path = self.registry_dir / REGISTRY_DB_FILE
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def __enter__(self) -> "SqliteRegistry":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (and if needed create) the database (caller holds the lock)."""
+        if self._conn is None:
+            self.registry_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            self._conn = conn
+        return self._conn
+
+    def query(self, sql: str, params: Iterable[Any] = ()) -> list[tuple]:
+        """Run a read query and return all rows."""
+        with self._lock:
+            if self._conn is None and not self.exists:
+                return []
+            return self._connect().execute(sql, tuple(params)).fetchall()
+
+    def _transaction(self, statements: Iterable[tuple[str, Any]]) -> None:
+        """Run ``(sql, rows)`` pairs with executemany in one transaction."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                for sql, rows in statements:
+                    conn.executemany(sql, rows)
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    _UPSERT_DOC = (
+        "INSERT INTO docs (doc_id, claim_id, claim_folder, claim_key, file_md5, record) "
+        "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(doc_id) DO UPDATE SET "
+        "claim_id=excluded.claim_id, claim_folder=excluded.claim_folder, "
+        "claim_key=excluded.claim_key, file_md5=excluded.file_md5, record=excluded.record"
+    )
+    _UPSERT_LABEL = (
+        "INSERT INTO labels (doc_id, claim_id, record) VALUES (?, ?, ?) "
+        "ON CONFLICT(doc_id) DO UPDATE SET "
+        "claim_id=excluded.claim_id, record=excluded.record"
+    )
+    _UPSERT_RUN = (
+        "INSERT INTO runs (run_id, record) VALUES (?, ?) "
+        "ON CONFLICT(run_id) DO UPDATE SET record=excluded.record"
+    )
+    _SET_META = (
+        "INSERT INTO meta (key, value) VALUES (?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET value=excluded.value"
+    )
+
+    def upsert_docs(self, records: list[dict]) -> int:
+        self._transaction([(self._UPSERT_DOC, [_doc_row(r) for r in records])])
+        return len(records)
+
+    def upsert_labels(self, records: list[dict]) -> int:
+        self._transaction([(self._UPSERT_LABEL, [_label_row(r) for r in records])])
+        return len(records)
+
+    def upsert_runs(self, records: list[dict]) -> int:
+        self._transaction([(self._UPSERT_RUN, [_run_row(r) for r in records])])
+        return len(records)
+
+    def write_meta(self, meta: dict) -> None:
+        self._transaction([(self._SET_META, [("registry_meta", _dumps(meta))])])
+
+    def replace_all(
+        self,
+        doc_records: list[dict],
+        label_records: list[dict],
+        run_records: list[dict],
+        claims_records: Optional[list[dict]],
+        meta: dict,
+    ) -> None:
+        """Replace every table in a single transaction.
+
+        ``claims_records`` of None means there is no claims index (as when
+        ``claims_index.jsonl`` is missing), which readers report as None.
+        """
+        statements: list[tuple[str, Any]] = [
+            ("DELETE FROM docs", [()]),
+            ("DELETE FROM labels", [()]),
+            ("DELETE FROM runs", [()]),
+            ("DELETE FROM claims", [()]),
+            ("DELETE FROM meta", [()]),
+            (self._UPSERT_DOC, [_doc_row(r) for r in doc_records]),
+            (self._UPSERT_LABEL, [_label_row(r) for r in label_records]),
+            (self._UPSERT_RUN, [_run_row(r) for r in run_records]),
+            (self._SET_META, [("registry_meta", _dumps(meta))]),
+        ]
+        if claims_records is not None:
+            statements.append((
+                "INSERT INTO claims (claim_id, record) VALUES (?, ?)",
+                [(r.get("claim_id"), _dumps(r)) for r in claims_records],
+            ))
+            statements.append((self._SET_META, [("claims_index", "1")]))
+        self._transaction(statements)
+
+    def has_claim_summaries(self) -> bool:
+        return bool(self.query("SELECT 1 FROM meta WHERE key = 'claims_index'"))
+
+    def replace_claim_summaries(self, records: list[dict]) -> None:
+        """Replace the claims index in one transaction."""
+        self._transaction([
+            ("DELETE FROM claims", [()]),
+            (
+                "INSERT INTO claims (claim_id, record) VALUES (?, ?)",
+                [(r.get("claim_id"), _dumps(r)) for r in records],
+            ),
+            (self._SET_META, [("claims_index", "1")]),
+        ])
+
+    def splice_claim_summaries(self, updates: dict[str, Optional[dict]]) -> bool:
+        """Replace, insert or delete (None) claim summaries by folder name.
+
+        Returns False without writing if no claims index has been built.
+        """
+        if not self.has_claim_summaries():
+            return False
+        delete = "DELETE FROM claims WHERE json_extract(record, '$.folder_name') = ?"
+        self._transaction([
+            (delete, [(folder_name,) for folder_name in updates]),
+            (
+                "INSERT INTO claims (claim_id, record) VALUES (?, ?)",
+                [
+                    (record.get("claim_id"), _dumps(record))
+                    for record in updates.values() if record is not None
+                ],
+            ),
+        ])
+        return True
+
+    def counts(self) -> dict:
+        """Current counts in the shape of registry_meta.json."""
+        [(doc_count, claim_count)] = self.query(
+            "SELECT COUNT(*), COUNT(DISTINCT claim_key) FROM docs"
+        ) or [(0, 0)]
+        [(label_count,)] = self.query("SELECT COUNT(*) FROM labels") or [(0,)]
+        [(run_count,)] = self.query("SELECT COUNT(*) FROM runs") or [(0,)]
+        return {
+            "doc_count": doc_count,
+            "label_count": label_count,
+            "run_count": run_count,
+            "claim_count": claim_count,
+        }
+
+    def import_jsonl(self) -> dict:
+        """Migrate the JSONL indexes in the registry directory into the database.
+
+        Returns:
+            The registry metadata stored with the imported records.
+        """
+        claims_path = self.registry_dir / CLAIMS_INDEX_FILE
+        claims_records = list(read_jsonl(claims_path)) if claims_path.exists() else None
+
+        meta: dict = {}
+        meta_path = self.registry_dir / REGISTRY_META_FILE
+        if meta_path.exists():
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning(f"Failed to read registry meta: {e}")
+
+        self.replace_all(
+            list(read_jsonl(self.registry_dir / DOC_INDEX_FILE)),
+            list(read_jsonl(self.registry_dir / LABEL_INDEX_FILE)),
+            list(read_jsonl(self.registry_dir / RUN_INDEX_FILE)),
+            claims_records,
+            meta,
+        )
+        meta = {**meta, **self.counts()}
+        self.write_meta(meta)
+        logger.info(
+            f"Migrated JSONL registry to {self.path}: "
+            f"{meta['doc_count']} docs, {meta['run_count']} runs"
+        )
+        return meta
+
+
+def remove_registry_db(registry_dir: Path) -> bool:
+    """Delete ``registry.db`` and its WAL files. Returns True if it existed."""
+    db_path = Path(registry_dir) / REGISTRY_DB_FILE
+    existed = db_path.exists()
+    for suffix in ("", "-wal", "-shm"):
+        db_path.with_name(db_path.name + suffix).unlink(missing_ok=True)
+    return existed
+
+
+class SqliteIndexReader(IndexReader):
+    """IndexReader backed by ``registry.db``.
+
+    Every lookup is a query, so there is nothing to load up front and
+    readers see committed writes without ``invalidate()``.
+    """
+
+    def __init__(self, registry_dir: Path):
+        super().__init__(registry_dir)
+        self._db = SqliteRegistry(registry_dir)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _meta_value(self, key: str) -> Optional[str]:
+        rows = self._db.query("SELECT value FROM meta WHERE key = ?", (key,))
+        return rows[0][0] if rows else None
+
+    @property
+    def is_available(self) -> bool:
+        """Check that the database exists and has been built."""
+        return self._db.exists and self._meta_value("registry_meta") is not None
+
+    def get_meta(self) -> Optional[RegistryMeta]:
+        """Get registry metadata."""
+        value = self._meta_value("registry_meta")
+        return meta_from_dict(json.loads(value)) if value is not None else None
+
+    def _docs(self, where: str, params: Iterable[Any] = ()) -> list[DocRef]:
+        rows = self._db.query(f"SELECT record FROM docs {where} ORDER BY rowid", params)
+        return [doc_ref_from_record(json.loads(record)) for (record,) in rows]
+
+    def get_doc(self, doc_id: str) -> Optional[DocRef]:
+        """Get document reference by doc_id."""
+        docs = self._docs("WHERE doc_id = ?", (doc_id,))
+        return docs[0] if docs else None
+
+    def get_docs_by_claim(self, claim_id: str) -> list[DocRef]:
+        """Get all documents for a claim."""
+        docs = self._docs("WHERE claim_key = ?", (claim_id,))
+        if not docs:
+            folder = self.get_claim_folder(claim_id)
+            if folder:
+                docs = self._docs("WHERE claim_key = ?", (folder,))
+        return docs
+
+    def get_docs_by_file_md5(self, file_md5: str) -> list[DocRef]:
+        """Get all documents ingested from a file with this MD5."""
+        return self._docs("WHERE file_md5 = ?", (file_md5,))
+
+    def get_all_docs(self) -> list[DocRef]:
+        """Get all document references."""
+        return self._docs("")
+
+    def get_all_claims(self) -> list[tuple[str, str, int]]:
+        """Get all claims as (claim_id, claim_folder, doc_count) tuples."""
+        rows = self._db.query(
+            "SELECT d.claim_id, d.claim_folder, g.doc_count FROM "
+            "(SELECT MIN(rowid) AS first_rowid, COUNT(*) AS doc_count "
+            " FROM docs GROUP BY claim_key) AS g "
+            "JOIN docs AS d ON d.rowid = g.first_rowid ORDER BY g.first_rowid"
+        )
+        claims = []
+        seen_folders = set()
+        for claim_id, claim_folder, doc_count in rows:
+            if claim_folder in seen_folders:
+                continue
+            seen_folders.add(claim_folder)
+            claims.append((claim_id or claim_folder, claim_folder, doc_count))
+        return claims
+
+    def get_label_summary(self, doc_id: str) -> Optional[LabelSummary]:
+        """Get label summary for a document."""
+        rows = self._db.query("SELECT record FROM labels WHERE doc_id = ?", (doc_id,))
+        return label_summary_from_record(json.loads(rows[0][0])) if rows else None
+
+    def get_all_label_summaries(self) -> list[LabelSummary]:
+        """Get all label summaries."""
+        rows = self._db.query("SELECT record FROM labels ORDER BY rowid")
+        return [label_summary_from_record(json.loads(record)) for (record,) in rows]
+
+    def get_run(self, run_id: str) -> Optional[RunRef]:
+        """Get run reference by run_id."""
+        rows = self._db.query("SELECT record FROM runs WHERE run_id = ?", (run_id,))
+        return run_ref_from_record(json.loads(rows[0][0])) if rows else None
+
+    def get_all_runs(self) -> list[RunRef]:
+        """Get all run references."""
+        rows = self._db.query("SELECT record FROM runs ORDER BY rowid")
+        return [run_ref_from_record(json.loads(record)) for (record,) in rows]
+
+    def get_claim_folder(self, claim_id: str) -> Optional[str]:
+        """Get claim folder name for a claim_id."""
+        rows = self._db.query(
+            "SELECT claim_folder FROM docs "
+            "WHERE (claim_id = ? OR claim_folder = ?) "
+            "AND claim_id != '' AND claim_folder != '' "
+            "ORDER BY rowid DESC LIMIT 1",
+            (claim_id, claim_id),
+        )
+        return rows[0][0] if rows else None
+
+    def get_all_claim_summaries(self) -> Optional[list[dict]]:
+        """Get pre-computed claim summaries, or None if none were indexed."""
+        if self._meta_value("claims_index") is None:
+            return None
+        rows = self._db.query(
+            "SELECT record FROM claims ORDER BY json_extract(record, '$.folder_name'), seq"
+        )
+        return [json.loads(record) for (record,) in rows]
+
+    def invalidate(self) -> None:
+        """Nothing is cached; kept for interface compatibility."""
+        super().invalidate()
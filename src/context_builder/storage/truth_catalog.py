@@ -0,0 +1,307 @@
+"""Persistent catalog of canonical truth entries.
+
+The catalog keeps the filterable attributes of each truth entry, keyed by
+file MD5, in a single JSONL file next to the other registry indexes, so
+truth can be listed and filtered without opening the truth files:
+
+- reviewer and reviewed_at
+- per-field label state
+- the document instances (doc_id, claim_id, doc_type, filename) for the file
+
+``GroundTruthStore.save_truth_by_file_md5`` appends one line per save.  The
+catalog is append-only, and the last line for a file MD5 wins.  When stale
+lines outnumber live entries, the file is compacted on load.  Parsed
+catalogs are cached per process and keyed on the file's mtime and size.
+Saves from this process update the cache in place.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TRUTH_CATALOG_FILE = "truth_catalog.jsonl"
+
+# Compact when the file holds this many more lines than live entries.
+_COMPACT_MIN_STALE = 1000
+
+
+@dataclass
+class TruthDocInstance:
+    """A document in some claim whose source file has a truth entry."""
+
+    doc_id: str
+    claim_id: str
+    doc_type: str = "unknown"
+    original_filename: str = ""
+
+
+@dataclass
+class TruthCatalogEntry:
+    """Filterable attributes of one truth entry (keyed by file MD5)."""
+
+    file_md5: str
+    content_md5: str = ""
+    reviewer: str = ""
+    reviewed_at: Optional[str] = None
+    field_states: Dict[str, Optional[str]] = field(default_factory=dict)
+    doc_instances: List[TruthDocInstance] = field(default_factory=list)
+
+    @classmethod
+    def from_truth(
+        cls,
+        file_md5: str,
+        truth: Dict[str, Any],
+        doc_instances: Iterable[TruthDocInstance] = (),
+    ) -> "TruthCatalogEntry":
+        """Build an entry from a truth payload."""
+        review = truth.get("review") or {}
+        return cls(
+            file_md5=file_md5,
+            content_md5=(truth.get("input_hashes") or {}).get("content_md5", ""),
+            reviewer=review.get("reviewer", "") or "",
+            reviewed_at=review.get("reviewed_at"),
+            field_states={
+                label["field_name"]: label.get("state")
+                for label in truth.get("field_labels", []) or []
+                if label.get("field_name")
+            },
+            doc_instances=list(doc_instances),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TruthCatalogEntry":
+        return cls(
+            file_md5=data["file_md5"],
+            content_md5=data.get("content_md5", ""),
+            reviewer=data.get("reviewer", ""),
+            reviewed_at=data.get("reviewed_at"),
+            field_states=data.get("field_states") or {},
+            doc_instances=[
+                TruthDocInstance(**d) for d in data.get("doc_instances") or []
+            ],
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def read_doc_instance(meta_path: Path) -> Optional[Tuple[str, TruthDocInstance]]:
+    """Read ``(file_md5, instance)`` from a ``docs/<doc_id>/meta/doc.json``."""
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return None
+
+    file_md5 = meta.get("file_md5")
+    if not file_md5:
+        return None
+
+    doc_dir = meta_path.parent.parent
+    return file_md5, TruthDocInstance(
+        doc_id=meta.get("doc_id", doc_dir.name),
+        claim_id=meta.get("claim_id", doc_dir.parent.parent.name),
+        doc_type=meta.get("doc_type", "unknown"),
+        original_filename=meta.get("original_filename", ""),
+    )
+
+
+# Process-wide parsed catalogs: path -> ((mtime_ns, size), entries, line_count)
+_CATALOG_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, TruthCatalogEntry], int]] = {}
+_CATALOG_LOCK = threading.Lock()
+
+
+def clear_truth_catalog_cache() -> None:
+    """Drop all parsed truth catalogs (e.g. after editing files by hand)."""
+    with _CATALOG_LOCK:
+        _CATALOG_CACHE.clear()
+
+
+def _signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class TruthCatalog:
+    """Append-only JSONL catalog of truth entries in a registry directory."""
+
+    def __init__(self, registry_dir: Path):
+        self.registry_dir = Path(registry_dir)
+        self.path = self.registry_dir / TRUTH_CATALOG_FILE
+
+    @property
+    def claims_dir(self) -> Path:
+        return self.registry_dir.parent / "claims"
+
+    @property
+    def truth_root(self) -> Path:
+        return self.registry_dir / "truth"
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def entries(self) -> Dict[str, TruthCatalogEntry]:
+        """Return all entries keyed by file MD5 (cached until the file changes).
+
+        Builds the catalog from the truth store first if it does not exist.
+        """
+        if not self.path.exists():
+            self.rebuild()
+
+        with _CATALOG_LOCK:
+            signature = _signature(self.path)
+            cached = _CATALOG_CACHE.get(self.path)
+            if cached and cached[0] == signature:
+                return cached[1]
+
+            entries, line_count = self._read()
+            if line_count - len(entries) >= max(_COMPACT_MIN_STALE, len(entries)):
+                self._write(entries.values())
+                line_count = len(entries)
+                signature = _signature(self.path)
+            _CATALOG_CACHE[self.path] = (signature, entries, line_count)
+            return entries
+
+    def get(self, file_md5: str) -> Optional[TruthCatalogEntry]:
+        return self.entries().get(file_md5)
+
+    def upsert(self, file_md5: str, truth: Dict[str, Any]) -> TruthCatalogEntry:
+        """Record the latest truth for a file MD5.
+
+        The document instances already known for the file are kept, and the
+        truth's source document is added if it is missing.
+        """
+        if not self.path.exists():
+            # First save: index whatever truth already exists.  The caller
+            # has written latest.json, so the rebuild includes this entry.
+            self.rebuild()
+            entry = self.get(file_md5)
+            if entry is not None:
+                return entry
+
+        previous = self.get(file_md5)
+        instances = list(previous.doc_instances) if previous else []
+        source = self._source_instance(truth)
+        if source and not any(
+            d.doc_id == source.doc_id and d.claim_id == source.claim_id
+            for d in instances
+        ):
+            instances.append(source)
+
+        entry = TruthCatalogEntry.from_truth(file_md5, truth, instances)
+        self._append(entry)
+        return entry
+
+    def rebuild(self) -> Dict[str, TruthCatalogEntry]:
+        """Rebuild the catalog from ``latest.json`` files and doc metadata."""
+        doc_index: Dict[str, List[TruthDocInstance]] = {}
+        if self.claims_dir.exists():
+            for meta_path in self.claims_dir.glob("*/docs/*/meta/doc.json"):
+                if meta_path.parts[-5].startswith("."):
+                    continue
+                found = read_doc_instance(meta_path)
+                if found:
+                    doc_index.setdefault(found[0], []).append(found[1])
+
+        entries: Dict[str, TruthCatalogEntry] = {}
+        if self.truth_root.exists():
+            for truth_dir in sorted(self.truth_root.iterdir()):
+                truth_path = truth_dir / "latest.json"
+                if not truth_dir.is_dir() or not truth_path.exists():
+                    continue
+                try:
+                    with open(truth_path, "r", encoding="utf-8") as f:
+                        truth = json.load(f)
+                except (json.JSONDecodeError, IOError) as exc:
+                    logger.warning("Failed to load truth file %s: %s", truth_path, exc)
+                    continue
+                file_md5 = (
+                    (truth.get("input_hashes") or {}).get("file_md5") or truth_dir.name
+                )
+                entries[file_md5] = TruthCatalogEntry.from_truth(
+                    file_md5, truth, doc_index.get(file_md5, [])
+                )
+
+        with _CATALOG_LOCK:
+            self._write(entries.values())
+            _CATALOG_CACHE[self.path] = (_signature(self.path), entries, len(entries))
+        logger.info("Built truth catalog with %s entries", len(entries))
+        return entries
+
+    def _source_instance(self, truth: Dict[str, Any]) -> Optional[TruthDocInstance]:
+        """Resolve the truth's source document, preferring its doc metadata."""
+        ref = truth.get("source_doc_ref") or {}
+        doc_id = ref.get("doc_id") or truth.get("doc_id")
+        claim_id = ref.get("claim_id") or truth.get("claim_id")
+        if not doc_id:
+            return None
+
+        meta_path = self.claims_dir / str(claim_id) / "docs" / doc_id / "meta" / "doc.json"
+        if claim_id and meta_path.exists():
+            found = read_doc_instance(meta_path)
+            if found:
+                return found[1]
+
+        return TruthDocInstance(
+            doc_id=doc_id,
+            claim_id=claim_id or "",
+            doc_type=truth.get("doc_type", "unknown"),
+            original_filename=ref.get("original_filename", "") or "",
+        )
+
+    def _read(self) -> Tuple[Dict[str, TruthCatalogEntry], int]:
+        entries: Dict[str, TruthCatalogEntry] = {}
+        line_count = 0
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                line_count += 1
+                try:
+                    entry = TruthCatalogEntry.from_dict(json.loads(line))
+                except (json.JSONDecodeError, KeyError, TypeError) as exc:
+                    logger.warning(
+                        "Invalid truth catalog line %s in %s: %s", line_num, self.path, exc
+                    )
+                    continue
+                entries.pop(entry.file_md5, None)  # Keep latest save order
+                entries[entry.file_md5] = entry
+        return entries, line_count
+
+    def _write(self, entries: Iterable[TruthCatalogEntry]) -> None:
+        """Atomically replace the catalog file (caller holds the lock)."""
+        self.registry_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry.to_dict(), ensure_ascii=False, default=str) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def _append(self, entry: TruthCatalogEntry) -> None:
+        line = json.dumps(entry.to_dict(), ensure_ascii=False, default=str) + "\n"
+        with _CATALOG_LOCK:
+            before = _signature(self.path)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+            cached = _CATALOG_CACHE.get(self.path)
+            if cached and cached[0] == before:
+                # Nobody else touched the file: apply the save to a copy
+                # (readers may be iterating the cached dict).
+                entries = dict(cached[1])
+                entries.pop(entry.file_md5, None)
+                entries[entry.file_md5] = entry
+                _CATALOG_CACHE[self.path] = (_signature(self.path), entries, cached[2] + 1)
+            else:
+                _CATALOG_CACHE.pop(self.path, None)
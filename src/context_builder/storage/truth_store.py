@@ -12,6 +12,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
+from context_builder.storage.truth_catalog import TruthCatalog
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,11 +36,15 @@ class GroundTruthStore:
     - Append-only history: Every save creates a new version file
     - latest.json always points to current truth
     - history.jsonl contains all versions for audit
+
+    Every save also updates the truth catalog (registry/truth_catalog.jsonl)
+    used to filter truth listings without opening each entry.
     """
 
     def __init__(self, output_root: Path):
         self.registry_dir = _resolve_registry_dir(output_root)
         self.truth_root = self.registry_dir / "truth"
+        self.catalog = TruthCatalog(self.registry_dir)
 
     def get_truth_by_file_md5(self, file_md5: str) -> Optional[dict]:
         """Load canonical truth by file MD5."""
@@ -88,6 +94,22 @@ class GroundTruthStore:
 
         # Append to history.jsonl (append-only for compliance)
         self._append_to_history(truth_dir, versioned_payload)
+        self._update_catalog(file_md5, versioned_payload)
+
+    def _update_catalog(self, file_md5: str, payload: dict) -> None:
+        """Record the save in the truth catalog.
+
+        A catalog that could not be updated is removed so that the next
+        listing rebuilds it instead of serving stale entries.
+        """
+        try:
+            self.catalog.upsert(file_md5, payload)
+        except Exception as exc:
+            logger.warning("Failed to update truth catalog for %s: %s", file_md5, exc)
+            try:
+                self.catalog.path.unlink()
+            except OSError:
+                pass
 
     def _get_next_version_number(self, truth_dir: Path) -> int:
         """Get the next version number for a truth entry."""
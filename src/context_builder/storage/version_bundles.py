@@ -11,15 +11,71 @@ import json
 import logging
 import os
 import subprocess
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from context_builder.schemas.decision_record import ScopeSnapshot, VersionBundle
+from context_builder.storage.evolution_log import EvolutionLog
 
 logger = logging.getLogger(__name__)
 
+# Directory (under version_bundles/) holding content shared by many runs
+SHARED_BUNDLES_DIR = "_shared"
+
+# Bundle fields that only depend on the code and configuration, not the run
+SHARED_FIELDS = (
+    "git_commit",
+    "git_dirty",
+    "contextbuilder_version",
+    "prompt_template_hash",
+    "extraction_spec_hash",
+    "scope_snapshot",
+)
+
+# Process-wide memo: git info is read once per process, shared bundle
+# content once per (config fingerprint, code version)
+_GIT_INFO: Optional[Dict[str, Any]] = None
+_SHARED_CONTENT: Dict[Tuple[str, str], Tuple[str, Dict[str, Any]]] = {}
+_MEMO_LOCK = threading.Lock()
+
+
+def clear_version_bundle_cache() -> None:
+    """Forget memoized git info and shared bundle content."""
+    global _GIT_INFO
+    with _MEMO_LOCK:
+        _GIT_INFO = None
+        _SHARED_CONTENT.clear()
+
+
+def _read_git_info() -> Dict[str, Any]:
+    """Run git to get the current commit and dirty status."""
+    try:
+        # Get current commit SHA
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        commit = result.stdout.strip() if result.returncode == 0 else None
+
+        # Check if working tree is dirty
+        result = subprocess.run(
+            ["git", "status", "--porcelain"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        dirty = bool(result.stdout.strip()) if result.returncode == 0 else None
+
+        return {"git_commit": commit, "git_dirty": dirty}
+    except Exception as e:
+        logger.debug(f"Failed to get git info: {e}")
+        return {"git_commit": None, "git_dirty": None}
+
 
 def _get_contextbuilder_version() -> str:
     """Read version from pyproject.toml.
@@ -73,34 +129,16 @@ class VersionBundleStore:
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
     def _get_git_info(self) -> Dict[str, Any]:
-        """Get current git commit and dirty status.
+        """Get current git commit and dirty status (read once per process).
 
         Returns:
             Dict with git_commit (str or None) and git_dirty (bool or None)
         """
-        try:
-            # Get current commit SHA
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            commit = result.stdout.strip() if result.returncode == 0 else None
-
-            # Check if working tree is dirty
-            result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            dirty = bool(result.stdout.strip()) if result.returncode == 0 else None
-
-            return {"git_commit": commit, "git_dirty": dirty}
-        except Exception as e:
-            logger.debug(f"Failed to get git info: {e}")
-            return {"git_commit": None, "git_dirty": None}
+        global _GIT_INFO
+        with _MEMO_LOCK:
+            if _GIT_INFO is None:
+                _GIT_INFO = _read_git_info()
+            return dict(_GIT_INFO)
 
     def _hash_file(self, file_path: Path) -> Optional[str]:
         """Compute SHA-256 hash of a file.
@@ -202,6 +240,74 @@ class VersionBundleStore:
         logger.warning(f"No extraction specs found. Searched: {[str(p) for p in possible_paths]}")
         return None
 
+    def _config_fingerprint(self) -> str:
+        """Cheap fingerprint of the inputs to the shared bundle content.
+
+        Covers the prompt and spec directories hashed by
+        ``_get_prompt_template_hash``/``_get_extraction_spec_hash`` plus the
+        workspace spec overrides read by the scope snapshot, using file
+        names, sizes and mtimes only.
+        """
+        module_dir = Path(__file__).resolve().parent.parent  # context_builder/
+        project_root = module_dir.parent.parent  # project root
+        sources = [
+            (module_dir / "prompts", "*.md"),
+            (project_root / "prompts", "*.md"),
+            (module_dir / "extraction" / "specs", "*.yaml"),
+        ]
+        try:
+            from context_builder.storage.workspace_paths import get_workspace_config_dir
+
+            sources.append((get_workspace_config_dir() / "extraction_specs", "*.yaml"))
+        except Exception as e:
+            logger.debug(f"Workspace config dir unavailable for fingerprint: {e}")
+
+        hasher = hashlib.sha256()
+        for dir_path, pattern in sources:
+            hasher.update(f"{dir_path}|{pattern}\n".encode("utf-8"))
+            if not dir_path.is_dir():
+                continue
+            for file_path in sorted(dir_path.glob(pattern)):
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                hasher.update(
+                    f"{file_path.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8")
+                )
+        return hasher.hexdigest()
+
+    def _get_shared_content(self) -> Tuple[str, Dict[str, Any]]:
+        """Get the run-independent bundle content and its content-addressed ID.
+
+        Computed once per (config fingerprint, code version) per process;
+        later runs only pay for the fingerprint's stat calls.
+        """
+        git_info = self._get_git_info()
+        code_version = f"{git_info.get('git_commit')}|{git_info.get('git_dirty')}|{_get_contextbuilder_version()}"
+        key = (self._config_fingerprint(), code_version)
+        with _MEMO_LOCK:
+            cached = _SHARED_CONTENT.get(key)
+        if cached is not None:
+            return cached
+
+        scope = self._capture_scope_snapshot()
+        content = {
+            "git_commit": git_info.get("git_commit"),
+            "git_dirty": git_info.get("git_dirty"),
+            "contextbuilder_version": _get_contextbuilder_version(),
+            "prompt_template_hash": self._get_prompt_template_hash(),
+            "extraction_spec_hash": self._get_extraction_spec_hash(),
+            "scope_snapshot": scope.model_dump() if scope else None,
+        }
+        digest = hashlib.sha256(
+            json.dumps(content, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        shared = (f"vbs_{digest[:16]}", content)
+        with _MEMO_LOCK:
+            _SHARED_CONTENT[key] = shared
+        return shared
+
     def _capture_scope_snapshot(self) -> Optional[ScopeSnapshot]:
         """Capture current extraction spec scope.
 
@@ -249,6 +355,11 @@ class VersionBundleStore:
     ) -> VersionBundle:
         """Create a version bundle snapshot for a pipeline run.
 
+        The code/config part of the bundle (git state, prompt and spec
+        hashes, scope) is computed once per process for a given config
+        fingerprint and stored once under ``_shared/``; the run's
+        bundle.json references it by ``shared_bundle_id``.
+
         Args:
             run_id: Pipeline run identifier
             model_name: LLM model being used
@@ -261,48 +372,79 @@ class VersionBundleStore:
         bundle_id = f"vb_{uuid.uuid4().hex[:12]}"
         created_at = datetime.utcnow().isoformat() + "Z"
 
-        # Get git info
-        git_info = self._get_git_info()
+        shared_id, shared_content = self._get_shared_content()
 
         # Create version bundle
         bundle = VersionBundle(
             bundle_id=bundle_id,
             created_at=created_at,
-            git_commit=git_info.get("git_commit"),
-            git_dirty=git_info.get("git_dirty"),
-            contextbuilder_version=_get_contextbuilder_version(),
             extractor_version=extractor_version,
             model_name=model_name,
             model_version=model_version,
-            prompt_template_hash=self._get_prompt_template_hash(),
-            extraction_spec_hash=self._get_extraction_spec_hash(),
-            scope_snapshot=self._capture_scope_snapshot(),
+            **shared_content,
         )
 
         # Save to storage
-        self._save_bundle(run_id, bundle)
+        self._save_shared_content(shared_id, shared_content)
+        self._save_bundle(run_id, bundle, shared_id)
 
         logger.debug(f"Created version bundle {bundle_id} for run {run_id}")
         return bundle
 
-    def _save_bundle(self, run_id: str, bundle: VersionBundle) -> None:
+    def _save_shared_content(self, shared_id: str, content: Dict[str, Any]) -> None:
+        """Write shared bundle content once (content-addressed, never rewritten)."""
+        shared_file = self.storage_dir / SHARED_BUNDLES_DIR / f"{shared_id}.json"
+        if shared_file.exists():
+            return
+        shared_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = shared_file.with_name(f"{shared_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(content, f, indent=2, default=str)
+        tmp_file.replace(shared_file)
+
+    def _load_shared_content(self, shared_id: str) -> Optional[Dict[str, Any]]:
+        shared_file = self.storage_dir / SHARED_BUNDLES_DIR / f"{shared_id}.json"
+        try:
+            with open(shared_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Failed to load shared version bundle {shared_id}: {e}")
+            return None
+
+    def _save_bundle(
+        self, run_id: str, bundle: VersionBundle, shared_id: Optional[str] = None
+    ) -> None:
         """Save version bundle to storage.
 
         Args:
             run_id: Pipeline run identifier
             bundle: Version bundle to save
+            shared_id: ID of the shared content the bundle references; the
+                shared fields are then not duplicated in bundle.json
         """
         # Create run-specific directory
         run_dir = self.storage_dir / run_id
         run_dir.mkdir(parents=True, exist_ok=True)
 
+        data = bundle.model_dump()
+        if shared_id:
+            for field_name in SHARED_FIELDS:
+                data.pop(field_name, None)
+            data["shared_bundle_id"] = shared_id
+
         # Save bundle.json
         bundle_file = run_dir / "bundle.json"
         with open(bundle_file, "w", encoding="utf-8") as f:
-            json.dump(bundle.model_dump(), f, indent=2, default=str)
+            json.dump(data, f, indent=2, default=str)
 
         logger.debug(f"Saved version bundle to {bundle_file}")
 
+        # Feed the incrementally materialized evolution timeline
+        try:
+            EvolutionLog(self.storage_dir).record_bundle(run_id, bundle)
+        except Exception as e:
+            logger.warning(f"Failed to record version bundle in evolution log: {e}")
+
     def get_version_bundle(self, run_id: str) -> Optional[VersionBundle]:
         """Retrieve a version bundle by run ID.
 
@@ -319,6 +461,9 @@ class VersionBundleStore:
         try:
             with open(bundle_file, "r", encoding="utf-8") as f:
                 data = json.load(f)
+            shared_id = data.pop("shared_bundle_id", None)
+            if shared_id:
+                data = {**(self._load_shared_content(shared_id) or {}), **data}
             return VersionBundle.model_validate(data)
         except Exception as e:
             logger.warning(f"Failed to load version bundle for run {run_id}: {e}")
@@ -0,0 +1,137 @@
+"""Tests for JSON artifact encoding and transparent readers."""
+
+import json
+
+import pytest
+
+from context_builder.pipeline.paths import get_claim_paths, get_doc_paths
+from context_builder.pipeline.stages.ingestion import load_existing_ingestion
+from context_builder.pipeline.writer import ResultWriter
+from context_builder.storage import FileStorage, artifact_codec
+from context_builder.storage.artifact_codec import (
+    COMPRESSION_ENV,
+    MIN_BYTES_ENV,
+    detect_codec,
+    encode_artifact,
+    read_json_artifact,
+    recompress_workspace,
+)
+
+PAGES = {"schema_version": "doc_text_v1", "pages": [{"page": 1, "text": "Total: CHF 1'250.–"}]}
+
+CODEC_PARAMS = [
+    "gzip",
+    pytest.param(
+        "zstd",
+        marks=pytest.mark.skipif(artifact_codec.zstandard is None, reason="zstandard not installed"),
+    ),
+]
+
+
+@pytest.fixture
+def compression(monkeypatch):
+    def configure(codec, min_bytes=0):
+        monkeypatch.setenv(COMPRESSION_ENV, codec)
+        monkeypatch.setenv(MIN_BYTES_ENV, str(min_bytes))
+
+    return configure
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    doc_dir = tmp_path / "claims" / "CLM-001" / "docs" / "DOC-001"
+    (doc_dir / "meta").mkdir(parents=True)
+    (doc_dir / "meta" / "doc.json").write_text(json.dumps({"doc_id": "DOC-001", "claim_id": "CLM-001"}))
+    (doc_dir / "text" / "raw").mkdir(parents=True)
+    (doc_dir / "text" / "pages.json").write_text(json.dumps(PAGES, indent=2))
+    (doc_dir / "text" / "raw" / "azure_di.json").write_text(
+        json.dumps({"raw_azure_di_output": {"content": "x" * 5000}}, indent=2)
+    )
+    summary_dir = tmp_path / "claims" / "CLM-001" / "runs" / "run_1" / "logs"
+    summary_dir.mkdir(parents=True)
+    (summary_dir / "summary.json").write_text(json.dumps({"status": "success"}, indent=2))
+    return tmp_path
+
+
+class TestEncoding:
+    def test_compact_by_default(self):
+        encoded = encode_artifact(PAGES, compressible=True)
+
+        assert detect_codec(encoded) == "none"
+        assert b"\n" not in encoded
+        assert json.loads(encoded) == PAGES
+
+    @pytest.mark.parametrize("codec", CODEC_PARAMS)
+    def test_compressed_round_trip(self, compression, tmp_path, codec):
+        compression(codec)
+        path = tmp_path / "pages.json"
+
+        ResultWriter().write_artifact(path, PAGES)
+
+        assert detect_codec(path.read_bytes()) == codec
+        assert read_json_artifact(path) == PAGES
+
+    def test_threshold_and_eligibility(self, compression, tmp_path):
+        compression("gzip", min_bytes=10_000)
+        writer = ResultWriter()
+
+        writer.write_artifact(tmp_path / "pages.json", PAGES)
+        compression("gzip")
+        writer.write_artifact(tmp_path / "summary.json", PAGES)
+
+        # Too small, and not a compressible artifact
+        assert detect_codec((tmp_path / "pages.json").read_bytes()) == "none"
+        assert detect_codec((tmp_path / "summary.json").read_bytes()) == "none"
+
+    def test_reads_legacy_pretty_json(self, tmp_path):
+        path = tmp_path / "pages.json"
+        path.write_text(json.dumps(PAGES, indent=2, ensure_ascii=False), encoding="utf-8")
+
+        assert read_json_artifact(path) == PAGES
+
+
+class TestTransparentReaders:
+    @pytest.mark.parametrize("codec", CODEC_PARAMS)
+    def test_storage_and_ingestion_read_compressed(self, compression, workspace, codec):
+        compression(codec)
+        recompress_workspace(workspace)
+        storage = FileStorage(workspace)
+
+        assert storage.get_doc_text("DOC-001").pages == PAGES["pages"]
+        assert storage.get_doc_azure_di("DOC-001")["raw_azure_di_output"]["content"] == "x" * 5000
+
+        doc_paths = get_doc_paths(get_claim_paths(workspace / "claims", "CLM-001"), "DOC-001")
+        text, pages_data = load_existing_ingestion(doc_paths)
+        assert text == PAGES["pages"][0]["text"]
+        assert pages_data == PAGES
+
+
+class TestRecompressWorkspace:
+    def test_dry_run_reports_without_writing(self, workspace):
+        pages_path = workspace / "claims" / "CLM-001" / "docs" / "DOC-001" / "text" / "pages.json"
+        before = pages_path.read_bytes()
+
+        stats = recompress_workspace(workspace, codec="gzip", min_bytes=0, dry_run=True)
+
+        assert stats["files_scanned"] == 3
+        assert stats["files_rewritten"] == 3
+        assert stats["bytes_saved"] > 0
+        assert pages_path.read_bytes() == before
+
+    def test_rewrite_is_idempotent_and_reversible(self, workspace):
+        stats = recompress_workspace(workspace, codec="gzip", min_bytes=1000)
+        again = recompress_workspace(workspace, codec="gzip", min_bytes=1000)
+        raw_dir = workspace / "claims" / "CLM-001" / "docs" / "DOC-001" / "text"
+
+        assert stats["bytes_after"] == again["bytes_before"] == again["bytes_after"]
+        assert again["files_rewritten"] == 0
+        # Only the large Azure DI payload crossed the threshold
+        assert detect_codec((raw_dir / "raw" / "azure_di.json").read_bytes()) == "gzip"
+        assert detect_codec((raw_dir / "pages.json").read_bytes()) == "none"
+
+        recompress_workspace(workspace, codec="none")
+        assert detect_codec((raw_dir / "raw" / "azure_di.json").read_bytes()) == "none"
+
+    def test_unknown_codec(self, workspace):
+        with pytest.raises(ValueError):
+            recompress_workspace(workspace, codec="brotli")
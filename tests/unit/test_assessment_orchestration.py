@@ -402,3 +402,59 @@ class TestServicePathScreening:
             "decision",
             "confidence",
         ]
+
+    def test_assess_manifest_records_stage_timings(
+        self,
+        mock_storage,
+        mock_reconciliation,
+        mock_claim_run_storage,
+        sample_facts,
+    ):
+        """Verify the stage graph timings and critical path land in the manifest."""
+        result, _, _, _ = self._run_assess_with_screening(
+            mock_storage,
+            mock_reconciliation,
+            mock_claim_run_storage,
+            sample_facts,
+            screening_result_dict={"claim_id": "CLM-001", "auto_reject": False},
+        )
+
+        assert result.success is True
+        timings = mock_claim_run_storage.read_manifest.return_value.stage_timings
+        assert set(timings["stages"]) == {
+            "reconciliation", "assessment_config", "screening",
+            "coverage_overrides", "assessment", "decision", "confidence",
+        }
+        assert timings["stages"]["assessment"]["depends_on"] == [
+            "reconciliation", "screening", "assessment_config",
+        ]
+        assert timings["stages"]["screening"]["depends_on"] == ["reconciliation"]
+        assert timings["critical_path"]
+
+        fingerprints = mock_claim_run_storage.read_manifest.return_value.stage_fingerprints
+        assert fingerprints["screening"]["action"] == "ran"
+        assert fingerprints["assessment"]["reason"] == "no_match"
+        assert fingerprints["decision"]["reason"] == "not_reusable"
+
+    def test_assess_reconciliation_failure_skips_stages(
+        self,
+        mock_storage,
+        mock_reconciliation,
+        mock_claim_run_storage,
+        sample_facts,
+    ):
+        """Verify a failed reconciliation stops the graph with its error."""
+        mock_reconciliation.reconcile.return_value.success = False
+        mock_reconciliation.reconcile.return_value.error = "no documents"
+
+        result, mock_processor, _, mock_screening = self._run_assess_with_screening(
+            mock_storage,
+            mock_reconciliation,
+            mock_claim_run_storage,
+            sample_facts,
+        )
+
+        assert result.success is False
+        assert result.error == "Reconciliation failed: no documents"
+        mock_screening.run.assert_not_called()
+        mock_processor.process.assert_not_called()
@@ -13,8 +13,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from pydantic import ValidationError
+
 from context_builder.pipeline.claim_stages.assessment_processor import (
     AssessmentProcessor,
+    clear_response_schema_cache,
+    validate_strict_schema,
 )
 from context_builder.pipeline.claim_stages.context import ClaimContext
 from context_builder.pipeline.claim_stages.processing import ProcessorConfig
@@ -823,3 +827,95 @@ class TestFormatScreeningContextNullPayout:
             screening["payout"][key] = None
         result = AssessmentProcessor._format_screening_context(screening)
         assert "Pre-computed Payout" in result
+
+
+# ── Response schema cache ───────────────────────────────────────────
+
+
+def _llm_response(check_result: str = "PASS") -> dict:
+    payout = AssessmentProcessor._zero_payout()
+    return {
+        "claim_id": "CLM-001",
+        "assessment_timestamp": "2026-01-28T10:00:00Z",
+        "recommendation": "APPROVE",
+        "recommendation_rationale": "All good",
+        "confidence_score": 0.9,
+        "checks": [
+            {
+                "check_number": "1",
+                "check_name": "policy_validity",
+                "result": check_result,
+                "details": "ok",
+            }
+        ],
+        "payout": payout,
+    }
+
+
+class TestResponseSchemaCache:
+    """Tests for the compiled strict response schema."""
+
+    def setup_method(self):
+        clear_response_schema_cache()
+        self.processor = AssessmentProcessor()
+
+    def test_response_format_built_once(self):
+        with patch.object(
+            AssessmentProcessor,
+            "_prepare_schema_for_strict_mode",
+            wraps=self.processor._prepare_schema_for_strict_mode,
+        ) as prepare:
+            first = self.processor._build_response_format("v1")
+            second = AssessmentProcessor()._build_response_format("v1")
+
+        assert first is second
+        assert prepare.call_count == 1
+
+    def test_cache_keyed_by_prompt_version(self):
+        v1 = self.processor._build_response_format("v1")
+        v2 = self.processor._build_response_format("v2")
+        assert v1 is not v2
+        assert v1 == v2
+
+    def test_compiled_schema_is_strict(self):
+        response_format = self.processor._build_response_format()
+        assert response_format["type"] == "json_schema"
+        assert response_format["json_schema"]["strict"] is True
+        validate_strict_schema(response_format["json_schema"]["schema"])
+
+    def test_validate_strict_schema_rejects_optional_property(self):
+        schema = {
+            "type": "object",
+            "additionalProperties": False,
+            "properties": {"a": {"type": "string"}},
+            "required": [],
+        }
+        with pytest.raises(ValueError, match="optional properties"):
+            validate_strict_schema(schema)
+
+    def test_validate_strict_schema_rejects_unresolved_ref(self):
+        schema = {"type": "array", "items": {"$ref": "#/$defs/CheckResult"}}
+        with pytest.raises(ValueError, match=r"\$ref"):
+            validate_strict_schema(schema)
+
+    def test_parse_response_fast_path(self):
+        content = json.dumps(_llm_response())
+        with patch.object(self.processor, "_normalize_response") as normalize:
+            validated = self.processor._parse_response(content)
+        normalize.assert_not_called()
+        assert validated.checks[0].result == "PASS"
+
+    def test_parse_response_normalizes_on_fallback(self):
+        content = json.dumps(_llm_response(check_result="UNKNOWN"))
+        validated = self.processor._parse_response(content)
+        assert validated.checks[0].result == "INCONCLUSIVE"
+
+    def test_parse_response_invalid_json(self):
+        with pytest.raises(json.JSONDecodeError):
+            self.processor._parse_response("{not json")
+
+    def test_parse_response_invalid_after_normalize(self):
+        data = _llm_response()
+        del data["recommendation"]
+        with pytest.raises(ValidationError):
+            self.processor._parse_response(json.dumps(data))
@@ -0,0 +1,188 @@
+"""Tests for the workspace change journal and its index builder consumer."""
+
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from context_builder.pipeline.writer import ResultWriter
+from context_builder.storage import FileStorage, apply_change_journal, build_all_indexes
+from context_builder.storage import index_builder, journal_watcher
+from context_builder.storage.change_journal import ChangeJournal, record_change
+from context_builder.storage.index_builder import INDEX_JOURNAL_CONSUMER
+from context_builder.storage.index_reader import read_jsonl
+from context_builder.storage.journal_watcher import JournalWatcher
+from context_builder.storage.path_map import PathMap
+
+
+def _add_doc(workspace, claim_id, doc_id):
+    ResultWriter().write_json(
+        workspace / "claims" / claim_id / "docs" / doc_id / "meta" / "doc.json",
+        {"doc_id": doc_id, "claim_id": claim_id, "doc_type": "invoice"},
+    )
+
+
+def _add_run(workspace, run_id):
+    writer = ResultWriter()
+    run_dir = workspace / "runs" / run_id
+    writer.write_json(run_dir / "manifest.json", {"claims_count": 1})
+    writer.write_json(run_dir / "summary.json", {"status": "success"})
+    writer.touch(run_dir / ".complete")
+
+
+def _doc_ids(workspace):
+    return [r["doc_id"] for r in read_jsonl(workspace / "registry" / "doc_index.jsonl")]
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    _add_doc(tmp_path, "CLM-001", "DOC-001")
+    _add_doc(tmp_path, "CLM-002", "DOC-002")
+    _add_run(tmp_path, "run_1")
+    build_all_indexes(tmp_path)
+    return tmp_path
+
+
+class TestChangeJournal:
+    def test_records_ids_from_path(self, workspace):
+        journal = ChangeJournal(workspace / "registry")
+        offset = journal.ensure()
+
+        record_change(workspace / "claims" / "CLM-001" / "docs" / "DOC-001" / "text" / "pages.json")
+        record_change(workspace / "claims" / "CLM-001" / "runs" / "run_2" / "logs" / "summary.json")
+        record_change(workspace / "runs" / "run_2", kind="delete")
+
+        entries, _ = journal.read_since(offset)
+        assert [(e["kind"], e["claim_id"], e["doc_id"], e["run_id"]) for e in entries] == [
+            ("write", "CLM-001", "DOC-001", None),
+            ("write", "CLM-001", None, "run_2"),
+            ("delete", None, None, "run_2"),
+        ]
+        assert entries[0]["path"] == "claims/CLM-001/docs/DOC-001/text/pages.json"
+
+    def test_no_registry_no_journal(self, tmp_path):
+        assert not record_change(tmp_path / "claims" / "CLM-001" / "docs" / "DOC-001" / "meta" / "doc.json")
+        assert not (tmp_path / "registry").exists()
+
+    def test_partial_line_left_for_next_read(self, workspace):
+        journal = ChangeJournal(workspace / "registry")
+        offset = journal.ensure()
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"kind": "write", "path": "claims/CLM-001"')
+
+        entries, end = journal.read_since(offset)
+
+        assert entries == [] and end == offset
+
+    def test_checkpoint_invalid_after_journal_replaced(self, workspace):
+        journal = ChangeJournal(workspace / "registry")
+        assert journal.get_checkpoint(INDEX_JOURNAL_CONSUMER) is not None
+
+        journal.path.unlink()
+        journal.ensure()
+
+        assert journal.get_checkpoint(INDEX_JOURNAL_CONSUMER) is None
+        assert journal.changes_since_checkpoint(INDEX_JOURNAL_CONSUMER) is None
+
+    def test_full_build_rotates_journal(self, workspace):
+        journal = ChangeJournal(workspace / "registry")
+        journal_id = journal.journal_id()
+        _add_doc(workspace, "CLM-001", "DOC-003")
+
+        build_all_indexes(workspace)
+
+        assert journal.journal_id() != journal_id
+        assert journal.path.read_text().count("\n") == 1
+        assert journal.changes_since_checkpoint(INDEX_JOURNAL_CONSUMER) == ([], journal.end_offset())
+
+    def test_changes_during_build_are_kept(self, workspace):
+        build_run_index = index_builder.build_run_index
+
+        def write_during_build(output_dir):
+            _add_doc(workspace, "CLM-002", "DOC-LATE")
+            return build_run_index(output_dir)
+
+        with patch.object(index_builder, "build_run_index", write_during_build):
+            build_all_indexes(workspace)
+
+        entries, _ = ChangeJournal(workspace / "registry").changes_since_checkpoint(
+            INDEX_JOURNAL_CONSUMER
+        )
+        assert [e["doc_id"] for e in entries] == ["DOC-LATE"]
+
+
+class TestApplyChangeJournal:
+    def test_applies_only_journaled_claims_and_runs(self, workspace):
+        _add_doc(workspace, "CLM-001", "DOC-003")
+        _add_run(workspace, "run_2")
+        # A change the journal does not know about stays unindexed
+        (workspace / "claims" / "CLM-002" / "docs" / "DOC-004" / "meta").mkdir(parents=True)
+        (workspace / "claims" / "CLM-002" / "docs" / "DOC-004" / "meta" / "doc.json").write_text(
+            json.dumps({"doc_id": "DOC-004"})
+        )
+
+        stats = apply_change_journal(workspace)
+
+        assert stats["mode"] == "journal"
+        assert (stats["claims_updated"], stats["runs_updated"]) == (1, 1)
+        assert _doc_ids(workspace) == ["DOC-001", "DOC-003", "DOC-002"]
+        runs = [r["run_id"] for r in read_jsonl(workspace / "registry" / "run_index.jsonl")]
+        assert runs == ["run_1", "run_2"]
+
+        # Checkpoint committed: nothing left to apply
+        assert apply_change_journal(workspace)["changes_applied"] == 0
+
+    def test_path_map_updated_per_claim(self, workspace):
+        path_map = PathMap.for_claims_dir(workspace / "claims")
+        _add_doc(workspace, "CLM-001", "DOC-003")
+
+        with patch.object(PathMap, "rebuild", side_effect=AssertionError("rebuilt")):
+            apply_change_journal(workspace)
+
+        assert path_map.doc_folder("DOC-003") == workspace / "claims" / "CLM-001" / "docs" / "DOC-003"
+        assert path_map.doc_folder("DOC-002") == workspace / "claims" / "CLM-002" / "docs" / "DOC-002"
+
+    def test_storage_deletes(self, workspace):
+        storage = FileStorage(workspace)
+        assert storage.delete_claim("CLM-002")
+        storage.delete_run("run_1")
+
+        apply_change_journal(workspace)
+
+        assert _doc_ids(workspace) == ["DOC-001"]
+        assert list(read_jsonl(workspace / "registry" / "run_index.jsonl")) == []
+        claims = [r["folder_name"] for r in read_jsonl(workspace / "registry" / "claims_index.jsonl")]
+        assert claims == ["CLM-001"]
+
+    def test_full_build_without_checkpoint(self, workspace):
+        (workspace / "registry" / "journal_checkpoints" / f"{INDEX_JOURNAL_CONSUMER}.json").unlink()
+        _add_doc(workspace, "CLM-003", "DOC-005")
+
+        stats = apply_change_journal(workspace)
+
+        assert stats["mode"] == "full"
+        assert "DOC-005" in _doc_ids(workspace)
+        assert apply_change_journal(workspace)["mode"] == "journal"
+
+
+@pytest.mark.skipif(journal_watcher.Observer is None, reason="watchdog not installed")
+class TestJournalWatcher:
+    def test_journals_external_changes(self, workspace):
+        journal = ChangeJournal(workspace / "registry")
+        offset = journal.ensure()
+        doc_json = workspace / "claims" / "CLM-009" / "docs" / "DOC-009" / "meta" / "doc.json"
+
+        with JournalWatcher(workspace, debounce_seconds=0.05):
+            doc_json.parent.mkdir(parents=True)
+            doc_json.write_text(json.dumps({"doc_id": "DOC-009"}))
+            (doc_json.parent / "doc.json.tmp").write_text("{}")
+            time.sleep(0.5)
+
+        entries, _ = journal.read_since(offset)
+        paths = {e["path"] for e in entries}
+        assert "claims/CLM-009/docs/DOC-009/meta/doc.json" in paths
+        assert not any(p.endswith(".tmp") for p in paths)
+
+        apply_change_journal(workspace)
+        assert "DOC-009" in _doc_ids(workspace)
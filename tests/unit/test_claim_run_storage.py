@@ -127,7 +127,7 @@ class TestListClaimRuns:
         assert storage.list_claim_runs() == []
 
     def test_list_claim_runs_sorted(self, storage):
-        """Test runs are sorted newest first (by mtime)."""
+        """Test runs are sorted newest first (by creation time)."""
         import time
 
         # Create multiple runs with slight delay to ensure distinct mtimes
@@ -139,7 +139,7 @@ class TestListClaimRuns:
 
         runs = storage.list_claim_runs()
         assert len(runs) == 3
-        # Newest first by modification time
+        # Newest first by manifest created_at
         assert runs[0] == run3.claim_run_id
         assert runs[-1] == run1.claim_run_id
 
@@ -163,7 +163,7 @@ class TestGetLatestClaimRunId:
         assert storage.get_latest_claim_run_id() is None
 
     def test_get_latest_claim_run_id(self, storage):
-        """Test getting latest run ID (most recently modified)."""
+        """Test getting latest run ID (most recently created)."""
         import time
 
         run1 = storage.create_claim_run(["run_1"], "0.5.0")
@@ -174,6 +174,84 @@ class TestGetLatestClaimRunId:
         assert storage.get_latest_claim_run_id() == run2.claim_run_id
 
 
+class TestClaimRunIndex:
+    """Tests for the claim_runs/index.json catalog."""
+
+    def test_index_written_on_create_and_manifest_update(self, storage):
+        run1 = storage.create_claim_run(["run_1"], "0.5.0")
+        run2 = storage.create_claim_run(["run_2"], "0.5.0")
+        run1.stages_completed = ["reconciliation"]
+        storage.write_manifest(run1)
+
+        index = json.loads(storage.index_path.read_text())
+        assert index["latest"] == run2.claim_run_id
+        assert [r["claim_run_id"] for r in index["runs"]] == [
+            run2.claim_run_id, run1.claim_run_id,
+        ]
+        assert index["runs"][1]["stages_completed"] == ["reconciliation"]
+        assert index["runs"][1]["extraction_runs_considered"] == ["run_1"]
+
+    def test_order_ignores_directory_mtime(self, storage):
+        import os
+
+        run1 = storage.create_claim_run(["run_1"], "0.5.0")
+        run2 = storage.create_claim_run(["run_2"], "0.5.0")
+        # Simulate a restore that touched the older run last
+        future = time.time() + 3600
+        os.utime(storage.get_claim_run_path(run1.claim_run_id), (future, future))
+        storage.rebuild_index()
+
+        assert storage.get_latest_claim_run_id() == run2.claim_run_id
+
+    def test_reconciles_added_and_removed_dirs(self, storage):
+        import shutil
+
+        run1 = storage.create_claim_run(["run_1"], "0.5.0")
+        run2 = storage.create_claim_run(["run_2"], "0.5.0")
+        (storage.claim_runs_dir / "clm_20990101_000000_abcdef").mkdir()
+        shutil.rmtree(storage.get_claim_run_path(run2.claim_run_id))
+
+        runs = storage.list_claim_runs()
+
+        assert runs == ["clm_20990101_000000_abcdef", run1.claim_run_id]
+        summary = storage.list_claim_run_summaries()[0]
+        assert summary["has_manifest"] is False
+        assert summary["created_at"] == "2099-01-01T00:00:00"
+
+    def test_repeated_reads_do_not_open_manifests(self, storage, monkeypatch):
+        from context_builder.storage import claim_run
+
+        storage.create_claim_run(["run_1"], "0.5.0")
+        storage.list_claim_runs()
+        monkeypatch.setattr(claim_run, "_RACY_WINDOW_NS", -10**18)
+        monkeypatch.setattr(
+            ClaimRunStorage, "read_manifest",
+            lambda self, run_id: pytest.fail("manifest read"),
+        )
+
+        assert len(storage.list_claim_runs()) == 1
+        assert storage.get_latest_claim_run_id() is not None
+
+    def test_corrupt_index_rebuilt(self, storage):
+        from context_builder.storage.claim_run import clear_claim_run_index_cache
+
+        run = storage.create_claim_run(["run_1"], "0.5.0")
+        storage.index_path.write_text("{not json")
+        clear_claim_run_index_cache()
+
+        assert storage.list_claim_runs() == [run.claim_run_id]
+        assert json.loads(storage.index_path.read_text())["latest"] == run.claim_run_id
+
+    def test_rebuild_all_claims(self, tmp_path):
+        from context_builder.storage.claim_run import rebuild_claim_run_indexes
+
+        for claim_id in ("CLM-A", "CLM-B"):
+            ClaimRunStorage(tmp_path / claim_id).create_claim_run([], "0.5.0")
+        (tmp_path / "CLM-C").mkdir()
+
+        assert rebuild_claim_run_indexes(tmp_path) == 2
+
+
 class TestWriteAndReadFromClaimRun:
     """Tests for writing and reading files from claim runs."""
 
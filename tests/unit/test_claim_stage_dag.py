@@ -0,0 +1,183 @@
+"""Unit tests for the dependency-declared claim stage runner."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from context_builder.pipeline.claim_stages.context import ClaimContext
+from context_builder.pipeline.claim_stages.dag import (
+    ClaimStageGraph,
+    StageNode,
+    StageRecord,
+    build_dependencies,
+    compute_critical_path,
+)
+
+
+def _context(tmp_path: Path) -> ClaimContext:
+    return ClaimContext(claim_id="CLM-001", workspace_path=tmp_path, run_id="run-001")
+
+
+def _setter(field_name, value, delay=0.0):
+    def run(ctx):
+        if delay:
+            time.sleep(delay)
+        setattr(ctx, field_name, value)
+        return ctx
+    return run
+
+
+class TestBuildDependencies:
+    def test_read_after_write(self):
+        nodes = [
+            StageNode("a", _setter("aggregated_facts", {}), outputs=("aggregated_facts",)),
+            StageNode("b", _setter("screening_result", {}), inputs=("aggregated_facts",),
+                      outputs=("screening_result",)),
+        ]
+        assert build_dependencies(nodes) == {"a": [], "b": ["a"]}
+
+    def test_independent_readers_do_not_depend_on_each_other(self):
+        nodes = [
+            StageNode("facts", _setter("aggregated_facts", {}), outputs=("aggregated_facts",)),
+            StageNode("x", _setter("screening_result", {}), inputs=("aggregated_facts",),
+                      outputs=("screening_result",)),
+            StageNode("y", _setter("coverage_overrides", {}), inputs=("aggregated_facts",),
+                      outputs=("coverage_overrides",)),
+        ]
+        deps = build_dependencies(nodes)
+        assert deps["x"] == ["facts"]
+        assert deps["y"] == ["facts"]
+
+    def test_write_after_read_waits_for_reader(self):
+        nodes = [
+            StageNode("facts", _setter("aggregated_facts", {}), outputs=("aggregated_facts",)),
+            StageNode("reader", _setter("screening_result", {}), inputs=("aggregated_facts",),
+                      outputs=("screening_result",)),
+            StageNode("enrich", _setter("aggregated_facts", {}), inputs=("aggregated_facts",),
+                      outputs=("aggregated_facts",)),
+        ]
+        assert build_dependencies(nodes)["enrich"] == ["facts", "reader"]
+
+    def test_unknown_field_rejected(self):
+        with pytest.raises(ValueError, match="unknown ClaimContext fields"):
+            build_dependencies([StageNode("a", _setter("x", 1), outputs=("not_a_field",))])
+
+    def test_duplicate_name_rejected(self):
+        with pytest.raises(ValueError, match="Duplicate"):
+            build_dependencies([StageNode("a", lambda c: c), StageNode("a", lambda c: c)])
+
+
+class TestClaimStageGraph:
+    def test_independent_stages_run_concurrently(self, tmp_path):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meet(field_name):
+            def run(ctx):
+                barrier.wait()  # Deadlocks (and times out) if run sequentially
+                setattr(ctx, field_name, {"ok": True})
+                return ctx
+            return run
+
+        graph = ClaimStageGraph([
+            StageNode("screening", meet("screening_result"), outputs=("screening_result",)),
+            StageNode("overrides", meet("coverage_overrides"), outputs=("coverage_overrides",)),
+        ])
+        context = graph.run(_context(tmp_path))
+
+        assert context.status == "success"
+        assert context.screening_result == {"ok": True}
+        assert context.coverage_overrides == {"ok": True}
+
+    def test_only_declared_outputs_merged(self, tmp_path):
+        def run(ctx):
+            ctx.screening_result = {"a": 1}
+            ctx.decision_result = {"undeclared": True}
+            return ctx
+
+        graph = ClaimStageGraph([
+            StageNode("screening", run, outputs=("screening_result",)),
+        ])
+        context = graph.run(_context(tmp_path))
+
+        assert context.screening_result == {"a": 1}
+        assert context.decision_result is None
+
+    def test_error_status_skips_pending_stages(self, tmp_path):
+        def fail(ctx):
+            ctx.status = "error"
+            ctx.error = "Reconciliation failed: boom"
+            return ctx
+
+        later = []
+        graph = ClaimStageGraph([
+            StageNode("reconciliation", fail, outputs=("aggregated_facts",)),
+            StageNode("screening", lambda c: later.append(1) or c,
+                      inputs=("aggregated_facts",)),
+        ])
+        context = graph.run(_context(tmp_path))
+
+        assert context.status == "error"
+        assert context.error == "Reconciliation failed: boom"
+        assert later == []
+        assert graph.report.stages["screening"].status == "skipped"
+
+    def test_non_fatal_exception_continues(self, tmp_path):
+        def crash(ctx):
+            raise RuntimeError("screener crashed")
+
+        graph = ClaimStageGraph([
+            StageNode("screening", crash, outputs=("screening_result",), fatal=False),
+            StageNode("processing", _setter("processing_result", {"r": 1}),
+                      inputs=("screening_result",), outputs=("processing_result",)),
+        ])
+        context = graph.run(_context(tmp_path))
+
+        assert context.status == "success"
+        assert context.screening_result is None
+        assert context.processing_result == {"r": 1}
+        assert graph.report.stages["screening"].status == "failed"
+        assert graph.report.stages["screening"].error == "screener crashed"
+
+    def test_fatal_exception_sets_error(self, tmp_path):
+        def crash(ctx):
+            raise RuntimeError("boom")
+
+        graph = ClaimStageGraph([StageNode("processing", crash)])
+        context = graph.run(_context(tmp_path))
+
+        assert context.status == "error"
+        assert context.error == "processing failed: boom"
+
+    def test_report_records_critical_path(self, tmp_path):
+        graph = ClaimStageGraph([
+            StageNode("facts", _setter("aggregated_facts", {}, delay=0.02),
+                      outputs=("aggregated_facts",)),
+            StageNode("slow", _setter("screening_result", {}, delay=0.08),
+                      inputs=("aggregated_facts",), outputs=("screening_result",)),
+            StageNode("fast", _setter("coverage_overrides", {}),
+                      inputs=("aggregated_facts",), outputs=("coverage_overrides",)),
+        ])
+        graph.run(_context(tmp_path))
+
+        report = graph.report.to_dict()
+        assert report["critical_path"] == ["facts", "slow"]
+        assert report["stages"]["slow"]["depends_on"] == ["facts"]
+        assert report["critical_path_ms"] >= 100
+        # Wall time tracks the critical path, not the sum of all stages
+        assert report["total_ms"] < report["critical_path_ms"] + 50
+
+
+class TestCriticalPath:
+    def test_longest_chain(self):
+        records = {
+            "a": StageRecord("a", duration_ms=10),
+            "b": StageRecord("b", depends_on=["a"], duration_ms=50),
+            "c": StageRecord("c", depends_on=["a"], duration_ms=5),
+            "d": StageRecord("d", depends_on=["b", "c"], duration_ms=10),
+        }
+        assert compute_critical_path(records) == (["a", "b", "d"], 70)
+
+    def test_empty(self):
+        assert compute_critical_path({}) == ([], 0)
@@ -0,0 +1,182 @@
+"""Tests for incremental claims index maintenance."""
+
+import json
+import os
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from context_builder.storage import FileStorage, build_all_indexes, index_builder
+from context_builder.storage.index_builder import (
+    build_claims_index,
+    reconcile_claims_index,
+    update_claim_indexes,
+    update_claim_summary,
+)
+from context_builder.storage.index_reader import (
+    CLAIMS_INDEX_FILE,
+    DOC_INDEX_FILE,
+    RUN_INDEX_FILE,
+    read_jsonl,
+)
+from context_builder.storage.sqlite_registry import SqliteIndexReader
+
+RUN_ID = "BATCH-20260101-001"
+
+
+def _write_claim(claims_dir, folder, doc_ids=("doc_a",), gate="pass"):
+    claim_dir = claims_dir / folder
+    for doc_id in doc_ids:
+        meta_dir = claim_dir / "docs" / doc_id / "meta"
+        meta_dir.mkdir(parents=True)
+        (meta_dir / "doc.json").write_text(json.dumps({"doc_id": doc_id, "doc_type": "invoice"}))
+        extraction_dir = claim_dir / "runs" / RUN_ID / "extraction"
+        extraction_dir.mkdir(parents=True, exist_ok=True)
+        (extraction_dir / f"{doc_id}.json").write_text(
+            json.dumps({"quality_gate": {"status": gate}})
+        )
+    return claim_dir
+
+
+def _label(claim_dir, doc_id):
+    labels_dir = claim_dir / "docs" / doc_id / "labels"
+    labels_dir.mkdir()
+    (labels_dir / "latest.json").write_text(json.dumps({"doc_id": doc_id}))
+
+
+def _records(output_dir):
+    return {r["folder_name"]: r for r in read_jsonl(output_dir / "registry" / CLAIMS_INDEX_FILE)}
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    claims_dir = tmp_path / "claims"
+    _write_claim(claims_dir, "claim_a")
+    _write_claim(claims_dir, "claim_b", doc_ids=("doc_b1", "doc_b2"), gate="fail")
+    _write_claim(claims_dir, "claim_c")
+    build_all_indexes(tmp_path)
+    return tmp_path
+
+
+class TestUpdateClaimSummary:
+    def test_splices_single_claim(self, output_dir):
+        claims_dir = output_dir / "claims"
+        _label(claims_dir / "claim_b", "doc_b1")
+
+        with patch.object(
+            index_builder, "build_claim_summary", wraps=index_builder.build_claim_summary
+        ) as build:
+            record = update_claim_summary(claims_dir / "claim_b", output_dir / "registry")
+
+        assert build.call_count == 1
+        assert record["status"] == "Reviewed"
+        records = _records(output_dir)
+        assert list(records) == ["claim_a", "claim_b", "claim_c"]
+        assert records["claim_b"] == record
+        assert list(records.values()) == build_claims_index(claims_dir, output_dir)
+
+    def test_deleted_claim_is_removed(self, output_dir):
+        storage = FileStorage(output_dir)
+
+        assert storage.delete_claim("claim_a")
+
+        assert list(_records(output_dir)) == ["claim_b", "claim_c"]
+
+    def test_no_claims_index_is_noop(self, tmp_path):
+        claim_dir = _write_claim(tmp_path / "claims", "claim_a")
+
+        assert update_claim_summary(claim_dir, tmp_path / "registry") is None
+        assert not (tmp_path / "registry" / CLAIMS_INDEX_FILE).exists()
+
+    def test_sqlite_backend(self, output_dir):
+        build_all_indexes(output_dir, backend="sqlite")
+        claims_dir = output_dir / "claims"
+        _label(claims_dir / "claim_c", "doc_a")
+        jsonl_before = _records(output_dir)
+
+        update_claim_summary(claims_dir / "claim_c", output_dir / "registry")
+
+        summaries = SqliteIndexReader(output_dir / "registry").get_all_claim_summaries()
+        assert [s["folder_name"] for s in summaries] == ["claim_a", "claim_b", "claim_c"]
+        assert summaries[2]["labeled_count"] == 1
+        assert _records(output_dir) == jsonl_before
+
+
+class TestReconcile:
+    def test_only_changed_claims_are_recomputed(self, output_dir):
+        claims_dir = output_dir / "claims"
+        _label(claims_dir / "claim_a", "doc_a")
+        _write_claim(claims_dir, "claim_d")
+        extraction = claims_dir / "claim_b" / "runs" / RUN_ID / "extraction" / "doc_b1.json"
+        extraction.write_text(json.dumps({"quality_gate": {"status": "pass"}}))
+        stat = extraction.stat()
+        os.utime(extraction, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        stats = reconcile_claims_index(claims_dir, output_dir / "registry")
+
+        assert stats == {"claims_checked": 4, "claims_updated": 3, "claims_removed": 0}
+        assert list(_records(output_dir).values()) == build_claims_index(claims_dir, output_dir)
+
+    def test_unchanged_tree_recomputes_nothing(self, output_dir):
+        stats = reconcile_claims_index(output_dir / "claims", output_dir / "registry")
+
+        assert stats["claims_updated"] == 0
+
+    def test_removed_folder_is_dropped(self, output_dir):
+        shutil.rmtree(output_dir / "claims" / "claim_c")
+
+        stats = reconcile_claims_index(output_dir / "claims", output_dir / "registry")
+
+        assert stats["claims_removed"] == 1
+        assert list(_records(output_dir)) == ["claim_a", "claim_b"]
+
+    def test_incremental_build_matches_full_build(self, output_dir):
+        claims_dir = output_dir / "claims"
+        _label(claims_dir / "claim_b", "doc_b2")
+
+        build_all_indexes(output_dir, incremental_claims=True)
+        incremental = _records(output_dir)
+        build_all_indexes(output_dir)
+
+        assert incremental == _records(output_dir)
+
+
+class TestUpdateClaimIndexes:
+    def test_only_processed_claims_and_run_are_indexed(self, output_dir):
+        claims_dir = output_dir / "claims"
+        _write_claim(claims_dir, "claim_d", doc_ids=("doc_d",))
+        _write_claim(claims_dir, "claim_e", doc_ids=("doc_e",))  # not processed
+        run_dir = output_dir / "runs" / RUN_ID
+        run_dir.mkdir(parents=True)
+        (run_dir / "manifest.json").write_text(json.dumps({"claims_count": 1}))
+        (run_dir / ".complete").touch()
+
+        with patch.object(
+            index_builder, "build_claim_summary", wraps=index_builder.build_claim_summary
+        ) as build:
+            stats = update_claim_indexes(output_dir, ["claim_d"], [RUN_ID])
+
+        assert build.call_count == 1
+        assert stats == {"mode": "claims", "claims_updated": 1, "runs_updated": 1}
+        assert list(_records(output_dir)) == ["claim_a", "claim_b", "claim_c", "claim_d"]
+        doc_ids = [r["doc_id"] for r in read_jsonl(output_dir / "registry" / DOC_INDEX_FILE)]
+        assert "doc_d" in doc_ids and "doc_e" not in doc_ids
+        runs = [r["run_id"] for r in read_jsonl(output_dir / "registry" / RUN_INDEX_FILE)]
+        assert runs == [RUN_ID]
+
+    def test_deleted_claim_and_run_are_dropped(self, output_dir):
+        shutil.rmtree(output_dir / "claims" / "claim_b")
+
+        update_claim_indexes(output_dir, ["claim_b"], ["run_gone"])
+
+        assert list(_records(output_dir)) == ["claim_a", "claim_c"]
+        doc_ids = [r["doc_id"] for r in read_jsonl(output_dir / "registry" / DOC_INDEX_FILE)]
+        assert doc_ids == ["doc_a", "doc_a"]
+
+    def test_sqlite_backend_falls_back_to_build(self, output_dir):
+        build_all_indexes(output_dir, backend="sqlite")
+
+        stats = update_claim_indexes(output_dir, ["claim_a"])
+
+        assert stats["mode"] == "full"
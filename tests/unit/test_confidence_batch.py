@@ -0,0 +1,139 @@
+"""Tests for batch CCI rescoring (confidence.batch)."""
+
+import json
+import random
+
+import pytest
+
+from context_builder.confidence.batch import BatchConfidenceScorer, SignalTable
+from context_builder.confidence.routing import DEFAULT_THRESHOLDS, ClaimRouter
+from context_builder.confidence.scorer import (
+    COMPONENT_SIGNALS,
+    ConfidenceScorer,
+)
+from context_builder.schemas.confidence import SignalSnapshot
+from context_builder.schemas.routing import RoutingTier
+from context_builder.storage.claim_run import ClaimRunStorage
+from context_builder.storage.dossier_index import clear_dossier_index_cache
+
+ALL_SIGNALS = [name for names in COMPONENT_SIGNALS.values() for name in names] + [
+    "coverage.line_item_complexity",
+    "coverage.zero_coverage_penalty",
+    "coverage.payout_materiality",
+]
+
+
+def _random_signals(rng):
+    return {
+        name: round(rng.random(), 4)
+        for name in ALL_SIGNALS
+        if rng.random() < 0.7
+    }
+
+
+def _thresholds(green, yellow):
+    return {**DEFAULT_THRESHOLDS, "cci_green_threshold": green, "cci_yellow_threshold": yellow}
+
+
+def _snapshots(signals):
+    return [
+        SignalSnapshot(
+            signal_name=name, normalized_value=value, source_stage=name.split(".")[0]
+        )
+        for name, value in signals.items()
+    ]
+
+
+class TestBatchScoring:
+    @pytest.mark.parametrize("weights", [None, {"document_quality": 0.5, "consistency": 0.5}])
+    def test_matches_per_claim_scorer(self, weights):
+        rng = random.Random(7)
+        table = SignalTable()
+        expected = []
+        for i in range(300):
+            signals = _random_signals(rng)
+            verdict = rng.choice(["APPROVE", "DENY", "REFER", ""])
+            table.add(f"CLM-{i}", "run", verdict, signals)
+            summary = ConfidenceScorer(weights=weights).compute(
+                _snapshots(signals), verdict=verdict
+            )
+            expected.append(
+                (summary.composite_score, {c.component: c.score for c in summary.component_scores})
+            )
+
+        scores = BatchConfidenceScorer(weights=weights).score(table)
+
+        for row, (composite, components) in enumerate(expected):
+            assert scores.composite_scores[row] == composite
+            assert scores.confidence_index(row)["components"] == components
+
+    def test_routing_uses_thresholds(self):
+        table = SignalTable()
+        table.add("A", "run", "APPROVE", {"coverage.structural_match_quality": 0.6})
+        table.add("B", "run", "REFER", {"coverage.structural_match_quality": 1.0})
+
+        strict = BatchConfidenceScorer(thresholds=_thresholds(0.99, 0.9))
+        lenient = BatchConfidenceScorer(thresholds=_thresholds(0.1, 0.05))
+
+        assert strict.rescore(table).tiers == [RoutingTier.RED, RoutingTier.RED]
+        assert lenient.rescore(table).tiers == [RoutingTier.GREEN, RoutingTier.RED]
+
+    def test_empty_table(self):
+        result = BatchConfidenceScorer().rescore(SignalTable())
+
+        assert result.tier_counts() == {"GREEN": 0, "YELLOW": 0, "RED": 0}
+        assert result.claims_per_second == 0.0
+
+
+@pytest.fixture
+def claims_dir(tmp_path):
+    """One APPROVE claim that the stage routed RED (verdict overridden)."""
+    clear_dossier_index_cache()
+    claim_folder = tmp_path / "claims" / "CLM-001"
+    claim_folder.mkdir(parents=True)
+    storage = ClaimRunStorage(claim_folder)
+    run_id = "clm_20260101_000000_abcdef"
+    signals = {"coverage.structural_match_quality": 0.6, "screening.pass_rate": 0.6}
+    storage.write_to_claim_run(run_id, "confidence_summary.json", {
+        "claim_id": "CLM-001",
+        "signals_collected": [s.model_dump() for s in _snapshots(signals)],
+    })
+    routing = ClaimRouter().evaluate(
+        claim_id="CLM-001", claim_run_id=run_id, verdict="APPROVE",
+        confidence_summary={"composite_score": 0.5},
+    )
+    storage.write_to_claim_run(run_id, "routing_decision.json", routing.model_dump(mode="json"))
+    storage.write_dossier(run_id, {
+        "version": 1,
+        "claim_verdict": "REFER",
+        "verdict_reason": "Routed to REFER: CCI 0.500.",
+        "routing": {"routing_tier": "RED", "original_verdict_reason": "All clauses passed"},
+    })
+    return tmp_path / "claims"
+
+
+class TestRescoreWrite:
+    def test_load_reads_persisted_signals(self, claims_dir):
+        table = SignalTable.load(claims_dir)
+
+        assert table.claim_ids == ["CLM-001"]
+        assert table.verdicts == ["APPROVE"]
+        assert table.columns["screening.pass_rate"] == [0.6]
+
+    def test_write_updates_routing_and_restores_verdict(self, claims_dir):
+        table = SignalTable.load(claims_dir)
+        scorer = BatchConfidenceScorer(thresholds=_thresholds(0.5, 0.4))
+
+        result = scorer.rescore(table, write=True)
+
+        assert result.written == 1
+        assert result.changed == 1
+        run_dir = claims_dir / "CLM-001" / "claim_runs" / table.claim_run_ids[0]
+        routing = json.loads((run_dir / "routing_decision.json").read_text())
+        assert routing["routing_tier"] == "GREEN"
+        assert routing["routed_verdict"] is None
+        assert {t["trigger_id"] for t in routing["all_triggers"]} >= {"RT-1", "RT-5"}
+        dossier = json.loads((run_dir / "decision_dossier_v1.json").read_text())
+        assert dossier["claim_verdict"] == "APPROVE"
+        assert dossier["verdict_reason"] == "All clauses passed"
+        assert dossier["confidence_index"]["composite_score"] == result.scores.composite_scores[0]
@@ -0,0 +1,106 @@
+"""Tests for content-addressed workspace config snapshots."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from context_builder.storage import config_snapshots
+from context_builder.storage.config_snapshots import (
+    ConfigSnapshotStore,
+    clear_config_digest_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_config_digest_cache()
+    yield
+    clear_config_digest_cache()
+
+
+def _age(path, seconds=60):
+    """Backdate a file out of the racy-mtime window."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    config_dir = tmp_path / "workspace" / "config"
+    (config_dir / "prompts").mkdir(parents=True)
+    (config_dir / "prompts" / "a.md").write_text("prompt a")
+    (config_dir / "prompts" / "b.md").write_text("prompt a")  # duplicate content
+    (config_dir / "tenant.yaml").write_text("tenant_id: test")
+    for path in config_dir.rglob("*"):
+        if path.is_file():
+            _age(path)
+    return config_dir
+
+
+class TestSnapshots:
+    def test_identical_config_shares_one_snapshot(self, config_dir):
+        store = ConfigSnapshotStore(config_dir)
+
+        first = store.snapshot()
+        second = store.snapshot()
+
+        assert first == second == store.compute_id()
+        assert len(list(store.trees_dir.iterdir())) == 1
+        # Two unique contents across three files
+        assert len([p for p in store.objects_dir.rglob("*") if p.is_file()]) == 2
+
+    def test_change_adds_only_new_blob(self, config_dir):
+        store = ConfigSnapshotStore(config_dir)
+        first = store.snapshot()
+
+        (config_dir / "tenant.yaml").write_text("tenant_id: other")
+        second = store.snapshot()
+
+        assert second != first
+        assert len(list(store.trees_dir.iterdir())) == 2
+        assert len([p for p in store.objects_dir.rglob("*") if p.is_file()]) == 3
+        assert store.read_file(first, "tenant.yaml") == b"tenant_id: test"
+        assert store.read_file(second, "tenant.yaml") == b"tenant_id: other"
+
+    def test_restore(self, config_dir, tmp_path):
+        store = ConfigSnapshotStore(config_dir)
+        snapshot_id = store.snapshot()
+
+        assert store.restore(snapshot_id, tmp_path / "restored")
+        assert (tmp_path / "restored" / "prompts" / "b.md").read_text() == "prompt a"
+        assert not store.restore("unknown", tmp_path / "nothing")
+
+    def test_empty_config(self, tmp_path):
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+
+        assert ConfigSnapshotStore(config_dir).snapshot() is None
+
+
+class TestIncrementalHashing:
+    def test_unchanged_files_are_not_read(self, config_dir):
+        ConfigSnapshotStore(config_dir).compute_id()
+
+        with patch.object(
+            config_snapshots, "_hash_file", wraps=config_snapshots._hash_file
+        ) as hash_file:
+            ConfigSnapshotStore(config_dir).compute_id()
+            clear_config_digest_cache()  # Persisted cache serves other processes
+            ConfigSnapshotStore(config_dir).compute_id()
+
+        assert hash_file.call_count == 0
+
+    def test_modified_file_is_rehashed(self, config_dir):
+        store = ConfigSnapshotStore(config_dir)
+        before = store.compute_id()
+        target = config_dir / "prompts" / "a.md"
+
+        target.write_text("prompt A")  # Same size, fresh mtime
+        with patch.object(
+            config_snapshots, "_hash_file", wraps=config_snapshots._hash_file
+        ) as hash_file:
+            after = store.compute_id()
+
+        assert after != before
+        assert [c.args[0].name for c in hash_file.call_args_list] == ["a.md"]
@@ -9,10 +9,15 @@ import yaml
 
 from context_builder.coverage.analyzer import (
     AnalyzerConfig,
+    AnalyzerSetup,
     ComponentConfig,
     CoverageAnalyzer,
+    RepairContext,
     _normalize_coverage_scale,
+    clear_analyzer_setup_cache,
+    get_analyzer_setup,
 )
+from context_builder.coverage.incremental import diff_line_items, line_item_fingerprint
 from context_builder.coverage.keyword_matcher import KeywordConfig, KeywordMatcher
 from context_builder.coverage.llm_matcher import LLMMatcherConfig
 from context_builder.coverage.post_processing import (
@@ -20,6 +25,7 @@ from context_builder.coverage.post_processing import (
     demote_labor_for_excluded_parts,
     demote_orphan_labor,
     flag_nominal_price_labor,
+    prelink_labor,
     validate_llm_coverage_decision,
 )
 from context_builder.coverage.rule_engine import RuleConfig, RuleEngine
@@ -29,10 +35,11 @@ from context_builder.coverage.schemas import (
     MatchMethod,
     PrimaryRepairResult,
     TraceAction,
+    TraceStep,
 )
 from context_builder.coverage.trace import TraceBuilder
 
-from coverage_test_helpers import make_line_item
+from coverage_test_helpers import make_line_item, make_uncovered_labor
 
 _WORKSPACE_COVERAGE_DIR = (
     Path(__file__).resolve().parents[2]
@@ -3209,3 +3216,471 @@ class TestDemoteOrphanLaborAncillaryOnly:
         )
         result = demote_orphan_labor(items, primary_repair=primary)
         assert result[1].coverage_status == CoverageStatus.COVERED
+
+
+class TestAnalyzerSetupCache:
+    """Tests for the shared, config-hash-versioned AnalyzerSetup."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        clear_analyzer_setup_cache()
+        yield
+        clear_analyzer_setup_cache()
+
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        coverage_dir = tmp_path / "config" / "coverage"
+        coverage_dir.mkdir(parents=True)
+        path = coverage_dir / "test_coverage_config.yaml"
+        path.write_text(yaml.safe_dump({
+            "analyzer": {"keyword_min_confidence": 0.75},
+            "rules": {"exclusion_patterns": ["ENTSORGUNG"]},
+        }), encoding="utf-8")
+        (coverage_dir / "test_keyword_mappings.yaml").write_text(yaml.safe_dump({
+            "mappings": [{"category": "engine", "keywords": ["MOTOR"]}],
+        }), encoding="utf-8")
+        return path
+
+    def test_setup_built_once_per_config_hash(self, config_path, tmp_path):
+        first = get_analyzer_setup(config_path, tmp_path)
+        second = get_analyzer_setup(config_path, tmp_path)
+        assert first is second
+        assert first.config.keyword_min_confidence == 0.75
+
+    def test_setup_rebuilt_when_config_changes(self, config_path, tmp_path):
+        first = get_analyzer_setup(config_path, tmp_path)
+        config_path.write_text(yaml.safe_dump({
+            "analyzer": {"keyword_min_confidence": 0.9},
+        }), encoding="utf-8")
+        second = get_analyzer_setup(config_path, tmp_path)
+        assert second is not first
+        assert second.config_hash != first.config_hash
+        assert second.config.keyword_min_confidence == 0.9
+
+    def test_setup_rebuilt_when_sibling_changes(self, config_path, tmp_path):
+        first = get_analyzer_setup(config_path, tmp_path)
+        sibling = config_path.parent / "test_keyword_mappings.yaml"
+        sibling.write_text(yaml.safe_dump({
+            "mappings": [{"category": "chassis", "keywords": ["FEDER"]}],
+        }), encoding="utf-8")
+        assert get_analyzer_setup(config_path, tmp_path) is not first
+
+    def test_analyzers_share_setup_but_not_llm_state(self, config_path, tmp_path):
+        a = CoverageAnalyzer.for_workspace(config_path, tmp_path)
+        b = CoverageAnalyzer.for_workspace(config_path, tmp_path)
+        assert a is not b
+        assert a.rule_engine is b.rule_engine
+        assert a.keyword_matcher is b.keyword_matcher
+        assert a.part_lookup is b.part_lookup
+        assert a.llm_matcher is not b.llm_matcher
+        a.llm_matcher._llm_calls = 5
+        assert b.llm_matcher.get_llm_call_count() == 0
+
+    def test_analyzer_records_config_hash(self, config_path, tmp_path):
+        setup = get_analyzer_setup(config_path, tmp_path)
+        analyzer = setup.create_analyzer()
+        result = analyzer.analyze(
+            claim_id="C1",
+            line_items=[{"description": "ENTSORGUNG", "item_type": "parts", "total_price": 10.0}],
+            covered_components={"engine": ["Motor"]},
+        )
+        assert result.metadata.config_hash == setup.config_hash
+
+    def test_missing_config_uses_defaults(self, tmp_path):
+        setup = AnalyzerSetup.from_config_path(tmp_path / "missing.yaml", tmp_path)
+        assert setup.config == AnalyzerConfig()
+        assert setup.rule_engine.config.exclusion_patterns == []
+
+    def test_from_config_path_matches_setup(self, config_path, tmp_path):
+        analyzer = CoverageAnalyzer.from_config_path(config_path, tmp_path)
+        assert analyzer.config.keyword_min_confidence == 0.75
+        assert analyzer.config_hash == get_analyzer_setup(config_path, tmp_path).config_hash
+
+    def test_llm_client_shared_across_analyzers(self, config_path, tmp_path, monkeypatch):
+        from context_builder.services import llm_audit
+
+        created = []
+
+        def fake_create(*args, **kwargs):
+            base = MagicMock()
+            created.append(base)
+            return base
+
+        monkeypatch.setattr(llm_audit, "create_audited_client", fake_create)
+        setup = get_analyzer_setup(config_path, tmp_path)
+        c1 = setup.create_analyzer().llm_matcher._get_client()
+        c2 = setup.create_analyzer().llm_matcher._get_client()
+        assert len(created) == 1
+        assert c1 is not c2
+        assert c1.client is c2.client
+
+
+class TestPrelinkLabor:
+    """Tests for the deterministic labor pre-linker."""
+
+    def test_links_labor_by_part_number(self):
+        items = [
+            make_line_item(item_code="11-42-8507", description="Oelkuehler"),
+            make_uncovered_labor(description="Ersetzen 11428507"),
+        ]
+        prelink_labor(items)
+        assert items[1].coverage_status == CoverageStatus.COVERED
+        assert items[1].decision_trace[-1].detail["strategy"] == "part_number_in_description"
+
+    def test_links_adjacent_labor_sharing_a_term(self):
+        items = [
+            make_line_item(item_code=None, description="Steuerkette",
+                           matched_component="timing_chain"),
+            make_uncovered_labor(description="Aus-/Einbau Steuerkette", total_price=300.0),
+        ]
+        prelink_labor(items)
+        labor = items[1]
+        assert labor.coverage_status == CoverageStatus.COVERED
+        assert labor.matched_component == "timing_chain"
+        assert labor.covered_amount == 300.0
+        assert labor.decision_trace[-1].detail["linked_part_index"] == 0
+
+    def test_adjacent_labor_without_shared_term_left_for_llm(self):
+        items = [
+            make_line_item(item_code=None, description="Steuerkette"),
+            make_uncovered_labor(description="Fehlerspeicher auslesen"),
+        ]
+        prelink_labor(items)
+        assert items[1].coverage_status == CoverageStatus.NOT_COVERED
+
+    def test_non_adjacent_labor_not_linked(self):
+        items = [
+            make_line_item(item_code=None, description="Steuerkette"),
+            make_line_item(item_code=None, description="Schraube",
+                           coverage_status=CoverageStatus.NOT_COVERED),
+            make_uncovered_labor(description="Aus-/Einbau Steuerkette"),
+        ]
+        prelink_labor(items)
+        assert items[2].coverage_status == CoverageStatus.NOT_COVERED
+
+    def test_adjacent_uncovered_part_not_linked(self):
+        items = [
+            make_line_item(item_code=None, description="Steuerkette",
+                           coverage_status=CoverageStatus.NOT_COVERED),
+            make_uncovered_labor(description="Aus-/Einbau Steuerkette"),
+        ]
+        prelink_labor(items)
+        assert items[1].coverage_status == CoverageStatus.NOT_COVERED
+
+
+class TestCombinedPostProcessing:
+    """Tests for the combined primary repair + labor linkage LLM pass."""
+
+    @pytest.fixture
+    def analyzer(self):
+        return CoverageAnalyzer(
+            config=AnalyzerConfig(
+                use_llm_primary_repair=True,
+                use_combined_post_processing=True,
+            ),
+        )
+
+    @pytest.fixture
+    def items(self):
+        return [
+            make_line_item(item_code=None, description="Wasserpumpe",
+                           coverage_category="cooling_system",
+                           matched_component="water_pump", total_price=400.0),
+            make_line_item(item_code=None, description="Dichtring",
+                           coverage_status=CoverageStatus.NOT_COVERED,
+                           total_price=5.0),
+            make_uncovered_labor(description="Kuehlmittel ablassen/einfuellen",
+                                 total_price=120.0),
+            make_uncovered_labor(description="Fehlersuche", total_price=90.0),
+        ]
+
+    def _run(self, analyzer, items):
+        return analyzer._run_combined_post_processing(
+            items, {"cooling_system": ["Wasserpumpe"]}, None, "C-1",
+        )
+
+    def test_single_call_sets_primary_and_links_labor(self, analyzer, items):
+        mock_llm = MagicMock()
+        mock_llm.classify_post_processing.return_value = {
+            "primary_repair": {
+                "primary_item_index": 0, "component": "water_pump",
+                "category": "cooling_system", "confidence": 0.9,
+                "reasoning": "pump leak",
+            },
+            "labor_items": [
+                {"index": 2, "is_covered": True, "linked_part_index": 0,
+                 "confidence": 0.85, "reasoning": "coolant drain for pump"},
+                {"index": 3, "is_covered": False, "linked_part_index": None,
+                 "confidence": 0.9, "reasoning": "diagnostics"},
+            ],
+        }
+        analyzer.llm_matcher = mock_llm
+
+        primary, result = self._run(analyzer, items)
+
+        mock_llm.classify_post_processing.assert_called_once()
+        mock_llm.determine_primary_repair.assert_not_called()
+        mock_llm.classify_labor_linkage.assert_not_called()
+        assert primary.determination_method == "llm"
+        assert primary.component == "water_pump"
+        assert primary.is_covered is True
+        assert result[2].coverage_status == CoverageStatus.COVERED
+        assert result[2].decision_trace[-1].detail["strategy"] == "combined_post_processing"
+        assert result[3].coverage_status == CoverageStatus.NOT_COVERED
+
+    def test_prelinked_labor_not_sent_to_llm(self, analyzer):
+        items = [
+            make_line_item(item_code=None, description="Wasserpumpe"),
+            make_uncovered_labor(description="Wasserpumpe ersetzen"),
+            make_uncovered_labor(description="Fehlersuche"),
+        ]
+        mock_llm = MagicMock()
+        mock_llm.classify_post_processing.return_value = {
+            "primary_repair": {"primary_item_index": 0},
+            "labor_items": [],
+        }
+        analyzer.llm_matcher = mock_llm
+
+        self._run(analyzer, items)
+
+        labor_payload = mock_llm.classify_post_processing.call_args.kwargs["labor_items"]
+        assert [entry["index"] for entry in labor_payload] == [2]
+
+    def test_invalid_primary_falls_back_to_deterministic_without_extra_call(
+        self, analyzer, items,
+    ):
+        mock_llm = MagicMock()
+        mock_llm.classify_post_processing.return_value = {
+            "primary_repair": None,
+            "labor_items": [],
+        }
+        analyzer.llm_matcher = mock_llm
+
+        primary, _ = self._run(analyzer, items)
+
+        assert primary.determination_method == "deterministic"
+        mock_llm.determine_primary_repair.assert_not_called()
+
+    def test_failed_combined_call_returns_none(self, analyzer, items):
+        mock_llm = MagicMock()
+        mock_llm.classify_post_processing.return_value = None
+        analyzer.llm_matcher = mock_llm
+        assert self._run(analyzer, items) is None
+
+    def test_fallback_matches_flag_off_output(self):
+        def run(combined):
+            items = [
+                make_line_item(item_code=None, description="Wasserpumpe"),
+                make_uncovered_labor(description="Wasserpumpe ersetzen"),
+                make_uncovered_labor(description="Fehlersuche"),
+            ]
+            mock_llm = MagicMock()
+            mock_llm.classify_post_processing.side_effect = RuntimeError("boom")
+            mock_llm.determine_primary_repair.return_value = None
+            mock_llm.classify_labor_linkage.return_value = []
+            analyzer = CoverageAnalyzer(
+                config=AnalyzerConfig(
+                    use_llm_primary_repair=True,
+                    use_combined_post_processing=combined,
+                ),
+                llm_matcher=mock_llm,
+            )
+            primary, result = analyzer._post_process(
+                items, {"cooling_system": ["Wasserpumpe"]}, {}, RepairContext(), "C-3",
+            )
+            return primary, [(i.coverage_status, i.match_reasoning) for i in result]
+
+        assert run(combined=True) == run(combined=False)
+
+    def test_analyze_falls_back_to_separate_calls(self):
+        mock_llm = MagicMock()
+        mock_llm.classify_items.return_value = []
+        mock_llm.classify_post_processing.side_effect = RuntimeError("boom")
+        mock_llm.determine_primary_repair.return_value = None
+        mock_llm.get_llm_call_count.return_value = 0
+        analyzer = CoverageAnalyzer(
+            config=AnalyzerConfig(use_combined_post_processing=True),
+            llm_matcher=mock_llm,
+        )
+        analyzer.analyze(
+            claim_id="C-2",
+            line_items=[{"description": "Fee", "item_type": "fee", "total_price": 10.0}],
+            covered_components={"engine": ["Motor"]},
+        )
+        mock_llm.classify_post_processing.assert_called_once()
+        mock_llm.determine_primary_repair.assert_called_once()
+
+    def test_parse_combined_response(self):
+        from context_builder.coverage.llm_matcher import LLMMatcher
+
+        matcher = LLMMatcher()
+        all_items = [{"index": 0}, {"index": 1}]
+        labor_items = [{"index": 1}]
+        parsed = matcher._parse_post_processing_response(
+            '{"primary_repair": {"primary_item_index": 0, "component": "pump"},'
+            ' "labor_items": [{"index": 1, "is_covered": true, "linked_part_index": 0}]}',
+            all_items, labor_items,
+        )
+        assert parsed["primary_repair"]["component"] == "pump"
+        assert parsed["labor_items"][0]["is_covered"] is True
+        assert matcher._parse_post_processing_response("not json", all_items, labor_items) is None
+        assert matcher._parse_post_processing_response('{"labor_items": []}', all_items, labor_items) is None
+
+
+class RecordingLLMMatcher(FakeLLMMatcher):
+    """FakeLLMMatcher that records which items were sent for classification."""
+
+    def __init__(self, keyword_matcher: KeywordMatcher):
+        super().__init__(keyword_matcher)
+        self.classified: List[str] = []
+
+    def classify_items(self, items, *args, **kwargs):
+        self.classified.extend(item.get("description", "") for item in items)
+        return super().classify_items(items, *args, **kwargs)
+
+
+class TestIncrementalAnalysis:
+    """Tests for CoverageAnalyzer.analyze_incremental()."""
+
+    @pytest.fixture
+    def analyzer(self):
+        kw_matcher = KeywordMatcher(KeywordConfig.from_dict({}))
+        analyzer = CoverageAnalyzer(
+            config=AnalyzerConfig(use_llm_fallback=True),
+            rule_engine=RuleEngine(RuleConfig.default()),
+            keyword_matcher=kw_matcher,
+        )
+        analyzer.llm_matcher = RecordingLLMMatcher(kw_matcher)
+        return analyzer
+
+    @pytest.fixture
+    def line_items(self):
+        return [
+            {"description": "HANDLING FEE", "item_type": "fee", "total_price": 50.0},
+            {"description": "WASSERPUMPE", "item_type": "parts", "total_price": 400.0},
+            {"description": "THERMOSTAT", "item_type": "parts", "total_price": 120.0},
+            {"description": "DICHTRING", "item_type": "parts", "total_price": 5.0},
+        ]
+
+    @pytest.fixture
+    def covered(self):
+        return {"cooling_system": ["Wasserpumpe", "Thermostat"]}
+
+    def _previous(self, analyzer, line_items, covered):
+        previous = analyzer.analyze("C-1", [dict(i) for i in line_items],
+                                    covered_components=dict(covered))
+        analyzer.llm_matcher.classified.clear()
+        return previous
+
+    def test_analyze_records_item_fingerprints(self, analyzer, line_items, covered):
+        result = analyzer.analyze("C-1", line_items, covered_components=covered)
+
+        fingerprints = result.metadata.item_fingerprints
+        assert len(fingerprints) == len(result.line_items)
+        assert result.metadata.inputs_fingerprint
+        by_description = dict(zip(
+            (i.description for i in result.line_items), fingerprints
+        ))
+        assert by_description["THERMOSTAT"] == line_item_fingerprint(line_items[2])
+
+    def test_unchanged_items_skip_classification(self, analyzer, line_items, covered):
+        previous = self._previous(analyzer, line_items, covered)
+
+        result = analyzer.analyze_incremental(
+            previous, "C-1", [dict(i) for i in line_items],
+            covered_components=dict(covered), excess_percent=10.0,
+        )
+
+        assert analyzer.llm_matcher.classified == []
+        assert result.metadata.items_reused == len(line_items)
+        assert [i.coverage_status for i in result.line_items] == [
+            i.coverage_status for i in previous.line_items
+        ]
+        assert result.inputs.excess_percent == 10.0
+
+    def test_only_changed_item_is_classified(self, analyzer, line_items, covered):
+        previous = self._previous(analyzer, line_items, covered)
+        edited = [dict(i) for i in line_items]
+        edited[2]["total_price"] = 135.0
+
+        result = analyzer.analyze_incremental(
+            previous, "C-1", edited, covered_components=dict(covered),
+        )
+
+        assert analyzer.llm_matcher.classified == ["THERMOSTAT"]
+        assert result.metadata.items_reused == 3
+        assert len(result.line_items) == 4
+        thermostat = next(i for i in result.line_items if i.description == "THERMOSTAT")
+        assert thermostat.total_price == 135.0
+        # Order matches a full analysis: rule results first, then LLM by input position
+        assert [i.description for i in result.line_items] == [
+            i.description for i in previous.line_items
+        ]
+
+    def test_removed_item_dropped_without_classification(self, analyzer, line_items, covered):
+        previous = self._previous(analyzer, line_items, covered)
+
+        result = analyzer.analyze_incremental(
+            previous, "C-1", [dict(i) for i in line_items[:3]],
+            covered_components=dict(covered),
+        )
+
+        assert analyzer.llm_matcher.classified == []
+        assert [i.description for i in result.line_items] == [
+            "HANDLING FEE", "WASSERPUMPE", "THERMOSTAT",
+        ]
+        assert len(result.metadata.item_fingerprints) == 3
+
+    def test_policy_change_triggers_full_analysis(self, analyzer, line_items, covered):
+        previous = self._previous(analyzer, line_items, covered)
+
+        result = analyzer.analyze_incremental(
+            previous, "C-1", [dict(i) for i in line_items],
+            covered_components={"cooling_system": ["Wasserpumpe"]},
+        )
+
+        assert len(analyzer.llm_matcher.classified) == 3
+        assert result.metadata.items_reused == 0
+
+    def test_previous_without_fingerprints_triggers_full_analysis(
+        self, analyzer, line_items, covered,
+    ):
+        previous = self._previous(analyzer, line_items, covered)
+        previous.metadata.item_fingerprints = None
+
+        analyzer.analyze_incremental(
+            previous, "C-1", [dict(i) for i in line_items],
+            covered_components=dict(covered),
+        )
+
+        assert len(analyzer.llm_matcher.classified) == 3
+
+    def test_post_processed_item_is_reclassified(self, analyzer, line_items, covered):
+        previous = self._previous(analyzer, line_items, covered)
+        item = next(i for i in previous.line_items if i.description == "WASSERPUMPE")
+        item.decision_trace.append(TraceStep(
+            stage="labor_demotion", action=TraceAction.DEMOTED,
+            verdict=CoverageStatus.NOT_COVERED, reasoning="test",
+        ))
+
+        analyzer.analyze_incremental(
+            previous, "C-1", [dict(i) for i in line_items[:3]],
+            covered_components=dict(covered),
+        )
+
+        assert analyzer.llm_matcher.classified == ["WASSERPUMPE"]
+
+    def test_diff_matches_duplicate_fingerprints_one_to_one(self, analyzer, covered):
+        items = [
+            {"description": "AW ARBEIT", "item_type": "labor", "total_price": 80.0},
+            {"description": "AW ARBEIT", "item_type": "labor", "total_price": 80.0},
+        ]
+        previous = self._previous(analyzer, items, covered)
+
+        diff = diff_line_items(
+            previous, [line_item_fingerprint(i) for i in items + items[:1]]
+        )
+
+        assert sorted(diff.reused) == [0, 1]
+        assert diff.changed == [2]
+        assert diff.removed == 0
@@ -563,3 +563,114 @@ class TestMatchesExclusionPattern:
         upper = nsa_engine.matches_exclusion_pattern("ADBLUE_VALVE")
         assert lower is not None
         assert upper is not None
+
+
+def _synthetic_rule_config(n_generated: int = 0) -> RuleConfig:
+    """Rule config exercising every rule, plus optional filler patterns."""
+    filler = [rf"\bFILLER{i:04d}\b" for i in range(n_generated)]
+    return RuleConfig(
+        fee_item_types=["fee", "Gebuehr"],
+        exclusion_patterns=filler + [
+            r"ENTSORGUNG", r"MIETWAGEN", r"REINIGUNG", r"ADBLUE",
+        ],
+        consumable_patterns=[r"\bOEL\b", r"FILTER", r"KUEHLMITTEL"],
+        non_covered_labor_patterns=[r"DIAGNOSE", r"FEHLERSUCHE", r"(\w+) \1"],
+        component_override_patterns=[r"PUMPE", r"KUEHLER"],
+        generic_description_patterns=["DIVERSES", "ARBEIT", r"TEIL\s*\d*", "MATERIAL"],
+    )
+
+
+def _synthetic_items(count: int):
+    descriptions = [
+        "ENTSORGUNG ALTOEL", "OEL 5W30", "OELFILTER", "KUEHLMITTELPUMPE",
+        "KUEHLMITTEL G13", "DIAGNOSE MOTOR", "FEHLERSUCHE ELEKTRIK",
+        "DIVERSES", "teil 12", "Material", "WASSERPUMPE", "ZAHNRIEMEN",
+        "REINIGUNG ADBLUE TANK", "PRUEFEN PRUEFEN", "FILLER0007 SATZ", "  ARBEIT  ",
+    ]
+    types = ["parts", "labor", "fee", "Parts", "LABOR", "gebuehr", ""]
+    prices = [0.0, 12.5, 150.0]
+    return [
+        {
+            "description": descriptions[i % len(descriptions)],
+            "item_type": types[(i // len(descriptions)) % len(types)],
+            "item_code": f"C{i}",
+            "total_price": prices[i % len(prices)],
+        }
+        for i in range(count)
+    ]
+
+
+class TestColumnarEvaluation:
+    """Columnar batch_match must match per-item evaluation exactly."""
+
+    @pytest.mark.parametrize("skip_consumable", [False, True])
+    def test_columnar_equivalent_to_per_item(self, skip_consumable):
+        config = _synthetic_rule_config(n_generated=50)
+        items = _synthetic_items(16 * 7 * 3)
+
+        expected = RuleEngine(config, columnar=False).batch_match(
+            items, skip_consumable_check=skip_consumable,
+            repair_context_component="water_pump",
+        )
+        actual = RuleEngine(config, columnar=True).batch_match(
+            items, skip_consumable_check=skip_consumable,
+            repair_context_component="water_pump",
+        )
+
+        assert [r.model_dump() for r in actual[0]] == [r.model_dump() for r in expected[0]]
+        assert actual[1] == expected[1]
+
+    def test_first_pattern_in_config_order_wins(self):
+        """A later pattern matching earlier in the text must not win."""
+        engine = RuleEngine(RuleConfig(
+            fee_item_types=["fee"],
+            exclusion_patterns=[r"TANK", r"ADBLUE"],
+            consumable_patterns=[],
+            non_covered_labor_patterns=[],
+            component_override_patterns=[],
+            generic_description_patterns=[],
+        ))
+
+        matched, _ = engine.batch_match([
+            {"description": "ADBLUE TANK", "item_type": "parts", "total_price": 10.0},
+        ])
+
+        assert matched[0].decision_trace[0].detail["pattern"] == "TANK"
+        assert engine.matches_exclusion_pattern("ADBLUE TANK") == "TANK"
+
+    def test_backreference_pattern_falls_back_to_individual_search(self):
+        engine = RuleEngine(_synthetic_rule_config())
+
+        result = engine.check_non_covered_labor("PRUEFEN PRUEFEN")
+
+        assert result is not None
+        assert r"\1" in result.match_reasoning
+
+    def test_literal_generic_descriptions_use_exact_lookup(self):
+        engine = RuleEngine(_synthetic_rule_config())
+
+        assert engine.match("material", "parts", total_price=5.0) is not None
+        assert engine.match("MATERIALSATZ", "parts", total_price=5.0) is None
+        assert engine.match("Teil 7", "parts", total_price=5.0) is not None
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_columnar_benchmark_large_rule_set():
+    """Benchmark: columnar evaluation vs per-pattern loop (pytest -m performance)."""
+    import time
+
+    config = _synthetic_rule_config(n_generated=2000)
+    items = _synthetic_items(2000)
+    timings = {}
+    for columnar in (False, True):
+        engine = RuleEngine(config, columnar=columnar)
+        start = time.perf_counter()
+        engine.batch_match(items)
+        timings[columnar] = time.perf_counter() - start
+
+    print(
+        f"\nper-item: {timings[False]:.3f}s, columnar: {timings[True]:.3f}s "
+        f"({timings[False] / timings[True]:.1f}x)"
+    )
+    assert timings[True] < timings[False]
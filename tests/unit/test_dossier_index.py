@@ -0,0 +1,193 @@
+"""Tests for the per-claim dossier index and warm re-evaluation sessions."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from context_builder.api.services.decision_dossier import (
+    DecisionDossierService,
+    ReevaluationSession,
+    clear_reevaluation_sessions,
+)
+from context_builder.storage.claim_run import ClaimRunStorage, resolve_claim_folder
+from context_builder.storage.dossier_index import (
+    DOSSIER_INDEX_FILE,
+    DossierIndex,
+    clear_dossier_index_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    clear_dossier_index_cache()
+    clear_reevaluation_sessions()
+    yield
+    clear_dossier_index_cache()
+    clear_reevaluation_sessions()
+
+
+def _dossier(version, verdict="APPROVE", **extra):
+    return {
+        "claim_id": "CLM-001",
+        "version": version,
+        "claim_verdict": verdict,
+        "engine_id": "test",
+        "failed_clauses": [],
+        "unresolved_assumptions": [],
+        **extra,
+    }
+
+
+@pytest.fixture
+def claim_folder(tmp_path):
+    run_dir = tmp_path / "claims" / "CLM-001" / "claim_runs" / "run-001"
+    run_dir.mkdir(parents=True)
+    (run_dir / "claim_facts.json").write_text(json.dumps({"facts": [{"name": "a"}]}))
+    return tmp_path / "claims" / "CLM-001"
+
+
+class TestDossierIndex:
+    def test_write_dossier_records_summary(self, claim_folder):
+        storage = ClaimRunStorage(claim_folder)
+        storage.write_dossier("run-001", _dossier(1, "REFER", failed_clauses=["x"]))
+
+        [summary] = json.loads((claim_folder / DOSSIER_INDEX_FILE).read_text())[
+            "runs"]["run-001"]["versions"]
+
+        assert summary["filename"] == "decision_dossier_v1.json"
+        assert summary["claim_verdict"] == "REFER"
+        assert summary["failed_clauses_count"] == 1
+
+    def test_versions_are_ordered_numerically(self, claim_folder):
+        storage = ClaimRunStorage(claim_folder)
+        for version in (2, 10, 9):
+            storage.write_dossier("run-001", _dossier(version))
+
+        index = DossierIndex(claim_folder)
+
+        assert [v["version"] for v in index.versions("run-001")] == [2, 9, 10]
+        assert index.next_version("run-001") == 11
+
+    def test_reads_do_not_open_dossiers(self, claim_folder):
+        ClaimRunStorage(claim_folder).write_dossier("run-001", _dossier(1))
+        clear_dossier_index_cache()
+
+        with patch(
+            "context_builder.storage.dossier_index.DossierIndex._scan_run",
+            side_effect=AssertionError("scanned"),
+        ):
+            latest = DossierIndex(claim_folder).latest("run-001")
+
+        assert latest["version"] == 1
+
+    def test_unindexed_dossier_triggers_rescan(self, claim_folder):
+        ClaimRunStorage(claim_folder).write_dossier("run-001", _dossier(1))
+        run_dir = claim_folder / "claim_runs" / "run-001"
+        (run_dir / "decision_dossier_v2.json").write_text(json.dumps(_dossier(2, "DENY")))
+        # Make sure the directory mtime differs from the indexed one
+        stat = run_dir.stat()
+        os.utime(run_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        latest = DossierIndex(claim_folder).latest("run-001")
+
+        assert (latest["version"], latest["claim_verdict"]) == (2, "DENY")
+
+    def test_record_file_refreshes_patched_verdict(self, claim_folder):
+        path = ClaimRunStorage(claim_folder).write_dossier("run-001", _dossier(1))
+        DossierIndex.record_file(path, _dossier(1, "REFER"))
+
+        assert DossierIndex(claim_folder).latest("run-001")["claim_verdict"] == "REFER"
+
+    def test_missing_run(self, claim_folder):
+        assert DossierIndex(claim_folder).versions("nope") == []
+        assert DossierIndex(claim_folder).next_version("nope") == 1
+
+
+class TestResolveClaimFolder:
+    def test_direct_and_partial_match(self, claim_folder):
+        claims_dir = claim_folder.parent
+        (claims_dir / "claim_65258").mkdir()
+
+        assert resolve_claim_folder(claims_dir, "CLM-001") == claim_folder
+        assert resolve_claim_folder(claims_dir, "65258").name == "claim_65258"
+        assert resolve_claim_folder(claims_dir, "NONEXISTENT") is None
+
+    def test_uses_registry_claim_index(self, claim_folder):
+        claims_dir = claim_folder.parent
+        registry = claims_dir.parent / "registry"
+        registry.mkdir()
+        (registry / "registry_meta.json").write_text("{}")
+        (registry / "doc_index.jsonl").write_text(json.dumps({
+            "doc_id": "d1", "claim_id": "65258", "claim_folder": "CLM-001",
+            "doc_type": "invoice", "filename": "a.pdf", "source_type": "pdf",
+            "doc_root": "claims/CLM-001/docs/d1",
+        }) + "\n")
+
+        assert resolve_claim_folder(claims_dir, "65258") == claim_folder
+
+
+ECHO_ENGINE = """
+class EchoEngine:
+    engine_id = "echo"
+    engine_version = "1.0.0"
+
+    def __init__(self, workspace_path):
+        pass
+
+    def evaluate(self, claim_id, aggregated_facts, coverage_overrides=None, **kwargs):
+        return {
+            "claim_id": claim_id,
+            "claim_verdict": "APPROVE",
+            "engine_id": self.engine_id,
+            "coverage_overrides": coverage_overrides or {},
+        }
+"""
+
+
+class TestReevaluationSession:
+    def test_what_if_edits_reuse_loaded_inputs(self, claim_folder):
+        engine_dir = claim_folder.parent.parent / "config" / "decision"
+        engine_dir.mkdir(parents=True)
+        (engine_dir / "engine.py").write_text(ECHO_ENGINE)
+        service = DecisionDossierService(claim_folder.parent, claim_folder.parent.parent)
+
+        with patch.object(
+            ReevaluationSession, "load", wraps=ReevaluationSession.load
+        ) as load:
+            first = service.evaluate_with_assumptions("CLM-001", {"a": True}, {"item_0": False})
+            second = service.evaluate_with_assumptions("CLM-001", {"a": False})
+
+        assert load.call_count == 1
+        assert (first["version"], second["version"]) == (1, 2)
+        # Overrides from the previous version are carried over
+        assert second["coverage_overrides"] == {"item_0": False}
+        assert [v["version"] for v in service.list_versions("CLM-001")] == [1, 2]
+
+    def test_changed_inputs_reload_session(self, claim_folder):
+        session = ReevaluationSession.get(claim_folder, "run-001")
+        facts_path = claim_folder / "claim_runs" / "run-001" / "claim_facts.json"
+        facts_path.write_text(json.dumps({"facts": [{"name": "b"}]}))
+        stat = facts_path.stat()
+        os.utime(facts_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        reloaded = ReevaluationSession.get(claim_folder, "run-001")
+
+        assert reloaded is not session
+        assert reloaded.facts == {"facts": [{"name": "b"}]}
+
+    def test_engine_mutations_do_not_leak_into_session(self, claim_folder):
+        class MutatingEngine:
+            def evaluate(self, aggregated_facts, coverage_analysis, **kwargs):
+                aggregated_facts["facts"].append({"name": "injected"})
+                coverage_analysis["line_items"].clear()
+                return {"claim_verdict": "APPROVE"}
+
+        session = ReevaluationSession.get(claim_folder, "run-001")
+        session.coverage = {"line_items": [{"item_code": "X"}]}
+
+        session.evaluate(MutatingEngine(), "CLM-001", {}, {})
+
+        assert session.facts == {"facts": [{"name": "a"}]}
+        assert session.coverage == {"line_items": [{"item_code": "X"}]}
@@ -0,0 +1,137 @@
+"""Tests for the incrementally materialized evolution timeline."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from context_builder.api.services.evolution import EvolutionService
+from context_builder.schemas.decision_record import ScopeSnapshot, VersionBundle
+from context_builder.storage.evolution_log import EvolutionLog
+from context_builder.storage.version_bundles import VersionBundleStore
+
+
+def _bundle(created_at, spec_hash="spec_aaaaaaaaaaaa", doc_types=("invoice",), model="gpt-4o"):
+    return VersionBundle(
+        bundle_id=f"vb_{created_at}",
+        created_at=created_at,
+        git_commit="0123456789abcdef",
+        model_name=model,
+        extraction_spec_hash=spec_hash,
+        scope_snapshot=ScopeSnapshot(
+            doc_types=list(doc_types),
+            total_fields=10 * len(doc_types),
+            fields_by_type={dt: 10 for dt in doc_types},
+        ),
+    )
+
+
+def _write_eval(workspace, run_id, correct, incorrect=0, missing=0):
+    eval_dir = workspace / "runs" / run_id / "eval"
+    eval_dir.mkdir(parents=True)
+    summary = {"correct": correct, "incorrect": incorrect, "missing": missing, "docs_evaluated": 3}
+    (eval_dir / "summary.json").write_text(json.dumps(summary))
+    return summary
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    store = VersionBundleStore(tmp_path)
+    store._save_bundle("run_1", _bundle("2026-01-01T00:00:00Z"))
+    store._save_bundle("run_2", _bundle("2026-01-02T00:00:00Z"))
+    store._save_bundle(
+        "run_3", _bundle("2026-02-01T00:00:00Z", spec_hash="spec_bbbbbbbbbbbb",
+                         doc_types=("invoice", "police_report"))
+    )
+    return tmp_path
+
+
+class TestEvolutionTimeline:
+    def test_incremental_matches_rebuild(self, workspace):
+        service = EvolutionService(workspace)
+        service.rebuild_timeline()  # Snapshot at the current log end
+        summary = _write_eval(workspace, "run_3", correct=8, incorrect=2)
+        service.evolution_log.record_eval("run_3", summary)
+        VersionBundleStore(workspace)._save_bundle(
+            "run_4", _bundle("2026-03-01T00:00:00Z", spec_hash="spec_cccccccccccc")
+        )
+
+        incremental = service.get_evolution_timeline()
+        rebuilt_groups = service.rebuild_timeline()
+
+        assert incremental == service.get_evolution_timeline()
+        assert len(rebuilt_groups) == 3
+        assert [p["spec_hash"] for p in incremental["timeline"]] == [
+            "spec_aaaaaaa", "spec_bbbbbbb", "spec_ccccccc",
+        ]
+        point = incremental["timeline"][1]
+        assert point["accuracy_rate"] == 80.0
+        assert point["representative_run_id"] == "run_3"
+        assert incremental["timeline"][0]["bundle_count"] == 2
+        assert incremental["timeline"][0]["representative_run_id"] == "run_2"
+
+    def test_reads_do_not_scan_bundles(self, workspace):
+        service = EvolutionService(workspace)
+        service.get_evolution_timeline()  # First read builds the snapshot
+
+        with patch.object(
+            VersionBundleStore, "get_all_bundles", side_effect=AssertionError("scanned")
+        ):
+            VersionBundleStore(workspace)._save_bundle(
+                "run_4", _bundle("2026-01-03T00:00:00Z")
+            )
+            result = service.get_evolution_timeline()
+
+        first = result["timeline"][0]
+        assert first["bundle_count"] == 3
+        assert first["representative_run_id"] == "run_4"
+        # Appended events are folded into the snapshot once
+        snapshot = json.loads(service.evolution_log.snapshot_path.read_text())
+        assert snapshot["log_offset"] == service.evolution_log.log_size()
+
+    def test_bundle_saved_during_rebuild_counted_once(self, workspace):
+        service = EvolutionService(workspace)
+        get_all_bundles = VersionBundleStore.get_all_bundles
+
+        def save_during_scan(store):
+            store._save_bundle("run_4", _bundle("2026-01-03T00:00:00Z"))
+            return get_all_bundles(store)
+
+        with patch.object(VersionBundleStore, "get_all_bundles", save_during_scan):
+            service.rebuild_timeline()
+        result = service.get_evolution_timeline()
+
+        first = result["timeline"][0]
+        assert first["bundle_count"] == 3
+        assert first["representative_run_id"] == "run_4"
+
+    def test_older_bundle_does_not_replace_representative(self, tmp_path):
+        log = EvolutionLog(tmp_path / "version_bundles")
+        log.write_snapshot({}, 0)
+        log.record_bundle("run_new", _bundle("2026-02-01T00:00:00Z", model="new"))
+        log.record_bundle("run_old", _bundle("2026-01-01T00:00:00Z", model="old"))
+
+        [group] = log.load_groups().values()
+
+        assert group["representative_run_id"] == "run_new"
+        assert group["model_name"] == "new"
+        assert group["first_seen"] == "2026-01-01T00:00:00Z"
+        assert group["bundle_count"] == 2
+
+    def test_eval_before_bundle_is_applied(self, tmp_path):
+        log = EvolutionLog(tmp_path / "version_bundles")
+        log.write_snapshot({}, 0)
+        log.record_eval("run_1", {"correct": 1, "incorrect": 1, "missing": 0})
+        log.record_bundle("run_1", _bundle("2026-01-01T00:00:00Z"))
+
+        [group] = log.load_groups().values()
+
+        assert group["accuracy_rate"] == 50.0
+
+    def test_empty_workspace(self, tmp_path):
+        service = EvolutionService(tmp_path)
+
+        result = service.get_evolution_timeline()
+
+        assert result["timeline"] == []
+        assert result["accuracy_trend"]["trend"] == "no_data"
@@ -783,3 +783,82 @@ class TestParseLLMResponse:
         # Group 99 doesn't match group 1, so original is preserved
         assert result[0].explanation == "template text"
         assert result[0].policy_reference == "Art. 1"
+
+
+
+# ---------------------------------------------------------------------------
+# Deferred (lazy) LLM rewrite
+# ---------------------------------------------------------------------------
+
+class TestDeferredRewrite:
+    """Tests for prepare() + rewrite_pending()."""
+
+    _COVERED = {"engine": ["timing chain", "cylinder head"]}
+
+    def _prepared(self):
+        items = [
+            _make_item(description="Oil filter", exclusion_reason="consumable",
+                       total_price=15.0),
+            _make_item(description="HANDLING", exclusion_reason="fee",
+                       total_price=50.0),
+        ]
+        result = _make_result(items)
+        ExplanationGenerator().prepare(result, covered_components=self._COVERED)
+        return result
+
+    def test_prepare_stores_templates_and_inputs(self):
+        result = self._prepared()
+
+        assert len(result.non_covered_explanations) == 2
+        assert all(
+            e.explanation_source == "template" for e in result.non_covered_explanations
+        )
+        assert result.explanation_inputs.covered_components == self._COVERED
+        assert result.non_covered_summary
+        assert ExplanationGenerator.needs_rewrite(result)
+
+    def test_prepare_without_covered_components_never_rewrites(self):
+        result = _make_result([_make_item(exclusion_reason="fee")])
+        ExplanationGenerator().prepare(result)
+
+        assert result.explanation_inputs is None
+        assert not ExplanationGenerator.needs_rewrite(result)
+
+    def test_rewrite_pending_rewrites_once(self):
+        result = self._prepared()
+        client = _FakeLLMClient(_json.dumps([
+            {"group": 1, "explanation": "Handling fees are not covered."},
+            {"group": 2, "explanation": "Oil filters are consumables."},
+        ]))
+        gen = ExplanationGenerator()
+
+        assert gen.rewrite_pending(result, client) is True
+        assert gen.rewrite_pending(result, client) is False
+
+        assert len(client.calls) == 1
+        assert all(e.explanation_source == "llm" for e in result.non_covered_explanations)
+        assert not gen.needs_rewrite(result)
+
+    def test_rewrite_pending_only_sends_template_groups(self):
+        result = self._prepared()
+        result.non_covered_explanations[0] = result.non_covered_explanations[0].model_copy(
+            update={"explanation": "Already rewritten.", "explanation_source": "llm"}
+        )
+        client = _FakeLLMClient(_json.dumps([{"group": 1, "explanation": "Rewritten."}]))
+
+        ExplanationGenerator().rewrite_pending(result, client)
+
+        prompt = client.calls[0]["messages"][-1]["content"]
+        assert "Oil filter" in prompt
+        assert "HANDLING" not in prompt
+        assert result.non_covered_explanations[0].explanation == "Already rewritten."
+        assert result.non_covered_explanations[1].explanation == "Rewritten."
+
+    def test_rewrite_failure_keeps_templates_for_retry(self):
+        result = self._prepared()
+
+        changed = ExplanationGenerator().rewrite_pending(result, _FailingLLMClient())
+
+        assert changed is False
+        assert ExplanationGenerator.needs_rewrite(result)
+        assert result.non_covered_explanations[1].explanation == "Consumable items are not covered."
@@ -0,0 +1,108 @@
+"""Tests for the per-document label history header and paging."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from context_builder.storage import FileStorage, build_all_indexes
+from context_builder.storage.index_builder import upsert_label_entry
+from context_builder.storage.index_reader import LABEL_INDEX_FILE, IndexReader
+from context_builder.storage.label_history import LabelHistory
+
+
+@pytest.fixture
+def storage(tmp_path):
+    meta_dir = tmp_path / "claims" / "CLM-001" / "docs" / "DOC-001" / "meta"
+    meta_dir.mkdir(parents=True)
+    (meta_dir / "doc.json").write_text(json.dumps({"doc_id": "DOC-001", "claim_id": "CLM-001"}))
+    return FileStorage(tmp_path)
+
+
+def _label(i, states=("LABELED",)):
+    return {
+        "doc_id": "DOC-001",
+        "claim_id": "CLM-001",
+        "version": i,
+        "field_labels": [{"state": s} for s in states],
+        "review": {"reviewed_at": f"2026-01-0{i + 1}T00:00:00Z"},
+    }
+
+
+def _history(storage):
+    return LabelHistory(storage.registry_dir / "labels", "DOC-001")
+
+
+class TestHeader:
+    def test_save_does_not_scan_history(self, storage):
+        storage.save_label("DOC-001", _label(0))
+
+        with patch.object(LabelHistory, "rebuild_header") as rebuild:
+            for i in range(1, 4):
+                storage.save_label("DOC-001", _label(i, states=("LABELED", "UNLABELED")))
+
+        rebuild.assert_not_called()
+        header = _history(storage).header()
+        assert header["latest_version"] == 4
+        assert len(header["offsets"]) == 4
+        assert header["latest_summary"]["unlabeled_count"] == 1
+        assert storage.get_label("DOC-001")["_version_metadata"]["version_number"] == 4
+
+    def test_legacy_history_gets_header(self, storage):
+        labels_dir = storage.registry_dir / "labels"
+        labels_dir.mkdir(parents=True)
+        history = _history(storage)
+        history.history_path.write_text(
+            "".join(json.dumps(_label(i)) + "\n" for i in range(3))
+        )
+
+        storage.save_label("DOC-001", _label(3))
+
+        versions = storage.get_label_history("DOC-001")
+        assert [v["version"] for v in versions] == [0, 1, 2, 3]
+        assert versions[-1]["_version_metadata"]["version_number"] == 4
+
+    def test_stale_header_is_rebuilt(self, storage):
+        for i in range(2):
+            storage.save_label("DOC-001", _label(i))
+        history = _history(storage)
+        # Another process appended without updating the header
+        with open(history.history_path, "a") as f:
+            f.write(json.dumps(_label(2)) + "\n")
+
+        assert history.latest_version() == 3
+        assert storage.get_label_version_count("DOC-001") == 3
+
+
+class TestPaging:
+    def test_page_by_version(self, storage):
+        for i in range(5):
+            storage.save_label("DOC-001", _label(i))
+
+        page = storage.get_label_history("DOC-001", start_version=2, limit=2)
+
+        assert [v["_version_metadata"]["version_number"] for v in page] == [2, 3]
+        assert storage.get_label_history("DOC-001", start_version=5)[0]["version"] == 4
+        assert storage.get_label_history("DOC-001", start_version=6) == []
+        assert len(storage.get_label_history("DOC-001")) == 5
+
+
+class TestLabelIndexAppend:
+    def test_upsert_appends_and_reader_keeps_latest(self, storage):
+        build_all_indexes(storage.output_root)
+        registry_dir = storage.registry_dir
+        reader = IndexReader(registry_dir)
+        assert reader.get_all_label_summaries() == []
+
+        upsert_label_entry(registry_dir, {"doc_id": "DOC-001", "labeled_count": 1})
+        assert reader.get_label_summary("DOC-001").labeled_count == 1
+
+        with patch("context_builder.storage.index_reader.read_jsonl") as read_jsonl:
+            upsert_label_entry(registry_dir, {"doc_id": "DOC-001", "labeled_count": 2})
+            upsert_label_entry(registry_dir, {"doc_id": "DOC-002", "labeled_count": 5})
+            summaries = {s.doc_id: s.labeled_count for s in reader.get_all_label_summaries()}
+
+        read_jsonl.assert_not_called()
+        assert summaries == {"DOC-001": 2, "DOC-002": 5}
+        assert len((registry_dir / LABEL_INDEX_FILE).read_text().splitlines()) == 3
+        assert IndexReader(registry_dir).get_label_summary("DOC-001").labeled_count == 2
@@ -0,0 +1,168 @@
+"""Tests for the persistent claim/doc path map."""
+
+import json
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from context_builder.storage import FileStorage, build_all_indexes
+from context_builder.storage.path_map import (
+    PATH_MAP_FILE,
+    PathMap,
+    clear_path_map_cache,
+)
+
+
+def _write_doc(claims_dir, folder, doc_id, claim_id=None):
+    meta_dir = claims_dir / folder / "docs" / doc_id / "meta"
+    meta_dir.mkdir(parents=True)
+    meta = {"doc_id": doc_id, "doc_type": "invoice"}
+    if claim_id:
+        meta["claim_id"] = claim_id
+    (meta_dir / "doc.json").write_text(json.dumps(meta))
+
+
+@pytest.fixture(autouse=True)
+def _clear_maps():
+    clear_path_map_cache()
+    yield
+    clear_path_map_cache()
+
+
+@pytest.fixture
+def claims_dir(tmp_path):
+    claims_dir = tmp_path / "claims"
+    _write_doc(claims_dir, "claim_65258", "doc_a", claim_id="CLM-65258")
+    _write_doc(claims_dir, "claim_65258", "doc_b", claim_id="CLM-65258")
+    _write_doc(claims_dir, "claim_70001", "doc_c")
+    return claims_dir
+
+
+def _iterdir_calls(fn):
+    with patch.object(Path, "iterdir", autospec=True, side_effect=Path.iterdir) as iterdir:
+        result = fn()
+    return result, iterdir.call_count
+
+
+class TestLookups:
+    def test_missing_map_is_built_once(self, claims_dir):
+        path_map = PathMap(claims_dir)
+
+        assert path_map.claim_folder("CLM-65258") == claims_dir / "claim_65258"
+        assert (claims_dir.parent / "registry" / PATH_MAP_FILE).exists()
+
+        result, scans = _iterdir_calls(lambda: (
+            path_map.doc_folder("doc_c"),
+            path_map.claim_folder("claim_70001"),
+            PathMap(claims_dir).doc_folder("doc_b"),
+        ))
+        assert result == (
+            claims_dir / "claim_70001" / "docs" / "doc_c",
+            claims_dir / "claim_70001",
+            claims_dir / "claim_65258" / "docs" / "doc_b",
+        )
+        assert scans == 0
+
+    def test_partial_match_is_opt_in(self, claims_dir):
+        path_map = PathMap(claims_dir)
+
+        assert path_map.claim_folder("70001") is None
+        assert path_map.claim_folder("70001", partial=True) == claims_dir / "claim_70001"
+
+    def test_negative_lookups_are_cached(self, claims_dir):
+        path_map = PathMap(claims_dir)
+        assert path_map.doc_folder("nope") is None
+
+        result, scans = _iterdir_calls(lambda: [path_map.doc_folder("nope") for _ in range(5)])
+
+        assert result == [None] * 5
+        assert scans == 0
+
+    def test_recorded_doc_clears_negative_cache(self, claims_dir):
+        path_map = PathMap(claims_dir)
+        assert path_map.doc_folder("doc_new") is None
+
+        _write_doc(claims_dir, "claim_70001", "doc_new")
+        PathMap(claims_dir).record_doc("claim_70001", "doc_new", "CLM-70001")
+
+        assert path_map.doc_folder("doc_new") == claims_dir / "claim_70001" / "docs" / "doc_new"
+        assert path_map.claim_folder("CLM-70001") == claims_dir / "claim_70001"
+
+    def test_rerecording_doc_appends_nothing(self, claims_dir):
+        path_map = PathMap(claims_dir)
+        path_map.rebuild()
+        size = path_map.path.stat().st_size
+
+        path_map.record_doc("claim_65258", "doc_a", "CLM-65258")
+
+        assert path_map.path.stat().st_size == size
+
+    def test_unhooked_claim_folder_is_repaired(self, claims_dir):
+        path_map = PathMap(claims_dir)
+        assert path_map.claim_folder("CLM-9") is None
+
+        _write_doc(claims_dir, "claim_9", "doc_z", claim_id="CLM-9")
+
+        assert path_map.claim_folder("CLM-9") == claims_dir / "claim_9"
+        assert path_map.doc_folder("doc_z") == claims_dir / "claim_9" / "docs" / "doc_z"
+
+    def test_unmapped_doc_found_by_scan(self, claims_dir):
+        path_map = PathMap(claims_dir)
+        path_map.rebuild()
+        # Written into an existing folder without the hooks
+        _write_doc(claims_dir, "claim_70001", "doc_unhooked")
+
+        assert path_map.doc_folder("doc_unhooked") == (
+            claims_dir / "claim_70001" / "docs" / "doc_unhooked"
+        )
+        assert '"doc_unhooked"' in path_map.path.read_text()
+
+    def test_rebuild_in_other_process_is_replayed(self, claims_dir):
+        path_map = PathMap(claims_dir)
+        path_map.rebuild()
+        for i in range(5):
+            _write_doc(claims_dir, "claim_70001", f"zdoc_{i}")
+        _write_doc(claims_dir, "claim_65258", "doc_extra")
+
+        # Larger file: its entry lands before this instance's offset
+        PathMap(claims_dir).rebuild()
+        result, scans = _iterdir_calls(lambda: path_map.doc_folder("doc_extra"))
+
+        assert result == claims_dir / "claim_65258" / "docs" / "doc_extra"
+        assert scans == 0
+        assert path_map.claim_folder("CLM-65258") == claims_dir / "claim_65258"
+
+    def test_forget_claim(self, claims_dir):
+        path_map = PathMap(claims_dir)
+        path_map.rebuild()
+        shutil.rmtree(claims_dir / "claim_65258")
+
+        path_map.forget_claim("claim_65258")
+
+        assert PathMap(claims_dir).claim_folder("CLM-65258") is None
+        assert path_map.doc_folder("doc_a") is None
+
+
+class TestIntegration:
+    def test_index_build_rewrites_map(self, claims_dir):
+        path_map = PathMap.for_claims_dir(claims_dir)
+        path_map.record_claim("claim_70001", "ALIAS")
+        lines_before = path_map.path.read_text().count("\n")
+
+        build_all_indexes(claims_dir.parent)
+
+        lines = path_map.path.read_text().splitlines()
+        assert json.loads(lines[0]) == {"schema_version": "path_map_v1"}
+        assert len(lines) < lines_before
+        assert path_map.claim_folder("ALIAS") is None
+        assert path_map.claim_folder("CLM-65258") == claims_dir / "claim_65258"
+
+    def test_file_storage_without_indexes(self, claims_dir):
+        storage = FileStorage(claims_dir.parent)
+
+        assert storage.get_doc("doc_b").claim_id == "CLM-65258"
+        assert storage.delete_claim("CLM-65258")
+        assert storage.get_doc("doc_a") is None
+        assert storage.get_doc("doc_c") is not None
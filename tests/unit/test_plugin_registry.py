@@ -0,0 +1,199 @@
+"""Unit tests for the process-wide workspace plugin registry."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from context_builder.pipeline.claim_stages.decision import load_engine_from_workspace
+from context_builder.pipeline.claim_stages.plugin_registry import (
+    PluginRegistry,
+    clear_plugin_registry,
+    get_plugin_registry,
+)
+from context_builder.pipeline.claim_stages.screening import load_screener_from_workspace
+
+
+_PLUGIN_TEMPLATE = """
+import builtins
+
+builtins.__dict__.setdefault("_plugin_exec_count", 0)
+builtins._plugin_exec_count += 1
+
+
+class {name}:
+    version = "{version}"
+
+    def __init__(self, workspace_path):
+        self.workspace_path = workspace_path
+
+    def screen(self, claim_id, aggregated_facts, **kwargs):
+        return None, None
+"""
+
+
+def _select(name, cls):
+    return hasattr(cls, "screen")
+
+
+def _write_plugin(path: Path, name: str = "FooScreener", version: str = "1") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(_PLUGIN_TEMPLATE.format(name=name, version=version), encoding="utf-8")
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture(autouse=True)
+def _reset_exec_counter():
+    import builtins
+
+    builtins._plugin_exec_count = 0
+    yield
+    del builtins._plugin_exec_count
+    clear_plugin_registry()
+
+
+def _exec_count() -> int:
+    import builtins
+
+    return builtins._plugin_exec_count
+
+
+class TestPluginRegistry:
+    def _get(self, registry, plugin_path, workspace):
+        return registry.get(
+            kind="screener",
+            plugin_path=plugin_path,
+            module_name="test_plugin",
+            select=_select,
+            workspace_path=workspace,
+        )
+
+    def test_missing_file_returns_none(self, tmp_path):
+        registry = PluginRegistry()
+        assert self._get(registry, tmp_path / "missing.py", tmp_path) is None
+        assert registry.stats() == []
+
+    def test_module_executed_once(self, tmp_path):
+        registry = PluginRegistry()
+        plugin_path = tmp_path / "plugin.py"
+        _write_plugin(plugin_path)
+
+        first = self._get(registry, plugin_path, tmp_path)
+        second = self._get(registry, plugin_path, tmp_path)
+
+        assert first is not None
+        assert first is second
+        assert _exec_count() == 1
+        [stats] = registry.stats()
+        assert stats["class_name"] == "FooScreener"
+        assert stats["hits"] == 1
+        assert stats["reloads"] == 0
+        assert stats["load_ms"] >= 0
+
+    def test_touch_without_edit_keeps_instance(self, tmp_path):
+        registry = PluginRegistry()
+        plugin_path = tmp_path / "plugin.py"
+        _write_plugin(plugin_path)
+
+        first = self._get(registry, plugin_path, tmp_path)
+        _bump_mtime(plugin_path)
+        second = self._get(registry, plugin_path, tmp_path)
+
+        assert first is second
+        assert _exec_count() == 1
+
+    def test_content_change_swaps_instance(self, tmp_path):
+        registry = PluginRegistry()
+        plugin_path = tmp_path / "plugin.py"
+        _write_plugin(plugin_path, version="1")
+        first = self._get(registry, plugin_path, tmp_path)
+
+        _write_plugin(plugin_path, version="2")
+        _bump_mtime(plugin_path)
+        second = self._get(registry, plugin_path, tmp_path)
+
+        assert first.version == "1"
+        assert second.version == "2"
+        assert _exec_count() == 2
+        [stats] = registry.stats()
+        assert stats["reloads"] == 1
+
+    def test_workspace_config_change_swaps_instance(self, tmp_path):
+        registry = PluginRegistry()
+        plugin_path = tmp_path / "config" / "screening" / "screener.py"
+        _write_plugin(plugin_path)
+        rules_path = tmp_path / "config" / "screening" / "rules.yaml"
+        rules_path.write_text("max_age: 5\n", encoding="utf-8")
+        first = self._get(registry, plugin_path, tmp_path)
+        assert self._get(registry, plugin_path, tmp_path) is first
+
+        rules_path.write_text("max_age: 7\n", encoding="utf-8")
+        second = self._get(registry, plugin_path, tmp_path)
+
+        assert second is not first
+        assert _exec_count() == 2
+        [stats] = registry.stats()
+        assert stats["reloads"] == 1
+
+    def test_failure_cached_until_file_changes(self, tmp_path):
+        registry = PluginRegistry()
+        plugin_path = tmp_path / "plugin.py"
+        plugin_path.write_text(
+            "import builtins\n"
+            "builtins._plugin_exec_count += 1\n"
+            "raise RuntimeError('broken')\n",
+            encoding="utf-8",
+        )
+
+        assert self._get(registry, plugin_path, tmp_path) is None
+        assert self._get(registry, plugin_path, tmp_path) is None
+        assert _exec_count() == 1
+        assert registry.stats()[0]["error"] == "broken"
+
+        _write_plugin(plugin_path)
+        _bump_mtime(plugin_path)
+        assert self._get(registry, plugin_path, tmp_path) is not None
+
+    def test_no_matching_class(self, tmp_path):
+        registry = PluginRegistry()
+        plugin_path = tmp_path / "plugin.py"
+        plugin_path.write_text("class Unrelated:\n    pass\n", encoding="utf-8")
+
+        assert self._get(registry, plugin_path, tmp_path) is None
+        assert registry.stats()[0]["error"] == "no matching class"
+
+
+class TestWorkspaceLoaders:
+    def test_screener_shared_across_calls(self, tmp_path):
+        _write_plugin(tmp_path / "config" / "screening" / "screener.py")
+
+        first = load_screener_from_workspace(tmp_path)
+        second = load_screener_from_workspace(tmp_path)
+
+        assert first is second
+        assert _exec_count() == 1
+        kinds = [s["kind"] for s in get_plugin_registry().stats()]
+        assert kinds == ["screener"]
+
+    def test_engine_and_screener_registered_separately(self, tmp_path):
+        _write_plugin(tmp_path / "config" / "screening" / "screener.py")
+        engine_path = tmp_path / "config" / "decision" / "engine.py"
+        engine_path.parent.mkdir(parents=True)
+        engine_path.write_text(
+            "class Engine:\n"
+            "    engine_id = 'test'\n"
+            "    def __init__(self, workspace_path):\n"
+            "        pass\n"
+            "    def evaluate(self, claim_id, aggregated_facts, **kwargs):\n"
+            "        return {}\n",
+            encoding="utf-8",
+        )
+
+        assert load_screener_from_workspace(tmp_path) is not None
+        assert load_engine_from_workspace(tmp_path).engine_id == "test"
+        kinds = sorted(s["kind"] for s in get_plugin_registry().stats())
+        assert kinds == ["decision_engine", "screener"]
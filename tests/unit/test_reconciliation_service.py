@@ -1,5 +1,6 @@
 """Unit tests for the ReconciliationService."""
 
+import copy
 import json
 import pytest
 from datetime import datetime
@@ -169,6 +170,83 @@ class TestDetectConflicts:
         # Sources should be grouped by value
         assert len(conflict.sources) == 2
 
+    def test_vin_values_grouped_after_normalization(self, service):
+        """Test that OCR-ambiguous VIN characters do not create conflicts."""
+        candidates = {
+            "vin": [
+                {"value": "WBA0I123", "doc_id": "doc1", "confidence": 0.9},
+                {"value": "wba01 123", "doc_id": "doc2", "confidence": 0.8},
+            ],
+        }
+
+        assert service.detect_conflicts(candidates) == []
+
+    def test_candidates_not_modified(self, service):
+        """Test that conflict detection leaves the caller's candidates untouched."""
+        candidates = {
+            "chassis_number": [
+                {"value": "ABC-O1", "doc_id": "doc1", "confidence": 0.9},
+                {"value": "ABC-Q1", "doc_id": "doc2", "confidence": 0.8},
+            ],
+        }
+        before = copy.deepcopy(candidates)
+
+        [conflict] = service.detect_conflicts(candidates)
+
+        assert conflict.values == ["ABC01", "ABC91"]
+        assert candidates == before
+
+    def test_equal_confidence_selects_first_value(self, service):
+        """Test that ties keep the first value seen."""
+        candidates = {
+            "policy_number": [
+                {"value": "A", "doc_id": "doc1", "confidence": 0.8},
+                {"value": "B", "doc_id": "doc2", "confidence": 0.8},
+            ],
+        }
+
+        [conflict] = service.detect_conflicts(candidates)
+
+        assert conflict.selected_value == "A"
+        assert conflict.sources[1][0].doc_id == "doc2"
+        assert conflict.sources[1][0].filename == "doc2.pdf"
+
+
+def _synthetic_claim_candidates(n_docs=50, n_fields=300, n_conflicts=10):
+    """Candidates for a claim with ``n_docs`` documents reporting every field."""
+    candidates = {}
+    for f in range(n_fields):
+        name = "vin" if f == 0 else f"field_{f}"
+        candidates[name] = [
+            {
+                "value": f"value-{f}-{d % 2}" if f < n_conflicts else f"value-{f}",
+                "doc_id": f"doc{d}",
+                "doc_type": "invoice",
+                "filename": f"doc{d}.pdf",
+                "confidence": 0.5 + (d % 10) / 20,
+            }
+            for d in range(n_docs)
+        ]
+    return candidates
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_detect_conflicts_benchmark_50_documents():
+    """Benchmark: conflict detection on a 50-document claim (pytest -m performance)."""
+    import time
+
+    service = ReconciliationService(MagicMock(), MagicMock())
+    candidates = _synthetic_claim_candidates()
+
+    start = time.perf_counter()
+    conflicts = service.detect_conflicts(candidates)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n50 docs x 300 fields: {elapsed * 1000:.1f}ms")
+    assert len(conflicts) == 10
+    assert all(len(c.sources[0]) == 25 for c in conflicts)
+
 
 class TestEvaluateGate:
     """Tests for ReconciliationService.evaluate_gate()."""
@@ -0,0 +1,176 @@
+"""Tests for the run/claim reverse index and claim run status markers."""
+
+import json
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from context_builder.pipeline.state import is_claim_processed, record_claim_run
+from context_builder.storage import FileStorage, build_all_indexes
+from context_builder.storage import run_claims
+from context_builder.storage.run_claims import (
+    CLAIM_STATUS_FILE,
+    RunClaimIndex,
+    clear_run_claim_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_run_claim_cache()
+    yield
+    clear_run_claim_cache()
+
+
+@pytest.fixture
+def claims_dir(tmp_path):
+    claims_dir = tmp_path / "claims"
+    claims_dir.mkdir()
+    return claims_dir
+
+
+def _finish_run(claims_dir, claim_id, run_id, status="success"):
+    """Create a claim run the way process_claim leaves it."""
+    logs_dir = claims_dir / claim_id / "runs" / run_id / "logs"
+    logs_dir.mkdir(parents=True)
+    (logs_dir / "summary.json").write_text(json.dumps({"status": status}))
+    record_claim_run(claims_dir, claim_id, run_id, status)
+
+
+class TestIsClaimProcessed:
+    def test_uses_marker(self, claims_dir):
+        _finish_run(claims_dir, "CLM-001", "run_1", "failed")
+        _finish_run(claims_dir, "CLM-001", "run_2", "partial")
+
+        with patch.object(run_claims, "_read_run_status") as read_status:
+            assert is_claim_processed(claims_dir, "CLM-001")
+            assert not is_claim_processed(claims_dir, "CLM-002")
+
+        read_status.assert_not_called()
+
+    def test_failed_runs_only(self, claims_dir):
+        _finish_run(claims_dir, "CLM-001", "run_1", "failed")
+
+        assert not is_claim_processed(claims_dir, "CLM-001")
+
+    def test_legacy_claim_builds_marker(self, claims_dir):
+        logs_dir = claims_dir / "CLM-001" / "runs" / "run_1" / "logs"
+        logs_dir.mkdir(parents=True)
+        (logs_dir / "summary.json").write_text(json.dumps({"status": "success"}))
+
+        assert is_claim_processed(claims_dir, "CLM-001")
+        marker = json.loads((claims_dir / "CLM-001" / CLAIM_STATUS_FILE).read_text())
+        assert marker["runs"] == {"run_1": "success"}
+
+    def test_run_removed_outside_pipeline(self, claims_dir):
+        _finish_run(claims_dir, "CLM-001", "run_1")
+        shutil.rmtree(claims_dir / "CLM-001" / "runs" / "run_1")
+
+        assert not is_claim_processed(claims_dir, "CLM-001")
+
+
+class TestRunClaimIndex:
+    def test_records_and_replays(self, claims_dir):
+        _finish_run(claims_dir, "CLM-001", "run_1")
+        _finish_run(claims_dir, "CLM-002", "run_1", "failed")
+        _finish_run(claims_dir, "CLM-002", "run_2")
+
+        index = RunClaimIndex(claims_dir)  # Fresh process view
+        assert index.claims_for_run("run_1") == ["CLM-001", "CLM-002"]
+        assert index.runs_for_claim("CLM-002") == ["run_1", "run_2"]
+        assert index.claim_status("run_1", "CLM-002") == "failed"
+        assert index.claims_for_run("unknown") is None
+
+    def test_rebuild_from_claim_folders(self, claims_dir):
+        _finish_run(claims_dir, "CLM-001", "run_1")
+        (claims_dir.parent / "registry" / run_claims.RUN_CLAIMS_FILE).unlink()
+
+        assert RunClaimIndex(claims_dir).claims_for_run("run_1") == ["CLM-001"]
+
+    def test_rebuild_in_other_process_is_replayed(self, claims_dir):
+        _finish_run(claims_dir, "CLM-C1", "run_1")
+        index = RunClaimIndex(claims_dir)
+        assert index.claims_for_run("run_1") == ["CLM-C1"]
+        for claim_id in ("CLM-A1", "CLM-A2", "CLM-A3", "CLM-A4", "CLM-A5"):
+            logs_dir = claims_dir / claim_id / "runs" / "run_1" / "logs"
+            logs_dir.mkdir(parents=True)
+            (logs_dir / "summary.json").write_text(json.dumps({"status": "success"}))
+
+        # Larger file whose new entries sort before this instance's offset
+        RunClaimIndex(claims_dir).rebuild()
+
+        assert index.claims_for_run("run_1") == [
+            "CLM-A1", "CLM-A2", "CLM-A3", "CLM-A4", "CLM-A5", "CLM-C1",
+        ]
+
+
+class TestDeleteRun:
+    @pytest.fixture
+    def storage(self, claims_dir):
+        for claim_id in ("CLM-001", "CLM-002"):
+            _finish_run(claims_dir, claim_id, "run_1")
+        _finish_run(claims_dir, "CLM-002", "run_2")
+        # Claim the run skipped: listed in the manifest, no run folder
+        (claims_dir / "CLM-003").mkdir()
+        run_dir = claims_dir.parent / "runs" / "run_1"
+        run_dir.mkdir(parents=True)
+        (run_dir / "manifest.json").write_text(json.dumps({
+            "claims": [{"claim_id": c} for c in ("CLM-001", "CLM-002", "CLM-003")],
+        }))
+        (run_dir / ".complete").touch()
+        return FileStorage(claims_dir.parent)
+
+    def test_only_touches_run_claims(self, storage, claims_dir):
+        for i in range(20):
+            (claims_dir / f"OTHER-{i}").mkdir()
+
+        with patch.object(FileStorage, "_find_claim_folder", autospec=True,
+                          side_effect=FileStorage._find_claim_folder) as find:
+            success, affected, deleted = storage.delete_run("run_1")
+
+        assert (success, affected, deleted) == (True, 2, 0)
+        assert sorted(c.args[1] for c in find.call_args_list) == ["CLM-001", "CLM-002"]
+        assert not (claims_dir / "CLM-001" / "runs" / "run_1").exists()
+        assert (claims_dir / "CLM-002" / "runs" / "run_2").exists()
+        assert storage.get_claims_for_run("run_1") == []
+        assert not is_claim_processed(claims_dir, "CLM-001")
+        assert is_claim_processed(claims_dir, "CLM-002")
+
+    def test_delete_claims_skips_unprocessed(self, storage, claims_dir):
+        assert storage.get_claims_for_run("run_1") == ["CLM-001", "CLM-002"]
+
+        success, affected, deleted = storage.delete_run("run_1", delete_claims=True)
+
+        assert (success, deleted) == (True, 2)
+        assert (claims_dir / "CLM-003").exists()
+        assert RunClaimIndex(claims_dir).runs_for_claim("CLM-002") == []
+
+    def test_legacy_run_uses_manifest(self, storage, claims_dir):
+        run_dir = claims_dir.parent / "runs" / "run_old"
+        run_dir.mkdir(parents=True)
+        (run_dir / "manifest.json").write_text(json.dumps({"claims": [{"claim_id": "CLM-003"}]}))
+
+        assert storage.get_claims_for_run("run_old") == ["CLM-003"]
+
+    def test_unfinalized_manifest_claim_is_included(self, storage, claims_dir):
+        (claims_dir / "CLM-003" / "runs" / "run_1").mkdir(parents=True)
+
+        assert storage.get_claims_for_run("run_1") == ["CLM-001", "CLM-002", "CLM-003"]
+
+    def test_killed_run_folders_are_removed(self, storage, claims_dir):
+        _finish_run(claims_dir, "CLM-001", "run_3")
+        # Killed before CLM-002 finished and before the global run was written
+        (claims_dir / "CLM-002" / "runs" / "run_3" / "logs").mkdir(parents=True)
+
+        success, affected, _ = storage.delete_run("run_3")
+
+        assert (success, affected) == (True, 2)
+        assert not (claims_dir / "CLM-002" / "runs" / "run_3").exists()
+
+    def test_full_index_build_compacts(self, storage, claims_dir):
+        storage.delete_run("run_1")
+        build_all_indexes(claims_dir.parent)
+
+        lines = (claims_dir.parent / "registry" / run_claims.RUN_CLAIMS_FILE).read_text().splitlines()
+        assert [json.loads(line).get("run") for line in lines[1:]] == ["run_2"]
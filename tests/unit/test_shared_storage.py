@@ -0,0 +1,148 @@
+"""Tests for the process-wide FileStorage and invalidation-aware IndexReader."""
+
+import json
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from context_builder.storage import (
+    FileStorage,
+    build_all_indexes,
+    clear_shared_storage,
+    get_shared_storage,
+)
+from context_builder.storage import index_reader
+from context_builder.storage.index_builder import append_doc_entry, upsert_label_entry
+from context_builder.storage.index_reader import (
+    DOC_INDEX_FILE,
+    LABEL_INDEX_FILE,
+    IndexReader,
+    notify_registry_changed,
+)
+from context_builder.storage.sqlite_registry import SqliteIndexReader
+
+
+def _doc(doc_id, claim="CLM-001"):
+    return {
+        "doc_id": doc_id, "claim_id": claim, "claim_folder": claim,
+        "doc_type": "invoice", "filename": f"{doc_id}.pdf", "source_type": "pdf",
+    }
+
+
+@pytest.fixture
+def registry_dir(tmp_path):
+    registry = tmp_path / "registry"
+    registry.mkdir()
+    (registry / "registry_meta.json").write_text(json.dumps({"doc_count": 1}))
+    (registry / DOC_INDEX_FILE).write_text(json.dumps(_doc("doc_1")) + "\n")
+    (registry / LABEL_INDEX_FILE).write_text(
+        json.dumps({"doc_id": "doc_1", "labeled_count": 1}) + "\n"
+    )
+    return registry
+
+
+@pytest.fixture(autouse=True)
+def _clear_shared():
+    clear_shared_storage()
+    yield
+    clear_shared_storage()
+
+
+class TestIndexReaderFreshness:
+    def test_unchanged_index_is_parsed_once(self, registry_dir):
+        reader = IndexReader(registry_dir)
+
+        with patch.object(index_reader, "read_jsonl", wraps=index_reader.read_jsonl) as read:
+            for _ in range(3):
+                assert reader.get_doc("doc_1") is not None
+                assert reader.get_docs_by_claim("CLM-001")
+
+        assert read.call_count == 1
+
+    def test_in_process_write_reloads_only_that_index(self, registry_dir):
+        reader = IndexReader(registry_dir)
+        reader.get_doc("doc_1")
+        reader.get_label_summary("doc_1")
+
+        with patch.object(index_reader, "read_jsonl", wraps=index_reader.read_jsonl) as read:
+            append_doc_entry(registry_dir, _doc("doc_2"))
+            assert reader.get_doc("doc_2") is not None
+            assert reader.get_label_summary("doc_1") is not None
+
+        assert [c.args[0].name for c in read.call_args_list] == [DOC_INDEX_FILE]
+
+    def test_generation_catches_rewrite_with_same_mtime_and_size(self, registry_dir):
+        reader = IndexReader(registry_dir)
+        assert reader.get_label_summary("doc_1").labeled_count == 1
+        label_path = registry_dir / LABEL_INDEX_FILE
+        stat = label_path.stat()
+
+        label_path.write_text(json.dumps({"doc_id": "doc_1", "labeled_count": 7}) + "\n")
+        os.utime(label_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert reader.get_label_summary("doc_1").labeled_count == 1
+
+        notify_registry_changed(registry_dir, LABEL_INDEX_FILE)
+        assert reader.get_label_summary("doc_1").labeled_count == 7
+
+    def test_external_write_is_detected(self, registry_dir):
+        reader = IndexReader(registry_dir)
+        assert reader.get_all_docs()[0].doc_id == "doc_1"
+
+        # E.g. the CLI pipeline rebuilding indexes in another process
+        (registry_dir / DOC_INDEX_FILE).write_text(
+            json.dumps(_doc("doc_9", claim="CLM-009")) + "\n"
+        )
+
+        assert [d.doc_id for d in reader.get_all_docs()] == ["doc_9"]
+        assert reader.get_claim_folder("CLM-009") == "CLM-009"
+
+    def test_concurrent_first_access_loads_once(self, registry_dir):
+        reader = IndexReader(registry_dir)
+        barrier = threading.Barrier(8)
+        results = []
+
+        def lookup():
+            barrier.wait()
+            results.append(reader.get_doc("doc_1"))
+
+        with patch.object(index_reader, "read_jsonl", wraps=index_reader.read_jsonl) as read:
+            threads = [threading.Thread(target=lookup) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert read.call_count == 1
+        assert all(r is not None and r.doc_id == "doc_1" for r in results)
+
+
+class TestSharedStorage:
+    def test_one_instance_per_output_root(self, registry_dir):
+        output_root = registry_dir.parent
+
+        storage = get_shared_storage(output_root)
+
+        assert get_shared_storage(output_root) is storage
+        clear_shared_storage()
+        assert get_shared_storage(output_root) is not storage
+
+    def test_label_upsert_is_visible_to_shared_storage(self, registry_dir):
+        (registry_dir.parent / "claims").mkdir()
+        storage = get_shared_storage(registry_dir.parent)
+        assert storage.get_label_summary("doc_1").labeled_count == 1
+
+        upsert_label_entry(registry_dir, {"doc_id": "doc_1", "labeled_count": 3})
+
+        assert storage.get_label_summary("doc_1").labeled_count == 3
+
+    def test_follows_backend_switch(self, tmp_path):
+        (tmp_path / "claims").mkdir()
+        storage = FileStorage(tmp_path)
+        build_all_indexes(tmp_path)
+        assert type(storage._index_reader) is IndexReader
+
+        build_all_indexes(tmp_path, backend="sqlite")
+
+        assert isinstance(storage._index_reader, SqliteIndexReader)
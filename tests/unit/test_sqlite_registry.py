@@ -0,0 +1,168 @@
+"""Tests for the SQLite registry backend."""
+
+import json
+
+import pytest
+
+from context_builder.storage import FileStorage, build_all_indexes
+from context_builder.storage.index_builder import (
+    append_doc_entry,
+    update_registry_meta,
+    upsert_label_entry,
+)
+from context_builder.storage.index_reader import (
+    DOC_INDEX_FILE,
+    LABEL_INDEX_FILE,
+    IndexReader,
+    open_index_reader,
+)
+from context_builder.storage.sqlite_registry import (
+    REGISTRY_DB_FILE,
+    SqliteIndexReader,
+    SqliteRegistry,
+)
+
+
+def _write_doc(claims_dir, folder, doc_id, claim_id=None, file_md5=None, label=False):
+    doc_dir = claims_dir / folder / "docs" / doc_id
+    (doc_dir / "meta").mkdir(parents=True)
+    meta = {
+        "doc_id": doc_id,
+        "original_filename": f"{doc_id}.pdf",
+        "source_type": "pdf",
+        "doc_type": "invoice",
+        "file_md5": file_md5 or f"md5-{doc_id}",
+    }
+    if claim_id:
+        meta["claim_id"] = claim_id
+    (doc_dir / "meta" / "doc.json").write_text(json.dumps(meta))
+    if label:
+        (doc_dir / "labels").mkdir()
+        (doc_dir / "labels" / "latest.json").write_text(json.dumps({
+            "doc_id": doc_id,
+            "field_labels": [{"state": "LABELED"}, {"state": "UNLABELED"}],
+            "review": {"reviewed_at": "2026-01-01T00:00:00Z"},
+        }))
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    claims_dir = tmp_path / "claims"
+    _write_doc(claims_dir, "claim_001", "doc_a", claim_id="CLM-001", label=True)
+    _write_doc(claims_dir, "claim_001", "doc_b", claim_id="CLM-001", file_md5="shared")
+    _write_doc(claims_dir, "claim_002", "doc_c", file_md5="shared")
+    run_dir = tmp_path / "runs" / "BATCH-20260101-001"
+    run_dir.mkdir(parents=True)
+    (run_dir / "summary.json").write_text(json.dumps({"status": "complete", "docs_total": 3}))
+    (run_dir / ".complete").touch()
+    return tmp_path
+
+
+def _readers(output_dir):
+    build_all_indexes(output_dir, backend="sqlite")
+    registry_dir = output_dir / "registry"
+    return IndexReader(registry_dir), SqliteIndexReader(registry_dir)
+
+
+class TestSqliteIndexReader:
+    def test_matches_jsonl_reader(self, output_dir):
+        jsonl, sqlite = _readers(output_dir)
+
+        assert sqlite.is_available
+        assert sqlite.get_meta() == jsonl.get_meta()
+        assert sqlite.get_all_docs() == jsonl.get_all_docs()
+        assert sqlite.get_all_claims() == jsonl.get_all_claims()
+        assert sqlite.get_all_runs() == jsonl.get_all_runs()
+        assert sqlite.get_all_label_summaries() == jsonl.get_all_label_summaries()
+        assert sqlite.get_all_claim_summaries() == jsonl.get_all_claim_summaries()
+        for key in ("CLM-001", "claim_001", "claim_002", "missing"):
+            assert sqlite.get_docs_by_claim(key) == jsonl.get_docs_by_claim(key)
+            assert sqlite.get_claim_folder(key) == jsonl.get_claim_folder(key)
+        assert sqlite.get_doc("doc_b") == jsonl.get_doc("doc_b")
+        assert sqlite.get_label_summary("doc_a") == jsonl.get_label_summary("doc_a")
+        assert sqlite.get_run("BATCH-20260101-001") == jsonl.get_run("BATCH-20260101-001")
+
+    def test_lookup_by_file_md5(self, output_dir):
+        jsonl, sqlite = _readers(output_dir)
+
+        assert [d.doc_id for d in sqlite.get_docs_by_file_md5("shared")] == ["doc_b", "doc_c"]
+        assert sqlite.get_docs_by_file_md5("shared") == jsonl.get_docs_by_file_md5("shared")
+
+    def test_missing_database_is_unavailable(self, tmp_path):
+        reader = SqliteIndexReader(tmp_path / "registry")
+
+        assert not reader.is_available
+        assert reader.get_all_docs() == []
+        assert reader.get_all_claim_summaries() is None
+        assert not (tmp_path / "registry" / REGISTRY_DB_FILE).exists()
+
+
+class TestBackendSelection:
+    def test_build_keeps_current_backend(self, output_dir):
+        registry_dir = output_dir / "registry"
+        build_all_indexes(output_dir)
+        assert type(open_index_reader(registry_dir)) is IndexReader
+
+        build_all_indexes(output_dir, backend="sqlite")
+        stats = build_all_indexes(output_dir)
+
+        assert stats["backend"] == "sqlite"
+        assert isinstance(open_index_reader(registry_dir), SqliteIndexReader)
+        assert isinstance(FileStorage(output_dir)._index_reader, SqliteIndexReader)
+
+    def test_switching_back_removes_database(self, output_dir):
+        build_all_indexes(output_dir, backend="sqlite")
+        build_all_indexes(output_dir, backend="jsonl")
+
+        assert not (output_dir / "registry" / REGISTRY_DB_FILE).exists()
+        assert type(open_index_reader(output_dir / "registry")) is IndexReader
+
+    def test_unknown_backend(self, output_dir):
+        with pytest.raises(ValueError):
+            build_all_indexes(output_dir, backend="postgres")
+
+
+class TestIncrementalWrites:
+    def test_label_upsert_skips_jsonl_rewrite(self, output_dir):
+        _, reader = _readers(output_dir)
+        label_path = output_dir / "registry" / LABEL_INDEX_FILE
+        before = label_path.read_text()
+
+        upsert_label_entry(output_dir / "registry", {
+            "doc_id": "doc_b", "claim_id": "CLM-001", "has_label": True, "labeled_count": 4,
+        })
+
+        assert label_path.read_text() == before
+        assert reader.get_label_summary("doc_b").labeled_count == 4
+        assert len(reader.get_all_label_summaries()) == 2
+
+    def test_doc_append_and_meta_counts(self, output_dir):
+        registry_dir = output_dir / "registry"
+        _, reader = _readers(output_dir)
+
+        append_doc_entry(registry_dir, {
+            "doc_id": "doc_d", "claim_id": "CLM-003", "claim_folder": "claim_003",
+        })
+        update_registry_meta(registry_dir)
+
+        meta = reader.get_meta()
+        assert (meta.doc_count, meta.claim_count, meta.label_count) == (4, 3, 1)
+        assert json.loads((registry_dir / "registry_meta.json").read_text())["doc_count"] == 4
+        assert reader.get_claim_folder("CLM-003") == "claim_003"
+
+
+class TestMigration:
+    def test_import_jsonl(self, output_dir):
+        build_all_indexes(output_dir, backend="jsonl")
+        registry_dir = output_dir / "registry"
+        jsonl = IndexReader(registry_dir)
+
+        with SqliteRegistry(registry_dir) as registry:
+            meta = registry.import_jsonl()
+
+        sqlite = open_index_reader(registry_dir)
+        assert isinstance(sqlite, SqliteIndexReader)
+        assert meta["doc_count"] == 3
+        assert sqlite.get_all_docs() == jsonl.get_all_docs()
+        assert sqlite.get_all_claims() == jsonl.get_all_claims()
+        assert (registry_dir / DOC_INDEX_FILE).exists()
@@ -0,0 +1,168 @@
+"""Tests for claim stage input fingerprints and output reuse."""
+
+from unittest.mock import patch
+
+import pytest
+
+from context_builder.pipeline.claim_stages import fingerprint as fingerprint_module
+from context_builder.pipeline.claim_stages.fingerprint import (
+    StageFingerprint,
+    StageReusePlanner,
+    hash_content,
+    parse_force_stages,
+)
+from context_builder.storage.claim_run import ClaimRunContext, ClaimRunStorage
+from context_builder.storage.config_snapshots import ConfigSnapshotStore
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / "config" / "screening").mkdir(parents=True)
+    (tmp_path / "config" / "screening" / "screener.py").write_text("# v1\n")
+    return tmp_path
+
+
+@pytest.fixture
+def storage(workspace):
+    folder = workspace / "claims" / "CLM-001"
+    folder.mkdir(parents=True)
+    return ClaimRunStorage(folder)
+
+
+def _create_run(storage, run_id):
+    storage.create_claim_run([], "test", run_context=ClaimRunContext(claim_run_id=run_id))
+    return run_id
+
+
+def _planner(storage, workspace, run_id, force=None):
+    return StageReusePlanner(
+        storage=storage,
+        claim_run_id=run_id,
+        workspace_path=workspace,
+        force_stages=set(force or ()),
+    )
+
+
+def _fingerprint(facts="a"):
+    return StageFingerprint("assessment", {"facts": hash_content({"v": facts})})
+
+
+def _complete_previous_run(storage, workspace, run_id, fingerprint):
+    """Simulate a finished run that produced assessment.json."""
+    _create_run(storage, run_id)
+    storage.write_assessment(run_id, {"recommendation": "APPROVE"})
+    planner = _planner(storage, workspace, run_id)
+    planner.try_reuse(fingerprint)
+    manifest = storage.read_manifest(run_id)
+    manifest.stage_fingerprints = planner.to_manifest()
+    storage.write_manifest(manifest)
+
+
+class TestHashing:
+    def test_volatile_keys_ignored(self):
+        a = {"claim_run_id": "clm_1", "generated_at": "t1", "facts": [{"name": "x", "run_id": "r1"}]}
+        b = {"claim_run_id": "clm_2", "generated_at": "t2", "facts": [{"name": "x", "run_id": "r2"}]}
+        assert hash_content(a) == hash_content(b)
+
+    def test_content_change_detected(self):
+        assert hash_content({"facts": [1]}) != hash_content({"facts": [2]})
+
+    def test_none(self):
+        assert hash_content(None) is None
+
+    def test_config_hash_is_snapshot_id(self, storage, workspace):
+        before = _planner(storage, workspace, "clm_1").config_hash
+        assert before == ConfigSnapshotStore(workspace / "config").compute_id()
+
+        (workspace / "config" / "screening" / "screener.py").write_text("# v2\n")
+        assert _planner(storage, workspace, "clm_2").config_hash != before
+        assert _planner(storage, workspace / "missing", "clm_3").config_hash is None
+
+
+class TestStageReusePlanner:
+    def test_reuses_matching_previous_run(self, storage, workspace):
+        _complete_previous_run(storage, workspace, "clm_prev", _fingerprint())
+        current = _create_run(storage, "clm_next")
+
+        planner = _planner(storage, workspace, current)
+        source = planner.try_reuse(_fingerprint())
+
+        assert source == "clm_prev"
+        assert storage.read_from_claim_run(current, "assessment.json") == {
+            "recommendation": "APPROVE"
+        }
+        decision = planner.to_manifest()["assessment"]
+        assert decision["action"] == "reused"
+        assert decision["reason"] == "fingerprint_match"
+        assert decision["source_claim_run_id"] == "clm_prev"
+
+    def test_changed_inputs_run_again(self, storage, workspace):
+        _complete_previous_run(storage, workspace, "clm_prev", _fingerprint("a"))
+        current = _create_run(storage, "clm_next")
+
+        planner = _planner(storage, workspace, current)
+        assert planner.try_reuse(_fingerprint("b")) is None
+        assert planner.to_manifest()["assessment"]["reason"] == "no_match"
+        assert storage.read_from_claim_run(current, "assessment.json") is None
+
+    def test_force_stage_overrides_match(self, storage, workspace):
+        _complete_previous_run(storage, workspace, "clm_prev", _fingerprint())
+        current = _create_run(storage, "clm_next")
+
+        planner = _planner(storage, workspace, current, force={"assessment"})
+        assert planner.try_reuse(_fingerprint()) is None
+        assert planner.to_manifest()["assessment"]["reason"] == "forced"
+
+    def test_force_all(self, storage, workspace):
+        planner = _planner(storage, workspace, "clm_x", force={"all"})
+        assert planner.is_forced("screening")
+        assert planner.is_forced("assessment")
+
+    def test_reused_output_gets_new_run_identity(self, storage, workspace):
+        _create_run(storage, "clm_prev")
+        storage.write_assessment("clm_prev", {
+            "claim_run_id": "clm_prev",
+            "assessment_timestamp": "2026-01-01T00:00:00+00:00",
+            "sources": [{"run_id": "BATCH-1"}],
+        })
+        planner = _planner(storage, workspace, "clm_prev")
+        planner.try_reuse(_fingerprint())
+        manifest = storage.read_manifest("clm_prev")
+        manifest.stage_fingerprints = planner.to_manifest()
+        storage.write_manifest(manifest)
+        current = _create_run(storage, "clm_next")
+
+        _planner(storage, workspace, current).try_reuse(_fingerprint())
+
+        reused = storage.read_from_claim_run(current, "assessment.json")
+        assert reused["claim_run_id"] == "clm_next"
+        assert reused["assessment_timestamp"] != "2026-01-01T00:00:00+00:00"
+        assert reused["sources"] == [{"run_id": "BATCH-1"}]
+
+    def test_code_upgrade_runs_again(self, storage, workspace):
+        _complete_previous_run(storage, workspace, "clm_prev", _fingerprint())
+        current = _create_run(storage, "clm_next")
+
+        with patch.object(fingerprint_module, "code_version", return_value="9.9.9"):
+            assert _planner(storage, workspace, current).try_reuse(_fingerprint()) is None
+
+    def test_missing_artifact_not_reused(self, storage, workspace):
+        _complete_previous_run(storage, workspace, "clm_prev", _fingerprint())
+        (storage.get_claim_run_path("clm_prev") / "assessment.json").unlink()
+        current = _create_run(storage, "clm_next")
+
+        assert _planner(storage, workspace, current).try_reuse(_fingerprint()) is None
+
+
+class TestParseForceStages:
+    def test_repeatable_and_comma_separated(self):
+        assert parse_force_stages(["screening,assessment", "ALL"]) == {
+            "screening", "assessment", "all",
+        }
+
+    def test_empty(self):
+        assert parse_force_stages(None) == set()
+
+    def test_unknown_stage(self):
+        with pytest.raises(ValueError, match="Unknown stage 'decision'"):
+            parse_force_stages(["decision"])
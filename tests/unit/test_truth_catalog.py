@@ -0,0 +1,166 @@
+"""Tests for the persistent truth catalog and catalog-backed truth listings."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from context_builder.api.services.truth import TruthService
+from context_builder.storage.truth_catalog import (
+    TRUTH_CATALOG_FILE,
+    TruthCatalog,
+    clear_truth_catalog_cache,
+)
+from context_builder.storage.truth_store import TruthStore
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_truth_catalog_cache()
+    yield
+    clear_truth_catalog_cache()
+
+
+def _add_doc(output_root: Path, claim_id: str, doc_id: str, file_md5: str,
+             doc_type: str = "invoice", filename: str = "invoice.pdf") -> None:
+    meta_dir = output_root / "claims" / claim_id / "docs" / doc_id / "meta"
+    meta_dir.mkdir(parents=True)
+    (meta_dir / "doc.json").write_text(json.dumps({
+        "doc_id": doc_id,
+        "claim_id": claim_id,
+        "doc_type": doc_type,
+        "original_filename": filename,
+        "file_md5": file_md5,
+    }))
+
+
+def _truth(claim_id: str, doc_id: str, reviewer: str = "alice",
+           reviewed_at: str = "2026-01-10T10:00:00Z", states=None) -> dict:
+    states = states or {"total_amount": "LABELED"}
+    return {
+        "doc_id": doc_id,
+        "claim_id": claim_id,
+        "review": {"reviewer": reviewer, "reviewed_at": reviewed_at},
+        "field_labels": [
+            {"field_name": name, "state": state, "truth_value": "100"}
+            for name, state in states.items()
+        ],
+        "source_doc_ref": {"claim_id": claim_id, "doc_id": doc_id},
+    }
+
+
+@pytest.fixture
+def output_root(tmp_path):
+    _add_doc(tmp_path, "CLM-1", "doc1", "md5a", doc_type="invoice", filename="inv.pdf")
+    _add_doc(tmp_path, "CLM-2", "doc2", "md5b", doc_type="police_report", filename="police.pdf")
+    store = TruthStore(tmp_path)
+    store.save_truth_by_file_md5("md5a", _truth("CLM-1", "doc1", reviewer="alice"))
+    store.save_truth_by_file_md5(
+        "md5b",
+        _truth("CLM-2", "doc2", reviewer="bob", reviewed_at="2026-03-01T00:00:00Z",
+               states={"report_number": "UNVERIFIABLE"}),
+    )
+    return tmp_path
+
+
+class TestTruthCatalog:
+    def test_save_updates_catalog(self, output_root):
+        entries = TruthCatalog(output_root / "registry").entries()
+
+        assert set(entries) == {"md5a", "md5b"}
+        entry = entries["md5b"]
+        assert entry.reviewer == "bob"
+        assert entry.field_states == {"report_number": "UNVERIFIABLE"}
+        [instance] = entry.doc_instances
+        assert (instance.claim_id, instance.doc_type, instance.original_filename) == (
+            "CLM-2", "police_report", "police.pdf",
+        )
+
+    def test_resave_replaces_entry_and_keeps_instances(self, output_root):
+        store = TruthStore(output_root)
+        store.save_truth_by_file_md5("md5a", _truth("CLM-1", "doc1", reviewer="carol"))
+
+        catalog = TruthCatalog(output_root / "registry")
+        clear_truth_catalog_cache()  # Force a re-read of the file
+        entry = catalog.get("md5a")
+
+        assert entry.reviewer == "carol"
+        assert [d.doc_id for d in entry.doc_instances] == ["doc1"]
+        assert list(catalog.entries())[-1] == "md5a"
+
+    def test_rebuilt_when_missing(self, output_root):
+        catalog = TruthCatalog(output_root / "registry")
+        catalog.path.unlink()
+        clear_truth_catalog_cache()
+
+        assert set(catalog.entries()) == {"md5a", "md5b"}
+        assert catalog.path.exists()
+
+    def test_compacts_stale_lines(self, output_root, monkeypatch):
+        monkeypatch.setattr(
+            "context_builder.storage.truth_catalog._COMPACT_MIN_STALE", 2
+        )
+        store = TruthStore(output_root)
+        for reviewer in ("x", "y", "z"):
+            store.save_truth_by_file_md5("md5a", _truth("CLM-1", "doc1", reviewer=reviewer))
+        clear_truth_catalog_cache()
+
+        entries = TruthCatalog(output_root / "registry").entries()
+
+        assert entries["md5a"].reviewer == "z"
+        lines = (output_root / "registry" / TRUTH_CATALOG_FILE).read_text().splitlines()
+        assert len(lines) == 2
+
+
+class TestTruthServiceListing:
+    def test_filters_use_catalog(self, output_root):
+        service = TruthService(output_root / "claims")
+
+        by_reviewer = service.list_truth_entries(reviewer="bob")
+        by_doc_type = service.list_truth_entries(doc_type="invoice")
+        by_date = service.list_truth_entries(reviewed_after="2026-02-01T00:00:00Z")
+
+        assert [e["file_md5"] for e in by_reviewer["entries"]] == ["md5b"]
+        assert [e["file_md5"] for e in by_doc_type["entries"]] == ["md5a"]
+        assert by_doc_type["entries"][0]["doc_instances"][0]["claim_id"] == "CLM-1"
+        assert [e["file_md5"] for e in by_date["entries"]] == ["md5b"]
+
+    def test_only_matching_truth_files_opened(self, output_root):
+        service = TruthService(output_root / "claims")
+
+        with patch.object(
+            TruthService, "_load_truth", autospec=True,
+            side_effect=lambda self, md5: TruthStore(output_root).get_truth_by_file_md5(md5),
+        ) as load:
+            result = service.list_truth_entries(claim_id="CLM-2", run_id="run_1")
+
+        assert [call.args[1] for call in load.call_args_list] == ["md5b"]
+        [entry] = result["entries"]
+        assert entry["fields"][0]["field_name"] == "report_number"
+        assert entry["fields"][0]["runs"] == {"run_1": None}
+
+    def test_outcome_prefilter_skips_impossible_entries(self, output_root):
+        service = TruthService(output_root / "claims")
+
+        with patch.object(TruthService, "_load_truth", autospec=True, return_value=None) as load:
+            service.list_truth_entries(outcome="unlabeled", run_id="run_1")
+
+        load.assert_not_called()
+
+    def test_instances_follow_ingestion_and_claim_deletion(self, output_root):
+        from context_builder.storage import FileStorage, build_all_indexes
+
+        _add_doc(output_root, "CLM-3", "doc3", "md5a", filename="inv_copy.pdf")
+        build_all_indexes(output_root)
+        service = TruthService(output_root / "claims")
+
+        by_claim = service.list_truth_entries(claim_id="CLM-3")
+        assert [e["file_md5"] for e in by_claim["entries"]] == ["md5a"]
+
+        assert FileStorage(output_root).delete_claim("CLM-2")
+        build_all_indexes(output_root)
+
+        assert service.list_truth_entries(claim_id="CLM-2")["entries"] == []
+        instances = service.list_truth_entries(doc_type="invoice")["entries"][0]["doc_instances"]
+        assert [d["claim_id"] for d in instances] == ["CLM-1", "CLM-3"]
@@ -0,0 +1,93 @@
+"""Tests for version bundle memoization and shared bundle content."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from context_builder.storage import version_bundles
+from context_builder.storage.version_bundles import (
+    SHARED_BUNDLES_DIR,
+    SHARED_FIELDS,
+    VersionBundleStore,
+    clear_version_bundle_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_version_bundle_cache()
+    yield
+    clear_version_bundle_cache()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return VersionBundleStore(tmp_path)
+
+
+def _git_result(stdout):
+    return type("Result", (), {"returncode": 0, "stdout": stdout})()
+
+
+class TestMemoization:
+    def test_git_runs_once_per_process(self, tmp_path):
+        with patch.object(
+            version_bundles.subprocess, "run", return_value=_git_result("abc123\n")
+        ) as run:
+            for i in range(3):
+                VersionBundleStore(tmp_path / f"ws{i}").create_version_bundle(run_id=f"run-{i}")
+
+        assert run.call_count == 2
+
+    def test_shared_content_computed_once(self, store):
+        with patch.object(
+            VersionBundleStore, "_hash_directory", autospec=True,
+            side_effect=VersionBundleStore._hash_directory,
+        ) as hash_dir, patch.object(
+            VersionBundleStore, "_capture_scope_snapshot", autospec=True, return_value=None,
+        ) as scope:
+            bundles = [store.create_version_bundle(run_id=f"run-{i}") for i in range(4)]
+
+        # Prompt templates and extraction specs, hashed for the first run only
+        assert hash_dir.call_count <= 2
+        assert scope.call_count == 1
+        assert len({b.bundle_id for b in bundles}) == 4
+        assert len({b.extraction_spec_hash for b in bundles}) == 1
+
+    def test_fingerprint_change_recomputes(self, store):
+        with patch.object(
+            VersionBundleStore, "_config_fingerprint", side_effect=["a", "a", "b"]
+        ), patch.object(
+            VersionBundleStore, "_capture_scope_snapshot", autospec=True, return_value=None,
+        ) as scope:
+            for i in range(3):
+                store.create_version_bundle(run_id=f"run-{i}")
+
+        assert scope.call_count == 2
+
+
+class TestSharedStorage:
+    def test_runs_reference_shared_content(self, store):
+        b1 = store.create_version_bundle(run_id="run-1", model_name="gpt-4o")
+        b2 = store.create_version_bundle(run_id="run-2", model_name="gpt-4o-mini")
+
+        raw = [
+            json.loads((store.storage_dir / run_id / "bundle.json").read_text())
+            for run_id in ("run-1", "run-2")
+        ]
+        assert raw[0]["shared_bundle_id"] == raw[1]["shared_bundle_id"]
+        assert not any(field in raw[0] for field in SHARED_FIELDS)
+        assert len(list((store.storage_dir / SHARED_BUNDLES_DIR).iterdir())) == 1
+
+        assert store.get_version_bundle("run-1") == b1
+        assert store.get_version_bundle("run-2") == b2
+        assert sorted(store.list_bundles()) == ["run-1", "run-2"]
+
+    def test_reads_legacy_full_bundle(self, store):
+        bundle = store.create_version_bundle(run_id="run-1")
+        legacy_dir = store.storage_dir / "legacy-run"
+        legacy_dir.mkdir()
+        (legacy_dir / "bundle.json").write_text(json.dumps(bundle.model_dump()))
+
+        assert store.get_version_bundle("legacy-run") == bundle
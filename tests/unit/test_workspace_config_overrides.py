@@ -504,9 +504,12 @@ class TestWorkspaceConfigSnapshot:
     """Tests for workspace config snapshot functionality."""
 
     def test_snapshot_workspace_config_creates_copy(self, tmp_path):
-        """Test that snapshot creates a copy of config dir."""
+        """Test that the run references a stored copy of the config dir."""
+        import json
+
         from context_builder.pipeline.helpers.metadata import snapshot_workspace_config
         from context_builder.pipeline.paths import RunPaths
+        from context_builder.storage.config_snapshots import ConfigSnapshotStore
 
         # Create config dir with files
         config_dir = tmp_path / "workspace" / "config"
@@ -533,10 +536,15 @@ class TestWorkspaceConfigSnapshot:
         with patch("context_builder.pipeline.helpers.metadata.get_workspace_config_dir") as mock_config:
             mock_config.return_value = config_dir
 
-            snapshot_path = snapshot_workspace_config(run_paths)
+            ref_path = snapshot_workspace_config(run_paths)
 
-            assert snapshot_path is not None
-            assert snapshot_path.exists()
+            assert ref_path is not None
+            ref = json.loads(ref_path.read_text())
+            # No host paths: the store is resolved from the workspace
+            assert list(ref) == ["snapshot_id"]
+            snapshot_id = ref["snapshot_id"]
+            snapshot_path = tmp_path / "restored"
+            assert ConfigSnapshotStore(config_dir).restore(snapshot_id, snapshot_path)
             assert (snapshot_path / "tenant.yaml").exists()
             assert (snapshot_path / "prompts" / "test.md").exists()
 